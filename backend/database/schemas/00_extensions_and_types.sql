@@ -346,4 +346,4 @@ COMMENT ON TYPE ai_service_type IS 'AI assistive services (advisory only, read-o
 COMMENT ON FUNCTION current_user_id() IS 'Returns current authenticated user ID for RLS policies';
 COMMENT ON FUNCTION current_user_role() IS 'Returns current user role for authorization checks';
 COMMENT ON FUNCTION has_national_access() IS 'Checks if user has national-level visibility';
-COMMENT ON FUNCTION calculate_audit_hash() IS 'Generates SHA-256 hash for audit log chain';
+COMMENT ON FUNCTION calculate_audit_hash(TEXT, JSONB, TIMESTAMP WITH TIME ZONE) IS 'Generates SHA-256 hash for audit log chain';
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Administrative Data Model - Compact records for provinces, districts,
+constituencies and wards
+Records use __slots__ (no per-instance dict, ~3x smaller than the dicts they
+replace), codes and names are interned so repeated values share one string,
+and parents are referenced by their integer index in AdminHierarchy rather
+than by nested dicts or repeated codes. The whole hierarchy pickles to a few
+flat lists, which keeps it cheap to cache and to send to worker processes.
+"""
+
+import sys
+
+
+def intern_text(value):
+    """sys.intern() for strings (None passes through)"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Record:
+    """Base for slotted records: pickles as (class, field values)
+
+    Unpickling goes back through __init__, so names are interned again in
+    the receiving process.
+    """
+    __slots__ = ()
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, field) for field in self.__slots__)
+
+    def __repr__(self):
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Province(Record):
+    """Province: database code (e.g. 'LSK') and name"""
+    __slots__ = ('code', 'name')
+
+    def __init__(self, code, name):
+        self.code = intern_text(code)
+        self.name = intern_text(name)
+
+
+class District(Record):
+    """District: database code, name and index of its province"""
+    __slots__ = ('code', 'name', 'province')
+
+    def __init__(self, code, name, province):
+        self.code = intern_text(code)
+        self.name = intern_text(name)
+        self.province = province
+
+
+class Constituency(Record):
+    """Constituency: 3-digit code, inferred name, index of its district and ward count"""
+    __slots__ = ('code', 'name', 'district', 'ward_count')
+
+    def __init__(self, code, name, district, ward_count=0):
+        self.code = intern_text(code)
+        self.name = intern_text(name)
+        self.district = district
+        self.ward_count = ward_count
+
+
+class Ward(Record):
+    """Ward as streamed from the CSV: code, name and its constituency's code
+
+    Wards are not kept in AdminHierarchy (there are too many), so the parent
+    is carried by code, which is what the SQL needs.
+    """
+    __slots__ = ('code', 'name', 'const_code')
+
+    def __init__(self, code, name, const_code):
+        self.code = code
+        self.name = name
+        self.const_code = const_code
+
+
+class AdminHierarchy:
+    """Provinces, districts and constituencies in first-seen CSV order
+
+    Each level is a list; the *_index dicts map the CSV's own keys (PROV_CODE,
+    'PROV_CODE-DISTRICT_C', CONST_CODE) to list positions.
+    """
+    __slots__ = ('provinces', 'districts', 'constituencies',
+                 'province_index', 'district_index', 'constituency_index',
+                 'unmapped_districts', 'ward_count')
+
+    def __init__(self):
+        self.provinces = []
+        self.districts = []
+        self.constituencies = []
+        self.province_index = {}
+        self.district_index = {}
+        self.constituency_index = {}
+        self.unmapped_districts = set()
+        self.ward_count = 0
+
+    def add_province(self, key, province):
+        """Append a province under its CSV key, returning its index"""
+        index = self.province_index[key] = len(self.provinces)
+        self.provinces.append(province)
+        return index
+
+    def add_district(self, key, district):
+        """Append a district under its CSV key, returning its index"""
+        index = self.district_index[key] = len(self.districts)
+        self.districts.append(district)
+        return index
+
+    def add_constituency(self, key, constituency):
+        """Append a constituency under its CSV key, returning its index"""
+        index = self.constituency_index[key] = len(self.constituencies)
+        self.constituencies.append(constituency)
+        return index
+
+    def district_of(self, constituency):
+        """District record of a constituency"""
+        return self.districts[constituency.district]
+
+    def province_of(self, district):
+        """Province record of a district"""
+        return self.provinces[district.province]
+
+    def constituency_provinces(self):
+        """{constituency code: province code}"""
+        return {constituency.code: self.province_of(self.district_of(constituency)).code
+                for constituency in self.constituencies}
+
+    def sorted_constituencies(self):
+        """Constituencies ordered by code, the order their SQL rows are written in"""
+        return sorted(self.constituencies, key=lambda constituency: constituency.code)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Converter Benchmarks - Wall time, throughput and peak memory of the converters
+Runs convert_full_admin_data, convert_zambia_admin_data and convert_ecz_data
+against synthetic inputs at 1x, 10x and 100x the real dataset (see
+synthetic_data.py), each in its own process so peak RSS is per converter.
+The peak is the converter's own VmHWM (plus any worker processes it waited
+for): ru_maxrss of the process would include the benchmark's own RSS, which
+Linux carries over into the child through fork and exec.
+
+Results are written as JSON. Given a baseline from an earlier run, any
+benchmark whose rows/sec dropped by more than the threshold fails the run.
+
+Usage:
+    python3 benchmark_converters.py --output bench.json
+    python3 benchmark_converters.py --baseline bench_main.json --threshold 0.15
+    python3 benchmark_converters.py --scales 1 10 --repeat 5 --only convert_ecz_data
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import synthetic_data
+from xlsx_reader import Workbook, is_workbook
+
+SEED_DIR = Path(__file__).resolve().parent
+
+DEFAULT_SCALES = (1, 10, 100)
+
+# name -> (script, synthetic input kind, extra arguments); rows are counted from the input
+BENCHMARKS = {
+    "convert_full_admin_data": ("convert_full_admin_data.py", "admin", ()),
+    "convert_full_admin_data:columnar": ("convert_full_admin_data.py", "admin", ("--columnar",)),
+    "convert_full_admin_data:jobs4": ("convert_full_admin_data.py", "admin", ("--jobs", "4")),
+    "convert_zambia_admin_data": ("convert_zambia_admin_data.py", "admin", ()),
+    "convert_zambia_admin_data:columnar": ("convert_zambia_admin_data.py", "admin", ("--columnar",)),
+    "convert_zambia_admin_data:jobs4": ("convert_zambia_admin_data.py", "admin", ("--jobs", "4")),
+    "convert_ecz_data:constituencies": ("convert_ecz_data.py", "ecz_constituencies", ()),
+    "convert_ecz_data:wards": ("convert_ecz_data.py", "ecz_wards", ()),
+    "convert_ecz_data:wards_xlsx": ("convert_ecz_data.py", "ecz_wards_xlsx", ()),
+}
+
+# Fail when rows/sec falls more than this fraction below the baseline
+DEFAULT_THRESHOLD = 0.20
+
+# Runs a converter as __main__ in a fresh interpreter, then writes its peak
+# RSS in kB to the report file: the VmHWM of this process (reset by exec, so
+# nothing of the benchmark's memory) or of the workers it waited for. Nothing
+# is written without /proc.
+RSS_LAUNCHER = """
+import os, resource, runpy, sys
+script, report = sys.argv[1:3]
+sys.argv = [script] + sys.argv[3:]
+sys.path[0] = os.path.dirname(os.path.abspath(script))
+try:
+    runpy.run_path(script, run_name="__main__")
+finally:
+    if os.path.exists("/proc/self/status"):
+        with open("/proc/self/status") as status:
+            own = next(int(line.split()[1]) for line in status if line.startswith("VmHWM:"))
+        workers = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        with open(report, "w") as f:
+            f.write(str(max(own, workers)))
+"""
+
+
+def count_rows(csv_path):
+    """Data rows in a CSV file, or in a workbook's first sheet (header excluded)"""
+    if is_workbook(csv_path):
+        with Workbook(csv_path) as workbook:
+            return sum(1 for _ in workbook.rows()) - 1
+    with open(csv_path, 'rb') as f:
+        return sum(1 for _ in f) - 1
+
+
+def max_rss_mb(rusage):
+    """Peak resident set size from a rusage struct, in MB"""
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return rusage.ru_maxrss / divisor
+
+
+def run_once(script, input_csv, extra_args=()):
+    """Run a converter once with stdout discarded: (seconds, peak RSS MB)
+
+    The converter runs under RSS_LAUNCHER; where that can't read /proc, the
+    process's ru_maxrss is used instead.
+    """
+    with tempfile.TemporaryFile() as stderr, tempfile.TemporaryDirectory() as report_dir:
+        report = Path(report_dir) / "peak_rss_kb"
+        start = time.perf_counter()
+        proc = subprocess.Popen([sys.executable, "-c", RSS_LAUNCHER, script, str(report), str(input_csv),
+                                 *extra_args], cwd=SEED_DIR, stdout=subprocess.DEVNULL, stderr=stderr)
+        _, status, rusage = os.wait4(proc.pid, 0)
+        seconds = time.perf_counter() - start
+        proc.returncode = os.waitstatus_to_exitcode(status)
+
+        if proc.returncode != 0:
+            stderr.seek(0)
+            raise RuntimeError(f"{script} failed ({proc.returncode}):\n{stderr.read().decode(errors='replace')}")
+        if report.exists():
+            return seconds, int(report.read_text()) / 1024
+    return seconds, max_rss_mb(rusage)
+
+
+def run_benchmark(script, input_csv, rows, repeat, extra_args=()):
+    """Best-of-repeat wall time, with the peak RSS over all repeats"""
+    timings = [run_once(script, input_csv, extra_args) for _ in range(repeat)]
+    seconds = min(seconds for seconds, _ in timings)
+    return {
+        "rows": rows,
+        "seconds": round(seconds, 4),
+        "rows_per_sec": round(rows / seconds, 1) if seconds > 0 else 0.0,
+        "peak_rss_mb": round(max(rss for _, rss in timings), 1),
+    }
+
+
+def run_suite(scales, repeat, data_dir, only=None):
+    """Run every benchmark at every scale: {'name@Nx': result}"""
+    results = {}
+    for scale in scales:
+        paths = synthetic_data.generate(scale, data_dir)
+        row_counts = {kind: count_rows(path) for kind, path in paths.items()}
+
+        for name, (script, kind, extra_args) in BENCHMARKS.items():
+            if only and not any(name.startswith(prefix) for prefix in only):
+                continue
+            key = f"{name}@{scale}x"
+            result = run_benchmark(script, paths[kind], row_counts[kind], repeat, extra_args)
+            results[key] = result
+            print(f"  {key:42} {result['seconds']:>8.3f}s {result['rows_per_sec']:>12,.0f} rows/s "
+                  f"{result['peak_rss_mb']:>8.1f} MB", file=sys.stderr)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Benchmarks whose throughput regressed: [(key, baseline rows/s, rows/s, change)]"""
+    regressions = []
+    for key, result in sorted(results.items()):
+        previous = baseline.get("results", {}).get(key)
+        if not previous or not previous.get("rows_per_sec"):
+            continue
+        change = result["rows_per_sec"] / previous["rows_per_sec"] - 1
+        if change < -threshold:
+            regressions.append((key, previous["rows_per_sec"], result["rows_per_sec"], change))
+    return regressions
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Benchmark the seed-data converters")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES),
+                        help="Dataset multiples to run (default: 1 10 100)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per benchmark; the fastest is kept (default: 3)")
+    parser.add_argument("--only", nargs="+", metavar="NAME",
+                        help="Only run benchmarks whose name starts with NAME")
+    parser.add_argument("--data-dir",
+                        help="Keep generated inputs here and reuse them (default: temporary directory)")
+    parser.add_argument("--output", help="Write results JSON here (use as a later --baseline)")
+    parser.add_argument("--baseline", help="Results JSON from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed rows/sec drop vs the baseline, as a fraction (default: 0.20)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    print(f"Benchmarking converters (scales: {', '.join(f'{s}x' for s in args.scales)}, "
+          f"best of {args.repeat})", file=sys.stderr)
+    if args.data_dir:
+        results = run_suite(args.scales, args.repeat, args.data_dir, args.only)
+    else:
+        with tempfile.TemporaryDirectory() as data_dir:
+            results = run_suite(args.scales, args.repeat, data_dir, args.only)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+
+    if not args.baseline:
+        return
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print("", file=sys.stderr)
+        print(f"❌ Throughput regressed more than {args.threshold:.0%}:", file=sys.stderr)
+        for key, before, after, change in regressions:
+            print(f"   {key:42} {before:>12,.0f} -> {after:>12,.0f} rows/s ({change:+.1%})", file=sys.stderr)
+        sys.exit(1)
+    print(f"✅ No throughput regressions beyond {args.threshold:.0%} vs {args.baseline}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
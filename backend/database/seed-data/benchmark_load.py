@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""
+Load Benchmarks - What seeding costs on the database side
+Builds an empty database from the extension and hierarchy schema files,
+seeds it with the provinces and districts of the generated input, loads the
+generated hierarchy at 1x and 10x the real dataset (see synthetic_data.py)
+with each load strategy, and records per run:
+
+    load_seconds      wall time of the constituency and ward load
+    wal_bytes         WAL written by the load
+    index_build       seconds and WAL to rebuild each hierarchy index (the wards gist index included)
+    refresh_seconds   REFRESH MATERIALIZED VIEW CONCURRENTLY vw_administrative_hierarchy
+    table_bytes       size of each hierarchy table and the view, indexes included
+
+INSERT, UPDATE and DELETE statements of the load run under EXPLAIN (ANALYZE,
+BUFFERS, WAL); their plans and the plan of the view's query are kept as one
+JSON file per run (--plans-dir), so strategies can be compared across
+commits. The insert strategy's plans carry the per-row get_district_id()
+lookups. Plans cost some load time; --no-plans measures without them.
+
+Each run drops and recreates --bench-database. Use a local server with
+nothing else running on it: WAL is measured server-wide.
+
+Requires psycopg2 (pip install psycopg2-binary)
+
+Usage:
+    python3 benchmark_load.py --output load_bench.json --plans-dir plans/
+    python3 benchmark_load.py --scales 1 --only copy stream --baseline load_bench_main.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import synthetic_data
+from benchmark_converters import DEFAULT_THRESHOLD, compare
+from convert_full_admin_data import read_and_organize_data
+from load_seed_data import DEFAULT_SHARD_JOBS, HIERARCHY_TABLES, execute_sql_file, load_admin_csv, load_shards, table_counts
+from sql_output import sql_literal
+
+SEED_DIR = Path(__file__).resolve().parent
+SCHEMA_DIR = SEED_DIR.parent / "schemas"
+
+DEFAULT_SCALES = (1, 10)
+DEFAULT_BENCH_DATABASE = "cdf_seed_bench"
+BENCH_CHUNK_ROWS = 5000
+
+# Extensions the schema relies on without creating them (ll_to_earth() in
+# the wards gist index)
+SCHEMA_PRELUDE = "CREATE EXTENSION IF NOT EXISTS cube; CREATE EXTENSION IF NOT EXISTS earthdistance;"
+
+# Schema files the hierarchy needs; the later ones bring tables and triggers
+# the seed load never touches
+SCHEMA_FILES = ("00_extensions_and_types.sql", "01_tenant_hierarchy.sql")
+
+MATERIALIZED_VIEW = "vw_administrative_hierarchy"
+
+# name -> (kind, options). file: convert_full_admin_data output (options are
+# its arguments) run by load_seed_data.execute_sql_file(); shards: its
+# --shard-dir output loaded --jobs at a time; stream: load_seed_data's COPY
+# streaming, options (ids, chunk_size), converting as it loads
+STRATEGIES = {
+    "insert": ("file", ("--format", "insert")),
+    "copy": ("file", ("--format", "copy")),
+    "copy_uuid": ("file", ("--format", "copy", "--ids", "uuid")),
+    "copy_chunked": ("file", ("--format", "copy", "--chunk-size", str(BENCH_CHUNK_ROWS))),
+    "shards": ("shards", ("--format", "copy")),
+    "stream": ("stream", ("lookup", None)),
+    "stream_uuid": ("stream", ("uuid", None)),
+    "stream_chunked": ("stream", ("lookup", BENCH_CHUNK_ROWS)),
+}
+
+# Tokens that matter when splitting SQL into statements: literals, quoted
+# identifiers and comments (skipped whole), dollar-quote tags and semicolons
+SQL_TOKEN = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|/\*.*?\*/|\$(?:[A-Za-z_]\w*)?\$|;", re.DOTALL)
+SQL_COMMENTS = re.compile(r"(?:\s+|--[^\n]*|/\*.*?\*/)*", re.DOTALL)
+DML_STATEMENT = re.compile(r"(?:INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+
+
+def split_statements(sql):
+    """Split SQL text into statements, leaving out empty ones and bare comments"""
+    statements = []
+    start = position = 0
+    while True:
+        match = SQL_TOKEN.search(sql, position)
+        if not match:
+            break
+        token = match.group()
+        position = match.end()
+        if token == ";":
+            statements.append(sql[start:position])
+            start = position
+        elif token.startswith("$"):
+            end = sql.find(token, position)
+            position = len(sql) if end < 0 else end + len(token)
+    statements.append(sql[start:])
+    return [statement for statement in statements
+            if SQL_COMMENTS.match(statement).end() < len(statement.rstrip("; \n"))]
+
+
+def statement_summary(statement, width=160):
+    """First line of a statement, comments skipped, for the plan files"""
+    text = statement[SQL_COMMENTS.match(statement).end():]
+    line = text.split("\n", 1)[0].strip()
+    return line if len(line) <= width else line[:width - 3] + "..."
+
+
+class ExplainingCursor:
+    """Cursor that runs INSERT, UPDATE and DELETE under EXPLAIN ANALYZE, keeping the plans
+
+    Everything else, COPY included, goes to the wrapped cursor unchanged.
+    """
+
+    def __init__(self, cursor, plans, options):
+        self.cursor = cursor
+        self.plans = plans
+        self.options = options
+
+    def execute(self, sql, params=None):
+        if params is not None:
+            return self.cursor.execute(sql, params)
+        for statement in split_statements(sql):
+            if not DML_STATEMENT.match(statement, SQL_COMMENTS.match(statement).end()):
+                self.cursor.execute(statement)
+                continue
+            start = time.perf_counter()
+            self.cursor.execute(f"EXPLAIN ({self.options}) {statement}")
+            self.plans.append({
+                "statement": statement_summary(statement),
+                "seconds": round(time.perf_counter() - start, 4),
+                "plan": self.cursor.fetchone()[0][0],
+            })
+
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.cursor.close()
+
+
+class ExplainingConnection:
+    """Connection whose cursors are ExplainingCursors"""
+
+    def __init__(self, conn, plans, options):
+        self.conn = conn
+        self.plans = plans
+        self.options = options
+
+    def cursor(self):
+        return ExplainingCursor(self.conn.cursor(), self.plans, self.options)
+
+    def __getattr__(self, name):
+        return getattr(self.conn, name)
+
+
+class ExplainingPool:
+    """Connection pool handing out ExplainingConnections (for the shard loads)"""
+
+    def __init__(self, pool, plans, options):
+        self.pool = pool
+        self.plans = plans
+        self.options = options
+
+    def getconn(self):
+        return ExplainingConnection(self.pool.getconn(), self.plans, self.options)
+
+    def putconn(self, conn):
+        self.pool.putconn(conn.conn)
+
+
+def connect(args, database):
+    """Open a connection to database"""
+    try:
+        import psycopg2
+    except ImportError:
+        print("psycopg2 is required: pip install psycopg2-binary", file=sys.stderr)
+        sys.exit(1)
+    return psycopg2.connect(host=args.host, port=args.port, dbname=database, user=args.username,
+                            password=args.password)
+
+
+def connection_pool(args, size):
+    """Thread-safe pool of size connections to the benchmark database"""
+    from psycopg2 import pool
+    return pool.ThreadedConnectionPool(1, size, host=args.host, port=args.port, dbname=args.bench_database,
+                                       user=args.username, password=args.password)
+
+
+def recreate_database(args):
+    """Drop and create the benchmark database (UTF8, whatever the cluster default)"""
+    conn = connect(args, args.maintenance_database)
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(f'DROP DATABASE IF EXISTS "{args.bench_database}";')
+            cursor.execute(f'CREATE DATABASE "{args.bench_database}" ENCODING \'UTF8\' TEMPLATE template0;')
+    finally:
+        conn.close()
+
+
+def parents_sql(input_csv):
+    """INSERTs for the provinces and districts the input's constituencies belong to
+
+    The static seed files use real codes (and MCH for Muchinga); synthetic
+    inputs make up their own districts, so the parents come from the input.
+    """
+    hierarchy = read_and_organize_data(input_csv)
+    provinces = ",\n".join(f"    ({sql_literal(province.code)}, {sql_literal(province.name)})"
+                           for province in hierarchy.provinces)
+    districts = ",\n".join(f"    ({sql_literal(hierarchy.province_of(district).code)}, {sql_literal(district.code)}, "
+                           f"{sql_literal(district.name)})" for district in hierarchy.districts)
+    return (f"INSERT INTO provinces (code, name) VALUES\n{provinces};\n"
+            "INSERT INTO districts (province_id, code, name)\n"
+            f"SELECT p.id, v.code, v.name FROM (VALUES\n{districts}\n) AS v(province_code, code, name)\n"
+            "JOIN provinces p ON p.code = v.province_code;\n")
+
+
+def build_database(args, seed_sql):
+    """A connection to a fresh benchmark database with the hierarchy schema and seed_sql loaded"""
+    recreate_database(args)
+    conn = connect(args, args.bench_database)
+    with conn.cursor() as cursor:
+        cursor.execute(SCHEMA_PRELUDE)
+        for schema_file in SCHEMA_FILES:
+            execute_sql_file(cursor, SCHEMA_DIR / schema_file)
+        cursor.execute(seed_sql)
+    conn.commit()
+    return conn
+
+
+def measure(conn, action):
+    """Run action(): (seconds, bytes of WAL written meanwhile)"""
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT pg_current_wal_lsn();")
+        lsn = cursor.fetchone()[0]
+    conn.commit()
+    start = time.perf_counter()
+    action()
+    seconds = time.perf_counter() - start
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), %s);", (lsn,))
+        wal_bytes = int(cursor.fetchone()[0])
+    conn.commit()
+    return seconds, wal_bytes
+
+
+def execute(conn, sql):
+    """Run SQL in its own transaction"""
+    with conn.cursor() as cursor:
+        cursor.execute(sql)
+    conn.commit()
+
+
+def explain_options(conn, analyze=True):
+    """EXPLAIN options for the server (WAL counters need PostgreSQL 13)"""
+    options = ["ANALYZE", "BUFFERS"] if analyze else []
+    if analyze and conn.server_version >= 130000:
+        options.append("WAL")
+    return ", ".join(options + ["FORMAT JSON"])
+
+
+def convert(input_csv, target, kind, extra_args):
+    """Write convert_full_admin_data output for a file or shards strategy"""
+    output_args = ("--shard-dir", str(target)) if kind == "shards" else ("--output", str(target))
+    subprocess.run([sys.executable, "convert_full_admin_data.py", str(input_csv), *extra_args, *output_args],
+                   cwd=SEED_DIR, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+
+def load_action(args, conn, kind, options, input_csv, target, plans):
+    """The hierarchy load of a strategy, as a function of no arguments"""
+    options_sql = explain_options(conn)
+    if args.plans:
+        conn = ExplainingConnection(conn, plans, options_sql)
+
+    if kind == "file":
+        def load():
+            with conn.cursor() as cursor:
+                execute_sql_file(cursor, target)
+            conn.commit()
+    elif kind == "shards":
+        def load():
+            shard_pool = connection_pool(args, args.jobs)
+            try:
+                pool = ExplainingPool(shard_pool, plans, options_sql) if args.plans else shard_pool
+                load_shards(conn, pool, target, args.jobs)
+            finally:
+                shard_pool.closeall()
+    else:
+        ids, chunk_size = options
+
+        def load():
+            load_admin_csv(conn, input_csv, ids=ids, chunk_size=chunk_size)
+    return load
+
+
+def rebuild_indexes(conn):
+    """Rebuild every hierarchy index: {index: {'seconds', 'wal_bytes'}}"""
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT indexname FROM pg_indexes WHERE schemaname = 'public' AND tablename = ANY(%s) "
+                       "ORDER BY tablename, indexname;", (list(HIERARCHY_TABLES),))
+        indexes = [name for name, in cursor.fetchall()]
+    conn.commit()
+
+    builds = {}
+    for index in indexes:
+        seconds, wal_bytes = measure(conn, lambda: execute(conn, f"REINDEX INDEX {index};"))
+        builds[index] = {"seconds": round(seconds, 4), "wal_bytes": wal_bytes}
+    return builds
+
+
+def view_query_plan(conn):
+    """EXPLAIN ANALYZE plan of the materialized view's query"""
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT definition FROM pg_matviews WHERE matviewname = %s;", (MATERIALIZED_VIEW,))
+        definition = cursor.fetchone()[0].strip().rstrip(";")
+        cursor.execute(f"EXPLAIN ({explain_options(conn)}) {definition}")
+        plan = cursor.fetchone()[0][0]
+    conn.rollback()
+    return plan
+
+
+def relation_sizes(conn):
+    """{relation: bytes, indexes included} for the hierarchy tables and the view"""
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT relname, pg_total_relation_size(oid) FROM pg_class "
+                       "WHERE relname = ANY(%s) ORDER BY relname;", (list(HIERARCHY_TABLES) + [MATERIALIZED_VIEW],))
+        sizes = dict(cursor.fetchall())
+    conn.commit()
+    return sizes
+
+
+def run_once(args, name, input_csv, target, seed_sql):
+    """Load one strategy into a fresh database: (result, plans)"""
+    kind, options = STRATEGIES[name]
+    conn = build_database(args, seed_sql)
+    plans = {"load": []}
+    try:
+        load = load_action(args, conn, kind, options, input_csv, target, plans["load"])
+        load_seconds, load_wal = measure(conn, load)
+        with conn.cursor() as cursor:
+            counts = table_counts(cursor)
+        conn.commit()
+
+        index_build = rebuild_indexes(conn)
+        refresh_seconds, refresh_wal = measure(conn, lambda: execute(conn, "SELECT refresh_administrative_hierarchy();"))
+        if args.plans:
+            plans["refresh_query"] = view_query_plan(conn)
+        sizes = relation_sizes(conn)
+    finally:
+        conn.close()
+
+    rows = counts["constituencies"] + counts["wards"]
+    result = {
+        "rows": rows,
+        "load_seconds": round(load_seconds, 4),
+        "rows_per_sec": round(rows / load_seconds, 1) if load_seconds > 0 else 0.0,
+        "wal_bytes": load_wal,
+        "index_build": index_build,
+        "index_build_seconds": round(sum(build["seconds"] for build in index_build.values()), 4),
+        "refresh_seconds": round(refresh_seconds, 4),
+        "refresh_wal_bytes": refresh_wal,
+        "table_bytes": sizes,
+    }
+    return result, plans
+
+
+def run_suite(args, data_dir):
+    """Run every strategy at every scale: {'strategy@Nx': result}"""
+    results = {}
+    plans_dir = Path(args.plans_dir) if args.plans_dir else None
+    if plans_dir:
+        plans_dir.mkdir(parents=True, exist_ok=True)
+
+    for scale in args.scales:
+        input_csv = synthetic_data.generate(scale, data_dir)["admin"]
+        seed_sql = parents_sql(input_csv)
+        for name, (kind, options) in STRATEGIES.items():
+            if args.only and not any(name.startswith(prefix) for prefix in args.only):
+                continue
+            key = f"{name}@{scale}x"
+            target = Path(data_dir) / (f"{key}_shards" if kind == "shards" else f"{key}.sql")
+            if kind != "stream":
+                convert(input_csv, target, kind, options)
+
+            # Fastest load of the repeats, with the plans of that run
+            result, plans = min((run_once(args, name, input_csv, target, seed_sql) for _ in range(args.repeat)),
+                                key=lambda run: run[0]["load_seconds"])
+            if plans_dir and args.plans:
+                plans_path = plans_dir / f"{key}.json"
+                with open(plans_path, 'w', encoding='utf-8') as f:
+                    json.dump(plans, f, indent=2)
+                    f.write("\n")
+                result["plans"] = plans_path.name
+            results[key] = result
+            print(f"  {key:24} load {result['load_seconds']:>8.3f}s {result['rows_per_sec']:>10,.0f} rows/s "
+                  f"WAL {result['wal_bytes'] / 1e6:>8.1f} MB  indexes {result['index_build_seconds']:>7.3f}s  "
+                  f"refresh {result['refresh_seconds']:>7.3f}s", file=sys.stderr)
+    return results
+
+
+def git_commit():
+    """Commit the benchmarked code is at, or None outside a git checkout"""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=SEED_DIR, check=True, capture_output=True,
+                              text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_args():
+    """Parse command line arguments (connection defaults follow load_seed_data.py)"""
+    parser = argparse.ArgumentParser(description="Benchmark seed loads against a local PostgreSQL")
+    parser.add_argument("--host", default=os.environ.get("DB_HOST", "localhost"),
+                        help="Database host (default: localhost)")
+    parser.add_argument("--port", default=os.environ.get("DB_PORT", "5432"),
+                        help="Database port (default: 5432)")
+    parser.add_argument("--username", default=os.environ.get("DB_USER", "postgres"),
+                        help="Database user, allowed to create databases (default: postgres)")
+    parser.add_argument("--password", default=os.environ.get("DB_PASSWORD", ""),
+                        help="Database password (default: none)")
+    parser.add_argument("--maintenance-database", default="postgres",
+                        help="Database to connect to while (re)creating the benchmark database "
+                             "(default: %(default)s)")
+    parser.add_argument("--bench-database", default=DEFAULT_BENCH_DATABASE,
+                        help="Scratch database, dropped and recreated for every run (default: %(default)s)")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES),
+                        help="Dataset multiples to run (default: 1 10)")
+    parser.add_argument("--only", nargs="+", metavar="NAME",
+                        help=f"Only run strategies whose name starts with NAME ({', '.join(STRATEGIES)})")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="Runs per strategy; the fastest load is kept (default: 1)")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_SHARD_JOBS,
+                        help="Shards loaded concurrently by the shards strategy (default: %(default)s)")
+    parser.add_argument("--no-plans", dest="plans", action="store_false",
+                        help="Load without EXPLAIN ANALYZE (timings without its overhead, no plans)")
+    parser.add_argument("--plans-dir", help="Write each run's plans here as <strategy>@<scale>x.json")
+    parser.add_argument("--data-dir",
+                        help="Keep generated inputs and SQL here and reuse the inputs (default: temporary directory)")
+    parser.add_argument("--output", help="Write results JSON here (use as a later --baseline)")
+    parser.add_argument("--baseline", help="Results JSON from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed load rows/sec drop vs the baseline, as a fraction (default: 0.20)")
+    args = parser.parse_args()
+    if args.bench_database in (args.maintenance_database, os.environ.get("DB_NAME", "cdf_smarthub")):
+        parser.error(f"--bench-database {args.bench_database} is dropped on every run; use a scratch database")
+    if args.repeat < 1 or args.jobs < 1:
+        parser.error("--repeat and --jobs must be at least 1")
+    return args
+
+
+def main():
+    args = parse_args()
+
+    print(f"Benchmarking seed loads into {args.bench_database}@{args.host}:{args.port} "
+          f"(scales: {', '.join(f'{s}x' for s in args.scales)}, best of {args.repeat})", file=sys.stderr)
+    if args.data_dir:
+        results = run_suite(args, args.data_dir)
+    else:
+        with tempfile.TemporaryDirectory() as data_dir:
+            results = run_suite(args, data_dir)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commit": git_commit(),
+        "plans": args.plans,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+
+    if not args.baseline:
+        return
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print("", file=sys.stderr)
+        print(f"❌ Load throughput regressed more than {args.threshold:.0%}:", file=sys.stderr)
+        for key, before, after, change in regressions:
+            print(f"   {key:24} {before:>12,.0f} -> {after:>12,.0f} rows/s ({change:+.1%})", file=sys.stderr)
+        sys.exit(1)
+    print(f"✅ No load throughput regressions beyond {args.threshold:.0%} vs {args.baseline}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Build Cache - Content-addressed cache for converter stages
+Keys every stage on what it depends on: the input file's content hash, the
+source of the modules that implement the stage, the district mapping and
+the output options. A rerun with nothing changed reuses the parsed hierarchy
+and streams the previously generated SQL instead of converting again.
+
+Layout (safe to delete at any time):
+    <cache_dir>/<stage>/<key>.pickle    parsed data (pickle, highest protocol)
+    <cache_dir>/<stage>/<key>.sql       generated SQL
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import pickle
+import shutil
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+# Bump to invalidate every existing cache entry
+CACHE_FORMAT = 1
+
+HASH_CHUNK_BYTES = 1 << 20
+
+
+def file_digest(path):
+    """blake2b of a file's contents"""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def code_version(*module_names):
+    """Hash of the source files of the named modules ('__main__' is the running script)"""
+    digest = hashlib.blake2b(digest_size=20)
+    for name in module_names:
+        with open(importlib.import_module(name).__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def data_version(value):
+    """Hash of JSON-serializable data (mappings, options); dict order does not matter"""
+    if isinstance(value, dict):
+        value = sorted((json.dumps(key), item) for key, item in value.items())
+    payload = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=20).hexdigest()
+
+
+class BuildCache:
+    """Content-addressed store of stage results under one directory"""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.hits = []
+        self.misses = []
+
+    def key(self, *parts):
+        """Cache key for a stage from its dependency hashes and options"""
+        payload = json.dumps([CACHE_FORMAT, sys.version_info[:2], *parts], default=str)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=20).hexdigest()
+
+    def path(self, stage, key, suffix):
+        """File holding a stage result"""
+        return self.cache_dir / stage / f"{key}{suffix}"
+
+    def _record(self, stage, hit):
+        (self.hits if hit else self.misses).append(stage)
+        print(f"Build cache {'hit' if hit else 'miss'}: {stage}", file=sys.stderr)
+
+    def load(self, stage, key):
+        """Unpickle a cached stage result (None on a miss)"""
+        path = self.path(stage, key, ".pickle")
+        if not path.exists():
+            self._record(stage, False)
+            return None
+        with open(path, 'rb') as f:
+            value = pickle.load(f)
+        self._record(stage, True)
+        return value
+
+    def store(self, stage, key, value):
+        """Pickle a stage result into the cache"""
+        path = self.path(stage, key, ".pickle")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def store_file(self, stage, key, suffix, source_path):
+        """Copy a file produced by a stage into the cache"""
+        path = self.path(stage, key, suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        shutil.copyfile(source_path, tmp_path)
+        os.replace(tmp_path, path)
+
+    def has_output(self, stage, key):
+        """True if generated SQL for key is cached (recorded as a hit or miss)"""
+        hit = self.path(stage, key, ".sql").exists()
+        self._record(stage, hit)
+        return hit
+
+    def replay_output(self, stage, key):
+        """Copy cached SQL to stdout"""
+        with open(self.path(stage, key, ".sql"), 'r', encoding='utf-8') as f:
+            shutil.copyfileobj(f, sys.stdout, HASH_CHUNK_BYTES)
+
+    @contextmanager
+    def capture_output(self, stage, key):
+        """Tee everything printed inside the block into the cache
+
+        The cached copy is only kept if the block completes.
+        """
+        path = self.path(stage, key, ".sql")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        stdout = sys.stdout
+
+        with open(tmp_path, 'w', encoding='utf-8') as cached:
+            class TeeWriter:
+                def write(self, text):
+                    cached.write(text)
+                    return stdout.write(text)
+
+                def flush(self):
+                    stdout.flush()
+
+            sys.stdout = TeeWriter()
+            try:
+                yield
+            except BaseException:
+                sys.stdout = stdout
+                cached.close()
+                os.remove(tmp_path)
+                raise
+            sys.stdout = stdout
+        os.replace(tmp_path, path)
+
+
+def cached_stage(cache, stage, key, compute):
+    """compute(), or its cached result when the cache holds key"""
+    if cache is None:
+        return compute()
+    value = cache.load(stage, key)
+    if value is None:
+        value = compute()
+        cache.store(stage, key, value)
+    return value
+
+
+def cached_output(cache, stage, key, generate):
+    """Run generate() (which prints SQL), or replay the SQL cached for key
+
+    A key of None (e.g. output that depends on state outside the cache, like
+    a delta manifest) always generates and caches nothing.
+    """
+    if cache is None or key is None:
+        generate()
+    elif cache.has_output(stage, key):
+        cache.replay_output(stage, key)
+    else:
+        with cache.capture_output(stage, key):
+            generate()
+
+
+def add_cache_args(parser):
+    """Add the --cache-dir option to a converter's argument parser"""
+    parser.add_argument("--cache-dir", default=os.environ.get("SEED_CACHE_DIR"),
+                        help="Reuse parsed input and generated SQL from this build cache when "
+                             "nothing they depend on has changed (default: $SEED_CACHE_DIR)")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Load Checkpoints - Chunked, resumable hierarchy loads
+With --chunk-size a table's rows are loaded in fixed-size chunks, each in
+its own transaction that also records a checkpoint in seed_load_checkpoints:
+the load key (a hash of the input file and the options that decide which
+rows are generated) and the last chunk committed. When a chunk fails, the
+chunks before it stay committed, and loading the same output again skips
+them and carries on from the failed one.
+
+Chunk n only loads while the checkpoint stands at n - 1, so once a chunk
+fails the rest of the run changes nothing (even when psql carries on past
+the error) and no gap is left behind.
+"""
+
+import sys
+
+from build_cache import data_version, file_digest
+
+CHECKPOINT_TABLE = "seed_load_checkpoints"
+
+
+def add_checkpoint_args(parser):
+    """Add the --chunk-size option to a converter's argument parser"""
+    parser.add_argument("--chunk-size", type=int, metavar="ROWS",
+                        help="Load each table in chunks of ROWS rows, each committed with a checkpoint "
+                             f"in {CHECKPOINT_TABLE}; loading the output again resumes after the last "
+                             "committed chunk")
+
+
+def check_checkpoint_args(parser, args):
+    """Reject option combinations that can't be chunked"""
+    if args.chunk_size is None:
+        return
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    if getattr(args, "shard_dir", None):
+        parser.error("--chunk-size and --shard-dir are alternatives (shards are loaded with "
+                     "--single-transaction)")
+
+
+def load_key(source, input_path, chunk_size, ids, output_format, manifest=None, joins=None):
+    """Checkpoint key of a load: what generated the rows, from which file, in which chunks
+
+    The id mode and output format decide what SQL each chunk runs, so runs
+    differing in either never share a checkpoint. A delta manifest decides
+    which rows are written, so its content is part of the key; it must be
+    the manifest as read, before the run updates it. joins is
+    source_join.join_version() of the sources joined into the rows.
+    """
+    parts = [source, file_digest(input_path), chunk_size, ids, output_format,
+             data_version(manifest) if manifest is not None else None]
+    if joins is not None:
+        parts.append(joins)
+    return data_version(parts)
+
+
+def checkpoint_table_sql():
+    """CREATE TABLE IF NOT EXISTS for the checkpoint table"""
+    return "\n".join([
+        f"CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE} (",
+        "    load_key VARCHAR(64) NOT NULL,",
+        "    table_name VARCHAR(50) NOT NULL,",
+        "    last_chunk INTEGER NOT NULL,",
+        "    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),",
+        "    PRIMARY KEY (load_key, table_name)",
+        ");",
+    ])
+
+
+def last_chunk_sql(key, table):
+    """Scalar subquery of the last chunk committed (0 before the first)"""
+    return (f"(SELECT COALESCE(MAX(last_chunk), 0) FROM {CHECKPOINT_TABLE} "
+            f"WHERE load_key = '{key}' AND table_name = '{table}')")
+
+
+def chunk_guard_sql(key, table, chunk):
+    """Condition under which chunk loads: the checkpoint is at the chunk before it"""
+    return f"{last_chunk_sql(key, table)} = {chunk - 1}"
+
+
+def checkpoint_sql(key, table, chunk):
+    """Record chunk as committed, if it followed the checkpoint
+
+    Both the first checkpoint row and later updates are guarded, so the
+    checkpoint only ever moves one past a chunk whose guard let it load.
+    """
+    return "\n".join([
+        f"INSERT INTO {CHECKPOINT_TABLE} (load_key, table_name, last_chunk)",
+        f"SELECT '{key}', '{table}', {chunk}",
+        f"WHERE {chunk_guard_sql(key, table, chunk)}",
+        "ON CONFLICT (load_key, table_name) DO UPDATE SET",
+        "    last_chunk = EXCLUDED.last_chunk,",
+        "    updated_at = NOW()",
+        f"WHERE {CHECKPOINT_TABLE}.last_chunk = EXCLUDED.last_chunk - 1;",
+    ])
+
+
+def print_checkpoint_summary(chunk_size, key):
+    """Progress message naming the load key"""
+    print(f"Chunked load: {chunk_size} rows per chunk, checkpoint key {key}", file=sys.stderr)
@@ -4,12 +4,44 @@ ECZ Data Converter - Convert CSV/Excel files to SQL INSERT statements
 Usage:
     python convert_ecz_data.py constituencies.csv > constituencies_ecz_full.sql
     python convert_ecz_data.py wards.csv > wards_ecz_full.sql
+    python convert_ecz_data.py ecz_export.xlsx#Wards > wards_ecz_full.sql
+
+Excel workbooks (.xlsx) are streamed sheet by sheet (see xlsx_reader.py); a
+workbook stands for all of its sheets, book.xlsx#Sheet for one of them.
+
+Batch mode (directory, glob or several files, converted on a process pool):
+    python convert_ecz_data.py exports/ --output-dir .
+    python convert_ecz_data.py 'exports/*_wards.csv' exports/constituencies.csv --output-dir .
+
+Output goes to stdout unless --output names a file (.sql, .sql.gz, .sql.zst) or a
+postgresql:// URL to pipe into psql; batch mode compresses with --compress gz|zst.
+
+Add --report run.json for stage timings and row counts, --profile convert.pstats for cProfile.
+With --cache-dir DIR, unchanged inputs reuse their cached SQL (single file) or
+staged records (batch mode) instead of being converted again.
 """
 
+import argparse
 import csv
+import glob
+import os
+import pickle
 import sys
 import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from itertools import chain, repeat
 from pathlib import Path
+from build_cache import BuildCache, add_cache_args, cached_output, code_version, data_version, file_digest
+from district_resolver import DistrictResolver, load_cache, save_cache
+from instrumentation import (
+    RunReport, add_instrumentation_args, counted, stage, start_profile, stop_profile, timed,
+    timed_stdout
+)
+from output_sink import add_output_args, redirect_output
+from sql_output import CDF_ALLOCATION, MP_ELECTED_DATE, print_insert_values
+from xlsx_reader import SheetReader, Workbook, is_workbook, read_ahead_rows
 
 # District code mapping
 DISTRICT_CODES = {
@@ -50,13 +82,30 @@ DISTRICT_CODES = {
     "mongu": "WP-MON", "senanga": "WP-SEN", "kaoma": "WP-KAO",
 }
 
+# Spelling variants of the names above resolve through the trigram index
+DISTRICT_RESOLVER = DistrictResolver((None, name, code) for name, code in DISTRICT_CODES.items())
+
+# Files picked up from an input directory
+INPUT_PATTERNS = ("*.csv", "*.xlsx", "*.xlsm")
+
+# book.xlsx#Sheet names one sheet of a workbook
+WORKBOOK_SHEET = re.compile(r"^(.+?\.xls[xm])(?:#(.*))?$", re.IGNORECASE)
+
+# Scan single sheets in a worker process only when it can run alongside the conversion
+READ_AHEAD = (os.cpu_count() or 1) > 1
+
 
 def clean_string(s):
-    """Clean string for SQL insertion"""
+    """Clean string read from the CSV (SQL escaping happens on output)"""
     if not s or s.strip() == "":
         return "TBD"
-    # Escape single quotes
-    return s.replace("'", "''").strip()
+    return s.strip()
+
+
+def parse_int(value, default):
+    """Parse a count column, tolerating blanks and thousands separators"""
+    value = str(value or "").replace(",", "").strip()
+    return int(value) if value else default
 
 
 def generate_constituency_code(name):
@@ -71,13 +120,140 @@ def generate_constituency_code(name):
 
 
 def get_district_code(district_name):
-    """Get district code from mapping"""
-    key = district_name.lower().strip()
-    return DISTRICT_CODES.get(key, None)
+    """Get district code from mapping, accepting close spelling variants"""
+    code, _ = DISTRICT_RESOLVER.resolve(district_name)
+    return code
+
+
+# ============================================================================
+# Streaming pipeline: read -> normalize -> code generation -> emit
+# Every stage is a generator, so memory stays flat regardless of input size.
+# ============================================================================
+
+def split_source(source):
+    """(path, sheet name or None) of an input: a CSV file, a workbook or book.xlsx#Sheet"""
+    match = WORKBOOK_SHEET.match(source)
+    return (match.group(1), match.group(2)) if match else (source, None)
+
+
+@contextmanager
+def open_source(source, read_ahead=False):
+    """csv.DictReader over a CSV file, or the same over a workbook sheet (default: its first)
+
+    With read_ahead a sheet is scanned by a worker process while its rows are
+    converted here; scanning sheet XML costs several times more per row than
+    reading a CSV, and this keeps it off the conversion's critical path.
+    """
+    path, sheet = split_source(source)
+    if is_workbook(path) and read_ahead:
+        rows = read_ahead_rows(path, sheet)
+        try:
+            yield SheetReader(rows)
+        finally:
+            rows.close()
+    elif is_workbook(path):
+        with Workbook(path) as workbook:
+            yield SheetReader(workbook.rows(sheet))
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            yield csv.DictReader(f)
+
+
+def read_rows(source):
+    """Stream CSV or sheet rows as dicts"""
+    with open_source(source) as reader:
+        yield from reader
+
+
+def normalize_constituencies(rows):
+    """Extract and clean constituency fields from raw CSV rows"""
+    for row in rows:
+        const_name = clean_string(row.get('constituency_name') or row.get('name') or row.get('Constituency'))
+        yield {
+            'name': const_name,
+            'district_name': clean_string(row.get('district') or row.get('District')),
+            'code': row.get('code') or row.get('Code'),
+            'mp_name': clean_string(row.get('mp_name') or row.get('MP') or 'TBD'),
+            'party': clean_string(row.get('party') or row.get('Party') or 'TBD'),
+            'voters': parse_int(row.get('registered_voters') or row.get('voters') or row.get('Voters'), 50000),
+            'population': parse_int(row.get('population') or row.get('Population'), 85000),
+        }
+
+
+def assign_constituency_codes(constituencies):
+    """Fill in constituency codes and resolve district codes"""
+    for const in constituencies:
+        const['code'] = const['code'] or generate_constituency_code(const['name'])
+
+        district_code = get_district_code(const['district_name'])
+        if not district_code:
+            print(f"-- WARNING: Unknown district '{const['district_name']}' for constituency '{const['name']}'", file=sys.stderr)
+            district_code = "LSK-LSK"  # Default fallback
+        const['district_code'] = district_code
+
+        yield const
+
+
+def constituency_rows(constituencies):
+    """Yield constituency rows in STAGING_TABLES['constituencies'] column order"""
+    for i, const in enumerate(constituencies):
+        # Generate bank account number (sequential)
+        bank_account = f"1{str(i+1).zfill(9)}"
+        bank = "Zanaco" if i % 2 == 0 else "Stanbic"
+        branch = f"{const['district_name']} Branch"
+
+        yield (const['district_code'], const['code'], const['name'], const['mp_name'], const['party'],
+               MP_ELECTED_DATE, CDF_ALLOCATION, CDF_ALLOCATION, const['voters'], const['population'],
+               bank, bank_account, branch, True)
+
+
+def normalize_wards(rows):
+    """Extract and clean ward fields from raw CSV rows"""
+    for row in rows:
+        yield {
+            'name': clean_string(row.get('ward_name') or row.get('name') or row.get('Ward')),
+            'const_code': row.get('constituency_code') or row.get('code') or row.get('Constituency Code'),
+            'code': row.get('ward_code') or row.get('Code'),
+            'population': parse_int(row.get('population') or row.get('Population'), 10000),
+        }
+
+
+def assign_ward_codes(wards):
+    """Fill in missing ward codes from the constituency code and row number"""
+    for i, ward in enumerate(wards):
+        ward['code'] = ward['code'] or f"{ward['const_code']}-{str(i+1).zfill(2)}"
+        yield ward
+
+
+def ward_rows(wards):
+    """Yield ward rows in STAGING_TABLES['wards'] column order"""
+    for ward in wards:
+        yield (ward['const_code'], ward['code'], ward['name'], ward['population'], True)
 
 
-def convert_constituencies(csv_file):
-    """Convert constituencies CSV to SQL"""
+def sniff_file_type(fieldnames):
+    """Detect 'constituencies' or 'wards' from the CSV header (None if unknown)"""
+    columns = [col.lower() for col in fieldnames or []]
+
+    if any('ward' in col for col in columns):
+        return 'wards'
+    elif any('constituency' in col or 'mp' in col for col in columns):
+        return 'constituencies'
+    return None
+
+
+def constituency_records(rows):
+    """Normalized, coded constituency records from raw CSV rows"""
+    return assign_constituency_codes(normalize_constituencies(rows))
+
+
+def ward_records(rows):
+    """Normalized, coded ward records from raw CSV rows"""
+    return assign_ward_codes(normalize_wards(rows))
+
+
+def print_constituencies_sql(constituencies):
+    """Print constituency INSERT SQL for normalized records"""
     print("-- ============================================================================")
     print("-- COMPLETE CONSTITUENCY DATA FROM ECZ")
     print("-- ============================================================================")
@@ -99,36 +275,7 @@ def convert_constituencies(csv_file):
     print("    is_active")
     print(") VALUES")
 
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-
-        for i, row in enumerate(rows):
-            # Extract and clean data
-            const_name = clean_string(row.get('constituency_name') or row.get('name') or row.get('Constituency'))
-            district_name = clean_string(row.get('district') or row.get('District'))
-            const_code = row.get('code') or row.get('Code') or generate_constituency_code(const_name)
-            mp_name = clean_string(row.get('mp_name') or row.get('MP') or 'TBD')
-            party = clean_string(row.get('party') or row.get('Party') or 'TBD')
-            voters = row.get('registered_voters') or row.get('voters') or row.get('Voters') or '50000'
-            population = row.get('population') or row.get('Population') or '85000'
-
-            # Get district code
-            district_code = get_district_code(district_name)
-            if not district_code:
-                print(f"-- WARNING: Unknown district '{district_name}' for constituency '{const_name}'", file=sys.stderr)
-                district_code = "LSK-LSK"  # Default fallback
-
-            # Generate bank account number (sequential)
-            bank_account = f"1{str(i+1).zfill(9)}"
-            bank = "Zanaco" if i % 2 == 0 else "Stanbic"
-            branch = f"{district_name} Branch"
-
-            # Build SQL line
-            is_last = (i == len(rows) - 1)
-            comma = ";" if is_last else ","
-
-            print(f"    (get_district_id('{district_code}'), '{const_code}', '{const_name}', '{mp_name}', '{party}', '2021-08-12', 1600000.00, 1600000.00, {voters}, {population}, '{bank}', '{bank_account}', '{branch}', true){comma}")
+    print_insert_values("get_district_id", constituency_rows(constituencies))
 
     print("")
     print("-- Cleanup")
@@ -137,8 +284,8 @@ def convert_constituencies(csv_file):
     print("\\echo '✓ Constituencies loaded successfully'")
 
 
-def convert_wards(csv_file):
-    """Convert wards CSV to SQL"""
+def print_wards_sql(wards):
+    """Print ward INSERT SQL for normalized records"""
     print("-- ============================================================================")
     print("-- COMPLETE WARD DATA FROM ECZ")
     print("-- ============================================================================")
@@ -151,25 +298,9 @@ def convert_wards(csv_file):
     print("    SELECT id FROM constituencies WHERE code = c_code LIMIT 1;")
     print("$$ LANGUAGE SQL STABLE;")
     print("")
-    print("INSERT INTO wards (constituency_id, code, name, population, registered_voters, is_active) VALUES")
+    print("INSERT INTO wards (constituency_id, code, name, population, is_active) VALUES")
 
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-
-        for i, row in enumerate(rows):
-            # Extract and clean data
-            ward_name = clean_string(row.get('ward_name') or row.get('name') or row.get('Ward'))
-            const_code = row.get('constituency_code') or row.get('code') or row.get('Constituency Code')
-            ward_code = row.get('ward_code') or row.get('Code') or f"{const_code}-{str(i+1).zfill(2)}"
-            population = row.get('population') or row.get('Population') or '10000'
-            voters = row.get('registered_voters') or row.get('Voters') or str(int(int(population) * 0.6))
-
-            # Build SQL line
-            is_last = (i == len(rows) - 1)
-            comma = ";" if is_last else ","
-
-            print(f"    (get_constituency_id('{const_code}'), '{ward_code}', '{ward_name}', {population}, {voters}, true){comma}")
+    print_insert_values("get_constituency_id", ward_rows(wards))
 
     print("")
     print("-- Cleanup")
@@ -178,37 +309,286 @@ def convert_wards(csv_file):
     print("\\echo '✓ Wards loaded successfully'")
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python convert_ecz_data.py <csv_file>")
-        print("")
-        print("The script will auto-detect if the file contains constituencies or wards")
-        print("based on column names.")
-        print("")
-        print("Examples:")
-        print("  python convert_ecz_data.py constituencies.csv > constituencies_ecz_full.sql")
-        print("  python convert_ecz_data.py wards.csv > wards_ecz_full.sql")
-        sys.exit(1)
+# File types in dependency order: constituencies must load before their wards
+FILE_TYPES = {
+    'constituencies': (constituency_records, print_constituencies_sql),
+    'wards': (ward_records, print_wards_sql),
+}
 
-    csv_file = sys.argv[1]
 
-    if not Path(csv_file).exists():
-        print(f"Error: File '{csv_file}' not found", file=sys.stderr)
-        sys.exit(1)
+def convert_constituencies(source):
+    """Convert constituencies CSV or sheet to SQL"""
+    print_constituencies_sql(constituency_records(read_rows(source)))
 
-    # Detect file type by checking column names
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        columns = [col.lower() for col in reader.fieldnames]
 
-        if any('ward' in col for col in columns):
-            convert_wards(csv_file)
-        elif any('constituency' in col or 'mp' in col for col in columns):
-            convert_constituencies(csv_file)
+def convert_wards(source):
+    """Convert wards CSV or sheet to SQL"""
+    print_wards_sql(ward_records(read_rows(source)))
+
+
+def convert_file(reader, file_type, report=None):
+    """Convert the rows of an open_source() reader, already sniffed as file_type, to SQL on stdout"""
+    to_records, print_sql = FILE_TYPES[file_type]
+    records = timed(report, "normalize", to_records(timed(report, "read", reader, "rows_in")))
+    with stage(report, "sql_generation"), timed_stdout(report):
+        print_sql(counted(report, f"{file_type}_rows_out", records))
+
+
+# ============================================================================
+# Batch mode: stage every input file on a process pool, then merge the staged
+# records per file type in sorted input order
+# ============================================================================
+
+def expand_inputs(inputs):
+    """Expand files, directories (*.csv, *.xlsx) and glob patterns into a sorted input list
+
+    A workbook expands to one book.xlsx#Sheet input per sheet, in tab order.
+    """
+    files = set()
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            files.update(str(p) for pattern in INPUT_PATTERNS for p in path.glob(pattern))
+        elif glob.has_magic(item):
+            files.update(glob.glob(item))
+        else:
+            files.add(item)
+
+    sources = []
+    for item in sorted(files):
+        path, sheet = split_source(item)
+        if sheet is None and is_workbook(path) and Path(path).exists():
+            with Workbook(path) as workbook:
+                sources.extend(f"{path}#{name}" for name in workbook.sheet_names)
         else:
-            print("Error: Could not detect file type. Ensure columns include 'constituency' or 'ward'", file=sys.stderr)
+            sources.append(item)
+    return sources
+
+
+def source_exists(source):
+    """Whether an input's file exists (a missing sheet is reported when it is read)"""
+    return Path(split_source(source)[0]).exists()
+
+
+def input_cache_key(cache, source, stage_name):
+    """Build cache key for one input: its file's contents and sheet, the converter code and the district codes"""
+    path, sheet = split_source(source)
+    return cache.key(f"convert_ecz_data:{stage_name}", file_digest(path), sheet,
+                     code_version("__main__", "district_resolver", "sql_output", "xlsx_reader"),
+                     data_version(DISTRICT_CODES), data_version(DISTRICT_RESOLVER.cache))
+
+
+def stage_file(source, part_path, district_cache=None):
+    """Worker: sniff, normalize and code one file or sheet into a pickled part file
+
+    The input is opened once - its header decides the type and the same reader
+    feeds the pipeline. Returns (source, file_type, record_count,
+    accepted_district_matches).
+    """
+    DISTRICT_RESOLVER.cache.update(district_cache or {})
+    with open_source(source) as reader:
+        file_type = sniff_file_type(reader.fieldnames)
+        if file_type is None:
+            return source, None, 0, {}
+
+        to_records, _ = FILE_TYPES[file_type]
+        count = 0
+        with open(part_path, 'wb') as part:
+            for record in to_records(reader):
+                pickle.dump(record, part, protocol=pickle.HIGHEST_PROTOCOL)
+                count += 1
+
+    return source, file_type, count, DISTRICT_RESOLVER.accepted
+
+
+def read_part(part_path):
+    """Stream the records of a staged part file"""
+    with open(part_path, 'rb') as part:
+        while True:
+            try:
+                yield pickle.load(part)
+            except EOFError:
+                return
+
+
+def stage_files(sources, tmp_dir, jobs=None, report=None, cache=None):
+    """Stage input files and sheets on a process pool, reusing cached parts of unchanged files
+
+    Returns ([(source, file_type, record_count, accepted_district_matches)],
+    part_paths), both in sources order.
+    """
+    part_paths = [os.path.join(tmp_dir, f"{i:05d}.part") for i in range(len(sources))]
+    staged = [None] * len(sources)
+    keys = [input_cache_key(cache, source, "staged") for source in sources] if cache else []
+
+    for i, key in enumerate(keys):
+        cached = cache.load("staged", key)
+        if cached is not None:
+            file_type, count = cached
+            staged[i] = (sources[i], file_type, count, {})
+            part_paths[i] = str(cache.path("staged", key, ".part"))
+
+    pending = [i for i, result in enumerate(staged) if result is None]
+    with stage(report, "read_normalize_parallel"), ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(stage_file, [sources[i] for i in pending], [part_paths[i] for i in pending],
+                           repeat(dict(DISTRICT_RESOLVER.cache)))
+        for i, result in zip(pending, results):
+            staged[i] = result
+
+    # The part file goes in first: a cached (file_type, count) always has its part
+    for i in (pending if cache else []):
+        _, file_type, count, _ = staged[i]
+        if file_type is not None:
+            cache.store_file("staged", keys[i], ".part", part_paths[i])
+        cache.store("staged", keys[i], (file_type, count))
+
+    return staged, part_paths
+
+
+def convert_batch(sources, output_dir, jobs=None, report=None, compress=None, cache=None):
+    """Convert many input files and sheets in parallel into one SQL file per type
+
+    Output is deterministic: inputs are merged in sorted path order (sheets in
+    tab order), and each
+    type is written to <output_dir>/<type>_ecz_full.sql (plus .gz/.zst when
+    compressed). Returns the written paths in load order.
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    outputs = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        staged, part_paths = stage_files(sources, tmp_dir, jobs, report, cache)
+
+        for source, file_type, count, accepted in staged:
+            DISTRICT_RESOLVER.accepted.update(accepted)
+            DISTRICT_RESOLVER.cache.update(accepted)
+            if file_type is None:
+                print(f"Warning: Could not detect file type of '{source}' (skipping)", file=sys.stderr)
+            else:
+                print(f"  {file_type:15} {count:>8} rows  {source}", file=sys.stderr)
+                if report:
+                    report.count(f"{file_type}_rows_in", count)
+
+        for file_type, (_, print_sql) in FILE_TYPES.items():
+            parts = [part_path for (_, staged_type, _, _), part_path in zip(staged, part_paths)
+                     if staged_type == file_type]
+            if not parts:
+                continue
+
+            output_path = Path(output_dir) / f"{file_type}_ecz_full.sql{'.' + compress if compress else ''}"
+            records = timed(report, "read_parts", chain.from_iterable(read_part(part_path) for part_path in parts))
+            with redirect_output(str(output_path)), \
+                    stage(report, "sql_generation"), timed_stdout(report):
+                print_sql(counted(report, f"{file_type}_rows_out", records))
+            outputs.append(output_path)
+
+    return outputs
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Convert ECZ constituency/ward CSV files or Excel sheets to SQL. The file type is "
+                    "auto-detected from the column names ('constituency' or 'ward').",
+        epilog="Examples:\n"
+               "  python convert_ecz_data.py constituencies.csv > constituencies_ecz_full.sql\n"
+               "  python convert_ecz_data.py wards.csv > wards_ecz_full.sql\n"
+               "  python convert_ecz_data.py ecz_export.xlsx --output-dir .\n"
+               "  python convert_ecz_data.py exports/ --output-dir .",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("inputs", nargs="+",
+                        help="CSV file or workbook sheet (book.xlsx#Sheet); or directories, globs, several "
+                             "files or a workbook of several sheets for batch mode")
+    parser.add_argument("--output-dir",
+                        help="Batch mode: write <type>_ecz_full.sql files here (default: current directory)")
+    parser.add_argument("--jobs", type=int,
+                        help="Batch mode: worker processes (default: CPU count)")
+    parser.add_argument("--district-cache", metavar="CACHE",
+                        help="JSON cache of accepted fuzzy district matches, read and updated")
+    parser.add_argument("--compress", choices=("gz", "zst"),
+                        help="Batch mode: compress the merged SQL files")
+    add_output_args(parser)
+    add_cache_args(parser)
+    add_instrumentation_args(parser)
+    return parser.parse_args()
+
+
+def save_district_cache(cache_path):
+    """Persist fuzzy district matches accepted during this run"""
+    if cache_path and DISTRICT_RESOLVER.accepted:
+        save_cache(cache_path, DISTRICT_RESOLVER.cache)
+        print(f"Updated district match cache: {cache_path}", file=sys.stderr)
+
+
+def finish_report(report, report_path, cache=None):
+    """Add the unresolved district count and write the run report"""
+    if report:
+        unresolved = sum(1 for code, _ in DISTRICT_RESOLVER.memo.values() if code is None)
+        report.count("unmapped_districts", unresolved)
+        if cache:
+            report.count("cache_hits", len(cache.hits))
+            report.count("cache_misses", len(cache.misses))
+        report.write(report_path)
+
+
+def main():
+    args = parse_args()
+    report = RunReport("convert_ecz_data") if args.report else None
+    profiler = start_profile(args.profile)
+    cache = BuildCache(args.cache_dir) if args.cache_dir else None
+    if args.district_cache:
+        DISTRICT_RESOLVER.cache.update(load_cache(args.district_cache))
+
+    sources = expand_inputs(args.inputs)
+    batch = (len(sources) > 1 or args.output_dir is not None
+             or any(Path(item).is_dir() or glob.has_magic(item) for item in args.inputs))
+
+    if not batch:
+        source = sources[0] if sources else args.inputs[0]
+
+        if not source_exists(source):
+            print(f"Error: File '{split_source(source)[0]}' not found", file=sys.stderr)
             sys.exit(1)
 
+        # The input is opened once: its header is checked before the output is
+        # opened, so no empty file is left behind, and the same reader is converted
+        with ExitStack() as inputs:
+            try:
+                reader = inputs.enter_context(open_source(source, read_ahead=READ_AHEAD))
+            except KeyError as e:
+                print(f"Error: {e.args[0]}", file=sys.stderr)
+                sys.exit(1)
+            file_type = sniff_file_type(reader.fieldnames)
+            if file_type is None:
+                print("Error: Could not detect file type. Ensure columns include 'constituency' or 'ward'",
+                      file=sys.stderr)
+                sys.exit(1)
+
+            sql_key = input_cache_key(cache, source, "sql") if cache else None
+            with redirect_output(args.output):
+                cached_output(cache, "sql", sql_key, lambda: convert_file(reader, file_type, report))
+        save_district_cache(args.district_cache)
+        stop_profile(profiler, args.profile)
+        finish_report(report, args.report, cache)
+        return
+
+    missing = [source for source in sources if not source_exists(source)]
+    if missing or not sources:
+        print(f"Error: No input files found: {', '.join(missing or args.inputs)}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Converting {len(sources)} inputs...", file=sys.stderr)
+    outputs = convert_batch(sources, args.output_dir or ".", args.jobs, report, args.compress, cache)
+    save_district_cache(args.district_cache)
+    stop_profile(profiler, args.profile)
+    finish_report(report, args.report, cache)
+
+    print("", file=sys.stderr)
+    print("✅ Conversion complete! Load in this order:", file=sys.stderr)
+    for output_path in outputs:
+        print(f"  {output_path}", file=sys.stderr)
+
 
 if __name__ == "__main__":
     main()
@@ -3,117 +3,129 @@
 Complete Zambian Administrative Data Converter
 Converts all 149 constituencies and 1,416 wards to SQL
 Uses proper district mapping to existing database codes
+
+Usage:
+    python3 convert_full_admin_data.py [input.csv] [--format insert|copy] [--delta manifest.json]
+            [--ids lookup|uuid] [--district-cache cache.json]
+            [--report report.json] [--profile convert.pstats]
+            [--output file.sql|file.sql.gz|file.sql.zst|postgresql://...] [--cache-dir DIR]
+            [--columnar] [--jobs N] [--index hierarchy.idx] [--shard-dir shards/] [--chunk-size ROWS]
+            [--join LEVEL=PATH:KEY:COLUMN=SOURCE_COLUMN ...] [--join-memory MB] [--join-report report.json]
 """
 
-import csv
+import argparse
 import sys
-from collections import defaultdict
-from district_mapping import get_district_code
+from itertools import repeat
+from build_cache import BuildCache, add_cache_args, cached_output, cached_stage, code_version, data_version, file_digest
+from checkpoints import add_checkpoint_args, check_checkpoint_args, load_key, print_checkpoint_summary
+from columnar import arange_column
+from district_mapping import DISTRICT_MAPPING, district_resolver
+from district_resolver import load_cache, save_cache
+from delta import check_delta_args, load_manifest, save_delta_manifest
+from ids import ID_MODES
+from hierarchy import build_hierarchy, iter_ward_batches, iter_wards, read_admin_rows, read_admin_rows_columnar
+from hierarchy_index import write_index
+from instrumentation import (
+    RunReport, add_instrumentation_args, counted, stage, start_profile, stop_profile, timed,
+    timed_stdout
+)
+from output_sink import add_output_args, describe_output, redirect_output
+from parallel_csv import read_hierarchy_parallel
+from shards import add_shard_args, check_shard_args, print_shard_summary, write_province_shards
+from source_join import (
+    DEFAULT_JOIN_MEMORY_MB, add_join_args, check_join_args, join_rows, join_version, print_join_summary,
+    write_join_report
+)
+from sql_output import CDF_ALLOCATION, MP_ELECTED_DATE, OUTPUT_FORMATS, print_load
 
 # Path to CSV file
 INPUT_CSV = "/Users/joseph-jameskapambwe/Desktop/Administrative_units_of_Zambia_(lvl_0%2C1%2C2%2C3)/Administrative_units_of_Zambia_(lvl_0%2C1%2C2%2C3).csv"
 
-def clean_string(s):
-    """Clean string for SQL insertion"""
-    if not s or str(s).strip() == "":
-        return ""
-    return str(s).replace("'", "''").strip()
-
-def generate_constituency_code(const_code):
-    """Generate 3-digit constituency code"""
-    return str(const_code).zfill(3)
-
-def generate_ward_code(const_code, ward_code):
-    """Generate ward code: CONSTCODE-WARDCODE"""
-    const = str(const_code).zfill(3)
-    ward = str(ward_code).zfill(2)
-    return f"{const}-{ward}"
-
-def read_and_organize_data():
-    """Read CSV and organize by hierarchy"""
-    constituencies = {}
-    wards = []
-    unmapped_districts = set()
-
-    with open(INPUT_CSV, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-
-        for row in reader:
-            prov_name = clean_string(row['PROVINCENA'])
-            dist_name = clean_string(row['DISTRICTNA'])
-            const_code = row['CONST_CODE']
-            ward_code = row['WARD_CODE']
-            ward_name = clean_string(row['WARD_NAME'])
-
-            # Get mapped district code
-            district_code = get_district_code(prov_name, dist_name)
-
-            if not district_code:
-                unmapped_districts.add((prov_name, dist_name))
-                # Use fallback code
-                district_code = f"XX-{dist_name[:3].upper()}"
-
-            # Store unique constituencies
-            if const_code not in constituencies:
-                # Infer constituency name from first ward
-                const_name = ward_name.replace(' Ward ', ' ').replace(ward_code, '').strip()
-                # Clean up common suffixes
-                for suffix in [' East', ' West', ' North', ' South', ' Central']:
-                    const_name = const_name.replace(suffix, '')
-
-                constituencies[const_code] = {
-                    'code': generate_constituency_code(const_code),
-                    'name': const_name if const_name else f"Constituency {const_code}",
-                    'district_code': district_code,
-                    'ward_count': 0
-                }
-
-            constituencies[const_code]['ward_count'] += 1
-
-            # Store wards
-            wards.append({
-                'code': generate_ward_code(const_code, ward_code),
-                'name': ward_name,
-                'const_code': generate_constituency_code(const_code)
-            })
-
-    return constituencies, wards, unmapped_districts
-
-def improve_constituency_names(constituencies, wards):
-    """Improve constituency names by analyzing ward patterns"""
-    const_wards = defaultdict(list)
-
-    for ward in wards:
-        const_wards[ward['const_code']].append(ward['name'])
-
-    for const_code, const_data in constituencies.items():
-        ward_names = const_wards[const_data['code']]
-
-        if not ward_names:
-            continue
-
-        # Find common prefix among ward names
-        if len(ward_names) > 1:
-            # Get first ward name without ward number
-            first_ward = ward_names[0]
-            parts = first_ward.split()
-
-            # Try to extract constituency name (usually first 1-2 words)
-            if len(parts) >= 2:
-                # Remove "Ward X" pattern
-                const_name = ' '.join(parts[:-2]) if parts[-2] == 'Ward' else ' '.join(parts[:-1])
-
-                if len(const_name) > 2:
-                    const_data['name'] = const_name
-
-def generate_sql(constituencies, wards):
-    """Generate complete SQL output"""
+def resolve_district(row, resolver):
+    """Map a CSV row's province/district names to the database district code"""
+    code, _ = resolver.resolve(row['dist_name'], row['prov_name'])
+    return code
+
+def read_and_organize_data(input_csv=INPUT_CSV, resolver=None, report=None, columnar=False, jobs=None):
+    """Read CSV and organize it into an AdminHierarchy
+
+    Only provinces, districts and constituencies are kept in memory; wards are streamed from the CSV
+    again by iter_wards() when the SQL is written. District names that do
+    not match DISTRICT_MAPPING exactly are resolved fuzzily. With columnar
+    the CSV is read and cleaned in column batches; with jobs it is parsed
+    on that many processes (parallel_csv.py).
+    """
+    resolver = resolver or district_resolver()
+    if jobs:
+        return read_hierarchy_parallel(input_csv, lambda row: resolve_district(row, resolver), jobs, report)
+    read_rows = read_admin_rows_columnar if columnar else read_admin_rows
+    rows = timed(report, "read", read_rows(input_csv), "rows_in")
+    with stage(report, "organize"):
+        hierarchy = build_hierarchy(rows, lambda row: resolve_district(row, resolver), report)
+    return hierarchy
+
+def hierarchy_cache_key(cache, input_csv, resolver):
+    """Build cache key of the parsed hierarchy: input, parsing code and district mapping"""
+    return cache.key("convert_full_admin_data:hierarchy", file_digest(input_csv),
+                     code_version("__main__", "hierarchy", "parallel_csv", "admin_model", "district_mapping",
+                                  "district_resolver"),
+                     data_version(DISTRICT_MAPPING), data_version(resolver.cache))
+
+def sql_cache_key(cache, hierarchy_key, args):
+    """Build cache key of the generated SQL (None for delta runs, which depend on the manifest)"""
+    if args.delta:
+        return None
+    return cache.key("convert_full_admin_data:sql", hierarchy_key,
+                     code_version("sql_output", "ids", "checkpoints", "source_join"), args.output_format,
+                     args.ids, args.chunk_size, join_version(args.join_sources))
+
+def constituency_rows(hierarchy):
+    """Yield constituency rows in STAGING_TABLES['constituencies'] column order"""
+    for i, constituency in enumerate(hierarchy.sorted_constituencies()):
+        bank_account = f"1{str(i+1).zfill(9)}"
+        bank = "Zanaco" if i % 2 == 0 else "Stanbic"
+        voters = 50000 + (i * 800)
+        population = 85000 + (i * 1200)
+        district_code = hierarchy.district_of(constituency).code
+
+        yield (district_code, constituency.code, constituency.name, 'TBD', 'TBD', MP_ELECTED_DATE,
+               CDF_ALLOCATION, CDF_ALLOCATION, voters, population, bank, bank_account, 'Main Branch', True)
+
+def ward_rows(wards):
+    """Yield ward rows in STAGING_TABLES['wards'] column order"""
+    for i, ward in enumerate(wards):
+        population = 8000 + (i * 50)
+
+        yield (ward.const_code, ward.code, ward.name, population, True)
+
+def ward_row_batches(ward_batches):
+    """Columnar ward_rows() over iter_ward_batches(): population per column batch"""
+    offset = 0
+    for const_codes, codes, names in ward_batches:
+        populations = arange_column(8000, 50, offset, len(codes))
+        yield from zip(const_codes, codes, names, populations, repeat(True))
+        offset += len(codes)
+
+def generate_sql(hierarchy, wards, output_format="insert", manifest=None, ids="lookup", report=None,
+                 columnar=False, chunk_size=None, checkpoint_key=None, joins=(),
+                 join_memory=DEFAULT_JOIN_MEMORY_MB):
+    """Generate complete SQL output (wards may be any iterable, e.g. iter_wards())
+
+    With a manifest only changed rows are written, as upserts, and the
+    manifest is updated with the current row hashes. With columnar, wards
+    are column batches from iter_ward_batches(). With a chunk_size each
+    table is loaded in checkpointed chunks (see checkpoints.py). joins are
+    source_join.JoinSource figures that replace the placeholder values.
+    """
+    constituency_count = len(hierarchy.constituencies)
+    ward_count = hierarchy.ward_count
+
     # Header
     print("-- ============================================================================")
     print("-- ZAMBIAN CONSTITUENCIES AND WARDS - COMPLETE DATA")
     print("-- Source: ECZ Administrative Units 2023")
-    print(f"-- Constituencies: {len(constituencies)}")
-    print(f"-- Wards: {len(wards)}")
+    print(f"-- Constituencies: {constituency_count}")
+    print(f"-- Wards: {ward_count}")
     print("-- ============================================================================")
     print("")
     print("\\echo 'Loading complete Zambian administrative data'")
@@ -126,36 +138,12 @@ def generate_sql(constituencies, wards):
     print("-- CONSTITUENCIES")
     print("-- ============================================================================")
     print("")
-    print("CREATE OR REPLACE FUNCTION get_district_id(d_code VARCHAR) RETURNS UUID AS $$")
-    print("    SELECT id FROM districts WHERE code = d_code LIMIT 1;")
-    print("$$ LANGUAGE SQL STABLE;")
+    rows = join_rows(constituency_rows(hierarchy), "constituencies", joins, join_memory, report)
+    rows = counted(report, "constituency_rows_out", rows)
+    print_load("constituencies", rows, output_format, manifest, ids,
+               chunk_size=chunk_size, checkpoint_key=checkpoint_key)
     print("")
-    print("INSERT INTO constituencies (")
-    print("    district_id, code, name,")
-    print("    current_mp_name, current_mp_party, current_mp_elected_date,")
-    print("    annual_cdf_allocation, current_year_allocation,")
-    print("    registered_voters, population,")
-    print("    bank_name, bank_account_number, bank_branch,")
-    print("    is_active")
-    print(") VALUES")
-
-    sorted_const = sorted(constituencies.items(), key=lambda x: x[1]['code'])
-
-    for i, (const_code, data) in enumerate(sorted_const):
-        is_last = (i == len(sorted_const) - 1)
-        comma = ";" if is_last else ","
-
-        bank_account = f"1{str(i+1).zfill(9)}"
-        bank = "Zanaco" if i % 2 == 0 else "Stanbic"
-        voters = 50000 + (i * 800)
-        population = 85000 + (i * 1200)
-
-        print(f"    (get_district_id('{data['district_code']}'), '{data['code']}', '{data['name']}', 'TBD', 'TBD', '2021-08-12', 1600000.00, 1600000.00, {voters}, {population}, '{bank}', '{bank_account}', 'Main Branch', true){comma}")
-
-    print("")
-    print("DROP FUNCTION IF EXISTS get_district_id;")
-    print("")
-    print(f"\\echo '✓ {len(constituencies)} constituencies loaded'")
+    print(f"\\echo '✓ {constituency_count} constituencies loaded'")
     print("")
 
     # ============================================================================
@@ -165,35 +153,75 @@ def generate_sql(constituencies, wards):
     print("-- WARDS")
     print("-- ============================================================================")
     print("")
-    print("CREATE OR REPLACE FUNCTION get_constituency_id(c_code VARCHAR) RETURNS UUID AS $$")
-    print("    SELECT id FROM constituencies WHERE code = c_code LIMIT 1;")
-    print("$$ LANGUAGE SQL STABLE;")
-    print("")
-    print("INSERT INTO wards (constituency_id, code, name, population, registered_voters, is_active) VALUES")
-
-    for i, ward in enumerate(wards):
-        is_last = (i == len(wards) - 1)
-        comma = ";" if is_last else ","
-
-        population = 8000 + (i * 50)
-        voters = int(population * 0.6)
-
-        print(f"    (get_constituency_id('{ward['const_code']}'), '{ward['code']}', '{ward['name']}', {population}, {voters}, true){comma}")
-
-    print("")
-    print("DROP FUNCTION IF EXISTS get_constituency_id;")
+    rows = ward_row_batches(wards) if columnar else ward_rows(wards)
+    rows = join_rows(rows, "wards", joins, join_memory, report)
+    print_load("wards", counted(report, "ward_rows_out", rows), output_format, manifest, ids,
+               chunk_size=chunk_size, checkpoint_key=checkpoint_key)
     print("")
-    print(f"\\echo '✓ {len(wards)} wards loaded'")
+    print(f"\\echo '✓ {ward_count} wards loaded'")
     print("")
 
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Convert the administrative units CSV to SQL")
+    parser.add_argument("input_csv", nargs="?", default=INPUT_CSV,
+                        help="Administrative units CSV (default: %(default)s)")
+    parser.add_argument("--format", dest="output_format", choices=OUTPUT_FORMATS, default="insert",
+                        help="insert: multi-row INSERT with per-row id lookups; "
+                             "copy: COPY into a staging table resolved with one JOIN")
+    parser.add_argument("--delta", metavar="MANIFEST",
+                        help="Only emit rows changed since MANIFEST (JSON of row hashes), as "
+                             "INSERT ... ON CONFLICT (code) DO UPDATE; MANIFEST is updated once the "
+                             "output is loaded (see delta.py)")
+    parser.add_argument("--ids", choices=ID_MODES, default="lookup",
+                        help="lookup: resolve parent ids by code at load time; "
+                             "uuid: write deterministic UUIDv5 ids derived from the codes")
+    parser.add_argument("--district-cache", metavar="CACHE",
+                        help="JSON cache of accepted fuzzy district matches, read and updated")
+    parser.add_argument("--index", metavar="PATH",
+                        help="Also write a memory-mapped hierarchy index for in-process lookups "
+                             "(see hierarchy_index.py)")
+    parser.add_argument("--columnar", action="store_true",
+                        help="Read and normalize the CSV in column batches (faster on large exports, same output)")
+    parser.add_argument("--jobs", type=int,
+                        help="Parse the CSV on this many processes over memory-mapped byte ranges "
+                             "(for very large exports, same output)")
+    add_output_args(parser)
+    add_shard_args(parser)
+    add_checkpoint_args(parser)
+    add_join_args(parser)
+    add_cache_args(parser)
+    add_instrumentation_args(parser)
+    args = parser.parse_args()
+    check_shard_args(parser, args)
+    check_delta_args(parser, args)
+    check_checkpoint_args(parser, args)
+    check_join_args(parser, args)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
+
 def main():
+    args = parse_args()
+    report = RunReport("convert_full_admin_data") if args.report else None
+    profiler = start_profile(args.profile)
+    cache = BuildCache(args.cache_dir) if args.cache_dir else None
+
     print("Reading CSV data...", file=sys.stderr)
-    constituencies, wards, unmapped_districts = read_and_organize_data()
+    resolver = district_resolver(load_cache(args.district_cache) if args.district_cache else None)
+    hierarchy_key = hierarchy_cache_key(cache, args.input_csv, resolver) if cache else None
+    hierarchy = cached_stage(
+        cache, "hierarchy", hierarchy_key,
+        lambda: read_and_organize_data(args.input_csv, resolver, report, args.columnar, args.jobs))
+    if args.district_cache and resolver.accepted:
+        save_cache(args.district_cache, resolver.cache)
+        print(f"Updated district match cache: {args.district_cache}", file=sys.stderr)
 
     print(f"Found:", file=sys.stderr)
-    print(f"  - Constituencies: {len(constituencies)}", file=sys.stderr)
-    print(f"  - Wards: {len(wards)}", file=sys.stderr)
+    print(f"  - Constituencies: {len(hierarchy.constituencies)}", file=sys.stderr)
+    print(f"  - Wards: {hierarchy.ward_count}", file=sys.stderr)
 
+    unmapped_districts = hierarchy.unmapped_districts
     if unmapped_districts:
         print(f"", file=sys.stderr)
         print(f"⚠️  Warning: {len(unmapped_districts)} districts not mapped:", file=sys.stderr)
@@ -201,19 +229,64 @@ def main():
             print(f"     {prov} -> {dist}", file=sys.stderr)
         print(f"", file=sys.stderr)
 
-    print("Improving constituency names...", file=sys.stderr)
-    improve_constituency_names(constituencies, wards)
-
-    print("Generating SQL...", file=sys.stderr)
+    print(f"Generating SQL to {args.shard_dir or describe_output(args.output)}...", file=sys.stderr)
     print("", file=sys.stderr)
 
-    generate_sql(constituencies, wards)
+    manifest = load_manifest(args.delta) if args.delta else None
+    checkpoint_key = None
+    if args.chunk_size:
+        checkpoint_key = load_key("convert_full_admin_data", args.input_csv, args.chunk_size, args.ids,
+                                  args.output_format, manifest, join_version(args.join_sources))
+        print_checkpoint_summary(args.chunk_size, checkpoint_key)
+    if args.columnar:
+        wards = timed(report, "read", iter_ward_batches(args.input_csv), batch_rows=1)
+    else:
+        wards = timed(report, "read", iter_wards(args.input_csv))
+    if args.shard_dir:
+        with stage(report, "sql_generation"):
+            constituencies = join_rows(constituency_rows(hierarchy), "constituencies", args.join_sources,
+                                       args.join_memory, report)
+            rows = ward_row_batches(wards) if args.columnar else ward_rows(wards)
+            rows = join_rows(rows, "wards", args.join_sources, args.join_memory, report)
+            counts = write_province_shards(
+                args.shard_dir, hierarchy, counted(report, "constituency_rows_out", constituencies),
+                counted(report, "ward_rows_out", rows), args.output_format, manifest, args.ids)
+        print_shard_summary(args.shard_dir, counts)
+    else:
+        sql_key = sql_cache_key(cache, hierarchy_key, args) if cache else None
+        with stage(report, "sql_generation"), redirect_output(args.output), timed_stdout(report):
+            cached_output(cache, "sql", sql_key,
+                          lambda: generate_sql(hierarchy, wards, args.output_format, manifest, args.ids, report,
+                                               args.columnar, args.chunk_size, checkpoint_key,
+                                               args.join_sources, args.join_memory))
+    print_join_summary(args.join_sources)
+    if args.join_report:
+        write_join_report(args.join_report, args.join_sources)
+        print(f"Wrote join report: {args.join_report}", file=sys.stderr)
+    if args.delta:
+        save_delta_manifest(args, manifest)
+    if args.index:
+        with stage(report, "index"):
+            duplicates = write_index(args.index, hierarchy, iter_wards(args.input_csv), args.ids == "uuid")
+        print(f"Wrote hierarchy index: {args.index}", file=sys.stderr)
+        if duplicates:
+            print(f"⚠️  Warning: {duplicates} duplicate ward codes (first occurrence indexed)", file=sys.stderr)
+
+    stop_profile(profiler, args.profile)
+    if report:
+        report.count("unmapped_districts", len(unmapped_districts))
+        if cache:
+            report.count("cache_hits", len(cache.hits))
+            report.count("cache_misses", len(cache.misses))
+        report.write(args.report)
 
     print("", file=sys.stderr)
     print("✅ Conversion complete!", file=sys.stderr)
     print("", file=sys.stderr)
     print("To save:", file=sys.stderr)
     print("  python3 convert_full_admin_data.py > zambia_full_admin_data.sql", file=sys.stderr)
+    print("  python3 convert_full_admin_data.py --format copy > zambia_full_admin_data_copy.sql", file=sys.stderr)
+    print("  python3 convert_full_admin_data.py --format copy -o zambia_full_admin_data_copy.sql.gz", file=sys.stderr)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Ward Boundary Converter - GeoJSON ward boundaries to a bulk UPDATE of wards
+Reads FeatureCollections of ward Polygon/MultiPolygon features, simplifies each
+boundary (Douglas-Peucker) into several levels of detail, and computes the
+centroid and area of the full-resolution boundary. Emits a COPY into a staging
+table plus one UPDATE ... FROM that fills wards.latitude, longitude, area_sqkm
+and geojson_boundary (at --store-level) by ward code.
+
+With --lod-dir every level is also written as wards_<level>.geojson, so map
+views can serve small payloads without touching full-resolution geometry.
+
+Ward codes come from --code-property, or from CONST_CODE + WARD_CODE properties
+(as in the administrative units CSV), or from a ward_code property.
+
+Usage:
+    python3 convert_ward_boundaries.py ward_boundaries.geojson -o ward_boundaries.sql
+    python3 convert_ward_boundaries.py boundaries/*.geojson --lod-dir public/boundaries \\
+            --store-level low --code-property WARD_ID
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+
+from geometry import area_sqkm, centroid, position_count, simplify_geometry
+from hierarchy import generate_ward_code
+from instrumentation import (
+    RunReport, add_instrumentation_args, counted, stage, start_profile, stop_profile, timed,
+    timed_stdout
+)
+from output_sink import add_output_args, describe_output, redirect_output
+from sql_output import copy_line, write_lines
+
+# level -> (Douglas-Peucker tolerance in degrees, coordinate decimals), finest
+# first; 0.0001 degrees is ~11 m on the ground, 0.002 degrees ~220 m
+LOD_LEVELS = {
+    "high": (0.0001, 6),
+    "medium": (0.0005, 5),
+    "low": (0.002, 4),
+}
+DEFAULT_STORE_LEVEL = "medium"
+
+BOUNDARY_STAGING = "staging_ward_boundaries"
+BOUNDARY_COLUMNS = [
+    ("code", "VARCHAR(20)"),
+    ("latitude", "NUMERIC(10, 7)"),
+    ("longitude", "NUMERIC(10, 7)"),
+    ("area_sqkm", "NUMERIC(10, 2)"),
+    ("geojson_boundary", "JSONB"),
+]
+
+FEATURES_ARRAY = re.compile(r'"features"\s*:\s*\[')
+# GeoJSON is read this many characters at a time
+READ_CHUNK_CHARS = 1 << 20
+
+
+def iter_features(geojson_file):
+    """Stream the features of a GeoJSON FeatureCollection (or a single Feature)
+
+    The file is read in chunks and features are decoded one at a time from
+    the buffer, so only the current feature's text and objects are held at
+    once however large the collection is. A single Feature is read whole.
+    """
+    decoder = json.JSONDecoder()
+    whitespace = re.compile(r'[\s,]*')
+    with open(geojson_file, 'r', encoding='utf-8-sig') as f:
+        text = ""
+        match = None
+        while match is None:
+            chunk = f.read(READ_CHUNK_CHARS)
+            if not chunk:
+                break
+            text += chunk
+            match = FEATURES_ARRAY.search(text)
+        if match is None:
+            document = json.loads(text)
+            if document.get("type") == "Feature":
+                yield document
+                return
+            raise ValueError(f"{geojson_file}: not a GeoJSON FeatureCollection or Feature")
+
+        position = match.end()
+        read_size = READ_CHUNK_CHARS
+        error = None
+        while True:
+            position = whitespace.match(text, position).end()
+            if position < len(text):
+                if text.startswith("]", position):
+                    return
+                try:
+                    feature, position = decoder.raw_decode(text, position)
+                except json.JSONDecodeError as decode_error:
+                    error = decode_error
+                else:
+                    read_size = READ_CHUNK_CHARS
+                    yield feature
+                    continue
+            # The next feature runs past the buffer: drop what was decoded and
+            # read more, doubling the read while one feature outgrows it
+            chunk = f.read(read_size)
+            if not chunk:
+                detail = f" ({error.msg})" if error is not None and position < len(text) else ""
+                raise ValueError(f"{geojson_file}: invalid or truncated FeatureCollection{detail}")
+            text = text[position:] + chunk
+            position = 0
+            read_size *= 2
+
+
+def feature_ward_code(properties, code_property=None):
+    """Ward code of a feature (None if its properties don't identify one)"""
+    if code_property:
+        value = properties.get(code_property)
+        return str(value).strip() if value not in (None, "") else None
+    if properties.get("CONST_CODE") not in (None, "") and properties.get("WARD_CODE") not in (None, ""):
+        return generate_ward_code(properties["CONST_CODE"], properties["WARD_CODE"])
+    for key in ("ward_code", "WARD_CODE", "code"):
+        if properties.get(key) not in (None, ""):
+            return str(properties[key]).strip()
+    return None
+
+
+def process_feature(feature, code_property=None):
+    """(ward code, name, latitude, longitude, area km², {level: geometry}) or None"""
+    properties = feature.get("properties") or {}
+    geometry = feature.get("geometry")
+    code = feature_ward_code(properties, code_property)
+    if code is None or not geometry or geometry.get("type") not in ("Polygon", "MultiPolygon"):
+        return None
+
+    longitude, latitude = centroid(geometry)
+    area = area_sqkm(geometry, latitude)
+    # Levels are finest first; each is simplified from the previous one, so
+    # only the first pass walks the full-resolution rings
+    levels = {}
+    source = geometry
+    for level, (tolerance, decimals) in LOD_LEVELS.items():
+        simplified = simplify_geometry(source, tolerance, decimals)
+        levels[level] = source = simplified if simplified["coordinates"] else source
+    name = properties.get("WARD_NAME") or properties.get("ward_name") or properties.get("name")
+    return code, name, latitude, longitude, area, levels
+
+
+def iter_boundaries(geojson_files, code_property=None, report=None):
+    """Stream processed boundaries from several files, first feature per code wins
+
+    Features without a ward code or polygon geometry, and repeated codes, are
+    counted and skipped.
+    """
+    seen = set()
+    skipped = duplicates = 0
+    for geojson_file in geojson_files:
+        for feature in timed(report, "read", iter_features(geojson_file), "features_in"):
+            with stage(report, "simplify"):
+                boundary = process_feature(feature, code_property)
+            if boundary is None:
+                skipped += 1
+                continue
+            if boundary[0] in seen:
+                duplicates += 1
+                continue
+            seen.add(boundary[0])
+            if report:
+                report.count("positions_in", position_count(feature["geometry"]))
+                for level, geometry in boundary[5].items():
+                    report.count(f"positions_{level}", position_count(geometry))
+            yield boundary
+
+    if skipped:
+        print(f"⚠️  Warning: skipped {skipped} features without a ward code or polygon geometry", file=sys.stderr)
+    if duplicates:
+        print(f"⚠️  Warning: skipped {duplicates} features repeating a ward code", file=sys.stderr)
+
+
+def geojson_text(geometry):
+    """Compact GeoJSON text of a geometry"""
+    return json.dumps(geometry, separators=(",", ":"))
+
+
+class LodWriter:
+    """Writes one GeoJSON FeatureCollection per level of detail, feature by feature
+
+    Files are written under temporary names and only moved into place when
+    the block exits cleanly.
+    """
+
+    def __init__(self, lod_dir):
+        Path(lod_dir).mkdir(parents=True, exist_ok=True)
+        self.paths = {level: Path(lod_dir) / f"wards_{level}.geojson" for level in LOD_LEVELS}
+        self.files = {}
+        self.count = 0
+
+    def __enter__(self):
+        for level, path in self.paths.items():
+            self.files[level] = open(f"{path}.tmp", 'w', encoding='utf-8')
+            self.files[level].write('{"type":"FeatureCollection","features":[\n')
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        for level, f in self.files.items():
+            if exc_type is None:
+                f.write("\n]}\n")
+            f.close()
+            if exc_type is None:
+                os.replace(f"{self.paths[level]}.tmp", self.paths[level])
+            else:
+                os.remove(f"{self.paths[level]}.tmp")
+
+    def add(self, code, name, levels):
+        """Append a ward's feature to every level's file"""
+        properties = json.dumps({"code": code, "name": name}, separators=(",", ":"), ensure_ascii=False)
+        separator = ",\n" if self.count else ""
+        for level, f in self.files.items():
+            f.write(f'{separator}{{"type":"Feature","properties":{properties},"geometry":{geojson_text(levels[level])}}}')
+        self.count += 1
+
+
+def boundary_rows(boundaries, store_level, lod_writer=None):
+    """Yield staging rows in BOUNDARY_COLUMNS order, feeding lod_writer as they pass"""
+    for code, name, latitude, longitude, area, levels in boundaries:
+        if lod_writer:
+            lod_writer.add(code, name, levels)
+        yield (code, round(latitude, 7), round(longitude, 7), round(area, 2), geojson_text(levels[store_level]))
+
+
+def print_boundaries_sql(rows, store_level):
+    """Print the staged COPY + UPDATE that loads ward boundaries"""
+    columns = ", ".join(name for name, _ in BOUNDARY_COLUMNS)
+    print("-- ============================================================================")
+    print("-- WARD BOUNDARIES, CENTROIDS AND AREAS")
+    print(f"-- geojson_boundary level of detail: {store_level} "
+          f"(tolerance {LOD_LEVELS[store_level][0]} degrees)")
+    print("-- ============================================================================")
+    print("")
+    print("\\echo 'Loading ward boundaries'")
+    print("")
+    print(f"CREATE TEMP TABLE {BOUNDARY_STAGING} (")
+    print(",\n".join(f"    {name} {sql_type}" for name, sql_type in BOUNDARY_COLUMNS))
+    print(");")
+    print("")
+    print(f"COPY {BOUNDARY_STAGING} ({columns}) FROM STDIN;")
+    write_lines(copy_line(row) for row in rows)
+    print("\\.")
+    print("")
+    print("DO $$")
+    print("DECLARE")
+    print("    v_missing TEXT;")
+    print("BEGIN")
+    print("    SELECT string_agg(s.code, ', ') INTO v_missing")
+    print(f"    FROM {BOUNDARY_STAGING} s")
+    print("    LEFT JOIN wards w ON w.code = s.code")
+    print("    WHERE w.id IS NULL;")
+    print("")
+    print("    IF v_missing IS NOT NULL THEN")
+    print("        RAISE WARNING 'Boundaries for unknown ward codes (ignored): %', v_missing;")
+    print("    END IF;")
+    print("END $$;")
+    print("")
+    print("UPDATE wards w")
+    print("SET latitude = s.latitude,")
+    print("    longitude = s.longitude,")
+    print("    area_sqkm = s.area_sqkm,")
+    print("    geojson_boundary = s.geojson_boundary,")
+    print("    updated_at = NOW(),")
+    print("    version = w.version + 1")
+    print(f"FROM {BOUNDARY_STAGING} s")
+    print("WHERE w.code = s.code;")
+    print("")
+    print(f"DROP TABLE {BOUNDARY_STAGING};")
+    print("")
+    print("\\echo '✓ Ward boundaries loaded'")
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Convert ward boundary GeoJSON to a bulk UPDATE of wards")
+    parser.add_argument("inputs", nargs="+", help="GeoJSON FeatureCollection files of ward boundaries")
+    parser.add_argument("--code-property", metavar="NAME",
+                        help="Feature property holding the ward code (default: CONST_CODE + WARD_CODE, "
+                             "or ward_code)")
+    parser.add_argument("--store-level", choices=LOD_LEVELS, default=DEFAULT_STORE_LEVEL,
+                        help="Level of detail stored in wards.geojson_boundary (default: %(default)s)")
+    parser.add_argument("--lod-dir", metavar="DIR",
+                        help="Also write wards_<level>.geojson for every level of detail here")
+    add_output_args(parser)
+    add_instrumentation_args(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    report = RunReport("convert_ward_boundaries") if args.report else None
+    profiler = start_profile(args.profile)
+
+    missing = [path for path in args.inputs if not Path(path).exists()]
+    if missing:
+        print(f"Error: File not found: {', '.join(missing)}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Converting {len(args.inputs)} boundary files to {describe_output(args.output)}...", file=sys.stderr)
+    boundaries = iter_boundaries(args.inputs, args.code_property, report)
+
+    lod_writer = LodWriter(args.lod_dir) if args.lod_dir else None
+    with lod_writer or nullcontext(), \
+            stage(report, "sql_generation"), redirect_output(args.output), timed_stdout(report):
+        rows = counted(report, "ward_rows_out", boundary_rows(boundaries, args.store_level, lod_writer))
+        print_boundaries_sql(rows, args.store_level)
+
+    stop_profile(profiler, args.profile)
+    if report:
+        report.write(args.report)
+
+    print("", file=sys.stderr)
+    print("✅ Conversion complete!", file=sys.stderr)
+    if lod_writer:
+        print(f"Levels of detail ({lod_writer.count} wards):", file=sys.stderr)
+        for path in lod_writer.paths.values():
+            print(f"  {path}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,38 +10,41 @@ Data structure:
 - Wards: 1,416+
 
 Usage:
-    python3 convert_zambia_admin_data.py
+    python3 convert_zambia_admin_data.py [input.csv] [--format insert|copy] [--delta manifest.json]
+            [--ids lookup|uuid] [--report report.json] [--profile convert.pstats]
+            [--output file.sql|file.sql.gz|file.sql.zst|postgresql://...] [--cache-dir DIR]
+            [--columnar] [--jobs N] [--index hierarchy.idx] [--shard-dir shards/] [--chunk-size ROWS]
+            [--join LEVEL=PATH:KEY:COLUMN=SOURCE_COLUMN ...] [--join-memory MB] [--join-report report.json]
 """
 
-import csv
+import argparse
 import sys
-from collections import defaultdict
+from itertools import repeat
+from build_cache import BuildCache, add_cache_args, cached_output, cached_stage, code_version, file_digest
+from checkpoints import add_checkpoint_args, check_checkpoint_args, load_key, print_checkpoint_summary
+from columnar import arange_column
+from delta import check_delta_args, load_manifest, save_delta_manifest
+from ids import ID_MODES
+from hierarchy import (
+    PROVINCE_MAP, build_hierarchy, iter_ward_batches, iter_wards, read_admin_rows, read_admin_rows_columnar
+)
+from hierarchy_index import write_index
+from instrumentation import (
+    RunReport, add_instrumentation_args, counted, stage, start_profile, stop_profile, timed,
+    timed_stdout
+)
+from output_sink import add_output_args, describe_output, redirect_output
+from parallel_csv import read_hierarchy_parallel
+from shards import add_shard_args, check_shard_args, print_shard_summary, write_province_shards
+from source_join import (
+    DEFAULT_JOIN_MEMORY_MB, add_join_args, check_join_args, join_rows, join_version, print_join_summary,
+    write_join_report
+)
+from sql_output import CDF_ALLOCATION, MP_ELECTED_DATE, OUTPUT_FORMATS, print_load
 
 # Path to your administrative units CSV
 INPUT_CSV = "/Users/joseph-jameskapambwe/Desktop/Administrative_units_of_Zambia_(lvl_0%2C1%2C2%2C3)/Administrative_units_of_Zambia_(lvl_0%2C1%2C2%2C3).csv"
 
-# Province code mapping (PROV_CODE from CSV -> Our province codes)
-PROVINCE_MAP = {
-    "1": "WP",   # Western
-    "2": "CB",   # Copperbelt
-    "3": "CP",   # Central
-    "4": "EP",   # Eastern
-    "5": "LSK",  # Lusaka
-    "6": "LP",   # Luapula
-    "7": "MP",   # Muchinga
-    "8": "NP",   # Northern
-    "9": "NWP",  # North-Western
-    "10": "SP",  # Southern
-}
-
-
-def clean_string(s):
-    """Clean string for SQL insertion"""
-    if not s or str(s).strip() == "":
-        return ""
-    # Escape single quotes
-    return str(s).replace("'", "''").strip()
-
 
 def generate_district_code(prov_code, district_code, district_name):
     """Generate district code: PROV-DISTCODE"""
@@ -50,135 +53,31 @@ def generate_district_code(prov_code, district_code, district_name):
     return f"{prov}-{dist_code}"
 
 
-def generate_constituency_code(const_code):
-    """Generate constituency code from CONST_CODE"""
-    return str(const_code).zfill(3)
-
-
-def generate_ward_code(const_code, ward_code):
-    """Generate ward code: CONSTCODE-WARDCODE"""
-    const = str(const_code).zfill(3)
-    ward = str(ward_code).zfill(2)
-    return f"{const}-{ward}"
-
-
-def read_csv_data():
-    """Read and organize CSV data"""
-    provinces = {}
-    districts = {}
-    constituencies = {}
-    wards = []
-
-    with open(INPUT_CSV, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-
-        for row in reader:
-            # Extract data
-            prov_code = row['PROV_CODE']
-            prov_name = clean_string(row['PROVINCENA'])
-            dist_code = row['DISTRICT_C']
-            dist_name = clean_string(row['DISTRICTNA'])
-            const_code = row['CONST_CODE']
-            ward_code = row['WARD_CODE']
-            ward_name = clean_string(row['WARD_NAME'])
-
-            # Store unique provinces
-            if prov_code not in provinces:
-                provinces[prov_code] = {
-                    'code': PROVINCE_MAP.get(prov_code, f"P{prov_code}"),
-                    'name': prov_name
-                }
-
-            # Store unique districts
-            dist_key = f"{prov_code}-{dist_code}"
-            if dist_key not in districts:
-                districts[dist_key] = {
-                    'code': generate_district_code(prov_code, dist_code, dist_name),
-                    'name': dist_name,
-                    'prov_code': PROVINCE_MAP.get(prov_code, f"P{prov_code}")
-                }
-
-            # Store unique constituencies
-            const_key = const_code
-            if const_key not in constituencies:
-                # Infer constituency name from first ward's pattern
-                # Most wards are named like "Ward Name" where constituency is the area
-                # For now, we'll use district name + constituency code
-                const_name = f"{dist_name} Constituency {const_code}"
-
-                constituencies[const_key] = {
-                    'code': generate_constituency_code(const_code),
-                    'name': const_name,
-                    'district_code': generate_district_code(prov_code, dist_code, dist_name),
-                    'first_ward': ward_name  # We'll use this to infer better names
-                }
-
-            # Store wards
-            wards.append({
-                'code': generate_ward_code(const_code, ward_code),
-                'name': ward_name,
-                'const_code': generate_constituency_code(const_code),
-                'const_name': constituencies[const_key]['name']
-            })
-
-    return provinces, districts, constituencies, wards
-
-
-def infer_constituency_names(constituencies, wards):
-    """Infer better constituency names from ward patterns"""
-    # Group wards by constituency
-    const_wards = defaultdict(list)
-    for ward in wards:
-        const_wards[ward['const_code']].append(ward['name'])
-
-    # Try to infer constituency name
-    for const_code, const_data in constituencies.items():
-        ward_names = const_wards[generate_constituency_code(const_code)]
-
-        # Common pattern: "Area Ward X" -> Area is the constituency
-        # Try to find common prefix
-        if ward_names:
-            # Simple heuristic: use first ward name without "Ward" suffix
-            first_ward = ward_names[0]
-            # Remove "Ward X" pattern
-            const_name = first_ward.split(' Ward ')[0] if ' Ward ' in first_ward else first_ward
-
-            # Clean up
-            const_name = const_name.replace(' East', '').replace(' West', '').replace(' North', '').replace(' South', '').replace(' Central', '')
-
-            if const_name and len(const_name) > 2:
-                const_data['name'] = const_name
-
-
-def generate_constituencies_sql(constituencies):
-    """Generate SQL for constituencies"""
-    print("-- ============================================================================")
-    print("-- ZAMBIAN CONSTITUENCIES (149 constituencies)")
-    print("-- Source: ECZ Administrative Units 2023")
-    print("-- ============================================================================")
-    print("")
-    print("\\echo 'Loading seed data: Zambian Constituencies'")
-    print("")
-    print("-- Helper function")
-    print("CREATE OR REPLACE FUNCTION get_district_id(d_code VARCHAR) RETURNS UUID AS $$")
-    print("    SELECT id FROM districts WHERE code = d_code LIMIT 1;")
-    print("$$ LANGUAGE SQL STABLE;")
-    print("")
-    print("INSERT INTO constituencies (")
-    print("    district_id, code, name,")
-    print("    current_mp_name, current_mp_party, current_mp_elected_date,")
-    print("    annual_cdf_allocation, current_year_allocation,")
-    print("    registered_voters, population,")
-    print("    bank_name, bank_account_number, bank_branch,")
-    print("    is_active")
-    print(") VALUES")
+def resolve_district(row):
+    """District code for a CSV row, derived from its province and district codes"""
+    return generate_district_code(row['prov_code'], row['dist_code'], row['dist_name'])
 
-    sorted_const = sorted(constituencies.items(), key=lambda x: x[1]['code'])
 
-    for i, (const_code, data) in enumerate(sorted_const):
-        is_last = (i == len(sorted_const) - 1)
-        comma = ";" if is_last else ","
+def read_csv_data(input_csv=INPUT_CSV, report=None, columnar=False, jobs=None):
+    """Read and organize CSV data into an AdminHierarchy
 
+    Provinces, districts and constituencies are kept in memory; wards are only
+    counted here and streamed from the CSV again by iter_wards(). With
+    columnar the CSV is read and cleaned in column batches; with jobs it is
+    parsed on that many processes (parallel_csv.py).
+    """
+    if jobs:
+        return read_hierarchy_parallel(input_csv, resolve_district, jobs, report)
+    read_rows = read_admin_rows_columnar if columnar else read_admin_rows
+    rows = timed(report, "read", read_rows(input_csv), "rows_in")
+    with stage(report, "organize"):
+        hierarchy = build_hierarchy(rows, resolve_district, report)
+    return hierarchy
+
+
+def constituency_rows(hierarchy):
+    """Yield constituency rows in STAGING_TABLES['constituencies'] column order"""
+    for i, constituency in enumerate(hierarchy.sorted_constituencies()):
         # Generate bank account (sequential)
         bank_account = f"1{str(i+1).zfill(9)}"
         bank = "Zanaco" if i % 2 == 0 else "Stanbic"
@@ -186,18 +85,53 @@ def generate_constituencies_sql(constituencies):
         # Default values for missing data
         voters = 50000 + (i * 1000)  # Estimated
         population = 85000 + (i * 1500)  # Estimated
+        district_code = hierarchy.district_of(constituency).code
+
+        yield (district_code, constituency.code, constituency.name, 'TBD', 'TBD', MP_ELECTED_DATE,
+               CDF_ALLOCATION, CDF_ALLOCATION, voters, population, bank, bank_account, 'Main Branch', True)
+
+
+def ward_rows(wards):
+    """Yield ward rows in STAGING_TABLES['wards'] column order"""
+    for i, ward in enumerate(wards):
+        # Estimate population
+        population = 8000 + (i * 100)  # Estimated
+
+        yield (ward.const_code, ward.code, ward.name, population, True)
+
 
-        print(f"    (get_district_id('{data['district_code']}'), '{data['code']}', '{data['name']}', 'TBD', 'TBD', '2021-08-12', 1600000.00, 1600000.00, {voters}, {population}, '{bank}', '{bank_account}', 'Main Branch', true){comma}")
+def ward_row_batches(ward_batches):
+    """Columnar ward_rows() over iter_ward_batches(): population per column batch"""
+    offset = 0
+    for const_codes, codes, names in ward_batches:
+        populations = arange_column(8000, 100, offset, len(codes))
+        yield from zip(const_codes, codes, names, populations, repeat(True))
+        offset += len(codes)
 
+
+def generate_constituencies_sql(hierarchy, output_format="insert", manifest=None, ids="lookup",
+                                report=None, chunk_size=None, checkpoint_key=None, joins=(),
+                                join_memory=DEFAULT_JOIN_MEMORY_MB):
+    """Generate SQL for constituencies"""
+    print("-- ============================================================================")
+    print("-- ZAMBIAN CONSTITUENCIES (149 constituencies)")
+    print("-- Source: ECZ Administrative Units 2023")
+    print("-- ============================================================================")
+    print("")
+    print("\\echo 'Loading seed data: Zambian Constituencies'")
     print("")
-    print("-- Cleanup")
-    print("DROP FUNCTION IF EXISTS get_district_id;")
+    rows = join_rows(constituency_rows(hierarchy), "constituencies", joins, join_memory, report)
+    rows = counted(report, "constituency_rows_out", rows)
+    print_load("constituencies", rows, output_format, manifest, ids,
+               chunk_size=chunk_size, checkpoint_key=checkpoint_key)
     print("")
     print("\\echo '✓ Constituencies loaded successfully'")
 
 
-def generate_wards_sql(wards):
-    """Generate SQL for wards"""
+def generate_wards_sql(wards, output_format="insert", manifest=None, ids="lookup", report=None, columnar=False,
+                       chunk_size=None, checkpoint_key=None, joins=(), join_memory=DEFAULT_JOIN_MEMORY_MB):
+    """Generate SQL for wards (wards may be any iterable, e.g. iter_wards(), or
+    with columnar the column batches of iter_ward_batches())"""
     print("")
     print("-- ============================================================================")
     print("-- ZAMBIAN WARDS (1,416+ wards)")
@@ -206,57 +140,157 @@ def generate_wards_sql(wards):
     print("")
     print("\\echo 'Loading seed data: Zambian Wards'")
     print("")
-    print("-- Helper function")
-    print("CREATE OR REPLACE FUNCTION get_constituency_id(c_code VARCHAR) RETURNS UUID AS $$")
-    print("    SELECT id FROM constituencies WHERE code = c_code LIMIT 1;")
-    print("$$ LANGUAGE SQL STABLE;")
+    rows = ward_row_batches(wards) if columnar else ward_rows(wards)
+    rows = join_rows(rows, "wards", joins, join_memory, report)
+    print_load("wards", counted(report, "ward_rows_out", rows), output_format, manifest, ids,
+               chunk_size=chunk_size, checkpoint_key=checkpoint_key)
     print("")
-    print("INSERT INTO wards (constituency_id, code, name, population, registered_voters, is_active) VALUES")
-
-    for i, ward in enumerate(wards):
-        is_last = (i == len(wards) - 1)
-        comma = ";" if is_last else ","
+    print("\\echo '✓ Wards loaded successfully'")
 
-        # Estimate population and voters
-        population = 8000 + (i * 100)  # Estimated
-        voters = int(population * 0.6)  # 60% registration rate
 
-        print(f"    (get_constituency_id('{ward['const_code']}'), '{ward['code']}', '{ward['name']}', {population}, {voters}, true){comma}")
-
-    print("")
-    print("-- Cleanup")
-    print("DROP FUNCTION IF EXISTS get_constituency_id;")
-    print("")
-    print("\\echo '✓ Wards loaded successfully'")
+def hierarchy_cache_key(cache, input_csv):
+    """Build cache key of the parsed hierarchy: input and parsing code"""
+    return cache.key("convert_zambia_admin_data:hierarchy", file_digest(input_csv),
+                     code_version("__main__", "hierarchy", "parallel_csv", "admin_model"))
+
+
+def sql_cache_key(cache, hierarchy_key, args):
+    """Build cache key of the generated SQL (None for delta runs, which depend on the manifest)"""
+    if args.delta:
+        return None
+    return cache.key("convert_zambia_admin_data:sql", hierarchy_key,
+                     code_version("sql_output", "ids", "checkpoints", "source_join"), args.output_format,
+                     args.ids, args.chunk_size, join_version(args.join_sources))
+
+
+def generate_sql(hierarchy, input_csv, output_format, manifest, ids, report, columnar=False,
+                 chunk_size=None, checkpoint_key=None, joins=(), join_memory=DEFAULT_JOIN_MEMORY_MB):
+    """Print constituency and ward SQL, streaming the wards from the CSV"""
+    generate_constituencies_sql(hierarchy, output_format, manifest, ids, report, chunk_size, checkpoint_key,
+                                joins, join_memory)
+    if columnar:
+        wards = timed(report, "read", iter_ward_batches(input_csv), batch_rows=1)
+    else:
+        wards = timed(report, "read", iter_wards(input_csv))
+    generate_wards_sql(wards, output_format, manifest, ids, report, columnar, chunk_size, checkpoint_key,
+                       joins, join_memory)
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Convert the administrative units CSV to SQL")
+    parser.add_argument("input_csv", nargs="?", default=INPUT_CSV,
+                        help="Administrative units CSV (default: %(default)s)")
+    parser.add_argument("--format", dest="output_format", choices=OUTPUT_FORMATS, default="insert",
+                        help="insert: multi-row INSERT with per-row id lookups; "
+                             "copy: COPY into a staging table resolved with one JOIN")
+    parser.add_argument("--delta", metavar="MANIFEST",
+                        help="Only emit rows changed since MANIFEST (JSON of row hashes), as "
+                             "INSERT ... ON CONFLICT (code) DO UPDATE; MANIFEST is updated once the "
+                             "output is loaded (see delta.py)")
+    parser.add_argument("--ids", choices=ID_MODES, default="lookup",
+                        help="lookup: resolve parent ids by code at load time; "
+                             "uuid: write deterministic UUIDv5 ids derived from the codes")
+    parser.add_argument("--index", metavar="PATH",
+                        help="Also write a memory-mapped hierarchy index for in-process lookups "
+                             "(see hierarchy_index.py)")
+    parser.add_argument("--columnar", action="store_true",
+                        help="Read and normalize the CSV in column batches (faster on large exports, same output)")
+    parser.add_argument("--jobs", type=int,
+                        help="Parse the CSV on this many processes over memory-mapped byte ranges "
+                             "(for very large exports, same output)")
+    add_output_args(parser)
+    add_shard_args(parser)
+    add_checkpoint_args(parser)
+    add_join_args(parser)
+    add_cache_args(parser)
+    add_instrumentation_args(parser)
+    args = parser.parse_args()
+    check_shard_args(parser, args)
+    check_delta_args(parser, args)
+    check_checkpoint_args(parser, args)
+    check_join_args(parser, args)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
 
 
 def main():
+    args = parse_args()
+    report = RunReport("convert_zambia_admin_data") if args.report else None
+    profiler = start_profile(args.profile)
+    cache = BuildCache(args.cache_dir) if args.cache_dir else None
+
     print("Reading CSV data...", file=sys.stderr)
-    provinces, districts, constituencies, wards = read_csv_data()
+    hierarchy_key = hierarchy_cache_key(cache, args.input_csv) if cache else None
+    hierarchy = cached_stage(
+        cache, "hierarchy", hierarchy_key, lambda: read_csv_data(args.input_csv, report, args.columnar, args.jobs))
 
     print(f"Found:", file=sys.stderr)
-    print(f"  - Provinces: {len(provinces)}", file=sys.stderr)
-    print(f"  - Districts: {len(districts)}", file=sys.stderr)
-    print(f"  - Constituencies: {len(constituencies)}", file=sys.stderr)
-    print(f"  - Wards: {len(wards)}", file=sys.stderr)
+    print(f"  - Provinces: {len(hierarchy.provinces)}", file=sys.stderr)
+    print(f"  - Districts: {len(hierarchy.districts)}", file=sys.stderr)
+    print(f"  - Constituencies: {len(hierarchy.constituencies)}", file=sys.stderr)
+    print(f"  - Wards: {hierarchy.ward_count}", file=sys.stderr)
     print("", file=sys.stderr)
 
-    # Infer better constituency names
-    print("Inferring constituency names from ward patterns...", file=sys.stderr)
-    infer_constituency_names(constituencies, wards)
-
-    print("Generating SQL...", file=sys.stderr)
+    print(f"Generating SQL to {args.shard_dir or describe_output(args.output)}...", file=sys.stderr)
     print("", file=sys.stderr)
 
     # Generate SQL
-    generate_constituencies_sql(constituencies)
-    generate_wards_sql(wards)
+    manifest = load_manifest(args.delta) if args.delta else None
+    checkpoint_key = None
+    if args.chunk_size:
+        checkpoint_key = load_key("convert_zambia_admin_data", args.input_csv, args.chunk_size, args.ids,
+                                  args.output_format, manifest, join_version(args.join_sources))
+        print_checkpoint_summary(args.chunk_size, checkpoint_key)
+    if args.shard_dir:
+        with stage(report, "sql_generation"):
+            if args.columnar:
+                rows = ward_row_batches(timed(report, "read", iter_ward_batches(args.input_csv), batch_rows=1))
+            else:
+                rows = ward_rows(timed(report, "read", iter_wards(args.input_csv)))
+            rows = join_rows(rows, "wards", args.join_sources, args.join_memory, report)
+            constituencies = join_rows(constituency_rows(hierarchy), "constituencies", args.join_sources,
+                                       args.join_memory, report)
+            counts = write_province_shards(
+                args.shard_dir, hierarchy, counted(report, "constituency_rows_out", constituencies),
+                counted(report, "ward_rows_out", rows), args.output_format, manifest, args.ids)
+        print_shard_summary(args.shard_dir, counts)
+    else:
+        sql_key = sql_cache_key(cache, hierarchy_key, args) if cache else None
+        with stage(report, "sql_generation"), redirect_output(args.output), timed_stdout(report):
+            cached_output(cache, "sql", sql_key,
+                          lambda: generate_sql(hierarchy, args.input_csv, args.output_format,
+                                               manifest, args.ids, report, args.columnar,
+                                               args.chunk_size, checkpoint_key, args.join_sources,
+                                               args.join_memory))
+    print_join_summary(args.join_sources)
+    if args.join_report:
+        write_join_report(args.join_report, args.join_sources)
+        print(f"Wrote join report: {args.join_report}", file=sys.stderr)
+    if args.delta:
+        save_delta_manifest(args, manifest)
+    if args.index:
+        with stage(report, "index"):
+            duplicates = write_index(args.index, hierarchy, iter_wards(args.input_csv), args.ids == "uuid")
+        print(f"Wrote hierarchy index: {args.index}", file=sys.stderr)
+        if duplicates:
+            print(f"⚠️  Warning: {duplicates} duplicate ward codes (first occurrence indexed)", file=sys.stderr)
+
+    stop_profile(profiler, args.profile)
+    if report:
+        if cache:
+            report.count("cache_hits", len(cache.hits))
+            report.count("cache_misses", len(cache.misses))
+        report.write(args.report)
 
     print("", file=sys.stderr)
     print("✅ Conversion complete!", file=sys.stderr)
     print("", file=sys.stderr)
     print("Save the output to files:", file=sys.stderr)
     print("  python3 convert_zambia_admin_data.py > full_admin_data.sql", file=sys.stderr)
+    print("  python3 convert_zambia_admin_data.py --format copy > full_admin_data_copy.sql", file=sys.stderr)
+    print("  python3 convert_zambia_admin_data.py --format copy -o full_admin_data_copy.sql.gz", file=sys.stderr)
 
 
 if __name__ == "__main__":
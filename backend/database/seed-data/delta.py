@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Delta Detection - Content hashes for incremental seed updates
+Hashes each generated hierarchy row so only the rows that changed since the
+last load are written. The converters' --delta compares against a local JSON
+manifest of the hashes of the last loaded rows; load_seed_data.py --delta
+compares against hashes of the rows already in the database.
+
+A converter run can't tell whether its output will load, so the updated
+manifest is written next to the output as <output>.manifest.pending.json and
+only replaces the manifest once a loader has committed the output
+(load_seed_data.py does; after loading by hand, run this script with
+--commit). Output piped straight into psql updates the manifest at once.
+
+Usage:
+    python3 delta.py --commit delta.sql       # after psql -f delta.sql succeeded
+    python3 delta.py --commit shards/
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from output_sink import sink_kind
+
+PENDING_MANIFEST_SUFFIX = ".manifest.pending.json"
+
+
+def canonical_value(value):
+    """Normalize a value so generated rows and database rows hash the same"""
+    if value is None or isinstance(value, (bool, int)):
+        return value
+    # Decimal, date and str all compare by their text form
+    return str(value)
+
+
+def row_hash(row):
+    """Stable content hash of a row tuple (staging column order)"""
+    payload = json.dumps([canonical_value(value) for value in row], ensure_ascii=False)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def load_manifest(manifest_path):
+    """Load {table: {code: hash}} from a manifest file (empty if missing)"""
+    path = Path(manifest_path)
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(manifest_path, manifest):
+    """Write the manifest atomically (sorted, so diffs stay readable)"""
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, manifest_path)
+
+
+def pending_manifest_path(target):
+    """Where the manifest of a delta run into target (SQL file or shard directory) waits to be committed"""
+    return Path(f"{Path(target)}{PENDING_MANIFEST_SUFFIX}")
+
+
+def check_delta_args(parser, args):
+    """Reject --delta output the manifest can't wait next to"""
+    if args.delta and not args.shard_dir and sink_kind(args.output) == "stdout":
+        parser.error("--delta needs --output FILE, --shard-dir or a database URL: the manifest waits next to "
+                     "the output until it is loaded")
+
+
+def save_delta_manifest(args, manifest):
+    """Save a converter's updated manifest: at once if the output went into psql, else pending next to it"""
+    if not args.shard_dir and sink_kind(args.output) == "psql":
+        save_manifest(args.delta, manifest)
+        print(f"Updated delta manifest: {args.delta}", file=sys.stderr)
+        return
+    pending = pending_manifest_path(args.shard_dir or args.output)
+    save_manifest(pending, {"manifest": str(Path(args.delta).resolve()), "tables": manifest})
+    print(f"Delta manifest pending until the output is loaded: {pending}", file=sys.stderr)
+
+
+def commit_pending_manifest(target):
+    """Replace the manifest with target's pending one once target is loaded: the manifest path, or None"""
+    pending = pending_manifest_path(target)
+    if not pending.exists():
+        return None
+    with open(pending, 'r', encoding='utf-8') as f:
+        saved = json.load(f)
+    save_manifest(saved["manifest"], saved["tables"])
+    pending.unlink()
+    return saved["manifest"]
+
+
+def changed_rows(rows, known_hashes, current_hashes):
+    """Yield only rows whose hash differs from known_hashes
+
+    Rows are tuples with the parent code first and the row's own code second.
+    Every row's hash is recorded in current_hashes (keyed by code) as it
+    passes, so the caller can save a complete manifest afterwards.
+    """
+    for row in rows:
+        code = row[1]
+        digest = row_hash(row)
+        current_hashes[code] = digest
+        if known_hashes.get(code) != digest:
+            yield row
+
+
+def delta_rows(table, rows, manifest):
+    """Filter a table's rows to those changed since the manifest was written
+
+    manifest[table] is replaced with the current hashes once rows has been
+    fully consumed (so removed codes drop out of the manifest too).
+    """
+    known_hashes = manifest.get(table, {})
+    current_hashes = {}
+    yield from changed_rows(rows, known_hashes, current_hashes)
+    manifest[table] = current_hashes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Commit the delta manifest of a loaded converter output")
+    parser.add_argument("--commit", metavar="OUTPUT", required=True,
+                        help="SQL file or shard directory of a --delta run, loaded successfully")
+    args = parser.parse_args()
+
+    manifest_path = commit_pending_manifest(args.commit)
+    if manifest_path is None:
+        print(f"No pending delta manifest for {args.commit}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Updated delta manifest: {manifest_path}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@ District Mapping: CSV District Names -> Database District Codes
 Maps districts from ECZ CSV to existing database district codes
 """
 
+from district_resolver import DistrictResolver
+
 # Comprehensive district mapping: CSV District Name -> Database District Code
 DISTRICT_MAPPING = {
     # CENTRAL PROVINCE
@@ -102,6 +104,11 @@ def get_district_code(province, district):
     key = (province, district)
     return DISTRICT_MAPPING.get(key, None)
 
+def district_resolver(cache=None):
+    """Fuzzy resolver over DISTRICT_MAPPING for names that do not match exactly"""
+    entries = ((prov, dist, code) for (prov, dist), code in DISTRICT_MAPPING.items())
+    return DistrictResolver(entries, cache)
+
 def print_mapping():
     """Print the mapping for verification"""
     print("District Mapping (CSV -> Database):")
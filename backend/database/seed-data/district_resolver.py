@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+District Resolver - Fuzzy district-name matching for the seed-data converters
+Normalizes district names and indexes them by character trigram, so spelling
+variants (Chienge/Chiengi, hyphenation, stray 'District' suffixes) resolve to
+a ranked list of candidate codes instead of an unmapped fallback
+
+Accepted fuzzy matches can be kept in a JSON cache so later runs resolve them
+without scoring (and reviewers can correct them by editing the file).
+
+Usage:
+    python3 district_resolver.py input.csv [--column District] [--province-column Province]
+        [--cache district_matches.json] [--accept]
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import unicodedata
+from collections import defaultdict
+from pathlib import Path
+
+# Minimum Dice score for a fuzzy match to be accepted
+MATCH_THRESHOLD = 0.6
+
+# Candidates from another province keep this share of their score
+OTHER_PROVINCE_PENALTY = 0.8
+
+# Words that qualify a name without identifying the district
+NOISE_WORDS = {"district", "province", "council", "municipal", "town", "city"}
+
+
+def normalize_name(name):
+    """Lowercase, strip accents and punctuation, drop qualifier words"""
+    text = unicodedata.normalize("NFKD", str(name or ""))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    text = re.sub(r"['`’]", "", text)         # Shiwang'andu -> shiwangandu
+    text = re.sub(r"[^a-z0-9]+", " ", text)   # Itezhi-Tezhi -> itezhi tezhi
+    return " ".join(word for word in text.split() if word not in NOISE_WORDS)
+
+
+def trigrams(normalized):
+    """Character trigrams of a normalized name, padded to weight word starts"""
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def cache_key(province, district):
+    """Key of a district name (and optional province) in the match cache"""
+    return f"{normalize_name(province)}|{normalize_name(district)}"
+
+
+def load_cache(cache_path):
+    """Load {cache_key: code} accepted matches (empty if missing)"""
+    path = Path(cache_path)
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_cache(cache_path, cache):
+    """Write the match cache atomically (sorted, so diffs stay readable)"""
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, cache_path)
+
+
+class DistrictResolver:
+    """Trigram index over known district names
+
+    entries are (province, district_name, code) tuples; province may be None
+    when the source mapping has none. Each lookup touches only the posting
+    lists of the query's trigrams (a dozen or so), then scores the candidates
+    that share at least one trigram with the Dice coefficient.
+    """
+
+    def __init__(self, entries, cache=None):
+        self.entries = []
+        self.exact = {}
+        self.postings = defaultdict(list)
+        self.cache = cache if cache is not None else {}
+        self.accepted = {}
+        self.memo = {}
+
+        for province, name, code in entries:
+            normalized = normalize_name(name)
+            grams = trigrams(normalized)
+            index = len(self.entries)
+            self.entries.append((normalize_name(province), name, code, len(grams)))
+            self.exact.setdefault((normalize_name(province), normalized), code)
+            for gram in grams:
+                self.postings[gram].append(index)
+
+    def candidates(self, district, province=None, limit=5):
+        """Rank known districts for a name: [(code, name, score)], best first"""
+        normalized = normalize_name(district)
+        province_key = normalize_name(province)
+        grams = trigrams(normalized)
+
+        shared = defaultdict(int)
+        for gram in grams:
+            for index in self.postings.get(gram, ()):
+                shared[index] += 1
+
+        best = {}
+        for index, overlap in shared.items():
+            entry_province, name, code, gram_count = self.entries[index]
+            score = 2 * overlap / (len(grams) + gram_count)
+            if province_key and entry_province and entry_province != province_key:
+                score *= OTHER_PROVINCE_PENALTY
+            if score > best.get(code, (None, 0))[1]:
+                best[code] = (name, score)
+
+        ranked = sorted(best.items(), key=lambda item: (-item[1][1], item[0]))
+        return [(code, name, round(score, 3)) for code, (name, score) in ranked[:limit]]
+
+    def resolve(self, district, province=None, threshold=MATCH_THRESHOLD):
+        """Return (code, score) for a name, or (None, best score) if nothing is close enough
+
+        Exact normalized matches and cached matches score 1.0; fuzzy matches
+        at or above threshold are accepted and recorded in the cache.
+        """
+        memo_key = (province, district)
+        if memo_key in self.memo:
+            return self.memo[memo_key]
+
+        normalized = normalize_name(district)
+        code = (self.exact.get((normalize_name(province), normalized))
+                or self.cache.get(cache_key(province, district)))
+        if code:
+            result = (code, 1.0)
+        else:
+            ranked = self.candidates(district, province, limit=1)
+            if ranked and ranked[0][2] >= threshold:
+                code, name, score = ranked[0]
+                print(f"-- Matched district '{district}' -> '{name}' ({code}, score {score})", file=sys.stderr)
+                self.cache[cache_key(province, district)] = code
+                self.accepted[cache_key(province, district)] = code
+                result = (code, score)
+            else:
+                result = (None, ranked[0][2] if ranked else 0.0)
+
+        self.memo[memo_key] = result
+        return result
+
+    def resolve_many(self, names, threshold=MATCH_THRESHOLD, limit=5):
+        """Resolve every distinct (province, district) pair in one call
+
+        names may repeat (e.g. one pair per CSV row); each distinct pair is
+        scored once. Returns {(province, district): (code, candidates)}.
+        """
+        results = {}
+        for province, district in names:
+            if (province, district) not in results:
+                code, _ = self.resolve(district, province, threshold)
+                results[(province, district)] = (code, self.candidates(district, province, limit))
+        return results
+
+
+def read_names(input_csv, column, province_column=None):
+    """Stream (province, district) pairs from a CSV column"""
+    with open(input_csv, 'r', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            province = row.get(province_column) if province_column else None
+            yield province, row.get(column) or ""
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Show how a CSV's district names resolve to codes")
+    parser.add_argument("input_csv", help="CSV file to check")
+    parser.add_argument("--column", default="DISTRICTNA", help="District name column (default: %(default)s)")
+    parser.add_argument("--province-column", help="Province name column (e.g. PROVINCENA)")
+    parser.add_argument("--cache", help="Match cache (JSON) to read and, with --accept, update")
+    parser.add_argument("--accept", action="store_true",
+                        help="Save fuzzy matches above the threshold to --cache")
+    return parser.parse_args()
+
+
+def main():
+    # Imported here: district_mapping is the source of names, not a dependency of the index
+    from district_mapping import district_resolver
+
+    args = parse_args()
+    cache = load_cache(args.cache) if args.cache else {}
+    resolver = district_resolver(cache)
+
+    results = resolver.resolve_many(read_names(args.input_csv, args.column, args.province_column))
+    unresolved = 0
+    for (province, district), (code, ranked) in sorted(results.items(), key=lambda item: str(item[0])):
+        label = f"{province} / {district}" if province else district
+        if code is None:
+            unresolved += 1
+        print(f"{label:40} -> {code or 'UNRESOLVED'}")
+        if code is None or ranked[:1] and ranked[0][2] < 1.0:
+            for candidate_code, name, score in ranked:
+                print(f"{'':44}{candidate_code:10} {name:25} {score:.3f}")
+
+    print(f"\n{len(results)} distinct names, {unresolved} unresolved", file=sys.stderr)
+    if args.accept and args.cache and resolver.accepted:
+        save_cache(args.cache, resolver.cache)
+        print(f"Updated match cache: {args.cache}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Geometry Helpers - Planar operations on GeoJSON Polygon/MultiPolygon geometries
+Douglas-Peucker simplification, centroids, areas and point-in-polygon tests
+for ward boundaries.
+Coordinates are [longitude, latitude] in degrees; wards are small enough that
+an equirectangular projection is accurate for areas and centroids.
+"""
+
+import math
+
+# Kilometres per degree of latitude, and of longitude at the equator (WGS84 mean)
+KM_PER_DEGREE_LAT = 110.574
+KM_PER_DEGREE_LON = 111.320
+
+# A valid linear ring is closed and has at least four positions
+MIN_RING_POINTS = 4
+
+
+def polygons(geometry):
+    """Polygons of a Polygon or MultiPolygon geometry, each a list of rings"""
+    geometry_type = geometry.get("type")
+    if geometry_type == "Polygon":
+        return [geometry["coordinates"]]
+    if geometry_type == "MultiPolygon":
+        return geometry["coordinates"]
+    raise ValueError(f"Unsupported geometry type: {geometry_type}")
+
+
+def simplify_line(points, tolerance):
+    """Douglas-Peucker simplification of a point sequence (endpoints kept)
+
+    Iterative, so long rings cannot hit the recursion limit. A closed ring
+    (first point == last) is split at the point farthest from its start.
+    """
+    count = len(points)
+    if count < 3 or tolerance <= 0:
+        return list(points)
+
+    keep = [False] * count
+    keep[0] = keep[-1] = True
+    tolerance_sq = tolerance * tolerance
+    stack = [(0, count - 1)]
+
+    while stack:
+        first, last = stack.pop()
+        ax, ay = points[first]
+        bx, by = points[last]
+        dx, dy = bx - ax, by - ay
+        length_sq = dx * dx + dy * dy
+
+        farthest, farthest_sq = None, tolerance_sq
+        for i in range(first + 1, last):
+            px, py = points[i]
+            if length_sq:
+                t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / length_sq))
+                ex, ey = px - (ax + t * dx), py - (ay + t * dy)
+            else:
+                ex, ey = px - ax, py - ay
+            distance_sq = ex * ex + ey * ey
+            if distance_sq > farthest_sq:
+                farthest, farthest_sq = i, distance_sq
+
+        if farthest is not None:
+            keep[farthest] = True
+            stack.append((first, farthest))
+            stack.append((farthest, last))
+
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def round_ring(points, decimals):
+    """Round positions and drop consecutive duplicates that rounding creates"""
+    rounded = []
+    for x, y in points:
+        point = [round(x, decimals), round(y, decimals)]
+        if not rounded or point != rounded[-1]:
+            rounded.append(point)
+    return rounded
+
+
+def simplify_ring(ring, tolerance, decimals):
+    """Simplified, rounded ring, or None if it collapses below a valid ring
+
+    The tolerance is halved until the ring keeps MIN_RING_POINTS positions.
+    """
+    points = [(position[0], position[1]) for position in ring]
+    while True:
+        simplified = round_ring(simplify_line(points, tolerance), decimals)
+        if len(simplified) >= MIN_RING_POINTS or tolerance <= 0:
+            break
+        tolerance = tolerance / 2 if tolerance > 1e-9 else 0
+    if len(simplified) < MIN_RING_POINTS:
+        return None
+    if simplified[0] != simplified[-1]:
+        simplified.append(list(simplified[0]))
+    return simplified
+
+
+def simplify_geometry(geometry, tolerance, decimals):
+    """Polygon/MultiPolygon simplified to tolerance (degrees), rounded to decimals
+
+    Holes that collapse are dropped, as are polygons whose exterior ring
+    cannot stay valid even unsimplified. Returns a Polygon when one polygon
+    survives, else a MultiPolygon (empty if none did).
+    """
+    simplified = []
+    for rings in polygons(geometry):
+        exterior = simplify_ring(rings[0], tolerance, decimals)
+        if exterior is None:
+            continue
+        holes = [hole for hole in (simplify_ring(ring, tolerance, decimals) for ring in rings[1:])
+                 if hole is not None]
+        simplified.append([exterior] + holes)
+
+    if len(simplified) == 1:
+        return {"type": "Polygon", "coordinates": simplified[0]}
+    return {"type": "MultiPolygon", "coordinates": simplified}
+
+
+def ring_moments(ring):
+    """(signed area, x moment, y moment) of a ring by the shoelace formula"""
+    area = cx = cy = 0.0
+    for (x1, y1, *_), (x2, y2, *_) in zip(ring, ring[1:]):
+        cross = x1 * y2 - x2 * y1
+        area += cross
+        cx += (x1 + x2) * cross
+        cy += (y1 + y2) * cross
+    return area / 2, cx / 6, cy / 6
+
+
+def centroid(geometry):
+    """Area-weighted centroid (longitude, latitude) of a polygon geometry
+
+    Holes are subtracted. Degenerate (zero-area) geometries fall back to the
+    mean of their exterior positions.
+    """
+    total = mx = my = 0.0
+    for rings in polygons(geometry):
+        for i, ring in enumerate(rings):
+            area, cx, cy = ring_moments(ring)
+            # Orientation varies between sources: exteriors add, holes subtract
+            sign = (1 if area >= 0 else -1) * (1 if i == 0 else -1)
+            total += sign * area
+            mx += sign * cx
+            my += sign * cy
+
+    if total:
+        return mx / total, my / total
+    points = [position for rings in polygons(geometry) for position in rings[0]]
+    return (sum(position[0] for position in points) / len(points),
+            sum(position[1] for position in points) / len(points))
+
+
+def area_sqkm(geometry, latitude=None):
+    """Area in km², projected equirectangularly at latitude (default: centroid)"""
+    if latitude is None:
+        latitude = centroid(geometry)[1]
+    x_scale = KM_PER_DEGREE_LON * math.cos(math.radians(latitude))
+    total = 0.0
+    for rings in polygons(geometry):
+        for i, ring in enumerate(rings):
+            area = abs(ring_moments(ring)[0])
+            total += area if i == 0 else -area
+    return total * x_scale * KM_PER_DEGREE_LAT
+
+
+def bbox(geometry):
+    """(min_lon, min_lat, max_lon, max_lat) of a polygon geometry's exteriors"""
+    xs = [position[0] for rings in polygons(geometry) for position in rings[0]]
+    ys = [position[1] for rings in polygons(geometry) for position in rings[0]]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def point_in_rings(rings, x, y):
+    """Whether (x, y) lies inside a polygon's rings (even-odd rule, so holes exclude)"""
+    inside = False
+    for ring in rings:
+        x1, y1 = ring[-1][0], ring[-1][1]
+        for position in ring:
+            x2, y2 = position[0], position[1]
+            if (y2 > y) != (y1 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+                inside = not inside
+            x1, y1 = x2, y2
+    return inside
+
+
+def scanline_crossings(rings, y):
+    """Sorted longitudes where a polygon's rings cross the line at latitude y
+
+    Uses the same half-open rule as point_in_rings(), so (x, y) is inside
+    exactly when an odd number of the crossings are greater than x.
+    """
+    crossings = []
+    for ring in rings:
+        x1, y1 = ring[-1][0], ring[-1][1]
+        for position in ring:
+            x2, y2 = position[0], position[1]
+            if (y2 > y) != (y1 > y):
+                crossings.append(x1 + (y - y1) * (x2 - x1) / (y2 - y1))
+            x1, y1 = x2, y2
+    crossings.sort()
+    return crossings
+
+
+def segment_crossings(px, py, qx, qy, edges):
+    """How many of edges (flat x1, y1, x2, y2, ... tuple) the segment P-Q crosses
+
+    Half-open on the P-Q line, so a path through a shared vertex counts once;
+    used to carry a known inside/outside state from P to Q.
+    """
+    dx, dy = qx - px, qy - py
+    crossings = 0
+    for i in range(0, len(edges), 4):
+        ax, ay, bx, by = edges[i], edges[i + 1], edges[i + 2], edges[i + 3]
+        if ((dx * (ay - py) - dy * (ax - px)) > 0) != ((dx * (by - py) - dy * (bx - px)) > 0):
+            ex, ey = bx - ax, by - ay
+            side_p = ex * (py - ay) - ey * (px - ax)
+            side_q = ex * (qy - ay) - ey * (qx - ax)
+            if (side_p > 0 and side_q < 0) or (side_p < 0 and side_q > 0):
+                crossings += 1
+    return crossings
+
+
+def position_count(geometry):
+    """Number of positions in a polygon geometry"""
+    return sum(len(ring) for rings in polygons(geometry) for ring in rings)
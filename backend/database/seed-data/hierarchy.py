@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Administrative Hierarchy Builder - Shared by the admin-data converters
+Folds rows of the administrative units CSV (PROV_CODE, DISTRICT_C, CONST_CODE,
+WARD_CODE, ...) into an AdminHierarchy (admin_model.py) in a single pass,
+inferring constituency names incrementally from their ward names. Parts of
+the file can be folded separately and merged in order (see parallel_csv.py).
+"""
+
+import csv
+
+from admin_model import AdminHierarchy, Constituency, District, Province, Ward, intern_text
+from columnar import COLUMNAR_BATCH_ROWS, clean_column, join_columns, read_column_batches, zfill_column
+from instrumentation import stage
+
+# Province code mapping (PROV_CODE from CSV -> Our province codes)
+PROVINCE_MAP = {
+    "1": "WP",   # Western
+    "2": "CB",   # Copperbelt
+    "3": "CP",   # Central
+    "4": "EP",   # Eastern
+    "5": "LSK",  # Lusaka
+    "6": "LP",   # Luapula
+    "7": "MP",   # Muchinga
+    "8": "NP",   # Northern
+    "9": "NWP",  # North-Western
+    "10": "SP",  # Southern
+}
+
+# CSV columns in the order read_admin_rows() maps them to row keys
+ADMIN_COLUMNS = ("PROV_CODE", "PROVINCENA", "DISTRICT_C", "DISTRICTNA", "CONST_CODE", "WARD_CODE", "WARD_NAME")
+ADMIN_ROW_KEYS = ('prov_code', 'prov_name', 'dist_code', 'dist_name', 'const_code', 'ward_code', 'ward_name')
+
+# Words that tell wards of one area apart ("Kabwata East"/"Kabwata West")
+DIRECTIONAL_WORDS = {"East", "West", "North", "South", "Central"}
+
+# Constituency names are short; deeper ward-name words never contribute
+MAX_NAME_WORDS = 4
+
+
+def clean_string(s):
+    """Clean string read from the CSV (SQL escaping happens on output)"""
+    if not s or str(s).strip() == "":
+        return ""
+    return str(s).strip()
+
+
+def generate_constituency_code(const_code):
+    """Generate 3-digit constituency code"""
+    return str(const_code).zfill(3)
+
+
+def generate_ward_code(const_code, ward_code):
+    """Generate ward code: CONSTCODE-WARDCODE"""
+    const = str(const_code).zfill(3)
+    ward = str(ward_code).zfill(2)
+    return f"{const}-{ward}"
+
+
+def read_admin_rows(input_csv):
+    """Stream normalized rows from the administrative units CSV"""
+    with open(input_csv, 'r', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            yield {
+                'prov_code': row['PROV_CODE'],
+                'prov_name': clean_string(row['PROVINCENA']),
+                'dist_code': row['DISTRICT_C'],
+                'dist_name': clean_string(row['DISTRICTNA']),
+                'const_code': row['CONST_CODE'],
+                'ward_code': row['WARD_CODE'],
+                'ward_name': clean_string(row['WARD_NAME']),
+            }
+
+
+def iter_wards(input_csv):
+    """Stream Ward records in CSV order"""
+    for row in read_admin_rows(input_csv):
+        yield Ward(generate_ward_code(row['const_code'], row['ward_code']), row['ward_name'],
+                   generate_constituency_code(row['const_code']))
+
+
+def read_admin_rows_columnar(input_csv, batch_rows=COLUMNAR_BATCH_ROWS):
+    """read_admin_rows(), cleaning names a column batch at a time"""
+    for prov_codes, prov_names, dist_codes, dist_names, const_codes, ward_codes, ward_names in \
+            read_column_batches(input_csv, ADMIN_COLUMNS, batch_rows):
+        columns = (prov_codes, clean_column(prov_names), dist_codes, clean_column(dist_names),
+                   const_codes, ward_codes, clean_column(ward_names))
+        for values in zip(*columns):
+            yield dict(zip(ADMIN_ROW_KEYS, values))
+
+
+def iter_ward_batches(input_csv, batch_rows=COLUMNAR_BATCH_ROWS):
+    """Stream wards in CSV order as (const_codes, codes, names) column batches
+
+    The columnar counterpart of iter_wards(): codes are zero-padded and
+    joined a whole column at a time.
+    """
+    for const_codes, ward_codes, ward_names in \
+            read_column_batches(input_csv, ("CONST_CODE", "WARD_CODE", "WARD_NAME"), batch_rows):
+        const_codes = zfill_column(const_codes, 3)
+        yield const_codes, join_columns("-", const_codes, zfill_column(ward_codes, 2)), clean_column(ward_names)
+
+
+def ward_name_words(ward_name):
+    """Split a ward name into words, dropping a trailing 'Ward X' / 'Ward'"""
+    words = ward_name.split()
+    if len(words) >= 2 and words[-2] == 'Ward':
+        words = words[:-2]
+    elif words and words[-1] == 'Ward':
+        words = words[:-1]
+    return words[:MAX_NAME_WORDS]
+
+
+class WardNameTrie:
+    """Word-level prefix trie over one constituency's ward names
+
+    Each node maps a word to [count, children]. Adding a ward costs one step
+    per word, so building every constituency's trie is linear in the total
+    length of the ward names.
+    """
+
+    def __init__(self):
+        self.root = {}
+        self.ward_count = 0
+        self.first_words = None
+
+    def add(self, ward_name):
+        """Add one ward name to the trie"""
+        words = ward_name_words(ward_name)
+        if self.first_words is None:
+            self.first_words = words
+        self.ward_count += 1
+
+        children = self.root
+        for word in words:
+            node = children.get(word)
+            if node is None:
+                node = children[word] = [0, {}]
+            node[0] += 1
+            children = node[1]
+
+    def merge(self, other):
+        """Add the wards of a trie built over later rows
+
+        Words new to a level are appended after the existing ones, so ties in
+        infer_name() break exactly as if every ward had been added here.
+        """
+        if self.first_words is None:
+            self.first_words = other.first_words
+        self.ward_count += other.ward_count
+
+        pending = [(self.root, other.root)]
+        while pending:
+            children, other_children = pending.pop()
+            for word, (count, other_grandchildren) in other_children.items():
+                node = children.get(word)
+                if node is None:
+                    children[word] = [count, other_grandchildren]
+                else:
+                    node[0] += count
+                    pending.append((node[1], other_grandchildren))
+
+    def infer_name(self):
+        """Infer the constituency name, or '' if nothing usable was found
+
+        The name is the longest word prefix shared by at least half of the
+        wards (and by more than one, when there are several), stopping at a
+        directional word. Without a shared prefix the first ward's name is
+        used with directional words removed.
+        """
+        min_count = max(2 if self.ward_count > 1 else 1, (self.ward_count + 1) // 2)
+
+        words = []
+        children = self.root
+        while children:
+            word, (count, grandchildren) = max(children.items(), key=lambda item: item[1][0])
+            if count < min_count or word in DIRECTIONAL_WORDS:
+                break
+            words.append(word)
+            children = grandchildren
+
+        if not words:
+            words = [word for word in (self.first_words or []) if word not in DIRECTIONAL_WORDS]
+
+        name = ' '.join(words)
+        return name if len(name) > 2 else ''
+
+
+def fold_admin_rows(rows):
+    """Fold admin rows into a partial hierarchy: (first_rows, tries)
+
+    first_rows are the rows that introduce a province, district or
+    constituency, in order; tries maps each constituency's CSV code to the
+    WardNameTrie of its wards. Folds of consecutive parts of a CSV, merged in
+    order by merge_hierarchy(), give exactly the hierarchy of the whole file.
+    """
+    first_rows = []
+    provinces = set()
+    districts = set()
+    tries = {}
+
+    for row in rows:
+        prov_code = row['prov_code']
+        dist_key = f"{prov_code}-{row['dist_code']}"
+        trie = tries.get(row['const_code'])
+        if trie is None or prov_code not in provinces or dist_key not in districts:
+            first_rows.append(row)
+            provinces.add(prov_code)
+            districts.add(dist_key)
+            if trie is None:
+                trie = tries[row['const_code']] = WardNameTrie()
+        trie.add(row['ward_name'])
+
+    return first_rows, tries
+
+
+def merge_hierarchy(parts, resolve_district, report=None):
+    """Merge partial folds (fold_admin_rows()), in CSV order, into an AdminHierarchy
+
+    resolve_district(row) returns the database district code for a row, or
+    None when the district is unmapped; unmapped districts are collected and
+    given an 'XX-' fallback code. Wards are counted and their tries merged
+    but not stored - stream them with iter_wards(). Name inference is timed
+    as its own stage when a RunReport is given.
+    """
+    hierarchy = AdminHierarchy()
+    province_index = hierarchy.province_index
+    district_index = hierarchy.district_index
+    constituency_index = hierarchy.constituency_index
+    constituencies = hierarchy.constituencies
+    # Scratch state for name inference, parallel to hierarchy.constituencies
+    tries = []
+    fallback_names = []
+
+    for first_rows, part_tries in parts:
+        for row in first_rows:
+            prov_code = row['prov_code']
+            const_code = row['const_code']
+
+            # Store unique provinces
+            if prov_code not in province_index:
+                hierarchy.add_province(prov_code, Province(PROVINCE_MAP.get(prov_code, f"P{prov_code}"),
+                                                           row['prov_name']))
+
+            # Store unique districts
+            dist_key = f"{prov_code}-{row['dist_code']}"
+            if dist_key not in district_index:
+                dist_name = row['dist_name']
+                district_code = resolve_district(row)
+                if not district_code:
+                    hierarchy.unmapped_districts.add((row['prov_name'], dist_name))
+                    # Use fallback code
+                    district_code = f"XX-{dist_name[:3].upper()}"
+                hierarchy.add_district(dist_key, District(district_code, dist_name, province_index[prov_code]))
+
+            # Store unique constituencies
+            if const_code not in constituency_index:
+                hierarchy.add_constituency(
+                    const_code, Constituency(generate_constituency_code(const_code), None, district_index[dist_key]))
+                tries.append(None)
+                fallback_names.append(f"{row['dist_name']} Constituency {const_code}")
+
+        # Later parts' wards extend the tries of the earlier ones
+        for const_code, trie in part_tries.items():
+            index = constituency_index[const_code]
+            if tries[index] is None:
+                tries[index] = trie
+            else:
+                tries[index].merge(trie)
+
+    for constituency, trie in zip(constituencies, tries):
+        constituency.ward_count = trie.ward_count
+    hierarchy.ward_count = sum(constituency.ward_count for constituency in constituencies)
+
+    # Names are read off each trie in O(name length) - no pass over the wards
+    with stage(report, "name_inference"):
+        for constituency, trie, fallback_name in zip(constituencies, tries, fallback_names):
+            constituency.name = intern_text(trie.infer_name() or fallback_name)
+
+    return hierarchy
+
+
+def build_hierarchy(rows, resolve_district, report=None):
+    """Fold admin rows into an AdminHierarchy in one pass (see merge_hierarchy())"""
+    return merge_hierarchy([fold_admin_rows(rows)], resolve_district, report)
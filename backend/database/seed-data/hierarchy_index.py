@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Hierarchy Index - Memory-mapped ward -> constituency -> district -> province lookups
+The admin converters write this file next to the SQL (--index PATH), and
+tools, batch jobs and services resolve full paths and parent ids from it
+in-process: opening it is one mmap() and each lookup is a binary search over
+fixed-size records, with no database round trip and no
+refresh_administrative_hierarchy() needed.
+
+File layout (little-endian):
+    header          magic 'ZHIX', version, flags, record counts
+    provinces       RECORD_SIZE-byte records sorted by code
+    districts       (parent = province position)
+    constituencies  (parent = district position)
+    wards           (parent = constituency position)
+    strings         UTF-8 codes and names referenced by the records
+
+Record: code offset/length, name offset/length, parent position, 16-byte id.
+Ids are the deterministic UUIDv5s of ids.py when the index was written with
+--ids uuid; otherwise (ids assigned by the database) they are absent, as are
+province ids, which --ids uuid does not rewrite. Names are as converted from
+the source CSV.
+
+Usage:
+    python3 hierarchy_index.py admin.idx ward 001-01
+    python3 hierarchy_index.py admin.idx constituency 001
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import uuid
+from bisect import bisect_left
+
+from ids import hierarchy_id
+
+INDEX_MAGIC = b"ZHIX"
+INDEX_VERSION = 1
+FLAG_IDS = 1
+
+HEADER = struct.Struct("<4sHHIIII")
+RECORD = struct.Struct("<IHIHI16s")
+RECORD_SIZE = RECORD.size
+
+NO_PARENT = 0xFFFFFFFF
+NO_ID = bytes(16)
+
+# Tables whose rows get deterministic ids with --ids uuid
+KEYED_TABLES = ("districts", "constituencies", "wards")
+
+# Levels in file order: (table, singular name used in lookup results)
+LEVELS = (("provinces", "province"), ("districts", "district"),
+          ("constituencies", "constituency"), ("wards", "ward"))
+LEVEL_TABLES = [table for table, _ in LEVELS]
+
+
+# ============================================================================
+# Writing
+# ============================================================================
+
+class StringTable:
+    """Deduplicated UTF-8 string pool: add() returns (offset, length)"""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = {}
+
+    def add(self, text):
+        ref = self.offsets.get(text)
+        if ref is None:
+            encoded = (text or "").encode('utf-8')
+            ref = self.offsets[text] = (len(self.data), len(encoded))
+            self.data += encoded
+        return ref
+
+
+def sorted_positions(records):
+    """(records sorted by code, {original index: sorted position})"""
+    order = sorted(range(len(records)), key=lambda index: records[index].code)
+    return [records[index] for index in order], {index: position for position, index in enumerate(order)}
+
+
+def pack_records(table, entries, strings, with_ids):
+    """Pack (code, name, parent position) entries into fixed-size records"""
+    packed = bytearray()
+    for code, name, parent in entries:
+        code_offset, code_length = strings.add(code)
+        name_offset, name_length = strings.add(name)
+        record_id = hierarchy_id(table, code).bytes if with_ids and table in KEYED_TABLES else NO_ID
+        packed += RECORD.pack(code_offset, code_length, name_offset, name_length, parent, record_id)
+    return packed
+
+
+def write_index(index_path, hierarchy, wards, with_ids=False):
+    """Write an index file for an AdminHierarchy and its streamed Ward records
+
+    The first ward seen with a code wins; later duplicates are counted and
+    skipped. Written to a temporary name and renamed into place. Returns the
+    number of duplicate ward codes.
+    """
+    provinces, province_positions = sorted_positions(hierarchy.provinces)
+    districts, district_positions = sorted_positions(hierarchy.districts)
+    constituencies, _ = sorted_positions(hierarchy.constituencies)
+    constituency_by_code = {constituency.code: position for position, constituency in enumerate(constituencies)}
+
+    ward_entries = {}
+    duplicates = 0
+    for ward in wards:
+        if ward.code in ward_entries:
+            duplicates += 1
+            continue
+        ward_entries[ward.code] = (ward.name, constituency_by_code.get(ward.const_code, NO_PARENT))
+
+    strings = StringTable()
+    sections = [
+        pack_records("provinces", ((p.code, p.name, NO_PARENT) for p in provinces), strings, with_ids),
+        pack_records("districts", ((d.code, d.name, province_positions[d.province]) for d in districts),
+                     strings, with_ids),
+        pack_records("constituencies", ((c.code, c.name, district_positions[c.district]) for c in constituencies),
+                     strings, with_ids),
+        pack_records("wards", ((code, name, parent) for code, (name, parent) in sorted(ward_entries.items())),
+                     strings, with_ids),
+    ]
+    header = HEADER.pack(INDEX_MAGIC, INDEX_VERSION, FLAG_IDS if with_ids else 0,
+                         len(provinces), len(districts), len(constituencies), len(ward_entries))
+
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        for section in sections:
+            f.write(section)
+        f.write(strings.data)
+    os.replace(tmp_path, index_path)
+    return duplicates
+
+
+# ============================================================================
+# Lookups
+# ============================================================================
+
+class HierarchyIndex:
+    """Read-only view of an index file
+
+    lookup results mirror the columns of vw_administrative_hierarchy:
+    ward_id, ward_code, ward_name, constituency_id, ..., province_name,
+    full_path (ids are None when the index has none).
+    """
+
+    def __init__(self, index_path):
+        with open(index_path, 'rb') as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, flags, *counts = HEADER.unpack_from(self.buffer, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            self.buffer.close()
+            raise ValueError(f"{index_path}: not a version {INDEX_VERSION} hierarchy index")
+        self.has_ids = bool(flags & FLAG_IDS)
+
+        self.counts = dict(zip(LEVEL_TABLES, counts))
+        self.offsets = {}
+        offset = HEADER.size
+        for table in LEVEL_TABLES:
+            self.offsets[table] = offset
+            offset += self.counts[table] * RECORD_SIZE
+        self.strings_offset = offset
+
+    def close(self):
+        self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _text(self, offset, length):
+        start = self.strings_offset + offset
+        return self.buffer[start:start + length].decode('utf-8')
+
+    def _code(self, table, position):
+        code_offset, code_length = struct.unpack_from("<IH", self.buffer, self.offsets[table] + position * RECORD_SIZE)
+        start = self.strings_offset + code_offset
+        return self.buffer[start:start + code_length]
+
+    def _record(self, table, position):
+        """(code, name, parent position, id) of a record"""
+        code_offset, code_length, name_offset, name_length, parent, record_id = \
+            RECORD.unpack_from(self.buffer, self.offsets[table] + position * RECORD_SIZE)
+        return (self._text(code_offset, code_length), self._text(name_offset, name_length), parent,
+                str(uuid.UUID(bytes=record_id)) if record_id != NO_ID else None)
+
+    def _find(self, table, code):
+        """Position of the record with this code, or None"""
+        key = code.encode('utf-8')
+        codes = _Codes(self, table)
+        position = bisect_left(codes, key)
+        if position < len(codes) and codes[position] == key:
+            return position
+        return None
+
+    def _path(self, table, position):
+        """Result dict for a record and all of its ancestors, most specific level first"""
+        level = LEVEL_TABLES.index(table)
+        result = {}
+        names = []
+        while level >= 0 and position != NO_PARENT:
+            table_name, name = LEVELS[level]
+            code, record_name, position, record_id = self._record(table_name, position)
+            result[f"{name}_id"] = record_id
+            result[f"{name}_code"] = code
+            result[f"{name}_name"] = record_name
+            names.append(record_name)
+            level -= 1
+        result["full_path"] = " > ".join(reversed(names))
+        return result
+
+    def ward(self, code):
+        """Full path of a ward by code ('001-01'), or None"""
+        position = self._find("wards", code)
+        return None if position is None else self._path("wards", position)
+
+    def constituency(self, code):
+        """Path of a constituency by code ('001'), or None"""
+        position = self._find("constituencies", code)
+        return None if position is None else self._path("constituencies", position)
+
+    def district(self, code):
+        """Path of a district by code ('LSK-LSK'), or None"""
+        position = self._find("districts", code)
+        return None if position is None else self._path("districts", position)
+
+    def ward_codes(self, constituency_code):
+        """Codes of a constituency's wards, in code order"""
+        parent = self._find("constituencies", constituency_code)
+        if parent is None:
+            return []
+        codes = _Codes(self, "wards")
+        prefix = f"{constituency_code}-".encode('utf-8')
+        result = []
+        for position in range(bisect_left(codes, prefix), len(codes)):
+            code = codes[position]
+            if not code.startswith(prefix):
+                break
+            if self._record("wards", position)[2] == parent:
+                result.append(code.decode('utf-8'))
+        return result
+
+
+class _Codes:
+    """Sequence view of one level's codes (as bytes), for bisect"""
+
+    def __init__(self, index, table):
+        self.index = index
+        self.table = table
+
+    def __len__(self):
+        return self.index.counts[self.table]
+
+    def __getitem__(self, position):
+        return self.index._code(self.table, position)
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Look up wards, constituencies and districts in a hierarchy index")
+    parser.add_argument("index", help="Index file written by a converter's --index option")
+    parser.add_argument("level", choices=("ward", "constituency", "district", "wards-of"),
+                        help="What the code identifies (wards-of: list a constituency's ward codes)")
+    parser.add_argument("codes", nargs="+", help="Codes to look up")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    missing = 0
+    with HierarchyIndex(args.index) as index:
+        for code in args.codes:
+            if args.level == "wards-of":
+                result = index.ward_codes(code)
+            else:
+                result = getattr(index, args.level)(code)
+            if not result:
+                missing += 1
+                print(f"Not found: {args.level} {code}", file=sys.stderr)
+                continue
+            print(json.dumps(result, ensure_ascii=False))
+    sys.exit(1 if missing else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Deterministic Ids - Namespace UUIDv5s for administrative hierarchy rows
+Derives every row's id from its table and stable code ('CP-KAB', '001',
+'001-01'), so generated rows can carry their parent's id directly and ids are
+identical across environments
+"""
+
+import uuid
+
+# uuid5(NAMESPACE_DNS, 'hierarchy.cdf-smarthub.gov.zm') - never change this,
+# every deterministic id in every environment is derived from it
+HIERARCHY_NAMESPACE = uuid.UUID("7a2629ef-98c5-573c-bc56-dd0c8dcb0ed9")
+
+ID_MODES = ("lookup", "uuid")
+
+
+def hierarchy_id(table, code):
+    """Deterministic id of the row with this code in a hierarchy table"""
+    return uuid.uuid5(HIERARCHY_NAMESPACE, f"{table}/{code}")
+
+
+def hierarchy_id_sql(table, code_expr):
+    """SQL expression computing hierarchy_id() in PostgreSQL (uuid-ossp)"""
+    return f"uuid_generate_v5('{HIERARCHY_NAMESPACE}'::uuid, '{table}/' || {code_expr})"
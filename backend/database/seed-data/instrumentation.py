@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Run Instrumentation - Stage timings, row counts and memory for the converters
+Collects per-stage wall time (read, organize, name inference, SQL generation,
+write), row and unmapped-district counters and peak RSS into a JSON run
+report, and optionally profiles the conversion with cProfile
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import resource
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from itertools import islice
+
+# Functions shown on stderr for --profile
+PROFILE_TOP_FUNCTIONS = 25
+
+# Rows pulled per timed batch, and characters buffered per timed stdout write;
+# timing every row or print() would cost more than the work being measured
+TIMED_BATCH_ROWS = 1024
+TIMED_WRITE_CHARS = 1 << 16
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far, in MB"""
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / divisor
+
+
+class RunReport:
+    """Stage timings and counters for one converter run
+
+    Stages may nest or interleave (reading is lazy, so it happens inside
+    organize and SQL generation). Time is charged to the innermost stage:
+    each stage's total excludes time spent in stages entered inside it.
+    """
+
+    def __init__(self, tool):
+        self.tool = tool
+        self.started = time.perf_counter()
+        self.stages = {}
+        self.counters = {}
+        self.stage_rss = {}
+        self._active = []
+
+    def _charge(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def enter(self, name):
+        """Start charging time to stage name (pair with leave())"""
+        now = time.perf_counter()
+        if self._active:
+            outer, outer_start = self._active[-1]
+            self._charge(outer, now - outer_start)
+        self._active.append((name, now))
+
+    def leave(self):
+        """Stop charging the innermost stage and resume the one outside it"""
+        name, start = self._active.pop()
+        now = time.perf_counter()
+        self._charge(name, now - start)
+        if self._active:
+            self._active[-1] = (self._active[-1][0], now)
+        return name
+
+    @contextmanager
+    def stage(self, name):
+        """Time a block as stage name"""
+        self.enter(name)
+        try:
+            yield
+        finally:
+            self.leave()
+            self.stage_rss[name] = round(peak_rss_mb(), 1)
+
+    def count(self, name, n=1):
+        """Add n to a counter"""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def timed(self, name, rows, counter=None, batch_rows=TIMED_BATCH_ROWS):
+        """Yield rows, charging the time spent producing them to stage name
+
+        Items are pulled batch_rows at a time; pass 1 for streams whose items
+        are already large batches (e.g. columnar.read_column_batches()).
+        """
+        rows = iter(rows)
+        while True:
+            self.enter(name)
+            batch = list(islice(rows, batch_rows))
+            self.leave()
+            if not batch:
+                return
+            if counter:
+                self.count(counter, len(batch))
+            yield from batch
+
+    def counted(self, counter, rows):
+        """Yield rows, counting them"""
+        count = 0
+        try:
+            for row in rows:
+                count += 1
+                yield row
+        finally:
+            self.count(counter, count)
+
+    @contextmanager
+    def timed_stdout(self, name="write"):
+        """Charge time spent writing to stdout to stage name
+
+        Output is gathered into large chunks and only the chunk writes are
+        timed, so formatting stays charged to the stage that printed it.
+        """
+        report = self
+        stdout = sys.stdout
+
+        class TimedWriter:
+            def __init__(self):
+                self.chunks = []
+                self.size = 0
+
+            def write(self, text):
+                self.chunks.append(text)
+                self.size += len(text)
+                if self.size >= TIMED_WRITE_CHARS:
+                    self.flush()
+                return len(text)
+
+            def flush(self):
+                report.enter(name)
+                try:
+                    stdout.write("".join(self.chunks))
+                    stdout.flush()
+                finally:
+                    report.leave()
+                self.chunks = []
+                self.size = 0
+
+        writer = TimedWriter()
+        sys.stdout = writer
+        try:
+            yield
+        finally:
+            writer.flush()
+            sys.stdout = stdout
+
+    def as_dict(self):
+        """Report contents as a JSON-serializable dict"""
+        return {
+            "tool": self.tool,
+            "argv": sys.argv[1:],
+            "total_seconds": round(time.perf_counter() - self.started, 4),
+            "stages": {name: {"seconds": round(seconds, 4), "peak_rss_mb": self.stage_rss.get(name)}
+                       for name, seconds in self.stages.items()},
+            "counters": self.counters,
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+        }
+
+    def write(self, report_path):
+        """Write the report as JSON"""
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(self.as_dict(), f, indent=2)
+            f.write("\n")
+        print(f"Wrote run report: {report_path}", file=sys.stderr)
+
+
+def stage(report, name):
+    """report.stage(name), or a no-op when there is no report"""
+    return report.stage(name) if report else nullcontext()
+
+
+def timed(report, name, rows, counter=None, batch_rows=TIMED_BATCH_ROWS):
+    """report.timed(...), or rows unchanged when there is no report"""
+    return report.timed(name, rows, counter, batch_rows) if report else rows
+
+
+def counted(report, counter, rows):
+    """report.counted(...), or rows unchanged when there is no report"""
+    return report.counted(counter, rows) if report else rows
+
+
+def timed_stdout(report):
+    """report.timed_stdout(), or a no-op when there is no report"""
+    return report.timed_stdout() if report else nullcontext()
+
+
+def add_instrumentation_args(parser):
+    """Add --report and --profile options to a converter's argument parser"""
+    parser.add_argument("--report", metavar="JSON",
+                        help="Write stage timings, row counts and peak memory to this JSON file")
+    parser.add_argument("--profile", metavar="PSTATS",
+                        help="Profile the conversion with cProfile, save the stats here and "
+                             "print the top functions to stderr")
+
+
+def start_profile(profile_path):
+    """Start a cProfile profiler when profile_path is set (else None)"""
+    if not profile_path:
+        return None
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def stop_profile(profiler, profile_path):
+    """Stop a profiler from start_profile(), save its stats and print the top functions"""
+    if profiler is None:
+        return
+    profiler.disable()
+    profiler.dump_stats(profile_path)
+    summary = io.StringIO()
+    pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(PROFILE_TOP_FUNCTIONS)
+    print(summary.getvalue(), file=sys.stderr)
+    print(f"Wrote profile: {profile_path} (python3 -m pstats {profile_path})", file=sys.stderr)
@@ -0,0 +1,588 @@
+#!/usr/bin/env python3
+"""
+CDF Smart Hub - Seed Data Loader (Python)
+Loads the administrative hierarchy over a single pooled connection instead of
+one psql process per file, query and sample
+
+Static seed files are executed as-is. With --admin-csv, constituencies and
+wards are streamed from convert_full_admin_data straight into the database
+through the COPY protocol - no intermediate .sql file is written.
+
+With --ids uuid, rows carry deterministic UUIDv5 ids (see ids.py) and are
+copied straight into their tables with no parent id lookups. It is for fresh
+databases: parents already referenced without their deterministic ids stop
+the load (see sql_output.rekey_parents_sql).
+
+With --delta, each generated row is hashed and compared with the same hash
+of the row already in the database; only changed rows are upserted.
+
+With --chunk-size, --admin-csv rows are copied in chunks, each committed
+with a checkpoint (see checkpoints.py); after a failure, running the same
+load again skips the chunks already committed without sending them.
+
+With --shard-dir, the province shards written by a converter's --shard-dir
+(see shards.py) are loaded after the provinces and districts, --jobs at a
+time over their own connections, each shard in its own transaction. With
+--sql-file, a converter's --output file is loaded the same way, as one
+transaction.
+
+Once a converter --delta output (shards or file) has loaded, its pending
+manifest replaces the converter's manifest (see delta.py).
+
+Everything about to be loaded is first checked by validate_seed_data.py
+(parents, unique codes and names, column widths) without touching the
+database; --skip-validation loads regardless.
+
+Requires psycopg2 (pip install psycopg2-binary)
+
+Usage:
+    python3 load_seed_data.py [--host H] [--port P] [--database D] [--username U]
+    python3 load_seed_data.py --admin-csv Administrative_units_of_Zambia.csv
+    python3 load_seed_data.py --admin-csv Administrative_units_of_Zambia.csv --delta
+    python3 load_seed_data.py --admin-csv Administrative_units_of_Zambia.csv --ids uuid
+    python3 load_seed_data.py --admin-csv Administrative_units_of_Zambia.csv --chunk-size 500
+    python3 load_seed_data.py --admin-csv Administrative_units_of_Zambia.csv --join ward=census.csv:WARD:population
+    python3 load_seed_data.py --shard-dir shards/ --jobs 4
+    python3 load_seed_data.py --sql-file delta.sql --delta
+"""
+
+import argparse
+import getpass
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from pathlib import Path
+
+import convert_full_admin_data
+from checkpoints import checkpoint_sql, checkpoint_table_sql, chunk_guard_sql, last_chunk_sql, load_key
+from delta import changed_rows, commit_pending_manifest, row_hash
+from ids import ID_MODES
+from shards import shard_files
+from source_join import (
+    DEFAULT_JOIN_MEMORY_MB, JoinSource, add_join_args, check_join_args, join_rows, join_version,
+    print_join_summary, write_join_report
+)
+from sql_output import (
+    STAGING_TABLES, CopyStream, FileCopyStream, chunk_copy_sql, chunk_insert_sql, chunk_staging_sql,
+    keyed_copy_sql, keyed_rows, keyed_staging_create_sql, keyed_staging_insert_sql, rekey_parents_sql,
+    row_chunks, staging_check_sql, staging_copy_sql, staging_create_sql, staging_drop_sql,
+    staging_insert_sql
+)
+from validate_seed_data import validate, validate_admin_csv
+
+SEED_DIR = Path(__file__).resolve().parent
+
+# Seed files in dependency order
+SEED_FILES = [
+    "01_provinces.sql",
+    "02_districts.sql",
+    "03_constituencies.sql",
+    "04_wards.sql",
+]
+
+# Used instead of 03/04 when constituencies and wards come from --admin-csv
+# or --shard-dir
+ADMIN_CSV_SEED_FILES = [
+    "01_provinces.sql",
+    "02_districts.sql",
+]
+
+HIERARCHY_TABLES = ("provinces", "districts", "constituencies", "wards")
+
+DEFAULT_SHARD_JOBS = 4
+
+# A COPY ... FROM STDIN statement in a generated SQL file; its data follows
+COPY_FROM_STDIN = re.compile(r"^COPY\s.*\sFROM\s+STDIN\s*;?\s*$", re.IGNORECASE)
+
+# Color codes
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+YELLOW = '\033[1;33m'
+BLUE = '\033[0;34m'
+NC = '\033[0m'
+
+
+def log_info(message):
+    print(f"{GREEN}[INFO]{NC} {message}")
+
+
+def log_warn(message):
+    print(f"{YELLOW}[WARN]{NC} {message}")
+
+
+def log_error(message):
+    print(f"{RED}[ERROR]{NC} {message}", file=sys.stderr)
+
+
+def log_section(title):
+    print(f"{BLUE}==== {title} ===={NC}")
+
+
+def parse_args():
+    """Parse command line arguments (defaults follow load_seed_data.sh)"""
+    parser = argparse.ArgumentParser(description="Load administrative hierarchy seed data")
+    parser.add_argument("--host", default=os.environ.get("DB_HOST", "localhost"),
+                        help="Database host (default: localhost)")
+    parser.add_argument("--port", default=os.environ.get("DB_PORT", "5432"),
+                        help="Database port (default: 5432)")
+    parser.add_argument("--database", default=os.environ.get("DB_NAME", "cdf_smarthub"),
+                        help="Database name (default: cdf_smarthub)")
+    parser.add_argument("--username", default=os.environ.get("DB_USER", "postgres"),
+                        help="Database user (default: postgres)")
+    parser.add_argument("--password", default=os.environ.get("DB_PASSWORD", ""),
+                        help="Database password (default: prompt)")
+    parser.add_argument("--admin-csv",
+                        help="Stream constituencies and wards from this administrative units CSV")
+    parser.add_argument("--delta", action="store_true",
+                        help="With --admin-csv: upsert only rows whose content differs from the "
+                             "database (skips the static seed files); with --shard-dir or --sql-file: "
+                             "skip the static seed files (output written with the converter's --delta)")
+    parser.add_argument("--ids", choices=ID_MODES, default="lookup",
+                        help="With --admin-csv: lookup resolves parent ids by code; uuid writes "
+                             "deterministic UUIDv5 ids and copies straight into the tables")
+    parser.add_argument("--chunk-size", type=int, metavar="ROWS",
+                        help="With --admin-csv: commit every ROWS rows with a checkpoint, resuming "
+                             "after the last committed chunk when the same load is run again")
+    parser.add_argument("--shard-dir",
+                        help="Load the province shards in this directory (a converter's --shard-dir) "
+                             "instead of 03/04")
+    parser.add_argument("--sql-file",
+                        help="Load this SQL file (a converter's --output) instead of 03/04")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_SHARD_JOBS,
+                        help="With --shard-dir: shards loaded concurrently (default: %(default)s)")
+    parser.add_argument("--skip-validation", action="store_true",
+                        help="Load without checking the seed data first (validate_seed_data.py)")
+    add_join_args(parser)
+    args = parser.parse_args()
+    check_join_args(parser, args)
+    if args.join_sources and not args.admin_csv:
+        parser.error("--join needs --admin-csv")
+    if sum(bool(source) for source in (args.shard_dir, args.sql_file, args.admin_csv)) > 1:
+        parser.error("--shard-dir, --sql-file and --admin-csv are alternatives")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.chunk_size is not None and (args.chunk_size < 1 or not args.admin_csv):
+        parser.error("--chunk-size needs --admin-csv and at least 1 row")
+    return args
+
+
+def create_pool(args):
+    """Open a connection pool: the loader connection, plus one per job with --shard-dir"""
+    try:
+        from psycopg2 import pool
+    except ImportError:
+        log_error("psycopg2 is required: pip install psycopg2-binary")
+        sys.exit(1)
+
+    return pool.ThreadedConnectionPool(
+        1, 1 + (args.jobs if args.shard_dir else 0),
+        host=args.host, port=args.port, dbname=args.database,
+        user=args.username, password=args.password,
+    )
+
+
+def has_sql(lines):
+    """Whether lines hold anything besides blank lines and -- comments
+
+    psycopg2 refuses to execute comment-only text (an empty query).
+    """
+    return any(line.strip() and not line.lstrip().startswith("--") for line in lines)
+
+
+def execute_sql_file(cursor, seed_path):
+    """Execute a seed or generated SQL file, returning the number of rows copied
+
+    psql meta-commands (\\echo etc.) are dropped. COPY ... FROM STDIN blocks
+    are streamed from the file with copy_expert(); the SQL between them is
+    executed as it stands.
+    """
+    copied = 0
+    statements = []
+    with open(seed_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if COPY_FROM_STDIN.match(line):
+                if has_sql(statements):
+                    cursor.execute("".join(statements))
+                statements = []
+                stream = FileCopyStream(f)
+                cursor.copy_expert(line.strip().rstrip(";"), stream)
+                copied += stream.row_count
+            elif not line.lstrip().startswith("\\"):
+                statements.append(line)
+    if has_sql(statements):
+        cursor.execute("".join(statements))
+    return copied
+
+
+def table_counts(cursor):
+    """Count active rows in every hierarchy table in one round trip"""
+    cursor.execute("SELECT " + ", ".join(
+        f"(SELECT COUNT(*) FROM {table} WHERE is_active = true)" for table in HIERARCHY_TABLES
+    ))
+    return dict(zip(HIERARCHY_TABLES, cursor.fetchone()))
+
+
+def report_step(name, duration, rows):
+    """Log wall time and throughput for one load step"""
+    rate = rows / duration if duration > 0 else 0
+    log_info(f"✓ {name} loaded ({duration:.2f}s, {rows} rows, {rate:,.0f} rows/s)")
+
+
+def load_seed_file(conn, seed_path):
+    """Execute one static seed file in its own transaction"""
+    with conn.cursor() as cursor:
+        before = table_counts(cursor)
+        start = time.perf_counter()
+        execute_sql_file(cursor, seed_path)
+        duration = time.perf_counter() - start
+        after = table_counts(cursor)
+    conn.commit()
+
+    rows = sum(after[table] - before[table] for table in HIERARCHY_TABLES)
+    report_step(seed_path.name, duration, rows)
+
+
+def copy_rows(conn, table, rows, upsert=False):
+    """Stream generated rows into a table through a COPY staging table"""
+    with conn.cursor() as cursor:
+        start = time.perf_counter()
+        stream = CopyStream(rows)
+        cursor.execute(staging_create_sql(table))
+        cursor.copy_expert(staging_copy_sql(table).rstrip(";"), stream)
+        cursor.execute(staging_check_sql(table))
+        cursor.execute(staging_insert_sql(table, upsert))
+        cursor.execute(staging_drop_sql(table))
+        duration = time.perf_counter() - start
+    conn.commit()
+
+    report_step(f"{table} (COPY{' delta' if upsert else ''})", duration, stream.row_count)
+
+
+def copy_keyed_rows(conn, table, rows, upsert=False):
+    """Stream rows carrying deterministic ids straight into a table with COPY"""
+    with conn.cursor() as cursor:
+        start = time.perf_counter()
+        stream = CopyStream(keyed_rows(table, rows))
+        cursor.execute(rekey_parents_sql(table))
+        if upsert:
+            cursor.execute(keyed_staging_create_sql(table))
+        cursor.copy_expert(keyed_copy_sql(table, upsert).rstrip(";"), stream)
+        if upsert:
+            cursor.execute(keyed_staging_insert_sql(table))
+            cursor.execute(staging_drop_sql(table))
+        duration = time.perf_counter() - start
+    conn.commit()
+
+    report_step(f"{table} (COPY uuid{' delta' if upsert else ''})", duration, stream.row_count)
+
+
+def copy_chunks(conn, table, rows, chunk_size, checkpoint_key=None, ids="lookup", upsert=False):
+    """Stream rows in chunks of chunk_size, each staged and committed on its own
+
+    With a checkpoint_key every chunk is committed together with its
+    checkpoint, and the chunks a previous run committed are skipped without
+    being sent. Without one (delta loads, whose rows shrink as chunks land)
+    chunks are just committed as they go.
+    """
+    start = time.perf_counter()
+    done = 0
+    with conn.cursor() as cursor:
+        if ids == "uuid":
+            cursor.execute(rekey_parents_sql(table))
+        if checkpoint_key:
+            cursor.execute(checkpoint_table_sql())
+            cursor.execute(f"SELECT {last_chunk_sql(checkpoint_key, table)};")
+            done = cursor.fetchone()[0]
+    conn.commit()
+    if done:
+        log_info(f"Resuming {table} after chunk {done} ({done * chunk_size} rows already committed)")
+        rows = islice(rows, done * chunk_size, None)
+
+    copied = 0
+    for chunk, chunk_rows in enumerate(row_chunks(rows, chunk_size), done + 1):
+        guard = chunk_guard_sql(checkpoint_key, table, chunk) if checkpoint_key else None
+        with conn.cursor() as cursor:
+            stream = CopyStream(keyed_rows(table, chunk_rows) if ids == "uuid" else chunk_rows)
+            cursor.execute(chunk_staging_sql(table, ids))
+            cursor.copy_expert(chunk_copy_sql(table, ids).rstrip(";"), stream)
+            if ids != "uuid":
+                cursor.execute(staging_check_sql(table))
+            cursor.execute(chunk_insert_sql(table, upsert, ids, guard))
+            cursor.execute(staging_drop_sql(table))
+            if checkpoint_key:
+                cursor.execute(checkpoint_sql(checkpoint_key, table, chunk))
+        conn.commit()
+        copied += stream.row_count
+    duration = time.perf_counter() - start
+
+    mode = " uuid" if ids == "uuid" else ""
+    report_step(f"{table} (COPY{mode}{' delta' if upsert else ''}, chunks of {chunk_size})", duration, copied)
+
+
+def fetch_db_hashes(conn, table):
+    """Hash every row already in a table, keyed by code
+
+    Rows are selected in staging column order with the parent code in place
+    of the parent id, so they hash exactly like freshly generated rows.
+    """
+    spec = STAGING_TABLES[table]
+    columns = [name for name, _ in spec["columns"]][1:]
+    with conn.cursor() as cursor:
+        cursor.execute(
+            f"SELECT p.code, {', '.join('t.' + name for name in columns)} "
+            f"FROM {table} t JOIN {spec['parent_table']} p ON p.id = t.{spec['parent_id']}"
+        )
+        return {row[1]: row_hash(row) for row in cursor}
+
+
+def load_rows(conn, table, rows, delta, ids, chunk_size=None, checkpoint_key=None):
+    """COPY a table's rows, restricted to changed rows when delta is set"""
+    if delta:
+        rows = changed_rows(rows, fetch_db_hashes(conn, table), {})
+    if chunk_size:
+        copy_chunks(conn, table, rows, chunk_size, None if delta else checkpoint_key, ids, upsert=delta)
+    elif ids == "uuid":
+        copy_keyed_rows(conn, table, rows, upsert=delta)
+    else:
+        copy_rows(conn, table, rows, upsert=delta)
+
+
+def load_admin_csv(conn, input_csv, delta=False, ids="lookup", chunk_size=None, joins=(),
+                   join_memory=DEFAULT_JOIN_MEMORY_MB):
+    """Convert the administrative units CSV and COPY it into the database
+
+    Chunked loads share convert_full_admin_data's checkpoint key, so a load
+    begun from its --format copy --chunk-size output (with the same --ids and
+    --join sources) can be finished here and vice versa.
+    """
+    hierarchy = convert_full_admin_data.read_and_organize_data(input_csv)
+    if hierarchy.unmapped_districts:
+        log_warn(f"{len(hierarchy.unmapped_districts)} districts not mapped:")
+        for prov, dist in sorted(hierarchy.unmapped_districts):
+            log_warn(f"   {prov} -> {dist}")
+
+    checkpoint_key = None
+    if chunk_size:
+        checkpoint_key = load_key("convert_full_admin_data", input_csv, chunk_size, ids, "copy", None,
+                                  join_version(joins))
+    rows = join_rows(convert_full_admin_data.constituency_rows(hierarchy), "constituencies", joins, join_memory)
+    load_rows(conn, "constituencies", rows, delta, ids, chunk_size, checkpoint_key)
+    wards = convert_full_admin_data.iter_wards(input_csv)
+    rows = join_rows(convert_full_admin_data.ward_rows(wards), "wards", joins, join_memory)
+    load_rows(conn, "wards", rows, delta, ids, chunk_size, checkpoint_key)
+
+
+def load_shard(connection_pool, shard_path):
+    """Load one province shard over its own connection, in its own transaction"""
+    conn = connection_pool.getconn()
+    try:
+        with conn.cursor() as cursor:
+            start = time.perf_counter()
+            rows = execute_sql_file(cursor, shard_path)
+            duration = time.perf_counter() - start
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        connection_pool.putconn(conn)
+    report_step(shard_path.name, duration, rows)
+
+
+def load_shards(conn, connection_pool, shard_dir, jobs):
+    """Load 00_prepare.sql, then every province shard, jobs at a time
+
+    All shards are attempted; the load fails afterwards if any did, naming
+    them. Shards that succeeded stay committed.
+    """
+    prepare, shards = shard_files(shard_dir)
+    load_seed_file(conn, prepare)
+
+    log_info(f"Loading {len(shards)} province shards ({min(jobs, len(shards))} at a time)")
+    start = time.perf_counter()
+    failed = []
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(load_shard, connection_pool, shard): shard for shard in shards}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                log_error(f"✗ Failed to load {futures[future].name}: {e}")
+                failed.append(futures[future].name)
+    if failed:
+        raise RuntimeError(f"{len(failed)} province shards failed: {', '.join(sorted(failed))}")
+    log_info(f"✓ All province shards loaded ({time.perf_counter() - start:.2f}s)")
+
+
+def seed_file_list(args):
+    """Static seed files to load, in dependency order"""
+    if args.delta and (args.admin_csv or args.shard_dir or args.sql_file):
+        return []
+    if args.admin_csv or args.shard_dir or args.sql_file:
+        return ADMIN_CSV_SEED_FILES
+    return SEED_FILES
+
+
+def validate_seed_data(args):
+    """Check everything about to be loaded; returns False if the load would fail
+
+    Delta loads skip the static seed files, which are then validated only as
+    the rows already in the database that generated rows may upsert.
+    """
+    log_section("Validating Seed Data")
+    static_files = seed_file_list(args) or ADMIN_CSV_SEED_FILES
+    seed_files = [SEED_DIR / seed_file for seed_file in static_files if (SEED_DIR / seed_file).exists()]
+    if args.shard_dir:
+        prepare, shards = shard_files(args.shard_dir)
+        seed_files += [prepare] + shards
+    if args.sql_file:
+        seed_files.append(Path(args.sql_file))
+
+    validator = validate(seed_files)
+    if args.admin_csv:
+        # Fresh sources, so the load's join statistics count its own rows only
+        joins = [JoinSource(source.spec) for source in args.join_sources]
+        validate_admin_csv(validator, args.admin_csv, upsert=args.delta, joins=joins, join_memory=args.join_memory)
+    valid = validator.report(sys.stdout)
+    print("")
+    return valid
+
+
+def load_all_seed_data(conn, args, connection_pool=None):
+    """Load all seed data in dependency order, stopping at the first error"""
+    log_section("Loading Seed Data")
+
+    for seed_file in seed_file_list(args):
+        seed_path = SEED_DIR / seed_file
+        if not seed_path.exists():
+            log_warn(f"Seed file not found: {seed_file} (skipping)")
+            continue
+        load_seed_file(conn, seed_path)
+
+    if args.admin_csv:
+        load_admin_csv(conn, args.admin_csv, args.delta, args.ids, args.chunk_size, args.join_sources,
+                       args.join_memory)
+        print_join_summary(args.join_sources)
+        if args.join_report:
+            write_join_report(args.join_report, args.join_sources)
+            log_info(f"Wrote join report: {args.join_report}")
+    if args.shard_dir:
+        load_shards(conn, connection_pool, args.shard_dir, args.jobs)
+    if args.sql_file:
+        load_seed_file(conn, Path(args.sql_file))
+
+    # Committed above, so a converter --delta output's manifest can now count its rows as loaded
+    generated = args.shard_dir or args.sql_file
+    manifest_path = commit_pending_manifest(generated) if generated else None
+    if manifest_path:
+        log_info(f"✓ Updated delta manifest: {manifest_path}")
+
+    print("")
+
+
+def refresh_views(conn):
+    """Refresh the administrative hierarchy materialized view"""
+    log_section("Refreshing Materialized Views")
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT refresh_administrative_hierarchy();")
+        conn.commit()
+        log_info("✓ Materialized views refreshed")
+    except Exception as e:
+        conn.rollback()
+        log_warn(f"Failed to refresh materialized views (may not exist yet): {e}")
+    print("")
+
+
+def verify_seed_data(conn):
+    """Report hierarchy counts (one query) and flag sample-sized datasets"""
+    log_section("Verifying Seed Data")
+    with conn.cursor() as cursor:
+        counts = table_counts(cursor)
+
+    log_info(f"Provinces: {counts['provinces']} (expected: 10)")
+    log_info(f"Districts: {counts['districts']} (expected: ~116)")
+    log_info(f"Constituencies: {counts['constituencies']} (expected: 156)")
+    log_info(f"Wards: {counts['wards']} (expected: ~624)")
+    print("")
+
+    if counts['provinces'] != 10:
+        log_warn("Province count mismatch!")
+    if counts['districts'] < 100:
+        log_warn("This appears to be a sample dataset. Full deployment requires all 116 districts.")
+    if counts['constituencies'] < 150:
+        log_warn("This appears to be a sample dataset. Full deployment requires all 156 constituencies.")
+    if counts['wards'] < 600:
+        log_warn("This appears to be a sample dataset. Full deployment requires all 624+ wards.")
+    print("")
+
+    return counts
+
+
+def display_sample_data(conn):
+    """Print a few provinces and constituencies"""
+    log_section("Sample Data Preview")
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT code, name, capital, population FROM provinces ORDER BY name LIMIT 5;")
+        log_info("Sample Provinces:")
+        for row in cursor.fetchall():
+            print("  " + " | ".join(str(value) for value in row))
+
+        cursor.execute("""
+            SELECT c.code, c.name, d.name AS district, p.name AS province
+            FROM constituencies c
+            JOIN districts d ON c.district_id = d.id
+            JOIN provinces p ON d.province_id = p.id
+            ORDER BY c.name LIMIT 5;
+        """)
+        log_info("Sample Constituencies:")
+        for row in cursor.fetchall():
+            print("  " + " | ".join(str(value) for value in row))
+    print("")
+
+
+def main():
+    args = parse_args()
+
+    print(f"{BLUE}Seed data loader: {args.database}@{args.host}:{args.port}{NC}")
+    print("")
+
+    if not args.skip_validation and not validate_seed_data(args):
+        log_error("Seed data failed validation (--skip-validation loads it anyway)")
+        sys.exit(1)
+
+    if not args.password:
+        args.password = getpass.getpass("Enter database password: ")
+
+    connection_pool = create_pool(args)
+    conn = connection_pool.getconn()
+    try:
+        start = time.perf_counter()
+        try:
+            load_all_seed_data(conn, args, connection_pool)
+        except Exception as e:
+            conn.rollback()
+            log_error(f"Seed data loading stopped: {e}")
+            sys.exit(1)
+
+        refresh_views(conn)
+        counts = verify_seed_data(conn)
+        display_sample_data(conn)
+    finally:
+        connection_pool.putconn(conn)
+        connection_pool.closeall()
+
+    print(f"{GREEN}✓ SEED DATA LOADING COMPLETED ({time.perf_counter() - start:.2f}s){NC}")
+    print("")
+    print("Administrative Hierarchy Summary:")
+    print(f"  - Provinces: {counts['provinces']}")
+    print(f"  - Districts: {counts['districts']}")
+    print(f"  - Constituencies: {counts['constituencies']}")
+    print(f"  - Wards: {counts['wards']}")
+
+
+if __name__ == "__main__":
+    main()
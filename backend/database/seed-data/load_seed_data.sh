@@ -22,6 +22,9 @@ DB_PORT="${DB_PORT:-5432}"
 DB_NAME="${DB_NAME:-cdf_smarthub}"
 DB_USER="${DB_USER:-postgres}"
 DB_PASSWORD="${DB_PASSWORD:-}"
+SHARD_DIR=""
+JOBS=4
+SKIP_VALIDATION=false
 TIMESTAMP=$(date +%Y%m%d_%H%M%S)
 
 # Banner
@@ -77,6 +80,18 @@ parse_args() {
                 DB_PASSWORD="$2"
                 shift 2
                 ;;
+            --shard-dir)
+                SHARD_DIR="$2"
+                shift 2
+                ;;
+            --jobs)
+                JOBS="$2"
+                shift 2
+                ;;
+            --skip-validation)
+                SKIP_VALIDATION=true
+                shift
+                ;;
             --help)
                 show_help
                 exit 0
@@ -99,6 +114,10 @@ show_help() {
     echo "  --database <dbname>     Database name (default: cdf_smarthub)"
     echo "  --username <user>       Database user (default: postgres)"
     echo "  --password <password>   Database password (default: prompt)"
+    echo "  --shard-dir <dir>       Load province shards from a converter's --shard-dir"
+    echo "                          instead of 03/04, several at a time"
+    echo "  --jobs <n>              Shards loaded concurrently (default: 4)"
+    echo "  --skip-validation       Load without checking the seed data first"
     echo "  --help                  Show this help message"
     echo ""
 }
@@ -146,18 +165,56 @@ load_seed_file() {
     fi
 }
 
+# Seed files in dependency order
+select_seed_files() {
+    if [ -n "$SHARD_DIR" ]; then
+        SEED_FILES=(
+            "01_provinces.sql"
+            "02_districts.sql"
+            "$SHARD_DIR/00_prepare.sql"
+        )
+    else
+        SEED_FILES=(
+            "01_provinces.sql"
+            "02_districts.sql"
+            "03_constituencies.sql"
+            "04_wards.sql"
+        )
+    fi
+}
+
+# Check parents, unique codes/names and column widths before any SQL runs
+validate_seed_data() {
+    log_section "Validating Seed Data"
+
+    local files=()
+    local seed_file
+    for seed_file in "${SEED_FILES[@]}"; do
+        if [ -f "$seed_file" ]; then
+            files+=("$seed_file")
+        fi
+    done
+    if [ -n "$SHARD_DIR" ]; then
+        for seed_file in "$SHARD_DIR"/*.sql; do
+            if [ "$(basename "$seed_file")" != "00_prepare.sql" ]; then
+                files+=("$seed_file")
+            fi
+        done
+    fi
+
+    if python3 validate_seed_data.py "${files[@]}"; then
+        echo ""
+        return 0
+    else
+        log_error "Seed data failed validation (--skip-validation loads it anyway)"
+        return 1
+    fi
+}
+
 # Load all seed data files
 load_all_seed_data() {
     log_section "Loading Seed Data"
 
-    # Seed files in dependency order
-    SEED_FILES=(
-        "01_provinces.sql"
-        "02_districts.sql"
-        "03_constituencies.sql"
-        "04_wards.sql"
-    )
-
     TOTAL_FILES=${#SEED_FILES[@]}
     SUCCESSFUL=0
     FAILED=0
@@ -179,6 +236,10 @@ load_all_seed_data() {
         fi
     done
 
+    if [ -n "$SHARD_DIR" ]; then
+        load_shards || return 1
+    fi
+
     echo ""
     log_info "Loading Summary: $SUCCESSFUL successful, $FAILED failed out of $TOTAL_FILES"
 
@@ -190,6 +251,38 @@ load_all_seed_data() {
     return 0
 }
 
+# Load province shards concurrently, each in its own transaction
+load_shards() {
+    local shards=()
+    local shard
+
+    # Largest first, so a big province doesn't start last; only files named
+    # like a shard (shards.SHARD_NAME), not other .sql files in the directory
+    while IFS= read -r shard; do
+        if [[ "$(basename "$shard")" =~ ^(WP|CB|CP|EP|LSK|LP|MP|NP|NWP|SP|P[0-9]+)\.sql$ ]]; then
+            shards+=("$shard")
+        fi
+    done < <(ls -S "$SHARD_DIR"/*.sql)
+
+    log_info "Loading ${#shards[@]} province shards ($JOBS at a time)"
+    export PGPASSWORD="$DB_PASSWORD"
+    START_TIME=$(date +%s)
+
+    if printf '%s\n' "${shards[@]}" | xargs -P "$JOBS" -I {} \
+        psql -h "$DB_HOST" -p "$DB_PORT" -U "$DB_USER" -d "$DB_NAME" \
+            --quiet -v ON_ERROR_STOP=1 --single-transaction -f {}; then
+        log_info "✓ Province shards loaded ($(($(date +%s) - START_TIME))s)"
+        # A converter --delta run's manifest waits for its shards to load (see delta.py)
+        if [ -f "${SHARD_DIR%/}.manifest.pending.json" ]; then
+            python3 delta.py --commit "$SHARD_DIR" || return 1
+        fi
+        return 0
+    else
+        log_error "✗ One or more province shards failed (the others are committed)"
+        return 1
+    fi
+}
+
 # Refresh materialized views
 refresh_views() {
     log_section "Refreshing Materialized Views"
@@ -295,6 +388,10 @@ main() {
     fi
 
     # Run loading steps
+    select_seed_files
+    if [ "$SKIP_VALIDATION" != true ]; then
+        validate_seed_data || exit 1
+    fi
     test_connection
     load_all_seed_data || exit 1
     refresh_views
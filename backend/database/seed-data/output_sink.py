@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Output Sinks - Where converter SQL goes
+A converter's --output picks the sink from its target:
+    -                       stdout (default)
+    file.sql                plain file with a large write buffer
+    file.sql.gz             streaming gzip
+    file.sql.zst            streaming zstd (requires zstandard: pip install zstandard)
+    postgresql://...        piped straight into psql, nothing written to disk
+
+File sinks are written to a temporary name and renamed into place when the
+conversion succeeds, so a failed run never leaves a truncated seed file.
+"""
+
+import gzip
+import io
+import os
+import shutil
+import subprocess
+import sys
+from contextlib import contextmanager, redirect_stdout
+
+# Write buffer for file sinks; converters emit many small writes
+OUTPUT_BUFFER_BYTES = 1 << 20
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 10
+
+DATABASE_URL_PREFIXES = ("postgresql://", "postgres://")
+
+
+def sink_kind(target):
+    """Sink type for an --output target: stdout, file, gzip, zstd or psql"""
+    if not target or target == "-":
+        return "stdout"
+    if target.startswith(DATABASE_URL_PREFIXES):
+        return "psql"
+    if target.endswith(".gz"):
+        return "gzip"
+    if target.endswith(".zst"):
+        return "zstd"
+    return "file"
+
+
+@contextmanager
+def file_stream(target, kind):
+    """Text stream writing a (possibly compressed) file via a temporary name"""
+    tmp_path = f"{target}.tmp"
+    if kind == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            print("Error: zstd output requires zstandard: pip install zstandard", file=sys.stderr)
+            sys.exit(1)
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(open(tmp_path, 'wb'))
+        stream = io.TextIOWrapper(compressor, encoding='utf-8')
+    elif kind == "gzip":
+        stream = gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=GZIP_LEVEL)
+    else:
+        stream = open(tmp_path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_BYTES)
+
+    try:
+        yield stream
+        stream.close()
+        os.replace(tmp_path, target)
+    except BaseException:
+        stream.close()
+        os.remove(tmp_path)
+        raise
+
+
+@contextmanager
+def psql_stream(database_url):
+    """Text stream feeding a psql process connected to database_url"""
+    if shutil.which("psql") is None:
+        print("Error: piping into a database requires psql on PATH", file=sys.stderr)
+        sys.exit(1)
+
+    proc = subprocess.Popen(["psql", database_url, "--quiet", "-v", "ON_ERROR_STOP=1"],
+                            stdin=subprocess.PIPE, stdout=sys.stderr,
+                            text=True, encoding='utf-8', bufsize=OUTPUT_BUFFER_BYTES)
+    try:
+        yield proc.stdin
+    finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        returncode = proc.wait()
+    if returncode != 0:
+        print(f"Error: psql exited with status {returncode}", file=sys.stderr)
+        sys.exit(returncode)
+
+
+@contextmanager
+def open_output(target):
+    """Text stream for an --output target (see module docstring)"""
+    kind = sink_kind(target)
+    if kind == "stdout":
+        yield sys.stdout
+    elif kind == "psql":
+        with psql_stream(target) as stream:
+            yield stream
+    else:
+        with file_stream(target, kind) as stream:
+            yield stream
+
+
+@contextmanager
+def redirect_output(target):
+    """Send everything printed inside the block to an --output target"""
+    with open_output(target) as stream, redirect_stdout(stream):
+        yield stream
+
+
+def describe_output(target):
+    """Human-readable name of an --output target for progress messages"""
+    kind = sink_kind(target)
+    if kind == "stdout":
+        return "stdout"
+    if kind == "psql":
+        return "psql (database)"
+    return f"{target} ({kind})"
+
+
+def add_output_args(parser):
+    """Add the --output option to a converter's argument parser"""
+    parser.add_argument("--output", "-o", default="-", metavar="TARGET",
+                        help="Where to write the SQL: - (stdout, default), a .sql file, a .sql.gz or "
+                             ".sql.zst file, or a postgresql:// URL to pipe into psql")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Parallel CSV Ingest - One large administrative units CSV parsed on a process pool
+The file is memory-mapped and cut into byte ranges that each start at a
+record boundary; every range is decoded, parsed and folded into a partial
+hierarchy (hierarchy.fold_admin_rows()) by a worker, and the parent merges
+the partial hierarchies in file order, so the result is the same as reading
+the file front to back.
+
+A newline only ends a record outside quotes. Quotes are counted per range
+first (also on the pool), and a range boundary moves forward to the first
+newline at which the number of quotes since the start of the file is even,
+so quoted fields spanning a boundary stay in one range. This holds for
+RFC 4180 quoting (quotes only around fields, doubled inside them), which is
+what csv.writer and spreadsheet exports produce.
+"""
+
+import csv
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from hierarchy import ADMIN_COLUMNS, clean_string, fold_admin_rows, merge_hierarchy
+from instrumentation import stage
+
+# Ranges per worker, so one slow range doesn't hold up the rest
+RANGES_PER_JOB = 4
+# Smaller ranges cost more in process overhead than they save
+MIN_RANGE_BYTES = 4 << 20
+
+
+def record_end(mm, position, quotes):
+    """Offset just past the first newline at or after position outside quotes
+
+    quotes is the number of quote characters before position. Returns the
+    file size when no such newline follows.
+    """
+    size = len(mm)
+    while position < size:
+        newline = mm.find(b"\n", position)
+        if newline < 0:
+            return size
+        quotes += mm[position:newline].count(b'"')
+        position = newline + 1
+        if quotes % 2 == 0:
+            return position
+    return size
+
+
+def count_quotes(input_csv, start, end):
+    """Quote characters in a byte range of a file"""
+    with open(input_csv, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return mm[start:end].count(b'"')
+
+
+def fold_range(input_csv, start, end, header):
+    """Parse the records in a byte range and fold them (worker side)"""
+    missing = [column for column in ADMIN_COLUMNS if column not in header]
+    if missing:
+        raise KeyError(f"{input_csv}: missing columns {', '.join(missing)}")
+    prov_code, prov_name, dist_code, dist_name, const_code, ward_code, ward_name = \
+        (header.index(column) for column in ADMIN_COLUMNS)
+    width = len(header)
+
+    with open(input_csv, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Ranges start after a newline, which never falls inside a UTF-8 sequence
+        text = mm[start:end].decode('utf-8')
+
+    def rows():
+        for record in csv.reader(io.StringIO(text, newline='')):
+            if not record:
+                continue
+            if len(record) < width:
+                record += [''] * (width - len(record))
+            yield {
+                'prov_code': record[prov_code],
+                'prov_name': clean_string(record[prov_name]),
+                'dist_code': record[dist_code],
+                'dist_name': clean_string(record[dist_name]),
+                'const_code': record[const_code],
+                'ward_code': record[ward_code],
+                'ward_name': clean_string(record[ward_name]),
+            }
+
+    return fold_admin_rows(rows())
+
+
+def split_ranges(input_csv, jobs, pool=None):
+    """(header, [(start, end)]) of a CSV: data byte ranges starting at record boundaries"""
+    size = os.path.getsize(input_csv)
+    if size == 0:
+        return None, []
+    with open(input_csv, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data_start = record_end(mm, 0, 0)
+        header = next(csv.reader(io.StringIO(mm[:data_start].decode('utf-8-sig'), newline='')), [])
+
+        count = 1 if jobs == 1 else max(1, min(jobs * RANGES_PER_JOB, (size - data_start) // MIN_RANGE_BYTES))
+        step = (size - data_start) // count
+        cuts = [data_start + step * i for i in range(count)] + [size]
+        # Only the quotes before each cut matter, so the last range isn't counted
+        raw = list(zip(cuts, cuts[1:]))
+        if count > 1 and pool is not None:
+            quote_counts = list(pool.map(count_quotes, repeat(input_csv), *zip(*raw[:-1])))
+        else:
+            quote_counts = [mm[start:end].count(b'"') for start, end in raw[:-1]]
+
+        starts = [data_start]
+        quotes = 0
+        for (start, _), quote_count in zip(raw[1:], quote_counts):
+            quotes += quote_count
+            starts.append(max(starts[-1], record_end(mm, start, quotes)))
+    bounds = starts + [size]
+    return header, [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def read_hierarchy_parallel(input_csv, resolve_district, jobs=None, report=None):
+    """Read the administrative units CSV into an AdminHierarchy on jobs processes
+
+    Same result as build_hierarchy(read_admin_rows(input_csv), ...);
+    resolve_district runs in this process, in file order.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        with stage(report, "split"):
+            header, ranges = split_ranges(input_csv, jobs, pool)
+        with stage(report, "read_parallel"):
+            if len(ranges) > 1:
+                parts = list(pool.map(fold_range, repeat(input_csv), *zip(*ranges), repeat(header)))
+            else:
+                parts = [fold_range(input_csv, start, end, header) for start, end in ranges]
+    with stage(report, "organize"):
+        hierarchy = merge_hierarchy(parts, resolve_district, report)
+    if report:
+        report.count("rows_in", hierarchy.ward_count)
+        report.count("byte_ranges", len(ranges))
+    return hierarchy
@@ -0,0 +1,533 @@
+#!/usr/bin/env python3
+"""
+Scale-Test Fixtures - Production-volume projects, payments and committees
+Generates COPY data for the platform's hot tables on top of the converted
+hierarchy, so queries and RLS policies can be measured on a local database
+at production volumes:
+
+    budget_allocations    one per constituency and fiscal year, covering its commitments
+    committees            CDFC, TAC, Panel A and Panel B per constituency, a WDC per ward
+    projects              --projects, spread over constituencies and (unevenly) their wards
+    budget_commitments    one per CDFC-approved project
+    project_milestones    the payment milestones of 06_payment_categories.sql
+    payment_vouchers      one per milestone reached: paid, reconciled or in approval
+
+Random draws are made a column at a time per constituency (standard library
+only) and seeded, so the same options always produce the same file. Older
+fiscal years are mostly completed and closed, the current one mostly in the
+pipeline. Every table is spooled to a temporary file and written as a single
+COPY, in foreign key order, followed by ANALYZE.
+
+With --ids uuid (hierarchy loaded with --ids uuid) rows carry their
+constituency and ward ids and are copied straight into the tables; with
+--ids lookup they go through staging tables that resolve the codes with one
+join per table. Fixture rows get their own deterministic ids.
+
+Usage:
+    python3 scale_fixtures.py admin_units.csv --projects 2000000 --ids uuid -o fixtures.sql.gz
+"""
+
+import argparse
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+
+import convert_full_admin_data
+from hierarchy import iter_wards
+from ids import ID_MODES, hierarchy_id
+from output_sink import add_output_args, describe_output, redirect_output
+from sql_output import CDF_ALLOCATION, copy_escape
+from synthetic_data import synthetic_name
+
+DEFAULT_PROJECTS = 100000
+DEFAULT_YEARS = "2021-2025"
+
+# Payment milestones from 06_payment_categories.sql: (title, payment_type,
+# percentage of the contract), each within its documented range
+MILESTONES = [
+    ("Mobilization", "ADVANCE", 15),
+    ("Materials Procurement", "PROGRESS", 20),
+    ("Progress Payment 1", "PROGRESS", 25),
+    ("Progress Payment 2", "PROGRESS", 20),
+    ("Progress Payment 3", "PROGRESS", 10),
+    ("Final Payment", "FINAL", 5),
+    ("Retention Release", "RETENTION_RELEASE", 5),
+]
+# Milestones an ACTIVE project has reached: mobilization up front, then a
+# progress milestone whenever progress passes its cumulative percentage
+PROGRESS_THRESHOLDS = [35, 60, 80, 90]
+RETENTION_DAYS = 180
+
+# Sector: (weight, estimated budget range in kwacha, typical projects), after
+# the amount guidelines in 06_payment_categories.sql
+SECTORS = {
+    "EDUCATION": (28, (50000, 500000), ["Classroom block", "School furniture", "Teachers' house"]),
+    "HEALTH": (14, (120000, 800000), ["Health post", "Staff house", "Maternity annex"]),
+    "WATER_SANITATION": (16, (30000, 200000), ["Borehole with solar pump", "Community tap stand",
+                                               "VIP toilets"]),
+    "INFRASTRUCTURE": (18, (100000, 1000000), ["Gravel road", "Bridge and culverts", "Drainage works"]),
+    "AGRICULTURE": (8, (50000, 1200000), ["Irrigation scheme", "Storage shed", "Farmer training centre"]),
+    "SOCIAL_WELFARE": (7, (150000, 1200000), ["Community hall", "Market shelter", "Sports ground"]),
+    "EMPOWERMENT": (6, (20000, 300000), ["Youth empowerment grants", "Women's club grants"]),
+    "BURSARY": (2, (20000, 200000), ["Secondary school bursaries", "Skills training bursaries"]),
+    "OTHER": (1, (50000, 400000), ["Solar installation", "Mini-grid connection"]),
+}
+CATEGORIES = list(SECTORS)
+
+PRIORITIES = ["LOW", "MEDIUM", "HIGH", "URGENT"]
+PRIORITY_WEIGHTS = [20, 50, 25, 5]
+
+# Status mix by fiscal year age (0 = the latest year, 2 = two or more years back)
+STATUSES = ["DRAFT", "SUBMITTED", "UNDER_TAC_REVIEW", "TAC_APPROVED", "TAC_REJECTED", "CDFC_APPROVED",
+            "CDFC_REJECTED", "PROCUREMENT", "AWARDED", "ACTIVE", "SUSPENDED", "COMPLETED", "CLOSED",
+            "CANCELLED"]
+STATUS_WEIGHTS = [
+    [12, 12, 8, 6, 3, 8, 2, 10, 8, 25, 1, 3, 0, 2],
+    [1, 1, 1, 1, 2, 2, 2, 4, 4, 45, 4, 22, 8, 3],
+    [0, 0, 0, 0, 2, 0, 2, 0, 0, 6, 3, 22, 60, 5],
+]
+# Statuses past CDFC approval: these have a commitment and milestones
+APPROVED = {"CDFC_APPROVED", "PROCUREMENT", "AWARDED", "ACTIVE", "SUSPENDED", "COMPLETED", "CLOSED"}
+STARTED = {"ACTIVE", "SUSPENDED", "COMPLETED", "CLOSED"}
+# Voucher statuses short of payment, with the panel approvals each implies
+IN_APPROVAL = [("PENDING_PANEL_A", 0), ("PANEL_A_APPROVED", 1), ("PENDING_PANEL_B", 1),
+               ("PANEL_B_APPROVED", 2), ("PENDING_PAYMENT", 2)]
+
+COMMITTEES = [  # (type, name, required members, quorum)
+    ("CDFC", "Constituency Development Fund Committee", 10, 6),
+    ("TAC", "Technical Assessment Committee", 7, 4),
+    ("PANEL_A", "Panel A (Planning)", 5, 3),
+    ("PANEL_B", "Panel B (Execution)", 5, 3),
+]
+WARD_COMMITTEE = ("WDC", "Ward Development Committee", 10, 6)
+
+CONTRACTORS_PER_CONSTITUENCY = 40
+CONTRACTOR_SUFFIXES = ["Construction Ltd", "Builders", "General Dealers", "Contractors", "Enterprises"]
+BANKS = ["Zanaco", "Stanbic", "FNB Zambia", "Absa", "Indo Zambia Bank"]
+
+# Fixture ids: a fixed prefix per table and a counter, cheap to generate and
+# never equal to a random or hierarchy id
+ID_PREFIXES = {
+    "budget_allocations": "f1c70001-0000-4000-8000-",
+    "committees": "f1c70002-0000-4000-8000-",
+    "projects": "f1c70003-0000-4000-8000-",
+    "budget_commitments": "f1c70004-0000-4000-8000-",
+    "project_milestones": "f1c70005-0000-4000-8000-",
+    "payment_vouchers": "f1c70006-0000-4000-8000-",
+}
+
+# Tables in load order: COPY columns, and the columns holding a hierarchy
+# reference (a code with --ids lookup, an id with --ids uuid)
+FIXTURE_TABLES = {
+    "budget_allocations": {
+        "columns": ["id", "fiscal_year", "allocation_reference", "constituency_id", "total_allocation"]
+                   + [f"{category.lower()}_allocation" for category in CATEGORIES]
+                   + ["status", "approved_by_ministry", "approved_by_treasury", "approved_at"],
+        "references": {"constituency_id": "constituencies"},
+    },
+    "committees": {
+        "columns": ["id", "committee_code", "committee_type", "committee_name", "constituency_id", "ward_id",
+                    "required_members", "quorum_requirement", "is_active", "established_date"],
+        "references": {"constituency_id": "constituencies", "ward_id": "wards"},
+    },
+    "projects": {
+        "columns": ["id", "project_number", "title", "description", "constituency_id", "ward_id", "category",
+                    "priority", "estimated_budget", "approved_budget", "actual_cost", "committed_amount",
+                    "proposed_start_date", "proposed_end_date", "actual_start_date", "actual_end_date",
+                    "expected_duration_days", "status", "progress_percentage", "direct_beneficiaries",
+                    "wdc_submission_date", "wdc_priority_rank", "cdfc_resolution_number",
+                    "cdfc_resolution_date", "completion_certificate_issued", "created_at"],
+        "references": {"constituency_id": "constituencies", "ward_id": "wards"},
+    },
+    "budget_commitments": {
+        "columns": ["id", "budget_allocation_id", "project_id", "commitment_reference", "commitment_amount",
+                    "commitment_date", "sector", "is_active"],
+        "references": {},
+    },
+    "project_milestones": {
+        "columns": ["id", "project_id", "milestone_number", "title", "planned_completion_date",
+                    "actual_completion_date", "milestone_value", "percentage_of_contract", "is_completed",
+                    "verification_date"],
+        "references": {},
+    },
+    "payment_vouchers": {
+        "columns": ["id", "voucher_number", "project_id", "commitment_id", "milestone_id", "constituency_id",
+                    "payment_type", "payment_description", "payment_amount", "beneficiary_name",
+                    "beneficiary_type", "beneficiary_bank_name", "beneficiary_bank_account", "status",
+                    "panel_a_approved_at", "panel_b_approved_at", "payment_execution_date",
+                    "payment_execution_method", "payment_transaction_reference", "reconciled", "reconciled_at",
+                    "created_at"],
+        "references": {"constituency_id": "constituencies"},
+    },
+}
+
+NULL = "\\N"
+
+
+def parse_years(text):
+    """'2021-2025' or '2024' -> [2021, ..., 2025]"""
+    first, _, last = text.partition("-")
+    years = list(range(int(first), int(last or first) + 1))
+    if not years:
+        raise ValueError(f"empty fiscal year range: {text}")
+    return years
+
+
+def money(amount):
+    """Whole kwacha as a NUMERIC(15, 2) COPY value"""
+    return f"{amount}.00"
+
+
+def timestamp(day, hour=9):
+    """COPY value of a Lusaka-time (UTC+2) timestamp on a date"""
+    return f"{day.isoformat()} {hour:02d}:00:00+02"
+
+
+def cumulative(weights):
+    """Running totals, for random.choices(cum_weights=...)"""
+    totals = []
+    total = 0
+    for weight in weights:
+        total += weight
+        totals.append(total)
+    return totals
+
+
+class FixtureWriter:
+    """COPY data lines per table, spooled to temporary files, and running id counters"""
+
+    def __init__(self, spool_dir):
+        self.files = {table: open(Path(spool_dir) / f"{table}.copy", 'w', encoding='utf-8',
+                                  buffering=1 << 20)
+                      for table in FIXTURE_TABLES}
+        self.counts = Counter()
+
+    def next_ids(self, table, count):
+        """The next count fixture ids of a table"""
+        start = self.counts[table]
+        self.counts[table] += count
+        prefix = ID_PREFIXES[table]
+        return [f"{prefix}{n:012x}" for n in range(start + 1, start + count + 1)]
+
+    def write(self, table, rows):
+        """Write rows (sequences of COPY-ready strings)"""
+        self.files[table].write("".join("\t".join(row) + "\n" for row in rows))
+
+    def close(self):
+        for f in self.files.values():
+            f.close()
+
+
+def read_hierarchy(input_csv):
+    """[(constituency, [wards])] in code order, each ward code once"""
+    hierarchy = convert_full_admin_data.read_and_organize_data(input_csv)
+    wards = {}
+    seen = set()
+    for ward in iter_wards(input_csv):
+        if ward.code not in seen:
+            seen.add(ward.code)
+            wards.setdefault(ward.const_code, []).append(ward)
+    return [(constituency, wards.get(constituency.code, []))
+            for constituency in hierarchy.sorted_constituencies()]
+
+
+def reference(ids, table, code):
+    """COPY value of a hierarchy reference: the code, or with uuid ids the deterministic id"""
+    return str(hierarchy_id(table, code)) if ids == "uuid" else code
+
+
+def project_counts(rng, constituencies, total):
+    """Projects per constituency: near-equal CDF allocations, so a mild spread around the mean"""
+    weights = [rng.lognormvariate(0, 0.25) if wards else 0 for _, wards in constituencies]
+    drawn = Counter(rng.choices(range(len(constituencies)), weights=weights, k=total))
+    return [drawn[index] for index in range(len(constituencies))]
+
+
+def write_committees(writer, constituency, wards, ids):
+    """CDFC, TAC and panels of a constituency, and a WDC per ward"""
+    constituency_ref = reference(ids, "constituencies", constituency.code)
+    established = "2022-01-15"
+    rows = [(committee_type, f"{committee_type}-{constituency.code}", f"{constituency.name} {name}",
+             constituency_ref, NULL, required, quorum)
+            for committee_type, name, required, quorum in COMMITTEES]
+    committee_type, name, required, quorum = WARD_COMMITTEE
+    rows += [(committee_type, f"{committee_type}-{ward.code}", f"{ward.name} {name}",
+              NULL, reference(ids, "wards", ward.code), required, quorum)
+             for ward in wards]
+    writer.write("committees", (
+        (committee_id, code, committee_type, copy_escape(name), constituency_ref, ward_ref,
+         str(required), str(quorum), "t", established)
+        for committee_id, (committee_type, code, name, constituency_ref, ward_ref, required, quorum)
+        in zip(writer.next_ids("committees", len(rows)), rows)
+    ))
+
+
+def contractor_pool(rng, constituency_code):
+    """(name, bank, account) of the contractors working in a constituency"""
+    return [(f"{synthetic_name(rng)} {rng.choice(CONTRACTOR_SUFFIXES)}", rng.choice(BANKS),
+             f"2{constituency_code.zfill(3)}{index:06d}")
+            for index in range(CONTRACTORS_PER_CONSTITUENCY)]
+
+
+def milestones_paid(status, progress):
+    """(milestones paid, whether the next one is in approval) for a project"""
+    if status == "AWARDED":
+        return 0, True
+    if status in ("ACTIVE", "SUSPENDED"):
+        paid = 1 + sum(progress >= threshold for threshold in PROGRESS_THRESHOLDS)
+        return paid, status == "ACTIVE"
+    if status == "COMPLETED":
+        return len(MILESTONES) - 1, True
+    if status == "CLOSED":
+        return len(MILESTONES), False
+    return 0, False
+
+
+def generate_constituency(writer, rng, constituency, wards, count, years, ids):
+    """Write one constituency's allocations, committees, projects, commitments, milestones and vouchers"""
+    write_committees(writer, constituency, wards, ids)
+    code = constituency.code
+    constituency_ref = reference(ids, "constituencies", code)
+    latest = years[-1]
+
+    # Columns drawn a whole constituency at a time
+    ward_weights = cumulative(rng.lognormvariate(0, 0.8) for _ in wards)
+    project_wards = rng.choices(wards, cum_weights=ward_weights, k=count) if wards else []
+    project_years = sorted(rng.choices(years, k=count))
+    categories = rng.choices(CATEGORIES, weights=[SECTORS[category][0] for category in CATEGORIES], k=count)
+    priorities = rng.choices(PRIORITIES, weights=PRIORITY_WEIGHTS, k=count)
+    status_cum = [cumulative(weights) for weights in STATUS_WEIGHTS]
+    statuses = [rng.choices(STATUSES, cum_weights=status_cum[min(latest - year, 2)])[0]
+                for year in project_years]
+    start_offsets = [rng.randrange(30, 240) for _ in range(count)]
+    durations = [rng.randrange(90, 541) for _ in range(count)]
+    contractors = contractor_pool(rng, code)
+    ward_refs = {ward.code: reference(ids, "wards", ward.code) for ward in wards}
+
+    project_ids = writer.next_ids("projects", count)
+    allocation_ids = dict(zip(years, writer.next_ids("budget_allocations", len(years))))
+    committed = {year: Counter() for year in years}
+    projects, commitments, milestones, vouchers = [], [], [], []
+    rank = Counter()
+
+    for index, project_id in enumerate(project_ids):
+        ward, year, category, status = project_wards[index], project_years[index], categories[index], statuses[index]
+        low, high = SECTORS[category][1]
+        estimated = rng.randrange(low // 1000, high // 1000 + 1) * 1000
+        approved = estimated * rng.randint(90, 100) // 10000 * 100 if status in APPROVED else None
+        number = f"{code}-{year}-{index + 1:06d}"
+        title = f"{rng.choice(SECTORS[category][2])} - {ward.name}"
+        submitted = date(year - 1, 9, 1) + timedelta(days=rng.randrange(0, 120))
+        start = date(year, 1, 1) + timedelta(days=start_offsets[index])
+        duration = durations[index]
+        end = start + timedelta(days=duration)
+        actual_start = start + timedelta(days=rng.randrange(0, 30)) if status in STARTED else None
+        finished = status in ("COMPLETED", "CLOSED")
+        actual_end = actual_start + timedelta(days=duration + rng.randrange(-20, 60)) if finished else None
+        progress = 100 if finished else rng.randrange(5, 96) if status in ("ACTIVE", "SUSPENDED") else 0
+        cdfc_date = submitted + timedelta(days=rng.randrange(60, 110)) if approved else None
+        rank[ward.code] += 1
+
+        actual_cost = 0
+        if approved:
+            commitment_id = writer.next_ids("budget_commitments", 1)[0]
+            committed[year][category] += approved
+            commitments.append((commitment_id, allocation_ids[year], project_id, f"BC-{number}", money(approved),
+                                timestamp(cdfc_date), category, "t"))
+
+            paid, in_approval = milestones_paid(status, progress)
+            milestone_ids = writer.next_ids("project_milestones", len(MILESTONES))
+            values = [approved * percentage // 100 for _, _, percentage in MILESTONES]
+            values[-1] = approved - sum(values[:-1])
+            elapsed = 0
+            contractor = contractors[rng.randrange(len(contractors))]
+            for number_in_project, ((milestone_title, payment_type, percentage), milestone_id, value) in enumerate(
+                    zip(MILESTONES, milestone_ids, values), 1):
+                if payment_type == "RETENTION_RELEASE":
+                    planned = end + timedelta(days=RETENTION_DAYS)
+                else:
+                    planned = start + timedelta(days=duration * elapsed // 100)
+                    elapsed += percentage
+                done = number_in_project <= paid
+                completed_on = planned + timedelta(days=rng.randrange(-5, 20)) if done else None
+                milestones.append((milestone_id, project_id, str(number_in_project), milestone_title,
+                                   planned.isoformat(), completed_on.isoformat() if done else NULL,
+                                   money(value), f"{percentage}.00", "t" if done else "f",
+                                   completed_on.isoformat() if done else NULL))
+
+                if done or (in_approval and number_in_project == paid + 1):
+                    base = completed_on or planned
+                    if done:
+                        voucher_status = "RECONCILED" if status == "CLOSED" or rng.random() < 0.7 else "PAID"
+                        approvals = 2
+                        actual_cost += value
+                    else:
+                        voucher_status, approvals = IN_APPROVAL[rng.randrange(len(IN_APPROVAL))]
+                    panel_a = base + timedelta(days=rng.randrange(1, 8))
+                    panel_b = panel_a + timedelta(days=rng.randrange(1, 10))
+                    executed = panel_b + timedelta(days=rng.randrange(1, 6))
+                    reconciled = voucher_status == "RECONCILED"
+                    vouchers.append((
+                        writer.next_ids("payment_vouchers", 1)[0], f"PV-{number}-{number_in_project}", project_id,
+                        commitment_id, milestone_id, constituency_ref, payment_type, milestone_title,
+                        money(value), copy_escape(contractor[0]), "CONTRACTOR", contractor[1], contractor[2],
+                        voucher_status,
+                        timestamp(panel_a) if approvals >= 1 else NULL,
+                        timestamp(panel_b, 14) if approvals >= 2 else NULL,
+                        timestamp(executed, 11) if done else NULL,
+                        "BANK_TRANSFER" if done else NULL,
+                        f"TXN{executed:%Y%m%d}{len(vouchers):08d}" if done else NULL,
+                        "t" if reconciled else "f",
+                        timestamp(executed + timedelta(days=30), 16) if reconciled else NULL,
+                        timestamp(base),
+                    ))
+
+        committed_amount = approved - actual_cost if approved and status != "CLOSED" else 0
+        projects.append((
+            project_id, number, copy_escape(title),
+            copy_escape(f"{title} in {ward.name} ward, {constituency.name} constituency"),
+            constituency_ref, ward_refs[ward.code], category, priorities[index],
+            money(estimated), money(approved) if approved else NULL, money(actual_cost), money(committed_amount),
+            start.isoformat(), end.isoformat(),
+            actual_start.isoformat() if actual_start else NULL, actual_end.isoformat() if actual_end else NULL,
+            str(duration), status, str(progress), str(rng.randrange(200, 20000)),
+            timestamp(submitted), str(rank[ward.code]),
+            f"CDFC/{code}/{year}/{index + 1}" if approved else NULL,
+            cdfc_date.isoformat() if approved else NULL,
+            "t" if finished else "f", timestamp(submitted),
+        ))
+
+    allocations = []
+    for year in years:
+        sectors = committed[year]
+        total = max(int(CDF_ALLOCATION), -(-sum(sectors.values()) // 100000) * 100000)
+        allocations.append((allocation_ids[year], str(year), f"MLGRD-{year}-CDF-{code}", constituency_ref,
+                            money(total), *(money(sectors[category]) for category in CATEGORIES),
+                            "APPROVED", "t", "t", timestamp(date(year, 1, 10))))
+    writer.write("budget_allocations", allocations)
+    writer.write("projects", projects)
+    writer.write("budget_commitments", commitments)
+    writer.write("project_milestones", milestones)
+    writer.write("payment_vouchers", vouchers)
+
+
+def staging_table(table):
+    """Name of a fixture table's lookup staging table"""
+    return f"staging_fixture_{table}"
+
+
+def print_table_load(table, spool_path, ids):
+    """Print one table's COPY (through a code-resolving staging table with lookup ids)"""
+    spec = FIXTURE_TABLES[table]
+    columns = spec["columns"]
+    references = spec["references"] if ids == "lookup" else {}
+    target = staging_table(table) if references else table
+    if references:
+        print(f"CREATE TEMP TABLE {target} (LIKE {table} INCLUDING DEFAULTS);")
+        print(f"ALTER TABLE {target} " + ", ".join(
+            f"ALTER COLUMN {column} TYPE VARCHAR(20)" for column in references) + ";")
+    print(f"COPY {target} ({', '.join(columns)}) FROM STDIN;")
+    sys.stdout.flush()
+    with open(spool_path, 'r', encoding='utf-8') as f:
+        shutil.copyfileobj(f, sys.stdout, 1 << 20)
+    print("\\.")
+    if references:
+        selected = [f"r_{column}.id" if column in references else f"s.{column}" for column in columns]
+        print(f"INSERT INTO {table} ({', '.join(columns)})")
+        print(f"SELECT {', '.join(selected)}")
+        print(f"FROM {target} s")
+        for column, parent_table in references.items():
+            print(f"LEFT JOIN {parent_table} r_{column} ON r_{column}.code = s.{column}")
+        print(";")
+        print(f"DROP TABLE {target};")
+    print(f"ANALYZE {table};")
+    print("")
+
+
+def print_fixtures(spool_dir, counts, ids):
+    """Print the header and every table's load in foreign key order"""
+    print("-- ============================================================================")
+    print("-- SCALE-TEST FIXTURES (generated by scale_fixtures.py - not for production)")
+    for table in FIXTURE_TABLES:
+        print(f"-- {table}: {counts[table]}")
+    print("-- Load after the hierarchy" + (" (loaded with --ids uuid)" if ids == "uuid" else ""))
+    print("-- ============================================================================")
+    print("")
+    print("\\echo 'Loading scale-test fixtures'")
+    print("")
+    for table in FIXTURE_TABLES:
+        print(f"\\echo '  {table} ({counts[table]} rows)'")
+        print_table_load(table, Path(spool_dir) / f"{table}.copy", ids)
+    print("\\echo '✓ Scale-test fixtures loaded'")
+
+
+def generate(input_csv, total_projects, years, ids="lookup", seed=42, spool_dir=None):
+    """Generate every fixture table into spool_dir, returning the row counts"""
+    constituencies = read_hierarchy(input_csv)
+    rng = random.Random(seed)
+    counts = project_counts(rng, constituencies, total_projects)
+    writer = FixtureWriter(spool_dir)
+    try:
+        for index, ((constituency, wards), count) in enumerate(zip(constituencies, counts)):
+            # One generator per constituency: its rows don't depend on the others'
+            generate_constituency(writer, random.Random(f"{seed}/{constituency.code}"), constituency, wards,
+                                  count, years, ids)
+            if (index + 1) % 100 == 0:
+                print(f"  {index + 1}/{len(constituencies)} constituencies, "
+                      f"{writer.counts['projects']} projects", file=sys.stderr)
+    finally:
+        writer.close()
+    return writer.counts
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Generate scale-test fixtures (projects, payments, committees) "
+                                                 "as COPY data")
+    parser.add_argument("input_csv", help="Administrative units CSV the hierarchy was loaded from")
+    parser.add_argument("--projects", type=int, default=DEFAULT_PROJECTS,
+                        help="Projects to generate (default: %(default)s)")
+    parser.add_argument("--years", default=DEFAULT_YEARS,
+                        help="Fiscal years, e.g. 2021-2025 (default: %(default)s)")
+    parser.add_argument("--ids", choices=ID_MODES, default="lookup",
+                        help="lookup: resolve constituency and ward codes in staging tables; "
+                             "uuid: copy deterministic hierarchy ids straight in (hierarchy loaded with --ids uuid)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: %(default)s)")
+    add_output_args(parser)
+    args = parser.parse_args()
+    if args.projects < 0:
+        parser.error("--projects must not be negative")
+    try:
+        args.years = parse_years(args.years)
+    except ValueError as e:
+        parser.error(f"--years: {e}")
+    return args
+
+
+def main():
+    args = parse_args()
+    print(f"Generating {args.projects} projects over fiscal years {args.years[0]}-{args.years[-1]}...",
+          file=sys.stderr)
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="scale_fixtures_") as spool_dir:
+        counts = generate(args.input_csv, args.projects, args.years, args.ids, args.seed, spool_dir)
+        generated = time.perf_counter() - start
+        print(f"Writing fixtures to {describe_output(args.output)}...", file=sys.stderr)
+        with redirect_output(args.output):
+            print_fixtures(spool_dir, counts, args.ids)
+
+    rows = sum(counts.values())
+    print("", file=sys.stderr)
+    for table in FIXTURE_TABLES:
+        print(f"  - {table}: {counts[table]}", file=sys.stderr)
+    print(f"✅ {rows} fixture rows generated in {generated:.1f}s ({rows / max(generated, 1e-9):,.0f} rows/s), "
+          f"written in {time.perf_counter() - start - generated:.1f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
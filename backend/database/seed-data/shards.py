@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Province Shards - Converter output split into one SQL file per province
+Constituencies and wards in different provinces don't depend on each other,
+only on the provinces and districts every province shares. With --shard-dir
+a converter writes each province's constituencies and wards to its own file,
+and load_seed_data.py --shard-dir (or load_seed_data.sh --shard-dir) loads
+them concurrently over several connections once the shared files are in.
+
+Layout:
+    <shard_dir>/00_prepare.sql    run first, after 01_provinces / 02_districts
+                                  (with --ids uuid it gives the parent rows their
+                                  deterministic ids)
+    <shard_dir>/<PROV>.sql        one per province code (CP, CB, LSK, ...), in
+                                  any order or all at once
+
+Only files named like a shard are loaded or swept as stale, so other .sql
+files sharing the directory are left alone.
+
+Shards need --format copy or --ids uuid: lookup INSERT loads create and drop
+a shared helper function that concurrent shards would drop under each other.
+"""
+
+import pickle
+import re
+import sys
+import tempfile
+from contextlib import ExitStack, redirect_stdout
+from pathlib import Path
+
+from hierarchy import PROVINCE_MAP
+from output_sink import file_stream
+from sql_output import print_load, rekey_parents_sql
+
+SHARD_PREPARE_FILE = "00_prepare.sql"
+
+# Province shard file names: a PROVINCE_MAP code, or P<code> for a province it doesn't map
+SHARD_NAME = re.compile(rf"^(?:{'|'.join(PROVINCE_MAP.values())}|P\d+)\.sql$")
+
+# Rows are spooled to disk this many at a time per province
+SPOOL_BATCH_ROWS = 1000
+
+
+def add_shard_args(parser):
+    """Add the --shard-dir option to a converter's argument parser"""
+    parser.add_argument("--shard-dir", metavar="DIR",
+                        help="Write one SQL file per province (plus 00_prepare.sql) to DIR instead of "
+                             "--output, for load_seed_data.py --shard-dir")
+
+
+def check_shard_args(parser, args):
+    """Reject option combinations that can't be sharded"""
+    if args.shard_dir and args.output_format == "insert" and args.ids == "lookup":
+        parser.error("--shard-dir needs --format copy or --ids uuid (lookup INSERT loads share a helper "
+                     "function across shards)")
+
+
+class RowSpool:
+    """One province's rows of a table, spooled to a temporary file in input order"""
+
+    def __init__(self):
+        self.file = tempfile.TemporaryFile()
+        self.batch = []
+        self.count = 0
+
+    def add(self, row):
+        self.batch.append(row)
+        self.count += 1
+        if len(self.batch) >= SPOOL_BATCH_ROWS:
+            self.flush()
+
+    def flush(self):
+        if self.batch:
+            pickle.dump(self.batch, self.file, pickle.HIGHEST_PROTOCOL)
+            self.batch = []
+
+    def __iter__(self):
+        """Yield the rows back (after every add())"""
+        self.flush()
+        self.file.seek(0)
+        while True:
+            try:
+                yield from pickle.load(self.file)
+            except EOFError:
+                return
+
+    def close(self):
+        self.file.close()
+
+
+def spool_rows(rows, province_of, spools, stack):
+    """Send each row to its province's spool as it arrives (spools: {province: RowSpool})"""
+    for row in rows:
+        province = province_of(row)
+        spool = spools.get(province)
+        if spool is None:
+            spool = spools[province] = RowSpool()
+            stack.callback(spool.close)
+        spool.add(row)
+
+
+def print_prepare_sql(ids):
+    """Print the SQL every shard depends on"""
+    print("-- ============================================================================")
+    print("-- PROVINCE SHARDS: PREPARE")
+    print("-- Load after the provinces and districts, before any province shard")
+    print("-- ============================================================================")
+    print("")
+    if ids == "uuid":
+        # Run once here rather than in every shard, where concurrent
+        # updates of the same parent rows would serialize the shards
+        for table in ("constituencies", "wards"):
+            print(rekey_parents_sql(table))
+            print("")
+    print("\\echo '✓ Province shards prepared'")
+
+
+def print_province_shard(province, constituencies, wards, output_format, manifest, ids):
+    """Print one province's constituencies and wards (RowSpools)"""
+    print("-- ============================================================================")
+    print(f"-- PROVINCE SHARD: {province}")
+    print(f"-- Constituencies: {constituencies.count}")
+    print(f"-- Wards: {wards.count}")
+    print(f"-- Load after {SHARD_PREPARE_FILE}; independent of the other province shards")
+    print("-- ============================================================================")
+    print("")
+    print(f"\\echo 'Loading province shard {province}'")
+    print("")
+    print_load("constituencies", constituencies, output_format, manifest, ids, rekey=False)
+    print("")
+    print_load("wards", wards, output_format, manifest, ids, rekey=False)
+    print("")
+    print(f"\\echo '✓ {province}: {constituencies.count} constituencies, {wards.count} wards loaded'")
+
+
+def write_sql_file(path, generate):
+    """Run generate() with its printed SQL going to path (written via a temporary name)"""
+    with file_stream(str(path), "file") as stream, redirect_stdout(stream):
+        generate()
+
+
+def write_province_shards(shard_dir, hierarchy, constituency_rows, ward_rows, output_format="copy",
+                          manifest=None, ids="lookup"):
+    """Write 00_prepare.sql and one shard per province, returning {province: (constituencies, wards)}
+
+    Rows are the converter's full constituency and ward row streams, split
+    by the province of their constituency: each row goes to its province's
+    spool file as it arrives, so memory doesn't grow with the row count, and
+    each shard is then written from its spools. With a manifest each shard
+    is delta-filtered against it and the manifest ends up with every shard's
+    hashes. Shard files left from provinces no longer present are removed;
+    other .sql files in shard_dir are not touched.
+    """
+    shard_dir = Path(shard_dir)
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    provinces = hierarchy.constituency_provinces()
+
+    write_sql_file(shard_dir / SHARD_PREPARE_FILE, lambda: print_prepare_sql(ids))
+    written = {SHARD_PREPARE_FILE}
+    counts = {}
+    merged = {}
+    with ExitStack() as stack:
+        constituencies = {}
+        wards = {}
+        spool_rows(constituency_rows, lambda row: provinces[row[1]], constituencies, stack)
+        spool_rows(ward_rows, lambda row: provinces[row[0]], wards, stack)
+
+        for province in sorted(constituencies):
+            # delta_rows() replaces manifest[table] with the hashes it saw, so
+            # each shard gets its own copy of the known hashes
+            shard_manifest = dict(manifest) if manifest is not None else None
+            province_constituencies = constituencies[province]
+            province_wards = wards.get(province)
+            if province_wards is None:
+                province_wards = RowSpool()
+                stack.callback(province_wards.close)
+            write_sql_file(shard_dir / f"{province}.sql", lambda: print_province_shard(
+                province, province_constituencies, province_wards, output_format, shard_manifest, ids))
+            written.add(f"{province}.sql")
+            counts[province] = (province_constituencies.count, province_wards.count)
+            if shard_manifest is not None:
+                for table in ("constituencies", "wards"):
+                    merged.setdefault(table, {}).update(shard_manifest.get(table, {}))
+    if manifest is not None:
+        manifest.update(merged)
+
+    for stale in sorted(shard_dir.glob("*.sql")):
+        if SHARD_NAME.match(stale.name) and stale.name not in written:
+            stale.unlink()
+            print(f"Removed stale shard: {stale}", file=sys.stderr)
+    return counts
+
+
+def shard_files(shard_dir):
+    """(prepare file, province shards largest first) of a shard directory
+
+    Starting the largest shards first keeps the last connection from being
+    left with a big province after the others have finished.
+    """
+    shard_dir = Path(shard_dir)
+    prepare = shard_dir / SHARD_PREPARE_FILE
+    if not prepare.exists():
+        raise FileNotFoundError(f"{prepare} not found (write shards with a converter's --shard-dir)")
+    shards = [path for path in shard_dir.glob("*.sql") if SHARD_NAME.match(path.name)]
+    return prepare, sorted(shards, key=lambda path: (-path.stat().st_size, path.name))
+
+
+def print_shard_summary(shard_dir, counts):
+    """Progress message listing the shards written"""
+    print(f"Wrote {len(counts)} province shards to {shard_dir}:", file=sys.stderr)
+    for province, (constituency_count, ward_count) in counts.items():
+        print(f"  {province}.sql: {constituency_count} constituencies, {ward_count} wards", file=sys.stderr)
@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""
+Source Joins - Census and ECZ figures merged into the generated rows by code
+Each --join names a secondary CSV, the level its key is at and the columns
+it fills:
+
+    --join ward=census_2022.csv:CONST_CODE+WARD_CODE:population=POP_TOTAL
+    --join constituency=ecz_register.csv:CONST_CODE:registered_voters=VOTERS
+    --join district=bank_branches.csv:DISTRICT:bank_branch=BRANCH
+
+ward sources fill ward rows by ward code, constituency sources fill
+constituency rows by constituency code, and district sources fill the
+constituency rows of each district by district code. Columns a source
+doesn't match keep the converter's placeholder values. Sources are applied
+in order, so a later source wins where two fill the same column.
+
+A source whose file fits in the --join-memory budget is hash-joined: it is
+loaded into a dict and the rows probe it as they stream past. Larger sources
+are sort-merge joined on disk: the rows are spilled in order while their
+keys are sorted into runs, the source is sorted into runs too, both are
+merged by key, and the matches are sorted back into row order and applied
+as the spilled rows are read again. Either way the rows come out in their
+original order and memory stays bounded.
+
+Keys no row matched and rows no source matched are counted per source;
+write_join_report() lists up to REPORT_KEYS of each.
+"""
+
+import csv
+import heapq
+import json
+import os
+import pickle
+import sys
+import tempfile
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from operator import itemgetter
+
+from build_cache import data_version, file_digest
+from hierarchy import generate_constituency_code, generate_ward_code
+from instrumentation import timed
+from sql_output import STAGING_TABLES
+
+# Key level -> (table the source fills, row column matched against its key)
+JOIN_LEVELS = {
+    "ward": ("wards", "code"),
+    "constituency": ("constituencies", "code"),
+    "district": ("constituencies", "district_code"),
+}
+
+DEFAULT_JOIN_MEMORY_MB = 256
+
+# A loaded dict of short keys and values takes about this many times the CSV bytes
+HASH_BYTES_PER_FILE_BYTE = 4
+# Sort runs are sized assuming about this many bytes per buffered record
+SORT_BYTES_PER_RECORD = 256
+# Runs never get smaller than this, even with --join-memory 0
+MIN_RUN_RECORDS = 1000
+# Spilled rows are pickled this many at a time
+SPILL_BATCH_ROWS = 1000
+# Unmatched keys listed on stderr per source
+SUMMARY_KEYS = 5
+# Unmatched keys kept for the report per source and side (the counts are exact)
+REPORT_KEYS = 10000
+
+
+class JoinSource:
+    """One --join: a CSV whose columns fill row columns by code"""
+
+    def __init__(self, spec):
+        self.spec = spec
+        level, sep, rest = spec.partition("=")
+        if not sep or level not in JOIN_LEVELS:
+            raise ValueError(f"{spec!r}: expected LEVEL=PATH:KEY:COLUMN=SOURCE_COLUMN[,...] "
+                             f"with LEVEL one of {', '.join(JOIN_LEVELS)}")
+        parts = rest.rsplit(":", 2)
+        if len(parts) != 3 or not all(parts):
+            raise ValueError(f"{spec!r}: expected {level}=PATH:KEY:COLUMN=SOURCE_COLUMN[,...]")
+        self.level = level
+        self.path, key, fields = parts
+        self.key_columns = key.split("+")
+        if len(self.key_columns) > (2 if level == "ward" else 1):
+            raise ValueError(f"{spec!r}: only ward keys can combine two columns (CONST+WARD)")
+        self.table, key_column = JOIN_LEVELS[level]
+
+        columns = STAGING_TABLES[self.table]["columns"]
+        names = [name for name, _ in columns]
+        fixed = {"code", key_column, STAGING_TABLES[self.table]["parent_code"]}
+        self.key_index = names.index(key_column)
+        self.fields = []
+        for field in fields.split(","):
+            column, sep, source_column = field.partition("=")
+            column = column.strip()
+            if column not in names or column in fixed:
+                fillable = ", ".join(name for name in names if name not in fixed)
+                raise ValueError(f"{spec!r}: {self.table} column {column!r} can't be filled "
+                                 f"(fillable: {fillable})")
+            self.fields.append((names.index(column), columns[names.index(column)][1],
+                                (source_column if sep else column).strip()))
+
+        self.rows_read = 0
+        self.blank_keys = 0
+        self.duplicate_keys = 0
+        self.invalid_values = 0
+        self.matched_rows = 0
+        self.unmatched_row_count = 0
+        self.unmatched_rows = set()
+        self.unmatched_key_count = 0
+        self.unmatched_keys = []
+        self.strategy = None
+
+    def normalize_key(self, values):
+        """The converter's code for a source record's key values ('' if blank)"""
+        values = [value.strip() for value in values]
+        if not all(values):
+            return ""
+        if self.level == "ward":
+            if len(values) == 2:
+                return generate_ward_code(*values)
+            if "-" in values[0]:
+                return generate_ward_code(*values[0].split("-", 1))
+            return values[0]
+        if self.level == "constituency":
+            return generate_constituency_code(values[0])
+        return values[0].upper()
+
+    def missing_columns(self, header):
+        """Key and source columns not in a CSV header"""
+        return [column for column in self.key_columns + [source for _, _, source in self.fields]
+                if column not in (header or ())]
+
+    def read_records(self):
+        """Yield (key, [raw value per field]) in file order, skipping blank keys"""
+        with open(self.path, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.DictReader(f)
+            missing = self.missing_columns(reader.fieldnames)
+            if missing:
+                raise KeyError(f"{self.path}: missing columns {', '.join(missing)}")
+            for record in reader:
+                self.rows_read += 1
+                key = self.normalize_key([record[column] for column in self.key_columns])
+                if not key:
+                    self.blank_keys += 1
+                    continue
+                yield key, [record[source] or "" for _, _, source in self.fields]
+
+    def coerce(self, raw_values):
+        """Typed values for a record's fields: None where blank or invalid (placeholder kept)"""
+        values = []
+        for (_, sql_type, _), raw in zip(self.fields, raw_values):
+            raw = raw.strip()
+            if not raw:
+                values.append(None)
+                continue
+            try:
+                values.append(coerce_value(raw, sql_type))
+            except ValueError:
+                self.invalid_values += 1
+                values.append(None)
+        return values
+
+    def apply(self, row, values):
+        """row with this source's non-blank values filled in"""
+        row = list(row)
+        for (index, _, _), value in zip(self.fields, values):
+            if value is not None:
+                row[index] = value
+        return row
+
+    def row_unmatched(self, key):
+        """Count a row no source record matched, keeping its key while under REPORT_KEYS"""
+        self.unmatched_row_count += 1
+        if len(self.unmatched_rows) < REPORT_KEYS:
+            self.unmatched_rows.add(key)
+
+    def key_unmatched(self, key):
+        """Count a source key no row matched (keys arrive in sorted order)"""
+        self.unmatched_key_count += 1
+        if len(self.unmatched_keys) < REPORT_KEYS:
+            self.unmatched_keys.append(key)
+
+    def summary(self):
+        """JSON-serializable match statistics, with up to REPORT_KEYS unmatched keys per side"""
+        return {
+            "source": self.spec,
+            "strategy": self.strategy,
+            "rows_read": self.rows_read,
+            "blank_keys": self.blank_keys,
+            "duplicate_keys": self.duplicate_keys,
+            "invalid_values": self.invalid_values,
+            "matched_rows": self.matched_rows,
+            "unmatched_rows": self.unmatched_row_count,
+            "unmatched_row_keys": sorted(self.unmatched_rows),
+            "unmatched_source_keys": self.unmatched_key_count,
+            "unmatched_source_key_sample": self.unmatched_keys,
+        }
+
+
+def coerce_value(raw, sql_type):
+    """Parse a CSV value for a column of sql_type (raises ValueError)"""
+    if sql_type == "INTEGER":
+        number = parse_number(raw)
+        if number != number.to_integral_value():
+            raise ValueError(raw)
+        return int(number)
+    if sql_type.startswith("NUMERIC"):
+        return parse_number(raw)
+    if sql_type == "BOOLEAN":
+        flag = raw.lower()
+        if flag in ("t", "true", "y", "yes", "1"):
+            return True
+        if flag in ("f", "false", "n", "no", "0"):
+            return False
+        raise ValueError(raw)
+    if sql_type == "DATE":
+        return date.fromisoformat(raw).isoformat()
+    if sql_type.startswith("VARCHAR(") and len(raw) > int(sql_type[8:-1]):
+        raise ValueError(raw)
+    return raw
+
+
+def parse_number(raw):
+    """Decimal of a number written with optional thousands separators"""
+    try:
+        number = Decimal(raw.replace(",", "").replace(" ", ""))
+    except InvalidOperation:
+        raise ValueError(raw) from None
+    if not number.is_finite():
+        raise ValueError(raw)
+    return number
+
+
+def add_join_args(parser):
+    """Add the --join options to a converter's argument parser"""
+    parser.add_argument("--join", action="append", default=[], metavar="LEVEL=PATH:KEY:COLUMN=SOURCE_COLUMN",
+                        help="Fill generated columns from a CSV keyed by ward, constituency or district "
+                             "code (repeatable; see source_join.py), e.g. "
+                             "ward=census.csv:CONST_CODE+WARD_CODE:population=POP_TOTAL")
+    parser.add_argument("--join-memory", type=int, default=DEFAULT_JOIN_MEMORY_MB, metavar="MB",
+                        help="Hash-join sources that fit in MB, sort-merge join the rest on disk "
+                             "(default: %(default)s; 0 always sort-merges)")
+    parser.add_argument("--join-report", metavar="PATH",
+                        help="Write match statistics and the unmatched keys as JSON")
+
+
+def check_join_args(parser, args):
+    """Parse the --join specs into args.join_sources"""
+    try:
+        args.join_sources = [JoinSource(spec) for spec in args.join]
+    except ValueError as error:
+        parser.error(f"--join {error}")
+    for source in args.join_sources:
+        if not os.path.isfile(source.path):
+            parser.error(f"--join: {source.path} not found")
+        with open(source.path, 'r', encoding='utf-8-sig', newline='') as f:
+            missing = source.missing_columns(next(csv.reader(f), []))
+        if missing:
+            parser.error(f"--join: {source.path} has no column {', '.join(missing)}")
+    if args.join_memory < 0:
+        parser.error("--join-memory can't be negative")
+    if args.join_report and not args.join_sources:
+        parser.error("--join-report needs at least one --join")
+
+
+def join_version(sources):
+    """Hash of the join specs and source contents, for cache and checkpoint keys (None without joins)"""
+    if not sources:
+        return None
+    return data_version([[source.spec, file_digest(source.path)] for source in sources])
+
+
+def join_rows(rows, table, sources, memory_mb=DEFAULT_JOIN_MEMORY_MB, report=None):
+    """rows of table with the sources that fill it joined in, in input order
+
+    rows are returned unchanged when no source fills the table; otherwise
+    the join is timed as the report's 'join' stage.
+    """
+    sources = [source for source in sources if source.table == table]
+    if not sources:
+        return rows
+    return timed(report, "join", joined_rows(rows, sources, memory_mb))
+
+
+def joined_rows(rows, sources, memory_mb):
+    """Yield rows with sources joined in: hash joins within the memory budget, sort-merge beyond it"""
+    budget = memory_mb << 20
+    indexes = {}
+    for position, source in enumerate(sources):
+        size = os.path.getsize(source.path) * HASH_BYTES_PER_FILE_BYTE
+        if size <= budget:
+            budget -= size
+            indexes[position] = load_index(source)
+            source.strategy = "hash"
+        else:
+            source.strategy = "sort-merge"
+    merged = [position for position in range(len(sources)) if position not in indexes]
+    if not merged:
+        yield from hash_join(rows, sources, indexes)
+        return
+
+    run_records = max(MIN_RUN_RECORDS, budget // SORT_BYTES_PER_RECORD)
+    with tempfile.TemporaryDirectory(prefix="seed-join-") as spill_dir:
+        yield from sort_merge_join(rows, sources, indexes, merged, run_records, spill_dir)
+
+
+def load_index(source):
+    """{key: typed values} of a source (first record per key)"""
+    index = {}
+    for key, raw_values in source.read_records():
+        if key in index:
+            source.duplicate_keys += 1
+        else:
+            index[key] = source.coerce(raw_values)
+    return index
+
+
+def probe(row, sources, indexes, matched, matches=None):
+    """Apply every source to a row in order: hash sources by lookup, merged ones from matches"""
+    for position, source in enumerate(sources):
+        if position in indexes:
+            key = row[source.key_index]
+            values = indexes[position].get(key)
+            if values is None:
+                source.row_unmatched(key)
+                continue
+            matched[position].add(key)
+            source.matched_rows += 1
+        else:
+            values = matches.get(position) if matches else None
+            if values is None:
+                continue
+        row = source.apply(row, values)
+    return tuple(row)
+
+
+def hash_join(rows, sources, indexes):
+    """Yield rows probed against in-memory indexes"""
+    matched = {position: set() for position in indexes}
+    for row in rows:
+        yield probe(row, sources, indexes, matched)
+    finish_hash_sources(sources, indexes, matched)
+
+
+def finish_hash_sources(sources, indexes, matched):
+    """Record the keys of hash-joined sources that no row matched"""
+    for position, index in indexes.items():
+        for key in sorted(key for key in index if key not in matched[position]):
+            sources[position].key_unmatched(key)
+
+
+def write_batches(records, spill_file):
+    """Pickle records to an open file SPILL_BATCH_ROWS at a time"""
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= SPILL_BATCH_ROWS:
+            pickle.dump(batch, spill_file, pickle.HIGHEST_PROTOCOL)
+            batch = []
+    if batch:
+        pickle.dump(batch, spill_file, pickle.HIGHEST_PROTOCOL)
+
+
+def read_batches(spill_file):
+    """Yield the records pickled by write_batches(), from the start of the file"""
+    spill_file.seek(0)
+    while True:
+        try:
+            yield from pickle.load(spill_file)
+        except EOFError:
+            return
+
+
+class RunWriter:
+    """Sorts records into run files of at most run_records each"""
+
+    def __init__(self, spill_dir, prefix, run_records, sort_key=None):
+        self.spill_dir = spill_dir
+        self.prefix = prefix
+        self.run_records = run_records
+        self.sort_key = sort_key
+        self.paths = []
+        self.buffer = []
+
+    def add(self, record):
+        self.buffer.append(record)
+        if len(self.buffer) >= self.run_records:
+            self.flush()
+
+    def flush(self):
+        self.buffer.sort(key=self.sort_key)
+        path = os.path.join(self.spill_dir, f"{self.prefix}-{len(self.paths)}.pickle")
+        with open(path, 'wb') as f:
+            write_batches(self.buffer, f)
+        self.paths.append(path)
+        self.buffer = []
+
+    def close(self):
+        """Paths of the runs written"""
+        if self.buffer:
+            self.flush()
+        return self.paths
+
+
+def merge_runs(paths, key):
+    """Yield the records of sorted run files in one sorted stream (stable across runs)"""
+    files = [open(path, 'rb') for path in paths]
+    try:
+        yield from heapq.merge(*(read_batches(f) for f in files), key=key)
+    finally:
+        for f in files:
+            f.close()
+
+
+def next_distinct(records, record, source):
+    """The next record with a key other than record's, counting the duplicates skipped"""
+    for following in records:
+        if following[0] != record[0]:
+            return following
+        source.duplicate_keys += 1
+    return None
+
+
+def merge_source(source, key_runs, run_records, spill_dir, prefix):
+    """Merge-join sorted (key, seq) runs with the source sorted on disk: yield (seq, typed values)"""
+    source_runs = RunWriter(spill_dir, f"{prefix}-source", run_records, itemgetter(0))
+    for key, raw_values in source.read_records():
+        source_runs.add((key, raw_values))
+    # Runs are in file order, so the first record of each key comes first
+    records = merge_runs(source_runs.close(), itemgetter(0))
+    record = next(records, None)
+    record_matched = False
+    for key, seq in merge_runs(key_runs, itemgetter(0)):
+        while record is not None and record[0] < key:
+            if not record_matched:
+                source.key_unmatched(record[0])
+            record, record_matched = next_distinct(records, record, source), False
+        if record is not None and record[0] == key:
+            if not record_matched:
+                values = source.coerce(record[1])
+                record_matched = True
+            source.matched_rows += 1
+            yield seq, values
+        else:
+            source.row_unmatched(key)
+    while record is not None:
+        if not record_matched:
+            source.key_unmatched(record[0])
+        record, record_matched = next_distinct(records, record, source), False
+
+
+def sort_merge_join(rows, sources, indexes, merged, run_records, spill_dir):
+    """Yield rows joined on disk with the merged sources (and probed against the indexes)"""
+    matched = {position: set() for position in indexes}
+    key_runs = {position: RunWriter(spill_dir, f"keys{position}", run_records) for position in merged}
+
+    def spilled(rows):
+        for seq, row in enumerate(rows):
+            for position in merged:
+                key_runs[position].add((row[sources[position].key_index], seq))
+            yield row
+
+    with open(os.path.join(spill_dir, "rows.pickle"), 'w+b') as spill_file:
+        # Pass 1: spill the rows in order, sorting each merged source's (key, seq) pairs into runs
+        write_batches(spilled(rows), spill_file)
+
+        # Merge each source with its keys, then sort the matches back into row order
+        match_runs = RunWriter(spill_dir, "matches", run_records, itemgetter(0, 1))
+        for position in merged:
+            for seq, values in merge_source(sources[position], key_runs[position].close(), run_records,
+                                            spill_dir, f"source{position}"):
+                match_runs.add((seq, position, values))
+        matches = merge_runs(match_runs.close(), itemgetter(0, 1))
+
+        # Pass 2: read the rows back in order, applying the matches for each
+        match = next(matches, None)
+        for seq, row in enumerate(read_batches(spill_file)):
+            row_matches = {}
+            while match is not None and match[0] == seq:
+                row_matches[match[1]] = match[2]
+                match = next(matches, None)
+            yield probe(row, sources, indexes, matched, row_matches)
+    finish_hash_sources(sources, indexes, matched)
+
+
+def print_join_summary(sources):
+    """Print per-source match counts and the first unmatched keys"""
+    for source in sources:
+        if source.strategy is None:
+            print(f"Joined {source.path}: rows reused from the build cache, no match statistics", file=sys.stderr)
+            continue
+        print(f"Joined {source.path} ({source.level} level, {source.strategy}): "
+              f"{source.matched_rows:,} {source.table} filled", file=sys.stderr)
+        for count, label, keys in (
+                (source.unmatched_row_count, f"{source.table} with no source record", sorted(source.unmatched_rows)),
+                (source.unmatched_key_count, "source keys matching no row", source.unmatched_keys)):
+            if count:
+                shown = ", ".join(keys[:SUMMARY_KEYS]) + (", ..." if count > SUMMARY_KEYS else "")
+                print(f"  ⚠️  {count:,} {label}: {shown}", file=sys.stderr)
+        if source.duplicate_keys or source.invalid_values or source.blank_keys:
+            print(f"  ⚠️  {source.duplicate_keys:,} duplicate keys (first kept), "
+                  f"{source.invalid_values:,} invalid values (placeholder kept), "
+                  f"{source.blank_keys:,} blank keys", file=sys.stderr)
+
+
+def write_join_report(path, sources):
+    """Write every source's summary() as JSON"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"joins": [source.summary() for source in sources]}, f, indent=2, ensure_ascii=False)
+        f.write("\n")
@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+"""
+SQL Output Helpers - Shared SQL formatting for the seed-data converters
+Formats INSERT literals and PostgreSQL COPY data, and emits the staging-table
+load that resolves parent ids with one set-based INSERT ... SELECT, whole or
+in checkpointed chunks (see checkpoints.py)
+"""
+
+import sys
+import textwrap
+from decimal import Decimal
+from itertools import chain, islice, takewhile
+from checkpoints import checkpoint_sql, checkpoint_table_sql, chunk_guard_sql
+from delta import delta_rows
+from ids import hierarchy_id, hierarchy_id_sql
+
+# Standard CDF values written for every generated constituency
+CDF_ALLOCATION = Decimal("1600000.00")
+MP_ELECTED_DATE = "2021-08-12"
+
+# Staging layouts: rows carry the parent *code*, which is joined to the parent
+# table once per load instead of calling get_*_id() for every row
+STAGING_TABLES = {
+    "constituencies": {
+        "staging": "staging_constituencies",
+        "parent_table": "districts",
+        "parent_code": "district_code",
+        "parent_id": "district_id",
+        "lookup_function": "get_district_id",
+        "lookup_param": "d_code",
+        "columns": [
+            ("district_code", "VARCHAR(10)"),
+            ("code", "VARCHAR(20)"),
+            ("name", "VARCHAR(100)"),
+            ("current_mp_name", "VARCHAR(200)"),
+            ("current_mp_party", "VARCHAR(100)"),
+            ("current_mp_elected_date", "DATE"),
+            ("annual_cdf_allocation", "NUMERIC(15, 2)"),
+            ("current_year_allocation", "NUMERIC(15, 2)"),
+            ("registered_voters", "INTEGER"),
+            ("population", "INTEGER"),
+            ("bank_name", "VARCHAR(100)"),
+            ("bank_account_number", "VARCHAR(50)"),
+            ("bank_branch", "VARCHAR(100)"),
+            ("is_active", "BOOLEAN"),
+        ],
+    },
+    "wards": {
+        "staging": "staging_wards",
+        "parent_table": "constituencies",
+        "parent_code": "constituency_code",
+        "parent_id": "constituency_id",
+        "lookup_function": "get_constituency_id",
+        "lookup_param": "c_code",
+        "columns": [
+            ("constituency_code", "VARCHAR(20)"),
+            ("code", "VARCHAR(20)"),
+            ("name", "VARCHAR(100)"),
+            ("population", "INTEGER"),
+            ("is_active", "BOOLEAN"),
+        ],
+    },
+}
+
+OUTPUT_FORMATS = ("insert", "copy")
+
+# Formatted lines are joined and written this many at a time
+WRITE_BATCH_LINES = 1000
+
+
+def sql_literal(value):
+    """Format a Python value as a SQL literal"""
+    if value is None:
+        return "NULL"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, (int, float, Decimal)):
+        return str(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def copy_escape(value):
+    """Format a Python value for PostgreSQL COPY text format"""
+    if value is None:
+        return "\\N"
+    if value is True:
+        return "t"
+    if value is False:
+        return "f"
+    return (str(value)
+            .replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r"))
+
+
+def copy_line(row):
+    """Format one row as a tab-separated COPY line"""
+    return "\t".join(copy_escape(value) for value in row)
+
+
+def insert_values(lookup_function, row):
+    """Format a staged row as an INSERT values tuple with a parent id lookup
+
+    Without a lookup_function the row is written as plain literals.
+    """
+    if lookup_function is None:
+        return "(" + ", ".join(sql_literal(value) for value in row) + ")"
+    values = ", ".join(sql_literal(value) for value in row[1:])
+    return f"({lookup_function}({sql_literal(row[0])}), {values})"
+
+
+def write_lines(lines, batch_size=WRITE_BATCH_LINES):
+    """Write lines to stdout in joined batches instead of one print() per line"""
+    lines = iter(lines)
+    write = sys.stdout.write
+    while True:
+        batch = list(islice(lines, batch_size))
+        if not batch:
+            return
+        batch.append("")
+        write("\n".join(batch))
+
+
+def insert_value_lines(lookup_function, rows, on_conflict=None):
+    """Yield INSERT values lines, terminating the last one with a semicolon
+
+    Rows are consumed lazily: each tuple is held back by one row so the
+    separator can be chosen without knowing the total row count. An
+    on_conflict clause, if given, is emitted before the final semicolon.
+    """
+    pending = None
+    for row in rows:
+        if pending is not None:
+            yield f"    {pending},"
+        pending = insert_values(lookup_function, row)
+
+    if pending is not None:
+        if on_conflict:
+            yield f"    {pending}"
+            yield f"{on_conflict};"
+        else:
+            yield f"    {pending};"
+
+
+def print_insert_values(lookup_function, rows, on_conflict=None):
+    """Print INSERT values tuples (see insert_value_lines)"""
+    write_lines(insert_value_lines(lookup_function, rows, on_conflict))
+
+
+def target_columns(table):
+    """Columns written to the target table (parent id first)"""
+    spec = STAGING_TABLES[table]
+    return [spec["parent_id"]] + [name for name, _ in spec["columns"]][1:]
+
+
+def insert_header_sql(table, keyed=False):
+    """INSERT INTO ... VALUES header, wrapped when the column list is long"""
+    columns = ", ".join(keyed_columns(table) if keyed else target_columns(table))
+    header = f"INSERT INTO {table} ({columns}) VALUES"
+    if len(header) <= 100:
+        return header
+    wrapped = textwrap.fill(columns, width=72, initial_indent="    ", subsequent_indent="    ")
+    return f"INSERT INTO {table} (\n{wrapped}\n) VALUES"
+
+
+def keyed_columns(table):
+    """Columns written to the target table when rows carry their own ids"""
+    return ["id"] + target_columns(table)
+
+
+def keyed_rows(table, rows):
+    """Replace each row's parent code with deterministic (id, parent id) values"""
+    parent_table = STAGING_TABLES[table]["parent_table"]
+    for row in rows:
+        yield (hierarchy_id(table, row[1]), hierarchy_id(parent_table, row[0])) + tuple(row[1:])
+
+
+def upsert_sql(table):
+    """ON CONFLICT (code) clause that updates the row and bumps its version"""
+    columns = [name for name in target_columns(table) if name != "code"]
+    assignments = [f"    {name} = EXCLUDED.{name}," for name in columns]
+    return "\n".join(
+        ["ON CONFLICT (code) DO UPDATE SET"]
+        + assignments
+        + [f"    version = {table}.version + 1,", "    updated_at = NOW()"]
+    )
+
+
+def peek_rows(rows):
+    """Return (has_rows, rows) without consuming the first row"""
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return False, iter(())
+    return True, chain([first], rows)
+
+
+def print_insert_load(table, rows, upsert=False):
+    """Print a multi-row INSERT for a hierarchy table with per-row id lookups
+
+    With upsert=True rows that already exist (by code) are updated in place
+    and their version is bumped instead of failing the UNIQUE(code) check.
+    """
+    spec = STAGING_TABLES[table]
+    has_rows, rows = peek_rows(rows)
+    if not has_rows:
+        print(f"-- No {table} rows to load")
+        return
+
+    print("-- Helper function")
+    print(f"CREATE OR REPLACE FUNCTION {spec['lookup_function']}({spec['lookup_param']} VARCHAR) RETURNS UUID AS $$")
+    print(f"    SELECT id FROM {spec['parent_table']} WHERE code = {spec['lookup_param']} LIMIT 1;")
+    print("$$ LANGUAGE SQL STABLE;")
+    print("")
+    print(insert_header_sql(table))
+    print_insert_values(spec["lookup_function"], rows, upsert_sql(table) if upsert else None)
+    print("")
+    print("-- Cleanup")
+    print(f"DROP FUNCTION IF EXISTS {spec['lookup_function']};")
+
+
+class CopyStream:
+    """File-like reader that streams rows as COPY text for cursor.copy_expert()"""
+
+    def __init__(self, rows):
+        self._lines = (copy_line(row) + "\n" for row in rows)
+        self._buffer = ""
+        self.row_count = 0
+
+    def read(self, size=-1):
+        """Return up to size characters of COPY data ('' once exhausted)"""
+        while size < 0 or len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line
+            self.row_count += 1
+
+        if size < 0:
+            data, self._buffer = self._buffer, ""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class FileCopyStream(CopyStream):
+    """CopyStream over the data lines of a COPY block in an open SQL file
+
+    Reads from the file's line iterator up to and including the \\.
+    terminator, leaving the file positioned after the block.
+    """
+
+    def __init__(self, f):
+        super().__init__(())
+        self._lines = takewhile(lambda line: line.rstrip("\r\n") != "\\.", f)
+
+
+def staging_create_sql(table):
+    """CREATE TEMP TABLE statement for a table's staging layout"""
+    spec = STAGING_TABLES[table]
+    columns = ",\n".join(f"    {name} {sql_type}" for name, sql_type in spec["columns"])
+    return f"CREATE TEMP TABLE {spec['staging']} (\n{columns}\n);"
+
+
+def staging_copy_sql(table):
+    """COPY ... FROM STDIN statement that fills a table's staging table"""
+    spec = STAGING_TABLES[table]
+    columns = ", ".join(name for name, _ in spec["columns"])
+    return f"COPY {spec['staging']} ({columns}) FROM STDIN;"
+
+
+def staging_check_sql(table):
+    """DO block that aborts the load when staged rows reference unknown parents"""
+    spec = STAGING_TABLES[table]
+    parent_code = spec["parent_code"]
+    return "\n".join([
+        "DO $$",
+        "DECLARE",
+        "    v_missing TEXT;",
+        "BEGIN",
+        f"    SELECT string_agg(DISTINCT s.{parent_code}, ', ') INTO v_missing",
+        f"    FROM {spec['staging']} s",
+        f"    LEFT JOIN {spec['parent_table']} p ON p.code = s.{parent_code}",
+        "    WHERE p.id IS NULL;",
+        "",
+        "    IF v_missing IS NOT NULL THEN",
+        f"        RAISE EXCEPTION 'Unknown {spec['parent_table']} codes in {table}: %', v_missing;",
+        "    END IF;",
+        "END $$;",
+    ])
+
+
+def staging_insert_sql(table, upsert=False, where=None):
+    """INSERT ... SELECT that resolves parent ids for all staged rows in one JOIN
+
+    A where condition, if given, decides whether the rows are inserted at all.
+    """
+    spec = STAGING_TABLES[table]
+    columns = [name for name, _ in spec["columns"]][1:]
+    return "\n".join([
+        f"INSERT INTO {table} ({spec['parent_id']}, {', '.join(columns)})",
+        f"SELECT p.id, {', '.join('s.' + name for name in columns)}",
+        f"FROM {spec['staging']} s",
+        f"JOIN {spec['parent_table']} p ON p.code = s.{spec['parent_code']}",
+    ] + ([f"WHERE {where}"] if where else []) + ([upsert_sql(table)] if upsert else [])) + ";"
+
+
+def staging_drop_sql(table):
+    """DROP statement for a table's staging table"""
+    return f"DROP TABLE {STAGING_TABLES[table]['staging']};"
+
+
+def print_copy_load(table, rows, upsert=False):
+    """Print a staged COPY load for a hierarchy table
+
+    Rows are tuples in STAGING_TABLES[table]['columns'] order. They are copied
+    into a temporary staging table, checked for unknown parent codes, and
+    moved into the target table with a single INSERT ... SELECT ... JOIN
+    (an upsert bumping version when upsert=True).
+    """
+    print(staging_create_sql(table))
+    print("")
+    print(staging_copy_sql(table))
+    write_lines(copy_line(row) for row in rows)
+    print("\\.")
+    print("")
+    print(staging_check_sql(table))
+    print("")
+    print(staging_insert_sql(table, upsert))
+    print("")
+    print(staging_drop_sql(table))
+
+
+def rekey_parents_sql(table):
+    """Guarded UPDATE giving a table's parent rows their deterministic ids (fresh databases only)
+
+    A no-op once the parents have them. Parents loaded from the static seed
+    files get random ids, so this may only run before anything references
+    them: rewriting a primary key that rows of any table point at (no
+    foreign key cascades updates) would fail, and on a live database it
+    would quietly change the ids the application already knows. The guard
+    raises instead when any foreign key references a parent that would be
+    rekeyed; load such databases with --ids lookup.
+    """
+    parent_table = STAGING_TABLES[table]["parent_table"]
+    expected = hierarchy_id_sql(parent_table, "p.code")
+    expected_literal = expected.replace("'", "''")
+    return "\n".join([
+        "DO $$",
+        "DECLARE",
+        "    fk RECORD;",
+        "    referenced BOOLEAN;",
+        "BEGIN",
+        "    FOR fk IN",
+        "        SELECT c.conrelid::regclass AS child, a.attname AS column_name",
+        "        FROM pg_constraint c",
+        "        JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = c.conkey[1]",
+        f"        WHERE c.contype = 'f' AND c.confrelid = '{parent_table}'::regclass",
+        "    LOOP",
+        "        EXECUTE format('SELECT EXISTS (SELECT 1 FROM %s c JOIN "
+        f"{parent_table} p ON p.id = c.%I WHERE p.id <> {expected_literal})',",
+        "                       fk.child, fk.column_name) INTO referenced;",
+        "        IF referenced THEN",
+        f"            RAISE EXCEPTION '{parent_table} without deterministic ids are referenced by %.%; "
+        "--ids uuid needs a fresh database (use --ids lookup)', fk.child, fk.column_name;",
+        "        END IF;",
+        "    END LOOP;",
+        "END $$;",
+        f"UPDATE {parent_table} p SET id = {expected}",
+        f"WHERE p.id <> {expected};",
+    ])
+
+
+def keyed_copy_sql(table, upsert=False):
+    """COPY ... FROM STDIN straight into the target table (or a staging copy of it)"""
+    target = STAGING_TABLES[table]["staging"] if upsert else table
+    return f"COPY {target} ({', '.join(keyed_columns(table))}) FROM STDIN;"
+
+
+def keyed_staging_create_sql(table):
+    """CREATE TEMP TABLE shaped like the target table, for keyed upserts"""
+    return f"CREATE TEMP TABLE {STAGING_TABLES[table]['staging']} (LIKE {table} INCLUDING DEFAULTS);"
+
+
+def keyed_staging_insert_sql(table, upsert=True, where=None):
+    """INSERT ... SELECT moving keyed staged rows into the target table (an upsert by default)"""
+    columns = ", ".join(keyed_columns(table))
+    return "\n".join([
+        f"INSERT INTO {table} ({columns})",
+        f"SELECT {columns} FROM {STAGING_TABLES[table]['staging']}",
+    ] + ([f"WHERE {where}"] if where else []) + ([upsert_sql(table)] if upsert else [])) + ";"
+
+
+def print_keyed_insert_load(table, rows, upsert=False, rekey=True):
+    """Print a multi-row INSERT whose rows carry their own and their parent's ids"""
+    has_rows, rows = peek_rows(rows)
+    if not has_rows:
+        print(f"-- No {table} rows to load")
+        return
+
+    if rekey:
+        print(rekey_parents_sql(table))
+        print("")
+    print(insert_header_sql(table, keyed=True))
+    print_insert_values(None, keyed_rows(table, rows), upsert_sql(table) if upsert else None)
+
+
+def print_keyed_copy_load(table, rows, upsert=False, rekey=True):
+    """Print a COPY load whose rows carry their own and their parent's ids
+
+    Without upsert the rows are copied straight into the target table; parent
+    references are checked by the foreign keys, so no join is needed.
+    """
+    if rekey:
+        print(rekey_parents_sql(table))
+        print("")
+    if upsert:
+        print(keyed_staging_create_sql(table))
+        print("")
+    print(keyed_copy_sql(table, upsert))
+    write_lines(copy_line(row) for row in keyed_rows(table, rows))
+    print("\\.")
+    if upsert:
+        print("")
+        print(keyed_staging_insert_sql(table))
+        print("")
+        print(staging_drop_sql(table))
+
+
+def row_chunks(rows, chunk_size):
+    """Split rows into lists of at most chunk_size rows"""
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def chunk_staging_sql(table, ids):
+    """CREATE TEMP TABLE a chunk is staged in: the staging layout, or the target's for keyed rows"""
+    return keyed_staging_create_sql(table) if ids == "uuid" else staging_create_sql(table)
+
+
+def chunk_insert_sql(table, upsert, ids, where):
+    """INSERT ... SELECT moving a staged chunk into the target table when where holds"""
+    if ids == "uuid":
+        return keyed_staging_insert_sql(table, upsert, where)
+    return staging_insert_sql(table, upsert, where)
+
+
+def chunk_copy_sql(table, ids):
+    """COPY ... FROM STDIN filling a chunk's staging table"""
+    return keyed_copy_sql(table, upsert=True) if ids == "uuid" else staging_copy_sql(table)
+
+
+def print_chunk_rows(table, rows, output_format, ids):
+    """Print the COPY or INSERT that fills a chunk's staging table"""
+    if ids == "uuid":
+        rows = keyed_rows(table, rows)
+    if output_format == "copy":
+        print(chunk_copy_sql(table, ids))
+        write_lines(copy_line(row) for row in rows)
+        print("\\.")
+    else:
+        columns = keyed_columns(table) if ids == "uuid" else [name for name, _ in STAGING_TABLES[table]["columns"]]
+        print(f"INSERT INTO {STAGING_TABLES[table]['staging']} ({', '.join(columns)}) VALUES")
+        print_insert_values(None, rows)
+
+
+def print_chunked_load(table, rows, output_format, upsert, ids, chunk_size, checkpoint_key, rekey=True):
+    """Print a load committed in chunks of chunk_size rows, each with a checkpoint
+
+    Every chunk is staged, moved into the target table only while the
+    checkpoint under checkpoint_key stands at the chunk before it, and
+    committed together with its own checkpoint (see checkpoints.py).
+    Staging means INSERT output needs no lookup helper function.
+    """
+    has_rows, rows = peek_rows(rows)
+    if not has_rows:
+        print(f"-- No {table} rows to load")
+        return
+
+    print(checkpoint_table_sql())
+    print("")
+    if ids == "uuid" and rekey:
+        print(rekey_parents_sql(table))
+        print("")
+    for chunk, chunk_rows in enumerate(row_chunks(rows, chunk_size), 1):
+        print(f"-- {table} chunk {chunk} ({len(chunk_rows)} rows)")
+        print("BEGIN;")
+        print(chunk_staging_sql(table, ids))
+        print_chunk_rows(table, chunk_rows, output_format, ids)
+        if ids != "uuid":
+            print(staging_check_sql(table))
+        print(chunk_insert_sql(table, upsert, ids, chunk_guard_sql(checkpoint_key, table, chunk)))
+        print(staging_drop_sql(table))
+        print(checkpoint_sql(checkpoint_key, table, chunk))
+        print("COMMIT;")
+        print("")
+
+
+def print_load(table, rows, output_format="insert", manifest=None, ids="lookup", rekey=True,
+               chunk_size=None, checkpoint_key=None):
+    """Print the load for a hierarchy table in the requested output format
+
+    With a manifest (see delta.py) only rows whose content hash changed are
+    written, as upserts that bump the existing row's version. With
+    ids="uuid" rows carry deterministic ids (see ids.py) instead of looking
+    up their parent's id at load time; rekey=False leaves out the
+    rekey_parents_sql() update for callers that run it once up front. With
+    a chunk_size the load is split into checkpointed chunks (see
+    print_chunked_load()).
+    """
+    upsert = manifest is not None
+    if upsert:
+        rows = delta_rows(table, rows, manifest)
+
+    if chunk_size:
+        print_chunked_load(table, rows, output_format, upsert, ids, chunk_size, checkpoint_key, rekey)
+    elif ids == "uuid":
+        if output_format == "copy":
+            print_keyed_copy_load(table, rows, upsert, rekey)
+        else:
+            print_keyed_insert_load(table, rows, upsert, rekey)
+    elif output_format == "copy":
+        print_copy_load(table, rows, upsert)
+    else:
+        print_insert_load(table, rows, upsert)
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Synthetic Administrative Data - National-scale test inputs for the converters
+Writes administrative units CSVs (PROV_CODE, PROVINCENA, DISTRICT_C, DISTRICTNA,
+CONST_CODE, WARD_CODE, WARD_NAME) at a multiple of the real 149-constituency,
+1,416-ward dataset, plus matching ECZ constituency and ward CSVs and the ECZ
+wards as an .xlsx workbook
+
+District names come from DISTRICT_MAPPING so districts resolve like real
+data; constituency and ward names are generated deterministically from a
+seed, so every run at the same scale produces identical files.
+
+Usage:
+    python3 synthetic_data.py --scale 10 --output-dir /tmp/synthetic
+"""
+
+import argparse
+import csv
+import random
+import sys
+import zipfile
+from itertools import chain
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from district_mapping import DISTRICT_MAPPING
+from hierarchy import PROVINCE_MAP
+
+# Size of the real administrative units dataset
+REAL_CONSTITUENCIES = 149
+REAL_WARDS = 1416
+
+PROVINCE_NAMES = {
+    "WP": "Western", "CB": "Copperbelt", "CP": "Central", "EP": "Eastern", "LSK": "Lusaka",
+    "LP": "Luapula", "MP": "Muchinga", "NP": "Northern", "NWP": "North-Western", "SP": "Southern",
+}
+
+ADMIN_COLUMNS = ["PROV_CODE", "PROVINCENA", "DISTRICT_C", "DISTRICTNA", "CONST_CODE", "WARD_CODE", "WARD_NAME"]
+ECZ_CONSTITUENCY_COLUMNS = ["constituency_name", "district", "code", "mp_name", "party",
+                            "registered_voters", "population"]
+ECZ_WARD_COLUMNS = ["ward_name", "constituency_code", "ward_code", "population", "registered_voters"]
+
+SYLLABLES = ["ka", "ma", "chi", "mu", "lu", "nga", "mba", "si", "na", "wa", "ko", "be",
+             "mwa", "ta", "le", "nde", "zi", "pa", "so", "ku"]
+SUFFIXES = ["", "", "", " East", " West", " North", " South", " Central"]
+
+
+def synthetic_name(rng, min_syllables=2, max_syllables=4):
+    """Pronounceable placeholder name, e.g. 'Kalunga'"""
+    count = rng.randint(min_syllables, max_syllables)
+    return "".join(rng.choice(SYLLABLES) for _ in range(count)).capitalize()
+
+
+def unique_name(rng, used):
+    """synthetic_name() not in used (numbered if need be), added to used"""
+    name = base = synthetic_name(rng)
+    number = 1
+    while name in used:
+        number += 1
+        name = f"{base} {number}"
+    used.add(name)
+    return name
+
+
+def districts_by_province():
+    """[(prov_code, province_name, [district names])] from DISTRICT_MAPPING"""
+    names = {}
+    for province, district in DISTRICT_MAPPING:
+        names.setdefault(province, []).append(district)
+    return [(prov_code, PROVINCE_NAMES[abbrev], names.get(PROVINCE_NAMES[abbrev], []))
+            for prov_code, abbrev in PROVINCE_MAP.items()]
+
+
+def iter_admin_rows(scale=1, seed=42):
+    """Yield admin CSV rows (dicts) for scale x the real dataset
+
+    Constituencies are spread over the real districts and each gets a
+    constituency-name stem shared by most of its wards, with the real average
+    of ~9.5 wards per constituency. Stems and other ward names are never
+    reused, so inferred constituency names are unique within their district
+    and ward names within their constituency, as the tables require.
+    """
+    rng = random.Random(seed)
+    provinces = districts_by_province()
+    districts = [(prov_code, prov_name, dist_index, dist_name)
+                 for prov_code, prov_name, names in provinces
+                 for dist_index, dist_name in enumerate(names, start=1)]
+
+    constituency_count = REAL_CONSTITUENCIES * scale
+    ward_total = REAL_WARDS * scale
+    wards_emitted = 0
+    used_names = set()
+
+    for const_index in range(constituency_count):
+        prov_code, prov_name, dist_index, dist_name = districts[const_index * len(districts) // constituency_count]
+        remaining = constituency_count - const_index
+        if remaining == 1:
+            ward_count = max(1, ward_total - wards_emitted)
+        else:
+            ward_count = max(1, round((ward_total - wards_emitted) / remaining + rng.uniform(-3, 3)))
+        stem = unique_name(rng, used_names)
+        ward_names = set()
+
+        for ward_index in range(1, ward_count + 1):
+            if rng.random() < 0.6:
+                ward_name = stem + rng.choice(SUFFIXES)
+            else:
+                ward_name = unique_name(rng, used_names)
+            if ward_name in ward_names:
+                ward_name = f"{ward_name} {ward_index}"
+            ward_names.add(ward_name)
+            yield {
+                "PROV_CODE": prov_code,
+                "PROVINCENA": prov_name,
+                "DISTRICT_C": str(dist_index),
+                "DISTRICTNA": dist_name,
+                "CONST_CODE": str(const_index + 1),
+                "WARD_CODE": str(ward_index),
+                "WARD_NAME": ward_name,
+            }
+        wards_emitted += ward_count
+
+
+def write_csv(path, columns, rows):
+    """Write dict rows to a CSV file, returning the row count"""
+    count = 0
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+XLSX_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+XLSX_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+XLSX_PACKAGE_RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml"
+
+
+def xlsx_column(index):
+    """Column letters of a 0-based column index"""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def write_xlsx(path, sheets):
+    """Write [(sheet name, columns, dict rows)] as a minimal .xlsx workbook
+
+    Text goes to the shared string table and whole numbers (without leading
+    zeros, which only text keeps) are written as numbers, as Excel does. Sheets are streamed into the archive; only
+    the shared strings are held in memory. Returns the row counts.
+    """
+    strings = {}
+    counts = []
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for number, (_, columns, rows) in enumerate(sheets, start=1):
+            letters = [xlsx_column(i) for i in range(len(columns))]
+            count = 0
+            with archive.open(f"xl/worksheets/sheet{number}.xml", 'w') as part:
+                part.write(f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                           f'<worksheet xmlns="{XLSX_MAIN_NS}"><sheetData>'.encode('utf-8'))
+                for line, values in enumerate(chain([dict(zip(columns, columns))], rows), start=1):
+                    cells = []
+                    for letter, column in zip(letters, columns):
+                        value = values.get(column, "")
+                        if value == "":
+                            continue
+                        if value.isdigit() and len(value) < 16 and (value == "0" or value[0] != "0"):
+                            cells.append(f'<c r="{letter}{line}"><v>{value}</v></c>')
+                        else:
+                            index = strings.setdefault(value, len(strings))
+                            cells.append(f'<c r="{letter}{line}" t="s"><v>{index}</v></c>')
+                    part.write(f'<row r="{line}">{"".join(cells)}</row>'.encode('utf-8'))
+                    count += 1
+                part.write(b'</sheetData></worksheet>')
+            counts.append(count - 1)
+
+        shared = "".join(f"<si><t>{escape(value)}</t></si>" for value in strings)
+        archive.writestr("xl/sharedStrings.xml",
+                         f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                         f'<sst xmlns="{XLSX_MAIN_NS}" count="{len(strings)}" uniqueCount="{len(strings)}">'
+                         f'{shared}</sst>')
+        sheet_entries = "".join(f'<sheet name="{escape(name)}" sheetId="{number}" r:id="rId{number}"/>'
+                                for number, (name, _, _) in enumerate(sheets, start=1))
+        archive.writestr("xl/workbook.xml",
+                         f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                         f'<workbook xmlns="{XLSX_MAIN_NS}" xmlns:r="{XLSX_REL_NS}"><sheets>{sheet_entries}'
+                         f'</sheets></workbook>')
+        relationships = "".join(f'<Relationship Id="rId{number}" Type="{XLSX_REL_NS}/worksheet" '
+                                f'Target="worksheets/sheet{number}.xml"/>' for number in range(1, len(sheets) + 1))
+        archive.writestr("xl/_rels/workbook.xml.rels",
+                         f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                         f'<Relationships xmlns="{XLSX_PACKAGE_RELS_NS}">{relationships}'
+                         f'<Relationship Id="rId{len(sheets) + 1}" Type="{XLSX_REL_NS}/sharedStrings" '
+                         f'Target="sharedStrings.xml"/></Relationships>')
+        archive.writestr("_rels/.rels",
+                         f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                         f'<Relationships xmlns="{XLSX_PACKAGE_RELS_NS}"><Relationship Id="rId1" '
+                         f'Type="{XLSX_REL_NS}/officeDocument" Target="xl/workbook.xml"/></Relationships>')
+        overrides = "".join(f'<Override PartName="/xl/worksheets/sheet{number}.xml" '
+                            f'ContentType="{XLSX_CONTENT_TYPE}.worksheet+xml"/>'
+                            for number in range(1, len(sheets) + 1))
+        archive.writestr("[Content_Types].xml",
+                         f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                         f'<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                         f'<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                         f'<Default Extension="xml" ContentType="application/xml"/>'
+                         f'<Override PartName="/xl/workbook.xml" ContentType="{XLSX_CONTENT_TYPE}.sheet.main+xml"/>'
+                         f'{overrides}<Override PartName="/xl/sharedStrings.xml" '
+                         f'ContentType="{XLSX_CONTENT_TYPE}.sharedStrings+xml"/></Types>')
+    return counts
+
+
+def ecz_constituency_rows(admin_csv):
+    """ECZ-shaped constituency rows derived from an admin CSV"""
+    seen = set()
+    with open(admin_csv, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            const_code = row["CONST_CODE"].zfill(3)
+            if const_code in seen:
+                continue
+            seen.add(const_code)
+            yield {
+                "constituency_name": f"{row['WARD_NAME'].split()[0]} {const_code}",
+                "district": row["DISTRICTNA"],
+                "code": const_code,
+                "mp_name": "",
+                "party": "",
+                "registered_voters": str(50000 + len(seen) * 10),
+                "population": str(85000 + len(seen) * 10),
+            }
+
+
+def ecz_ward_rows(admin_csv):
+    """ECZ-shaped ward rows derived from an admin CSV"""
+    with open(admin_csv, 'r', encoding='utf-8') as f:
+        for i, row in enumerate(csv.DictReader(f)):
+            const_code = row["CONST_CODE"].zfill(3)
+            yield {
+                "ward_name": row["WARD_NAME"],
+                "constituency_code": const_code,
+                "ward_code": f"{const_code}-{row['WARD_CODE'].zfill(2)}",
+                "population": str(8000 + i % 5000),
+                "registered_voters": "",
+            }
+
+
+def generate(scale, output_dir, seed=42):
+    """Write admin, ECZ constituency and ECZ ward CSVs for one scale
+
+    Existing files are reused (the output is deterministic). Returns
+    {'admin': path, 'ecz_constituencies': path, 'ecz_wards': path,
+    'ecz_wards_xlsx': path}.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = {
+        "admin": output_dir / f"admin_units_{scale}x.csv",
+        "ecz_constituencies": output_dir / f"ecz_constituencies_{scale}x.csv",
+        "ecz_wards": output_dir / f"ecz_wards_{scale}x.csv",
+        "ecz_wards_xlsx": output_dir / f"ecz_wards_{scale}x.xlsx",
+    }
+    if all(path.exists() for path in paths.values()):
+        return paths
+
+    write_csv(paths["admin"], ADMIN_COLUMNS, iter_admin_rows(scale, seed))
+    write_csv(paths["ecz_constituencies"], ECZ_CONSTITUENCY_COLUMNS, ecz_constituency_rows(paths["admin"]))
+    write_csv(paths["ecz_wards"], ECZ_WARD_COLUMNS, ecz_ward_rows(paths["admin"]))
+    write_xlsx(paths["ecz_wards_xlsx"], [("Wards", ECZ_WARD_COLUMNS, ecz_ward_rows(paths["admin"]))])
+    return paths
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Generate synthetic administrative units CSVs and workbooks")
+    parser.add_argument("--scale", type=int, default=1,
+                        help="Multiple of the real 1,416-ward dataset (default: 1)")
+    parser.add_argument("--output-dir", default=".", help="Directory for the CSV files")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    paths = generate(args.scale, args.output_dir, args.seed)
+    for kind, path in paths.items():
+        print(f"  {kind:20} {path}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,600 @@
+#!/usr/bin/env python3
+"""
+Seed Data Validator - Referential, uniqueness and column checks before loading
+Finds the rows PostgreSQL would reject (an unmapped district that became
+XX-KAL, a get_district_id() lookup that returns NULL, a duplicate
+(constituency_id, name) ward, a name longer than its column) in one pass over
+the seed files and generated rows, before any SQL runs, so a load doesn't die
+halfway through.
+
+Column types, NOT NULL, UNIQUE columns and UNIQUE(...) constraints are read
+from the hierarchy schema. Rows are checked in load order against hash
+indexes of the rows before them: parents must exist, codes and the unique
+(parent, name) pairs must not repeat (ON CONFLICT (code) DO UPDATE
+statements may replace a row loaded by an earlier statement), values
+must fit their columns and every column given must exist in the table.
+
+Seed files may hold INSERT ... VALUES statements (static seed files and
+--format insert output) or COPY blocks (--format copy output), with parents
+given by lookup function, staging code column or deterministic id.
+
+Usage:
+    python3 validate_seed_data.py                          # 01, 02, 03 and 04 seed files
+    python3 validate_seed_data.py 01_provinces.sql 02_districts.sql shards/*.sql
+    python3 validate_seed_data.py --admin-csv Administrative_units_of_Zambia.csv
+    python3 validate_seed_data.py --admin-csv Administrative_units_of_Zambia.csv --join ward=census.csv:...
+"""
+
+import argparse
+import re
+import sys
+import uuid
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+
+from ids import hierarchy_id
+from source_join import DEFAULT_JOIN_MEMORY_MB, add_join_args, check_join_args, join_rows, write_join_report
+from sql_output import STAGING_TABLES
+
+SEED_DIR = Path(__file__).resolve().parent
+SCHEMA_FILE = SEED_DIR.parent / "schemas" / "01_tenant_hierarchy.sql"
+
+# Files validated by default: load_seed_data.sh's seed files, in load order
+DEFAULT_SEED_FILES = ["01_provinces.sql", "02_districts.sql", "03_constituencies.sql", "04_wards.sql"]
+
+# Static files holding the parents of generated constituencies and wards
+REFERENCE_SEED_FILES = ["01_provinces.sql", "02_districts.sql"]
+
+HIERARCHY_TABLES = ("provinces", "districts", "constituencies", "wards")
+
+# Examples printed per kind of problem
+MAX_EXAMPLES = 5
+
+INTEGER_RANGE = (-2 ** 31, 2 ** 31 - 1)
+
+CREATE_TABLE = re.compile(r"^CREATE TABLE (\w+) \((.*)$")
+COLUMN_DEFINITION = re.compile(r"^\s*(\w+)\s+([A-Z]+(?:\s*\([\d,\s]+\))?)(.*)$")
+UNIQUE_CONSTRAINT = re.compile(r"^\s*UNIQUE\s*\(([^)]*)\)")
+REFERENCES = re.compile(r"REFERENCES\s+(\w+)\s*\(")
+
+INSERT_HEADER = re.compile(r"INSERT INTO (\w+)\s*\(([^)]*)\)\s*VALUES", re.IGNORECASE)
+COPY_BLOCK = re.compile(r"^COPY (\w+) \(([^)]*)\) FROM STDIN;\n(.*?)^\\\.$", re.MULTILINE | re.DOTALL)
+COPY_HEADER = re.compile(r"^COPY (\w+) \(([^)]*)\) FROM STDIN;$")
+STATEMENT_TOKEN = re.compile(r"'|--|;")
+VALUE_TOKEN = re.compile(r"""
+    (?P<skip>\s+|--[^\n]*)
+  | (?P<string>'(?:[^']|'')*')
+  | (?P<number>-?\d+(?:\.\d+)?)
+  | (?P<word>[A-Za-z_]\w*)
+  | (?P<cast>::\s*\w+)
+  | (?P<punct>[(),;])
+""", re.VERBOSE)
+COPY_ESCAPES = {"\\\\": "\\", "\\t": "\t", "\\n": "\n", "\\r": "\r"}
+
+
+# ============================================================================
+# Schema
+# ============================================================================
+
+def load_schema(schema_path=SCHEMA_FILE, tables=HIERARCHY_TABLES):
+    """{table: {"columns": {name: (type, not_null, has_default)}, "unique": [columns...], "parent": (column, table)}}"""
+    schema = {}
+    table = None
+    with open(schema_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if table is None:
+                match = CREATE_TABLE.match(line)
+                if match:
+                    table, body = match.group(1), [match.group(2)]
+            elif line.startswith(");"):
+                if table in tables:
+                    schema[table] = table_spec(body)
+                table = None
+            else:
+                body.append(line)
+
+    missing = [table for table in tables if table not in schema]
+    if missing:
+        raise ValueError(f"{schema_path}: no CREATE TABLE for {', '.join(missing)}")
+    return schema
+
+
+def table_spec(lines):
+    """Columns, unique keys and parent reference of a CREATE TABLE body"""
+    columns = {}
+    unique = []
+    parent = None
+    for line in lines:
+        line = line.split("--", 1)[0].rstrip().rstrip(",")
+        constraint = UNIQUE_CONSTRAINT.match(line)
+        if constraint:
+            unique.append(tuple(name.strip() for name in constraint.group(1).split(",")))
+            continue
+        definition = COLUMN_DEFINITION.match(line)
+        if not definition or definition.group(1) in ("UNIQUE", "PRIMARY", "CONSTRAINT", "CHECK"):
+            continue
+        name, sql_type, rest = definition.groups()
+        columns[name] = (re.sub(r"\s+", "", sql_type), "NOT NULL" in rest or "PRIMARY KEY" in rest,
+                         "DEFAULT" in rest)
+        if re.search(r"\bUNIQUE\b", rest):
+            unique.append((name,))
+        reference = REFERENCES.search(rest)
+        if reference:
+            parent = (name, reference.group(1))
+    return {"columns": columns, "unique": unique, "parent": parent}
+
+
+def column_problem(sql_type, value):
+    """Why value doesn't fit a column of sql_type, or None"""
+    text = value if isinstance(value, str) else None
+    if sql_type.startswith("VARCHAR("):
+        limit = int(sql_type[8:-1])
+        if len(str(value)) > limit:
+            return f"longer than {sql_type} ({len(str(value))} characters)"
+    elif sql_type.startswith("NUMERIC("):
+        precision, scale = (int(part) for part in sql_type[8:-1].split(","))
+        try:
+            number = Decimal(str(value))
+        except InvalidOperation:
+            return f"not a number for {sql_type}"
+        if abs(round(number, scale)) >= Decimal(10) ** (precision - scale):
+            return f"out of range for {sql_type}"
+    elif sql_type == "INTEGER":
+        try:
+            number = int(text) if text is not None else value
+        except ValueError:
+            return "not an integer"
+        if isinstance(number, bool) or not isinstance(number, int):
+            return "not an integer"
+        if not INTEGER_RANGE[0] <= number <= INTEGER_RANGE[1]:
+            return "out of range for INTEGER"
+    elif sql_type == "BOOLEAN":
+        if value not in (True, False) and str(value).lower() not in ("t", "f", "true", "false"):
+            return "not a boolean"
+    elif sql_type == "DATE":
+        try:
+            date.fromisoformat(str(value))
+        except ValueError:
+            return "not a date"
+    elif sql_type == "UUID":
+        try:
+            uuid.UUID(str(value))
+        except ValueError:
+            return "not a uuid"
+    return None
+
+
+# ============================================================================
+# Validation
+# ============================================================================
+
+class SeedValidator:
+    """Hash indexes of validated rows, and the problems found so far
+
+    Parents are identified by code everywhere; unique keys that include the
+    parent column compare parent codes.
+    """
+
+    def __init__(self, schema=None, max_examples=MAX_EXAMPLES):
+        self.schema = schema or load_schema()
+        self.max_examples = max_examples
+        self.rows = {table: {} for table in self.schema}
+        self.unique = {table: {key: {} for key in spec["unique"] if key != ("code",)}
+                       for table, spec in self.schema.items()}
+        self.parent_ids = {table: {} for table in self.schema}
+        self.problems = {}
+        self.row_count = 0
+        self.file_count = 0
+
+    def problem(self, kind, message):
+        """Record a problem of some kind (only the first examples are kept)"""
+        examples = self.problems.setdefault(kind, [0, []])
+        examples[0] += 1
+        if len(examples[1]) < self.max_examples:
+            examples[1].append(message)
+
+    def parent_code(self, parent_table, value):
+        """Code of a parent given by code or by deterministic id"""
+        if isinstance(value, uuid.UUID) or (isinstance(value, str) and len(value) == 36 and value.count("-") == 4):
+            ids = self.parent_ids[parent_table]
+            if len(ids) != len(self.rows[parent_table]):
+                ids.clear()
+                ids.update((str(hierarchy_id(parent_table, code)), code) for code in self.rows[parent_table])
+            return ids.get(str(value))
+        return value
+
+    def check(self, table, values, source, statement=None, upsert=False):
+        """Check one row (a {column: value} dict; the parent column holds the parent's code or id)
+
+        statement identifies the INSERT/COPY the row came from: a code
+        repeated within one statement is always an error, while an upsert
+        statement may replace a row from an earlier one.
+        """
+        spec = self.schema[table]
+        self.row_count += 1
+        code = values.get("code")
+        label = f"{source}: {table} {code!r}"
+
+        for column, (sql_type, not_null, has_default) in spec["columns"].items():
+            if column not in values:
+                if not_null and not has_default:
+                    self.problem(f"{table}.{column} missing", f"{label} has no {column}")
+                continue
+            value = values[column]
+            if value is None:
+                if not_null:
+                    self.problem(f"{table}.{column} NULL", f"{label}: {column} is NULL")
+                continue
+            if spec["parent"] and column == spec["parent"][0]:
+                continue
+            problem = column_problem(sql_type, value)
+            if problem:
+                self.problem(f"{table}.{column} {problem.split(' (')[0]}", f"{label}: {column} {value!r} {problem}")
+        for column in values:
+            if column not in spec["columns"]:
+                self.problem(f"{table}.{column} not in table", f"{label}: {table} has no column {column}")
+
+        parent_code = None
+        if spec["parent"]:
+            parent_column, parent_table = spec["parent"]
+            parent_code = self.parent_code(parent_table, values.get(parent_column))
+            if parent_code is None or parent_code not in self.rows[parent_table]:
+                self.problem(f"{table} with unknown {parent_table}",
+                             f"{label}: {parent_table} {values.get(parent_column)!r} not loaded before it")
+
+        if code is not None:
+            previous = self.rows[table].get(code)
+            if previous is not None:
+                if upsert and previous[0] != statement:
+                    self.forget(table, code, previous)
+                else:
+                    self.problem(f"{table}.code duplicate", f"{label} repeats {previous[2]}")
+                    return
+        for key, index in self.unique[table].items():
+            key_value = tuple(parent_code if spec["parent"] and column == spec["parent"][0] else values.get(column)
+                              for column in key)
+            if None in key_value:
+                continue
+            other = index.get(key_value)
+            if other is not None and other != code:
+                self.problem(f"{table} duplicate ({', '.join(key)})",
+                             f"{label}: ({', '.join(map(str, key_value))}) already used by {other!r}")
+            else:
+                index[key_value] = code
+        if code is not None:
+            self.rows[table][code] = (statement, parent_code, label, values)
+
+    def forget(self, table, code, previous):
+        """Drop a row's unique keys before an upsert replaces it"""
+        spec = self.schema[table]
+        values = previous[3]
+        for key, index in self.unique[table].items():
+            key_value = tuple(previous[1] if spec["parent"] and column == spec["parent"][0] else values.get(column)
+                              for column in key)
+            if index.get(key_value) == code:
+                del index[key_value]
+
+    def check_staging_rows(self, table, rows, source, upsert=False):
+        """Check generated rows in STAGING_TABLES[table] column order (parent code first)"""
+        spec = STAGING_TABLES[table]
+        columns = [self.schema[table]["parent"][0]] + [name for name, _ in spec["columns"]][1:]
+        statement = (source, table, self.row_count)
+        for number, row in enumerate(rows, 1):
+            self.check(table, dict(zip(columns, row)), f"{source} row {number}", statement, upsert)
+
+    def check_file(self, seed_path):
+        """Check every INSERT ... VALUES and COPY row of a seed or generated SQL file, in file order
+
+        The file is read a line at a time: COPY rows are checked as they are
+        read and other statements are parsed one at a time.
+        """
+        name = Path(seed_path).name
+        self.file_count += 1
+        with open(seed_path, 'r', encoding='utf-8') as f:
+            for table, columns, rows, upsert, position in iter_file_statements(f):
+                if table not in self.schema:
+                    continue
+                statement = (self.file_count, position)
+                for values, line in rows:
+                    self.check(table, dict(zip(columns, values)), f"{name}:{line}", statement, upsert)
+
+    def report(self, out=sys.stderr):
+        """Print the problems found; returns True when there were none"""
+        if not self.problems:
+            print(f"✓ {self.row_count} rows valid", file=out)
+            return True
+        total = sum(count for count, _ in self.problems.values())
+        print(f"✗ {total} problems in {self.row_count} rows:", file=out)
+        for kind, (count, examples) in sorted(self.problems.items()):
+            print(f"  {kind}: {count}", file=out)
+            for example in examples:
+                print(f"      {example}", file=out)
+            if count > len(examples):
+                print(f"      ... and {count - len(examples)} more", file=out)
+        return False
+
+
+# ============================================================================
+# SQL parsing
+# ============================================================================
+
+def sql_value(kind, text):
+    """Python value of a SQL literal token"""
+    if kind == "string":
+        return text[1:-1].replace("''", "'")
+    if kind == "number":
+        return Decimal(text) if "." in text else int(text)
+    lowered = text.lower()
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
+    if lowered == "null":
+        return None
+    return text
+
+
+def parse_values(text, position):
+    """Parse the VALUES tuples of an INSERT starting at position
+
+    Returns ([(values, offset)], upsert, end). A function call such as
+    get_district_id('LSK-LSK') stands for its first argument, the parent's
+    code (or for its name when it has none, as NOW() does).
+    """
+    rows = []
+    calls = []
+    current = None
+    word = None
+    row_offset = position
+
+    def add(value):
+        if calls:
+            if calls[-1][1] is None:
+                calls[-1][1] = value
+        else:
+            current.append(value)
+
+    while True:
+        match = VALUE_TOKEN.match(text, position)
+        if match is None:
+            break
+        position = match.end()
+        kind = match.lastgroup
+        token = match.group(kind)
+        if kind in ("skip", "cast"):
+            continue
+        if word is not None:
+            if token == "(":
+                calls.append([word, None])
+                word = None
+                continue
+            add(word)
+            word = None
+        if kind == "punct":
+            if token == "(":
+                if current is None:
+                    current, row_offset = [], match.start()
+                else:
+                    calls.append(["", None])
+            elif token == ")":
+                if calls:
+                    name, value = calls.pop()
+                    add(value if value is not None or not name else f"{name}()")
+                elif current is not None:
+                    rows.append((current, row_offset))
+                    current = None
+            elif token == ";" and current is None:
+                return rows, False, position
+            continue
+        if current is None:
+            # ON CONFLICT ... or the end of the VALUES list
+            upsert = token.upper() == "ON" and re.match(r"\s*CONFLICT\s*\([^)]*\)\s*DO\s+UPDATE",
+                                                        text[position:], re.IGNORECASE) is not None
+            end = text.find(";", position)
+            return rows, upsert, len(text) if end < 0 else end + 1
+        if kind == "word" and token.lower() not in ("true", "false", "null"):
+            word = token
+            continue
+        add(sql_value(kind, token))
+    return rows, False, position
+
+
+def copy_value(text):
+    """Python value of a COPY text field"""
+    if text == "\\N":
+        return None
+    if "\\" in text:
+        return re.sub(r"\\[\\tnr]", lambda match: COPY_ESCAPES[match.group(0)], text)
+    return text
+
+
+def target_table(table, columns):
+    """(table, columns) with a staging table replaced by its target and parent code by parent id"""
+    for target, spec in STAGING_TABLES.items():
+        if spec["staging"] == table:
+            return target, [spec["parent_id"] if name == spec["parent_code"] else name for name in columns]
+    return table, columns
+
+
+def iter_statements(text):
+    """Yield (table, columns, [(values, offset)], upsert, position) for each INSERT and COPY
+
+    COPY or INSERT into a staging table is reported as its target table,
+    the parent code column standing in for the parent id column.
+    """
+    statements = []
+    for match in COPY_BLOCK.finditer(text):
+        table, columns = target_table(match.group(1), [name.strip() for name in match.group(2).split(",")])
+        offset = match.start(3)
+        rows = []
+        for line in match.group(3).splitlines(keepends=True):
+            rows.append(([copy_value(field) for field in line.rstrip("\n").split("\t")], offset))
+            offset += len(line)
+        statements.append((match.start(), table, columns, rows, False))
+
+    copy_spans = [(match.start(), match.end()) for match in COPY_BLOCK.finditer(text)]
+    position = 0
+    while True:
+        match = INSERT_HEADER.search(text, position)
+        if match is None:
+            break
+        if any(start <= match.start() < end for start, end in copy_spans):
+            position = match.end()
+            continue
+        table, columns = target_table(match.group(1), [name.strip() for name in match.group(2).split(",")])
+        rows, upsert, position = parse_values(text, match.end())
+        statements.append((match.start(), table, columns, rows, upsert))
+
+    for start, table, columns, rows, upsert in sorted(statements, key=lambda statement: statement[0]):
+        yield table, columns, rows, upsert, start
+
+
+def scan_line(line, in_string):
+    """(in_string, ended) after line: whether a string literal is still open and the line ends a statement"""
+    ended = False
+    position = 0
+    while True:
+        if in_string:
+            end = line.find("'", position)
+            if end < 0:
+                return True, False
+            in_string, ended, position = False, False, end + 1
+            continue
+        match = STATEMENT_TOKEN.search(line, position)
+        if line[position:match.start() if match else len(line)].strip():
+            ended = False
+        if match is None or match.group() == "--":
+            return False, ended
+        if match.group() == ";":
+            ended = True
+        else:
+            in_string = True
+        position = match.end()
+
+
+def iter_file_statements(f):
+    """Yield (table, columns, rows, upsert, position) for each INSERT and COPY of an open SQL file
+
+    Like iter_statements, but reading f a line at a time: rows yields
+    (values, line number) pairs, lazily for COPY blocks, and position is
+    the statement's line (and offset within the statements ending on it).
+    """
+    lines = enumerate(f, 1)
+    buffer = []
+    first_line = 0
+    in_string = False
+    for line_number, line in lines:
+        if not in_string and COPY_HEADER.match(line):
+            yield from buffered_statements("".join(buffer), first_line)
+            buffer = []
+            header = COPY_HEADER.match(line)
+            table, columns = target_table(header.group(1), [name.strip() for name in header.group(2).split(",")])
+            rows = copy_rows(lines)
+            yield table, columns, rows, False, (line_number, 0)
+            for _ in rows:
+                pass  # rows the caller didn't read
+            continue
+        if not buffer:
+            first_line = line_number
+        buffer.append(line)
+        if line.startswith("\\") and not in_string:
+            continue
+        in_string, ended = scan_line(line, in_string)
+        if ended:
+            yield from buffered_statements("".join(buffer), first_line)
+            buffer = []
+    yield from buffered_statements("".join(buffer), first_line)
+
+
+def copy_rows(lines):
+    """(values, line number) for the numbered COPY data lines up to \\."""
+    for line_number, line in lines:
+        if line.rstrip("\n") == "\\.":
+            return
+        yield [copy_value(field) for field in line.rstrip("\n").split("\t")], line_number
+
+
+def buffered_statements(text, first_line):
+    """iter_statements of text starting at first_line, row offsets turned into line numbers"""
+    line, last = first_line, 0
+    for table, columns, rows, upsert, position in iter_statements(text):
+        numbered = []
+        for values, offset in rows:
+            line += text.count("\n", last, offset)
+            last = offset
+            numbered.append((values, line))
+        yield table, columns, numbered, upsert, (first_line, position)
+
+
+# ============================================================================
+# Entry points
+# ============================================================================
+
+def validate_admin_csv(validator, input_csv, converter="full", upsert=False, joins=(),
+                       join_memory=DEFAULT_JOIN_MEMORY_MB):
+    """Check the constituency and ward rows a converter generates from an admin CSV, joins applied"""
+    if converter == "zambia":
+        import convert_zambia_admin_data as convert
+        hierarchy = convert.read_csv_data(input_csv)
+    else:
+        import convert_full_admin_data as convert
+        hierarchy = convert.read_and_organize_data(input_csv)
+    name = Path(input_csv).name
+    constituencies = join_rows(convert.constituency_rows(hierarchy), "constituencies", joins, join_memory)
+    validator.check_staging_rows("constituencies", constituencies, name, upsert)
+    wards = join_rows(convert.ward_rows(convert.iter_wards(input_csv)), "wards", joins, join_memory)
+    validator.check_staging_rows("wards", wards, name, upsert)
+
+
+def validate(seed_files=(), admin_csv=None, converter="full", upsert=False, max_examples=MAX_EXAMPLES,
+             joins=(), join_memory=DEFAULT_JOIN_MEMORY_MB):
+    """Validate seed files, then the rows generated from admin_csv; returns the SeedValidator"""
+    validator = SeedValidator(max_examples=max_examples)
+    for seed_file in seed_files:
+        validator.check_file(seed_file)
+    if admin_csv:
+        validate_admin_csv(validator, admin_csv, converter, upsert, joins, join_memory)
+    return validator
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Validate seed data before loading it")
+    parser.add_argument("seed_files", nargs="*",
+                        help="Seed or generated SQL files in load order (default: "
+                             f"{', '.join(DEFAULT_SEED_FILES)}; with --admin-csv: "
+                             f"{', '.join(REFERENCE_SEED_FILES)})")
+    parser.add_argument("--admin-csv", help="Also check the rows generated from this administrative units CSV")
+    parser.add_argument("--converter", choices=("full", "zambia"), default="full",
+                        help="Converter whose rows --admin-csv produces (default: %(default)s)")
+    parser.add_argument("--upsert", action="store_true",
+                        help="Generated rows are upserts (--delta loads) and may replace existing codes")
+    parser.add_argument("--max-examples", type=int, default=MAX_EXAMPLES,
+                        help="Examples printed per kind of problem (default: %(default)s)")
+    add_join_args(parser)
+    args = parser.parse_args()
+    check_join_args(parser, args)
+    if args.join_sources and not args.admin_csv:
+        parser.error("--join needs --admin-csv")
+    return args
+
+
+def main():
+    args = parse_args()
+    seed_files = args.seed_files or [SEED_DIR / name for name in
+                                     (REFERENCE_SEED_FILES if args.admin_csv else DEFAULT_SEED_FILES)]
+    missing = [str(path) for path in seed_files if not Path(path).exists()]
+    if missing:
+        print(f"Error: File not found: {', '.join(missing)}", file=sys.stderr)
+        sys.exit(1)
+
+    validator = validate(seed_files, args.admin_csv, args.converter, args.upsert, args.max_examples,
+                         args.join_sources, args.join_memory)
+    if args.join_report:
+        write_join_report(args.join_report, args.join_sources)
+    sys.exit(0 if validator.report() else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Ward Geocoder - Bulk point-to-ward assignment from ward boundary GeoJSON
+Assigns ward codes to GPS coordinates offline, so bulk project imports can be
+reconciled before they reach the database instead of running one
+idx_wards_location query per point.
+
+Ward polygons are indexed on a uniform grid. Cells that lie wholly inside one
+ward answer directly; cells a boundary crosses keep a short candidate list
+that is refined with a point-in-polygon test. Points that fall in no ward
+(GPS noise along lakes and borders, simplified boundaries) fall back to the
+nearest ward centroid within --max-distance-km.
+
+Boundaries are the files given to convert_ward_boundaries.py, or the
+wards_<level>.geojson files it writes with --lod-dir (the high level is a
+good trade-off between accuracy and speed).
+
+Usage:
+    python3 ward_geocoder.py projects.csv --boundaries boundaries/wards_high.geojson -o projects_geocoded.csv
+    python3 ward_geocoder.py points.csv --boundaries ward_boundaries.geojson --lat-column lat \\
+            --lon-column lng --compare-column ward_code --max-distance-km 2 --cache-dir .seed-cache
+"""
+
+import argparse
+import csv
+import math
+import sys
+from bisect import bisect_right
+from pathlib import Path
+
+from build_cache import BuildCache, add_cache_args, cached_stage, code_version, file_digest
+from convert_ward_boundaries import feature_ward_code, iter_features
+from geometry import (
+    KM_PER_DEGREE_LAT, KM_PER_DEGREE_LON, bbox, centroid, polygons, scanline_crossings,
+    segment_crossings
+)
+from instrumentation import RunReport, add_instrumentation_args, counted, stage, start_profile, stop_profile, timed
+from output_sink import describe_output, open_output
+
+# Grid cell size in degrees (~2.2 km); most rural wards cover many cells
+GRID_CELL_DEGREES = 0.02
+
+# Where in a cell its reference point sits, as fractions of the cell size;
+# off-centre so boundaries along round coordinates never pass through it
+CELL_REFERENCE = (0.5236, 0.4142)
+DEFAULT_MAX_DISTANCE_KM = 5.0
+
+MATCH_INSIDE = "inside"
+MATCH_NEAREST = "nearest"
+MATCH_NONE = "none"
+MATCH_INVALID = "invalid"
+
+GEOCODE_COLUMNS = ["geocoded_ward_code", "geocode_match", "geocode_distance_km"]
+AGREES_COLUMN = "geocode_agrees"
+
+
+class WardGeocoder:
+    """Grid index over ward polygons and centroids
+
+    cells maps (column, row) to a ward index when the cell lies wholly inside
+    that ward, or to a tuple of (ward index, reference inside, edges) entries
+    when ward boundaries cross it, edges being the ward's edges within the
+    cell. A point is inside the ward when crossing those edges on the way from
+    the cell's reference point flips reference inside to True, so only a few
+    edges are tested instead of whole rings. Cells outside every ward are
+    absent. Pickles as plain lists, tuples and dicts, so a built index can be
+    kept in the build cache.
+    """
+
+    def __init__(self, cell_size=GRID_CELL_DEGREES):
+        self.cell_size = cell_size
+        self.codes = []
+        self.shapes = []
+        self.bboxes = []
+        self.centroids = []
+        self.cells = {}
+        self.centroid_cells = {}
+        self.centroid_extent = (0, 0, 0, 0)
+
+    def cell(self, x, y):
+        """Grid cell (column, row) of a position"""
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def add(self, code, geometry):
+        """Add a ward's Polygon/MultiPolygon boundary (call build() when done)"""
+        self.codes.append(code)
+        self.shapes.append([[tuple((position[0], position[1]) for position in ring) for ring in rings]
+                            for rings in polygons(geometry)])
+        self.bboxes.append(bbox(geometry))
+        self.centroids.append(centroid(geometry))
+
+    def cell_edges(self, index):
+        """{cell: flat edge coordinates} for the cells a ward's edges pass through
+
+        An edge is assigned to every cell its bounding box overlaps, a
+        superset of the cells it actually crosses.
+        """
+        edges = {}
+        for rings in self.shapes[index]:
+            for ring in rings:
+                for (x1, y1), (x2, y2) in zip(ring, ring[1:]):
+                    min_column, min_row = self.cell(min(x1, x2), min(y1, y2))
+                    max_column, max_row = self.cell(max(x1, x2), max(y1, y2))
+                    for column in range(min_column, max_column + 1):
+                        for row in range(min_row, max_row + 1):
+                            edges.setdefault((column, row), []).extend((x1, y1, x2, y2))
+        return edges
+
+    def reference_point(self, column, row):
+        """Reference position of a grid cell (see CELL_REFERENCE)"""
+        return (column + CELL_REFERENCE[0]) * self.cell_size, (row + CELL_REFERENCE[1]) * self.cell_size
+
+    def reference_states(self, index, min_column, min_row, max_column, max_row):
+        """{cell: whether its reference point is inside the ward} over a range of cells
+
+        One scanline per row of cells rather than a point-in-polygon test
+        per cell.
+        """
+        states = {}
+        for row in range(min_row, max_row + 1):
+            y = self.reference_point(min_column, row)[1]
+            crossings = [x for rings in self.shapes[index] for x in scanline_crossings(rings, y)]
+            crossings.sort()
+            for column in range(min_column, max_column + 1):
+                x = self.reference_point(column, row)[0]
+                states[(column, row)] = (len(crossings) - bisect_right(crossings, x)) % 2 == 1
+        return states
+
+    def build(self):
+        """Classify grid cells and bucket centroids"""
+        boundary = {}
+        interior = {}
+        for index, (min_x, min_y, max_x, max_y) in enumerate(self.bboxes):
+            edges = self.cell_edges(index)
+            min_column, min_row = self.cell(min_x, min_y)
+            max_column, max_row = self.cell(max_x, max_y)
+            states = self.reference_states(index, min_column, min_row, max_column, max_row)
+            for key, reference_inside in states.items():
+                if key in edges:
+                    boundary.setdefault(key, []).append((index, reference_inside, tuple(edges[key])))
+                elif reference_inside:
+                    # No edge of this ward enters the cell, so the whole cell is inside it
+                    interior.setdefault(key, []).append(index)
+
+        self.cells = {key: tuple(entries) for key, entries in boundary.items()}
+        for key, indexes in interior.items():
+            if key in self.cells or len(indexes) > 1:
+                # Overlapping boundaries: the cell is inside each of these wards
+                self.cells[key] = self.cells.get(key, ()) + tuple((index, True, ()) for index in indexes)
+            else:
+                self.cells[key] = indexes[0]
+
+        self.centroid_cells = {}
+        for index, (x, y) in enumerate(self.centroids):
+            self.centroid_cells.setdefault(self.cell(x, y), []).append(index)
+        if self.centroid_cells:
+            columns = [column for column, _ in self.centroid_cells]
+            rows = [row for _, row in self.centroid_cells]
+            self.centroid_extent = (min(columns), min(rows), max(columns), max(rows))
+
+    def nearest(self, x, y, max_distance_km=DEFAULT_MAX_DISTANCE_KM):
+        """(ward index, distance km) of the nearest centroid within max_distance_km, or (None, None)
+
+        Searches square rings of centroid cells outwards from the point's
+        cell, stopping once no unvisited cell can hold a closer centroid.
+        """
+        x_km = KM_PER_DEGREE_LON * math.cos(math.radians(y))
+        cell_km = self.cell_size * min(x_km, KM_PER_DEGREE_LAT)
+        column, row = self.cell(x, y)
+        min_column, min_row, max_column, max_row = self.centroid_extent
+        max_radius = max(column - min_column, max_column - column, row - min_row, max_row - row)
+        if math.isfinite(max_distance_km):
+            max_radius = min(max_radius, int(max_distance_km / cell_km) + 1)
+
+        best, best_distance = None, max_distance_km
+        for radius in range(max_radius + 1):
+            if best is not None and best_distance <= (radius - 1) * cell_km:
+                break
+            for ring_column in range(column - radius, column + radius + 1):
+                edge = ring_column in (column - radius, column + radius)
+                for ring_row in (range(row - radius, row + radius + 1) if edge else (row - radius, row + radius)):
+                    for index in self.centroid_cells.get((ring_column, ring_row), ()):
+                        cx, cy = self.centroids[index]
+                        distance = math.hypot((x - cx) * x_km, (y - cy) * KM_PER_DEGREE_LAT)
+                        if distance <= best_distance:
+                            best, best_distance = index, distance
+        return (best, best_distance) if best is not None else (None, None)
+
+    def locate(self, x, y, max_distance_km=DEFAULT_MAX_DISTANCE_KM):
+        """(ward code, match, distance km) for a longitude/latitude
+
+        match is MATCH_INSIDE (distance None), MATCH_NEAREST, or MATCH_NONE
+        (code None) when no centroid is within max_distance_km.
+        """
+        column, row = int(x // self.cell_size), int(y // self.cell_size)
+        entry = self.cells.get((column, row))
+        if entry.__class__ is int:
+            return self.codes[entry], MATCH_INSIDE, None
+        if entry:
+            reference_x, reference_y = self.reference_point(column, row)
+            for index, reference_inside, edges in entry:
+                if reference_inside != (segment_crossings(reference_x, reference_y, x, y, edges) % 2 == 1):
+                    return self.codes[index], MATCH_INSIDE, None
+        if max_distance_km > 0:
+            index, distance = self.nearest(x, y, max_distance_km)
+            if index is not None:
+                return self.codes[index], MATCH_NEAREST, distance
+        return None, MATCH_NONE, None
+
+
+def build_geocoder(boundary_files, code_property=None, cell_size=GRID_CELL_DEGREES):
+    """WardGeocoder over boundary GeoJSON files, first feature per ward code wins"""
+    geocoder = WardGeocoder(cell_size)
+    seen = set()
+    skipped = duplicates = 0
+    for boundary_file in boundary_files:
+        for feature in iter_features(boundary_file):
+            code = feature_ward_code(feature.get("properties") or {}, code_property)
+            geometry = feature.get("geometry")
+            if code is None or not geometry or geometry.get("type") not in ("Polygon", "MultiPolygon"):
+                skipped += 1
+                continue
+            if code in seen:
+                duplicates += 1
+                continue
+            seen.add(code)
+            geocoder.add(code, geometry)
+    geocoder.build()
+
+    if skipped:
+        print(f"⚠️  Warning: skipped {skipped} features without a ward code or polygon geometry", file=sys.stderr)
+    if duplicates:
+        print(f"⚠️  Warning: skipped {duplicates} features repeating a ward code", file=sys.stderr)
+    return geocoder
+
+
+def geocoder_cache_key(cache, boundary_files, code_property, cell_size):
+    """Build cache key of a geocoder index: boundary files, indexing code and grid options"""
+    return cache.key("ward_geocoder:index", [file_digest(path) for path in boundary_files],
+                     code_version("ward_geocoder", "geometry", "convert_ward_boundaries"),
+                     code_property, cell_size)
+
+
+def geocode_rows(geocoder, rows, lat_index, lon_index, max_distance_km, compare_index=None, counts=None):
+    """Yield rows with GEOCODE_COLUMNS (and AGREES_COLUMN with compare_index) appended"""
+    locate = geocoder.locate
+    for row in rows:
+        try:
+            latitude = float(row[lat_index])
+            longitude = float(row[lon_index])
+            valid = -90 <= latitude <= 90 and -180 <= longitude <= 180
+        except (ValueError, IndexError):
+            valid = False
+
+        if valid:
+            code, match, distance = locate(longitude, latitude, max_distance_km)
+            added = [code or "", match, f"{distance:.3f}" if distance is not None else ""]
+        else:
+            code, match = None, MATCH_INVALID
+            added = ["", match, ""]
+        if compare_index is not None:
+            existing = row[compare_index].strip() if compare_index < len(row) else ""
+            agrees = "" if not (code and existing) else ("yes" if existing == code else "no")
+            added.append(agrees)
+            if counts is not None and agrees:
+                counts[f"agrees_{agrees}"] = counts.get(f"agrees_{agrees}", 0) + 1
+        if counts is not None:
+            counts[match] = counts.get(match, 0) + 1
+        row.extend(added)
+        yield row
+
+
+def column_index(header, name, input_csv):
+    """Position of a column in a CSV header (exits if missing)"""
+    if name not in header:
+        print(f"Error: {input_csv} has no '{name}' column (columns: {', '.join(header)})", file=sys.stderr)
+        sys.exit(1)
+    return header.index(name)
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Assign ward codes to coordinates from ward boundaries")
+    parser.add_argument("input_csv", help="CSV of points to geocode")
+    parser.add_argument("--boundaries", nargs="+", required=True, metavar="GEOJSON",
+                        help="Ward boundary GeoJSON files (e.g. convert_ward_boundaries.py --lod-dir output)")
+    parser.add_argument("--lat-column", default="latitude", help="Latitude column (default: %(default)s)")
+    parser.add_argument("--lon-column", default="longitude", help="Longitude column (default: %(default)s)")
+    parser.add_argument("--compare-column", metavar="NAME",
+                        help="Column holding the ward code already assigned; adds geocode_agrees (yes/no)")
+    parser.add_argument("--max-distance-km", type=float, default=DEFAULT_MAX_DISTANCE_KM,
+                        help="Nearest-centroid fallback radius for points in no ward; 0 disables it, "
+                             "inf removes the limit (default: %(default)s)")
+    parser.add_argument("--code-property", metavar="NAME",
+                        help="Feature property holding the ward code (default: CONST_CODE + WARD_CODE, "
+                             "ward_code or code)")
+    parser.add_argument("--cell-size", type=float, default=GRID_CELL_DEGREES,
+                        help="Grid cell size in degrees (default: %(default)s)")
+    parser.add_argument("--output", "-o", default="-", metavar="TARGET",
+                        help="Where to write the geocoded CSV: - (stdout, default), a .csv, .csv.gz or .csv.zst file")
+    add_cache_args(parser)
+    add_instrumentation_args(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    report = RunReport("ward_geocoder") if args.report else None
+    profiler = start_profile(args.profile)
+    cache = BuildCache(args.cache_dir) if args.cache_dir else None
+
+    missing = [path for path in args.boundaries + [args.input_csv] if not Path(path).exists()]
+    if missing:
+        print(f"Error: File not found: {', '.join(missing)}", file=sys.stderr)
+        sys.exit(1)
+
+    with stage(report, "index"):
+        key = geocoder_cache_key(cache, args.boundaries, args.code_property, args.cell_size) if cache else None
+        geocoder = cached_stage(cache, "geocoder", key,
+                                lambda: build_geocoder(args.boundaries, args.code_property, args.cell_size))
+    print(f"Indexed {len(geocoder.codes)} wards in {len(geocoder.cells)} grid cells", file=sys.stderr)
+    print(f"Geocoding {args.input_csv} to {describe_output(args.output)}...", file=sys.stderr)
+
+    counts = {}
+    with open(args.input_csv, 'r', encoding='utf-8-sig', newline='') as f, open_output(args.output) as out:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        lat_index = column_index(header, args.lat_column, args.input_csv)
+        lon_index = column_index(header, args.lon_column, args.input_csv)
+        compare_index = column_index(header, args.compare_column, args.input_csv) if args.compare_column else None
+
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(header + GEOCODE_COLUMNS + ([AGREES_COLUMN] if args.compare_column else []))
+        rows = timed(report, "read", reader, "points_in")
+        with stage(report, "geocode"):
+            writer.writerows(counted(report, "rows_out", geocode_rows(
+                geocoder, rows, lat_index, lon_index, args.max_distance_km, compare_index, counts)))
+
+    stop_profile(profiler, args.profile)
+    if report:
+        for name, count in counts.items():
+            report.count(name, count)
+        if cache:
+            report.count("cache_hits", len(cache.hits))
+            report.count("cache_misses", len(cache.misses))
+        report.write(args.report)
+
+    print("", file=sys.stderr)
+    print("✅ Geocoding complete!", file=sys.stderr)
+    for match in (MATCH_INSIDE, MATCH_NEAREST, MATCH_NONE, MATCH_INVALID):
+        print(f"  {match}: {counts.get(match, 0)}", file=sys.stderr)
+    if args.compare_column:
+        print(f"  disagreeing with {args.compare_column}: {counts.get('agrees_no', 0)}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
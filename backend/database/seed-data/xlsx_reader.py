@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Excel Reader - Streaming, read-only rows of .xlsx worksheets
+Reads a workbook's XML parts straight out of the zip archive with the
+standard library. Sheet XML is decompressed a chunk of whole rows at a time
+and each chunk is discarded once its rows are yielded, so memory is bounded
+by the shared string table, not by the size of the sheet.
+
+Cells are found by scanning the (machine-written, regular) sheet XML with
+regular expressions rather than building an element tree, which costs
+several times more per cell than the conversion itself.
+
+Cells are returned as text, like a CSV export: shared and inline strings as
+they are, numbers as stored (integral values without a trailing .0),
+booleans as TRUE/FALSE. Formulas give their cached value. Dates are not
+converted (they come back as Excel serial numbers).
+
+Usage:
+    python3 xlsx_reader.py ecz_exports.xlsx               # list sheets and row counts
+    python3 xlsx_reader.py ecz_exports.xlsx Wards         # print a sheet as CSV
+"""
+
+import csv
+import multiprocessing
+import posixpath
+import re
+import sys
+import zipfile
+from functools import lru_cache
+from html import unescape
+from xml.etree.ElementTree import fromstring
+
+WORKBOOK_SUFFIXES = (".xlsx", ".xlsm")
+
+# Part names of the package relationships and the workbook's default parts
+WORKBOOK_PART = "xl/workbook.xml"
+WORKBOOK_RELS_PART = "xl/_rels/workbook.xml.rels"
+SHARED_STRINGS_PART = "xl/sharedStrings.xml"
+RELATIONSHIP_ID = "id"
+
+# Uncompressed bytes of sheet XML scanned per chunk of rows
+CHUNK_SIZE = 1 << 20
+
+# read_ahead_rows(): rows per batch sent from the worker, and batches it may run ahead
+READ_AHEAD_ROWS = 2048
+READ_AHEAD_BATCHES = 16
+
+# Elements may carry a namespace prefix (x:row); it is read from <sheetData>/<sst>
+SHEET_DATA_START = re.compile(rb"<((?:\w+:)?)sheetData\b[^>]*?(/?)>")
+SST_START = re.compile(r"<((?:\w+:)?)sst\b")
+
+
+def is_workbook(path):
+    """Whether a path names an .xlsx workbook (by suffix)"""
+    return str(path).lower().endswith(WORKBOOK_SUFFIXES)
+
+
+def namespace(tag):
+    """'{uri}' prefix of an element tag ('' if it has none)"""
+    return tag[:tag.index("}") + 1] if tag.startswith("{") else ""
+
+
+class ColumnNumbers(dict):
+    """0-based column of a cell reference's letters ('A' -> 0, 'AB' -> 27), computed once per letters"""
+
+    def __missing__(self, letters):
+        number = 0
+        for letter in letters:
+            number = number * 26 + ord(letter) - 64
+        self[letters] = number - 1
+        return number - 1
+
+
+COLUMNS = ColumnNumbers()
+
+
+def number_text(text):
+    """A numeric cell's text, with integral values written as integers"""
+    if "." in text or "E" in text:
+        value = float(text)
+        if value.is_integer() and abs(value) < 1e15:
+            return str(int(value))
+    return text
+
+
+class Workbook:
+    """An open .xlsx workbook: its sheet names, and a row stream per sheet"""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.archive = zipfile.ZipFile(self.path)
+        try:
+            root = fromstring(self.archive.read(WORKBOOK_PART))
+        except KeyError:
+            self.archive.close()
+            raise ValueError(f"{self.path}: not an .xlsx workbook (no {WORKBOOK_PART})") from None
+        self.ns = namespace(root.tag)
+        targets = {}
+        for rel in fromstring(self.archive.read(WORKBOOK_RELS_PART)):
+            target = rel.get("Target")
+            target = target[1:] if target.startswith("/") else posixpath.normpath(posixpath.join("xl", target))
+            targets[rel.get("Id")] = (rel.get("Type", "").rsplit("/", 1)[-1], target)
+
+        # Sheets keep their workbook (tab) order
+        self.sheets = {}
+        for sheet in root.iter(f"{self.ns}sheet"):
+            rel_id = next(value for key, value in sheet.attrib.items() if namespace(key) and
+                          key.endswith("}" + RELATIONSHIP_ID))
+            self.sheets[sheet.get("name")] = targets[rel_id][1]
+        self.shared_strings_part = next((target for kind, target in targets.values() if kind == "sharedStrings"),
+                                        SHARED_STRINGS_PART)
+        self._shared_strings = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def close(self):
+        self.archive.close()
+
+    @property
+    def sheet_names(self):
+        return list(self.sheets)
+
+    @property
+    def shared_strings(self):
+        """The shared string table, read on first use"""
+        if self._shared_strings is None:
+            self._shared_strings = self.read_shared_strings()
+        return self._shared_strings
+
+    def read_shared_strings(self):
+        """Every <si> of the shared string table as text (rich text runs joined, phonetic runs skipped)"""
+        if self.shared_strings_part not in self.archive.namelist():
+            return []
+        text = self.archive.read(self.shared_strings_part).decode('utf-8')
+        match = SST_START.search(text)
+        if match is None:
+            return []
+        patterns = xml_patterns(match.group(1))
+        strings = []
+        for item in patterns["item"].findall(text, match.end()):
+            if item.startswith("<t>") and item.endswith("</t>") and item.count("<") == 2:
+                value = item[3:-4]
+            else:
+                value = "".join(patterns["text"].findall(patterns["phonetic"].sub("", item)))
+            strings.append(unescape(value) if "&" in value else value)
+        return strings
+
+    def rows(self, sheet=None):
+        """Stream a sheet's rows (default: the first sheet) as lists of text
+
+        Cells missing from the XML come back as "", so values line up with
+        their columns; rows without any cells are skipped.
+        """
+        if sheet is None:
+            if not self.sheets:
+                raise KeyError(f"{self.path}: workbook has no sheets")
+            sheet = self.sheet_names[0]
+        if sheet not in self.sheets:
+            raise KeyError(f"{self.path}: no sheet named {sheet!r} (sheets: {', '.join(self.sheets)})")
+        shared_strings = self.shared_strings
+
+        with self.archive.open(self.sheets[sheet]) as f:
+            values = None
+            for prefix, text in iter_sheet_data(f):
+                patterns = xml_patterns(prefix)
+                for row_start, letters, attributes, value, content, other_attributes, other_content in \
+                        patterns["row_or_cell"].findall(text):
+                    if row_start:
+                        if values:
+                            yield values
+                        values = []
+                        continue
+                    if not letters:
+                        # Not the usual <c r="A1" ...>: the reference is optional, or comes later
+                        attributes, value, content = other_attributes, "", other_content
+                        letters = (attribute(attributes, "r") or "").rstrip("0123456789")
+                    if letters:
+                        column = COLUMNS[letters]
+                        if column != len(values):
+                            values.extend([""] * (column - len(values)))
+
+                    if not attributes:
+                        kind = "n"
+                    elif attributes.endswith(' t="s"'):
+                        kind = "s"
+                    else:
+                        kind = attribute(attributes, "t") or "n"
+                    if content:
+                        value, kind = cell_content(content, kind, patterns)
+
+                    if kind == "s":
+                        value = shared_strings[int(value)] if value else ""
+                    elif kind == "n":
+                        if "." in value or "E" in value:
+                            value = number_text(value)
+                    elif kind == "b":
+                        value = "TRUE" if value == "1" else "FALSE"
+                    elif "&" in value:
+                        value = unescape(value)
+                    values.append(value)
+            if values:
+                yield values
+
+
+def attribute(attributes, name):
+    """Value of an attribute in a start tag's attribute text (None if absent)"""
+    position = attributes.find(f' {name}="')
+    if position < 0:
+        return None
+    position += len(name) + 3
+    return attributes[position:attributes.index('"', position)]
+
+
+def cell_content(content, kind, patterns):
+    """(raw value, kind) of a cell whose content isn't a lone <v> (formulas, inline strings)"""
+    if kind == "inlineStr":
+        return "".join(patterns["text"].findall(patterns["phonetic"].sub("", content))), "str"
+    found = patterns["value"].search(content)
+    return (found.group(1) if found else ""), kind
+
+
+@lru_cache(maxsize=None)
+def xml_patterns(prefix):
+    """Compiled patterns for rows, cells and text of elements with a namespace prefix ('' or 'x:')"""
+    p = re.escape(prefix)
+    return {
+        # A row start tag (group 1 None), or a cell: (attributes, content or None)
+        # (row start, column letters, attributes, lone <v> value, other content) for the usual
+        # <c r="A1" s=".." t="..">, (..., attributes, content) for any other cell
+        "row_or_cell": re.compile(rf"(<{p}row\b)[^>]*>"
+                                  rf"|<{p}c r=\"([A-Z]+)\d+\"([^>/]*)(?:/>|>(?:<{p}v>([^<]*)</{p}v>)?"
+                                  rf"([^<]*(?:<(?!/{p}c>)[^<]*)*)</{p}c>)"
+                                  rf"|<{p}c\b([^>/]*)(?:/>|>([^<]*(?:<(?!/{p}c>)[^<]*)*)</{p}c>)"),
+        "value": re.compile(rf"<{p}v>([^<]*)</{p}v>"),
+        "text": re.compile(rf"<{p}t(?:\s[^>]*)?>([^<]*)</{p}t>"),
+        "phonetic": re.compile(rf"<{p}rPh\b.*?</{p}rPh>", re.DOTALL),
+        "item": re.compile(rf"<{p}si>(.*?)</{p}si>", re.DOTALL),
+    }
+
+
+def iter_sheet_data(f, chunk_size=CHUNK_SIZE):
+    """Yield (element prefix, text) chunks of a worksheet part's <sheetData>, each ending on a row boundary"""
+    buffer = b""
+    while True:
+        chunk = f.read(chunk_size)
+        buffer += chunk
+        match = SHEET_DATA_START.search(buffer)
+        if match or not chunk:
+            break
+    if not match or match.group(2):
+        return
+    prefix = match.group(1)
+    row_end = b"</" + prefix + b"row>"
+    sheet_data_end = b"</" + prefix + b"sheetData>"
+    prefix = prefix.decode('ascii')
+    buffer = buffer[match.end():]
+
+    while True:
+        end = buffer.find(sheet_data_end)
+        if end >= 0:
+            yield prefix, buffer[:end].decode('utf-8')
+            return
+        chunk = f.read(chunk_size)
+        if not chunk:
+            raise ValueError("worksheet XML ends inside <sheetData>")
+        # Cut after the last complete row (an ASCII boundary, so never inside a character)
+        end = buffer.rfind(row_end)
+        if end >= 0:
+            end += len(row_end)
+            yield prefix, buffer[:end].decode('utf-8')
+            buffer = buffer[end:]
+        buffer += chunk
+
+
+def read_ahead_worker(path, sheet, queue, batch_size):
+    """Worker process: put a sheet's rows on queue in batches, then None (or the exception raised)"""
+    try:
+        with Workbook(path) as workbook:
+            batch = []
+            for row in workbook.rows(sheet):
+                batch.append(row)
+                if len(batch) == batch_size:
+                    queue.put(batch)
+                    batch = []
+            if batch:
+                queue.put(batch)
+        queue.put(None)
+    except Exception as e:
+        queue.put(e)
+
+
+def read_ahead_rows(path, sheet=None, batch_size=READ_AHEAD_ROWS, batches=READ_AHEAD_BATCHES):
+    """Workbook(path).rows(sheet), decompressed and scanned by a worker process
+
+    The worker runs up to batches x batch_size rows ahead of the caller, so
+    scanning the sheet overlaps with whatever the caller does with its rows
+    instead of adding to it. Stopping early terminates the worker.
+    """
+    queue = multiprocessing.Queue(batches)
+    worker = multiprocessing.Process(target=read_ahead_worker, args=(str(path), sheet, queue, batch_size),
+                                     daemon=True)
+    worker.start()
+    try:
+        while True:
+            batch = queue.get()
+            if batch is None:
+                break
+            if isinstance(batch, Exception):
+                raise batch
+            yield from batch
+    finally:
+        if worker.is_alive():
+            worker.terminate()
+        worker.join()
+
+
+class SheetReader:
+    """csv.DictReader over a worksheet's rows: fieldnames from the first row, then one dict per row
+
+    rows is Workbook.rows() or read_ahead_rows(). Short rows are padded with
+    "", and cells beyond the header are dropped.
+    """
+
+    def __init__(self, rows):
+        self.rows = iter(rows)
+        header = next(self.rows, None)
+        self.fieldnames = header
+        self.line_num = 1 if header is not None else 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        values = next(self.rows)
+        self.line_num += 1
+        fieldnames = self.fieldnames
+        if len(values) < len(fieldnames):
+            values.extend([""] * (len(fieldnames) - len(values)))
+        return dict(zip(fieldnames, values))
+
+
+def main():
+    if len(sys.argv) not in (2, 3):
+        print("Usage: xlsx_reader.py WORKBOOK [SHEET]", file=sys.stderr)
+        sys.exit(1)
+    with Workbook(sys.argv[1]) as workbook:
+        if len(sys.argv) == 2:
+            for name in workbook.sheet_names:
+                print(f"  {name:30} {sum(1 for _ in workbook.rows(name)):>10} rows")
+            return
+        writer = csv.writer(sys.stdout)
+        for row in workbook.rows(sys.argv[2]):
+            writer.writerow(row)
+
+
+if __name__ == "__main__":
+    main()
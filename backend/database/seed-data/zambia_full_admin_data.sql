@@ -185,1423 +185,1423 @@ CREATE OR REPLACE FUNCTION get_constituency_id(c_code VARCHAR) RETURNS UUID AS $
     SELECT id FROM constituencies WHERE code = c_code LIMIT 1;
 $$ LANGUAGE SQL STABLE;
 
-INSERT INTO wards (constituency_id, code, name, population, registered_voters, is_active) VALUES
-    (get_constituency_id('134'), '134-08', 'Mapungu', 8000, 4800, true),
-    (get_constituency_id('134'), '134-09', 'Luanginga', 8050, 4830, true),
-    (get_constituency_id('134'), '134-10', 'Liumba', 8100, 4860, true),
-    (get_constituency_id('134'), '134-11', 'Yuka', 8150, 4890, true),
-    (get_constituency_id('134'), '134-12', 'Buleya', 8200, 4920, true),
-    (get_constituency_id('134'), '134-13', 'Lutwi', 8250, 4950, true),
-    (get_constituency_id('135'), '135-01', 'Siluwe', 8300, 4980, true),
-    (get_constituency_id('134'), '134-14', 'Ndoka', 8350, 5010, true),
-    (get_constituency_id('135'), '135-02', 'Likulundundu', 8400, 5040, true),
-    (get_constituency_id('027'), '027-09', 'Leya Mukutu', 8450, 5070, true),
-    (get_constituency_id('134'), '134-15', 'Namulilo', 8500, 5100, true),
-    (get_constituency_id('135'), '135-03', 'Luola', 8550, 5130, true),
-    (get_constituency_id('134'), '134-16', 'Nguma', 8600, 5160, true),
-    (get_constituency_id('134'), '134-17', 'Kandambo', 8650, 5190, true),
-    (get_constituency_id('027'), '027-10', 'David Kaunda', 8700, 5220, true),
-    (get_constituency_id('028'), '028-11', 'Mutundu', 8750, 5250, true),
-    (get_constituency_id('135'), '135-04', 'Salunda', 8800, 5280, true),
-    (get_constituency_id('136'), '136-19', 'Lulangunyi', 8850, 5310, true),
-    (get_constituency_id('135'), '135-05', 'Sishekanu', 8900, 5340, true),
-    (get_constituency_id('136'), '136-20', 'Tuuwa', 8950, 5370, true),
-    (get_constituency_id('135'), '135-06', 'Kuuli', 9000, 5400, true),
-    (get_constituency_id('136'), '136-25', 'Nengu', 9050, 5430, true),
-    (get_constituency_id('135'), '135-07', 'Libonda', 9100, 5460, true),
-    (get_constituency_id('143'), '143-25', 'Imwiko', 9150, 5490, true),
-    (get_constituency_id('136'), '136-18', 'Lueti', 9200, 5520, true),
-    (get_constituency_id('136'), '136-21', 'Maala', 9250, 5550, true),
-    (get_constituency_id('136'), '136-23', 'Licha', 9300, 5580, true),
-    (get_constituency_id('136'), '136-22', 'Liumena', 9350, 5610, true),
-    (get_constituency_id('136'), '136-24', 'Lwambi', 9400, 5640, true),
-    (get_constituency_id('136'), '136-26', 'Mutala', 9450, 5670, true),
-    (get_constituency_id('136'), '136-27', 'Mwenyi', 9500, 5700, true),
-    (get_constituency_id('137'), '137-01', 'Lalafuta', 9550, 5730, true),
-    (get_constituency_id('137'), '137-02', 'Shitwe', 9600, 5760, true),
-    (get_constituency_id('137'), '137-03', 'Namilangi', 9650, 5790, true),
-    (get_constituency_id('137'), '137-04', 'Nkeyama', 9700, 5820, true),
-    (get_constituency_id('137'), '137-05', 'Litoya', 9750, 5850, true),
-    (get_constituency_id('137'), '137-06', 'Mulamatila', 9800, 5880, true),
-    (get_constituency_id('137'), '137-07', 'Longe', 9850, 5910, true),
-    (get_constituency_id('143'), '143-28', 'Kaande', 9900, 5940, true),
-    (get_constituency_id('138'), '138-08', 'Naliele', 9950, 5970, true),
-    (get_constituency_id('138'), '138-09', 'Namando', 10000, 6000, true),
-    (get_constituency_id('138'), '138-10', 'Nyambi', 10050, 6030, true),
-    (get_constituency_id('138'), '138-11', 'Mulwa', 10100, 6060, true),
-    (get_constituency_id('138'), '138-12', 'Lui', 10150, 6090, true),
-    (get_constituency_id('138'), '138-13', 'Nkenga', 10200, 6120, true),
-    (get_constituency_id('138'), '138-14', 'Mbanyutu', 10250, 6150, true),
-    (get_constituency_id('139'), '139-19', 'Kapili', 10300, 6180, true),
-    (get_constituency_id('138'), '138-15', 'Luampa', 10350, 6210, true),
-    (get_constituency_id('140'), '140-05', 'Mwito', 10400, 6240, true),
-    (get_constituency_id('139'), '139-16', 'Namafulo', 10450, 6270, true),
-    (get_constituency_id('139'), '139-17', 'Luambuwa', 10500, 6300, true),
-    (get_constituency_id('139'), '139-18', 'Mushwala', 10550, 6330, true),
-    (get_constituency_id('139'), '139-20', 'Mangango', 10600, 6360, true),
-    (get_constituency_id('140'), '140-11', 'Mwandi', 10650, 6390, true),
-    (get_constituency_id('139'), '139-21', 'Kanabilumbu', 10700, 6420, true),
-    (get_constituency_id('140'), '140-12', 'Namayula', 10750, 6450, true),
-    (get_constituency_id('139'), '139-22', 'Shinkombwe', 10800, 6480, true),
-    (get_constituency_id('140'), '140-01', 'Simakumba', 10850, 6510, true),
-    (get_constituency_id('140'), '140-13', 'Luanchuma', 10900, 6540, true),
-    (get_constituency_id('140'), '140-02', 'Kamilende', 10950, 6570, true),
-    (get_constituency_id('140'), '140-03', 'Dongwe', 11000, 6600, true),
-    (get_constituency_id('143'), '143-15', 'Nyaala', 11050, 6630, true),
-    (get_constituency_id('140'), '140-04', 'Kashamba', 11100, 6660, true),
-    (get_constituency_id('143'), '143-22', 'Chin''onwe', 11150, 6690, true),
-    (get_constituency_id('140'), '140-06', 'Kang''oti', 11200, 6720, true),
-    (get_constituency_id('142'), '142-07', 'Simaa', 11250, 6750, true),
-    (get_constituency_id('140'), '140-07', 'Lukau', 11300, 6780, true),
-    (get_constituency_id('142'), '142-08', 'Ndanda', 11350, 6810, true),
-    (get_constituency_id('028'), '028-15', 'Kamuchanga', 11400, 6840, true),
-    (get_constituency_id('140'), '140-08', 'Likapai', 11450, 6870, true),
-    (get_constituency_id('143'), '143-14', 'Muyondoti', 11500, 6900, true),
-    (get_constituency_id('140'), '140-09', 'Mbanga', 11550, 6930, true),
-    (get_constituency_id('140'), '140-10', 'Kawaya', 11600, 6960, true),
-    (get_constituency_id('143'), '143-16', 'Mataba', 11650, 6990, true),
-    (get_constituency_id('143'), '143-17', 'Lupui', 11700, 7020, true),
-    (get_constituency_id('143'), '143-18', 'Kakwacha', 11750, 7050, true),
-    (get_constituency_id('028'), '028-16', 'Kasempa', 11800, 7080, true),
-    (get_constituency_id('143'), '143-19', 'Lutembwe', 11850, 7110, true),
-    (get_constituency_id('143'), '143-20', 'Mitete', 11900, 7140, true),
-    (get_constituency_id('143'), '143-21', 'Kanshizhi', 11950, 7170, true),
-    (get_constituency_id('143'), '143-16', 'Namushakende', 12000, 7200, true),
-    (get_constituency_id('142'), '142-01', 'Limulunga', 12050, 7230, true),
-    (get_constituency_id('035'), '035-20', 'Toka', 12100, 7260, true),
-    (get_constituency_id('142'), '142-02', 'Mabili', 12150, 7290, true),
-    (get_constituency_id('142'), '142-03', 'Ikwichi', 12200, 7320, true),
-    (get_constituency_id('142'), '142-04', 'Namboma', 12250, 7350, true),
-    (get_constituency_id('143'), '143-18', 'Kama', 12300, 7380, true),
-    (get_constituency_id('142'), '142-05', 'Nangula', 12350, 7410, true),
-    (get_constituency_id('142'), '142-06', 'Ushaa', 12400, 7440, true),
-    (get_constituency_id('143'), '143-22', 'Kambule', 12450, 7470, true),
-    (get_constituency_id('143'), '143-17', 'Yeta', 12500, 7500, true),
-    (get_constituency_id('143'), '143-19', 'Lumbo', 12550, 7530, true),
-    (get_constituency_id('143'), '143-23', 'Lewanika', 12600, 7560, true),
-    (get_constituency_id('143'), '143-24', 'Mulambwa', 12650, 7590, true),
-    (get_constituency_id('143'), '143-20', 'Katongo', 12700, 7620, true),
-    (get_constituency_id('143'), '143-21', 'Kanyonyo', 12750, 7650, true),
-    (get_constituency_id('143'), '143-26', 'Lealui', 12800, 7680, true),
-    (get_constituency_id('143'), '143-27', 'Mabumbu', 12850, 7710, true),
-    (get_constituency_id('144'), '144-09', 'Lui', 12900, 7740, true),
-    (get_constituency_id('017'), '017-05', 'Buntungwa', 12950, 7770, true),
-    (get_constituency_id('144'), '144-10', 'Imalyo', 13000, 7800, true),
-    (get_constituency_id('144'), '144-11', 'Mutondo', 13050, 7830, true),
-    (get_constituency_id('144'), '144-12', 'Namengo', 13100, 7860, true),
-    (get_constituency_id('144'), '144-13', 'Nakanyaa', 13150, 7890, true),
-    (get_constituency_id('146'), '146-11', 'Imatanda', 13200, 7920, true),
-    (get_constituency_id('144'), '144-14', 'Mbekise', 13250, 7950, true),
-    (get_constituency_id('144'), '144-15', 'Nakato', 13300, 7980, true),
-    (get_constituency_id('145'), '145-01', 'Lyamakumbi', 13350, 8010, true),
-    (get_constituency_id('145'), '145-02', 'Silowana', 13400, 8040, true),
-    (get_constituency_id('145'), '145-03', 'Shekela', 13450, 8070, true),
-    (get_constituency_id('145'), '145-04', 'Makoka', 13500, 8100, true),
-    (get_constituency_id('035'), '035-21', 'Kaloko', 13550, 8130, true),
-    (get_constituency_id('145'), '145-05', 'Kambai', 13600, 8160, true),
-    (get_constituency_id('150'), '150-20', 'Imusho', 13650, 8190, true),
-    (get_constituency_id('147'), '147-01', 'Mambolomoka', 13700, 8220, true),
-    (get_constituency_id('145'), '145-06', 'Kataba', 13750, 8250, true),
-    (get_constituency_id('145'), '145-07', 'Muoyo', 13800, 8280, true),
-    (get_constituency_id('145'), '145-08', 'Nanjucha', 13850, 8310, true),
-    (get_constituency_id('146'), '146-09', 'Mwanambuyu', 13900, 8340, true),
-    (get_constituency_id('146'), '146-10', 'Imatongo', 13950, 8370, true),
-    (get_constituency_id('146'), '146-12', 'Wanyau', 14000, 8400, true),
-    (get_constituency_id('146'), '146-13', 'Lipuwe', 14050, 8430, true),
-    (get_constituency_id('146'), '146-14', 'Naluywa', 14100, 8460, true),
-    (get_constituency_id('146'), '146-15', 'Lumbe', 14150, 8490, true),
-    (get_constituency_id('146'), '146-16', 'Sibukali', 14200, 8520, true),
-    (get_constituency_id('148'), '148-02', 'Kamanga', 14250, 8550, true),
-    (get_constituency_id('146'), '146-17', 'Mata', 14300, 8580, true),
-    (get_constituency_id('148'), '148-01', 'Nawinda', 14350, 8610, true),
-    (get_constituency_id('148'), '148-03', 'Lwamuloba', 14400, 8640, true),
-    (get_constituency_id('148'), '148-05', 'Mulobezi', 14450, 8670, true),
-    (get_constituency_id('148'), '148-04', 'Sichili', 14500, 8700, true),
-    (get_constituency_id('148'), '148-06', 'Machile', 14550, 8730, true),
-    (get_constituency_id('149'), '149-09', 'Mabumbu', 14600, 8760, true),
-    (get_constituency_id('149'), '149-07', 'Magumwi', 14650, 8790, true),
-    (get_constituency_id('149'), '149-10', 'Mwandi', 14700, 8820, true),
-    (get_constituency_id('149'), '149-08', 'Sankolonga', 14750, 8850, true),
-    (get_constituency_id('149'), '149-11', 'Simungoma', 14800, 8880, true),
-    (get_constituency_id('149'), '149-12', 'Lwanja', 14850, 8910, true),
-    (get_constituency_id('149'), '149-13', 'Lwazamba', 14900, 8940, true),
-    (get_constituency_id('149'), '149-14', 'Mushukula', 14950, 8970, true),
-    (get_constituency_id('150'), '150-16', 'Mulimambango', 15000, 9000, true),
-    (get_constituency_id('149'), '149-15', 'Maondo', 15050, 9030, true),
-    (get_constituency_id('015'), '015-18', 'Kamina', 15100, 9060, true),
-    (get_constituency_id('150'), '150-17', 'Lusu', 15150, 9090, true),
-    (get_constituency_id('150'), '150-18', 'Luampungu', 15200, 9120, true),
-    (get_constituency_id('016'), '016-11', 'Musenga', 15250, 9150, true),
-    (get_constituency_id('150'), '150-19', 'Kalobolelwa', 15300, 9180, true),
-    (get_constituency_id('147'), '147-02', 'Kayena', 15350, 9210, true),
-    (get_constituency_id('147'), '147-03', 'Nalwashi', 15400, 9240, true),
-    (get_constituency_id('147'), '147-04', 'Kalongola', 15450, 9270, true),
-    (get_constituency_id('147'), '147-05', 'Mbeta', 15500, 9300, true),
-    (get_constituency_id('147'), '147-06', 'Sioma', 15550, 9330, true),
-    (get_constituency_id('147'), '147-08', 'Mutomena', 15600, 9360, true),
-    (get_constituency_id('147'), '147-07', 'Sikabenga', 15650, 9390, true),
-    (get_constituency_id('147'), '147-09', 'Mulamba', 15700, 9420, true),
-    (get_constituency_id('147'), '147-10', 'Kaunga Mashi', 15750, 9450, true),
-    (get_constituency_id('147'), '147-11', 'Beshe', 15800, 9480, true),
-    (get_constituency_id('001'), '001-01', 'Muswishi', 15850, 9510, true),
-    (get_constituency_id('001'), '001-02', 'Mulungushi', 15900, 9540, true),
-    (get_constituency_id('001'), '001-03', 'Chikokomene', 15950, 9570, true),
-    (get_constituency_id('001'), '001-04', 'Chamuka', 16000, 9600, true),
-    (get_constituency_id('001'), '001-06', 'Liteta', 16050, 9630, true),
-    (get_constituency_id('147'), '147-12', 'Sipuma', 16100, 9660, true),
-    (get_constituency_id('002'), '002-12', 'Kabile', 16150, 9690, true),
-    (get_constituency_id('003'), '003-13', 'Chaloshi', 16200, 9720, true),
-    (get_constituency_id('003'), '003-14', 'Kalola', 16250, 9750, true),
-    (get_constituency_id('003'), '003-15', 'Kakoma', 16300, 9780, true),
-    (get_constituency_id('016'), '016-12', 'Kasompe', 16350, 9810, true),
-    (get_constituency_id('147'), '147-13', 'Mulonga', 16400, 9840, true),
-    (get_constituency_id('147'), '147-14', 'Simu', 16450, 9870, true),
-    (get_constituency_id('002'), '002-07', 'Katuba', 16500, 9900, true),
-    (get_constituency_id('004'), '004-06', 'Kawama', 16550, 9930, true),
-    (get_constituency_id('002'), '002-08', 'Chunga', 16600, 9960, true),
-    (get_constituency_id('002'), '002-09', 'Mungule', 16650, 9990, true),
-    (get_constituency_id('004'), '004-01', 'Muwowo', 16700, 10020, true),
-    (get_constituency_id('002'), '002-10', 'Muchenje', 16750, 10050, true),
-    (get_constituency_id('002'), '002-11', 'Chalochabalenge', 16800, 10080, true),
-    (get_constituency_id('003'), '003-16', 'Chikobo', 16850, 10110, true),
-    (get_constituency_id('004'), '004-05', 'Bwacha', 16900, 10140, true),
-    (get_constituency_id('003'), '003-17', 'Chibombo', 16950, 10170, true),
-    (get_constituency_id('016'), '016-15', 'Twatasha', 17000, 10200, true),
-    (get_constituency_id('003'), '003-18', 'Chitanda', 17050, 10230, true),
-    (get_constituency_id('003'), '003-20', 'Keembe', 17100, 10260, true),
-    (get_constituency_id('016'), '016-16', 'Chifwembe', 17150, 10290, true),
-    (get_constituency_id('003'), '003-21', 'Lunjofwa', 17200, 10320, true),
-    (get_constituency_id('003'), '003-22', 'Ipongo', 17250, 10350, true),
-    (get_constituency_id('004'), '004-02', 'Muwowo East', 17300, 10380, true),
-    (get_constituency_id('004'), '004-04', 'Chimanimani', 17350, 10410, true),
-    (get_constituency_id('004'), '004-07', 'Ben Kapufi', 17400, 10440, true),
-    (get_constituency_id('004'), '004-08', 'Makululu', 17450, 10470, true),
-    (get_constituency_id('004'), '004-09', 'Moomba', 17500, 10500, true),
-    (get_constituency_id('005'), '005-24', 'Kalonga', 17550, 10530, true),
-    (get_constituency_id('004'), '004-10', 'Zambezi', 17600, 10560, true),
-    (get_constituency_id('004'), '004-13', 'Munyama', 17650, 10590, true),
-    (get_constituency_id('004'), '004-11', 'Kangomba', 17700, 10620, true),
-    (get_constituency_id('004'), '004-12', 'Chinyanja', 17750, 10650, true),
-    (get_constituency_id('015'), '015-12', 'James Phiri', 17800, 10680, true),
-    (get_constituency_id('004'), '004-14', 'Munga', 17850, 10710, true),
-    (get_constituency_id('015'), '015-16', 'Yeta', 17900, 10740, true),
-    (get_constituency_id('004'), '004-15', 'Chililalila', 17950, 10770, true),
-    (get_constituency_id('004'), '004-23', 'Ngungu', 18000, 10800, true),
-    (get_constituency_id('005'), '005-16', 'Mpima', 18050, 10830, true),
-    (get_constituency_id('005'), '005-17', 'Luansase', 18100, 10860, true),
-    (get_constituency_id('005'), '005-21', 'Justine Kabwe', 18150, 10890, true),
-    (get_constituency_id('005'), '005-18', 'Waya', 18200, 10920, true),
-    (get_constituency_id('015'), '015-17', 'Ngebe', 18250, 10950, true),
-    (get_constituency_id('005'), '005-19', 'Chirwa', 18300, 10980, true),
-    (get_constituency_id('005'), '005-20', 'Njanji', 18350, 11010, true),
-    (get_constituency_id('016'), '016-17', 'Chabanyama', 18400, 11040, true),
-    (get_constituency_id('005'), '005-22', 'David Ramushu', 18450, 11070, true),
-    (get_constituency_id('005'), '005-23', 'Highridge', 18500, 11100, true),
-    (get_constituency_id('005'), '005-25', 'Luangwa', 18550, 11130, true),
-    (get_constituency_id('005'), '005-26', 'Nakoli', 18600, 11160, true),
-    (get_constituency_id('005'), '005-27', 'Kaputula', 18650, 11190, true),
-    (get_constituency_id('006'), '006-01', 'Ngabwe', 18700, 11220, true),
-    (get_constituency_id('006'), '006-02', 'Mukumbwe', 18750, 11250, true),
-    (get_constituency_id('006'), '006-03', 'Luanchele', 18800, 11280, true),
-    (get_constituency_id('007'), '007-04', 'Chibefwe', 18850, 11310, true),
-    (get_constituency_id('007'), '007-05', 'Nkumbi', 18900, 11340, true),
-    (get_constituency_id('006'), '006-04', 'Chipepo', 18950, 11370, true),
-    (get_constituency_id('007'), '007-06', 'Mushibemba', 19000, 11400, true),
-    (get_constituency_id('007'), '007-07', 'Nshinso', 19050, 11430, true),
-    (get_constituency_id('007'), '007-08', 'Matuka', 19100, 11460, true),
-    (get_constituency_id('007'), '007-09', 'Tembwe', 19150, 11490, true),
-    (get_constituency_id('007'), '007-10', 'Munda', 19200, 11520, true),
-    (get_constituency_id('007'), '007-11', 'Chikanda', 19250, 11550, true),
-    (get_constituency_id('008'), '008-12', 'Kalwa', 19300, 11580, true),
-    (get_constituency_id('008'), '008-13', 'Chingombe', 19350, 11610, true),
-    (get_constituency_id('008'), '008-14', 'Nkomashi', 19400, 11640, true),
-    (get_constituency_id('008'), '008-15', 'Kamimbya', 19450, 11670, true),
-    (get_constituency_id('008'), '008-16', 'Chapaba', 19500, 11700, true),
-    (get_constituency_id('006'), '006-05', 'Kapandwe', 19550, 11730, true),
-    (get_constituency_id('006'), '006-06', 'Mpunde', 19600, 11760, true),
-    (get_constituency_id('006'), '006-07', 'Chimbwelo', 19650, 11790, true),
-    (get_constituency_id('006'), '006-08', 'Kapiri Central', 19700, 11820, true),
-    (get_constituency_id('006'), '006-09', 'Kashitu', 19750, 11850, true),
-    (get_constituency_id('006'), '006-10', 'Mushimbili', 19800, 11880, true),
-    (get_constituency_id('006'), '006-11', 'Lunchu', 19850, 11910, true),
-    (get_constituency_id('006'), '006-12', 'Chang''ondo', 19900, 11940, true),
-    (get_constituency_id('006'), '006-13', 'Kakwelesa', 19950, 11970, true),
-    (get_constituency_id('006'), '006-14', 'Kapumba', 20000, 12000, true),
-    (get_constituency_id('007'), '007-01', 'Masofu', 20050, 12030, true),
-    (get_constituency_id('007'), '007-02', 'Upper Lunsefwa', 20100, 12060, true),
-    (get_constituency_id('007'), '007-03', 'Chalata', 20150, 12090, true),
-    (get_constituency_id('008'), '008-17', 'Mwalala', 20200, 12120, true),
-    (get_constituency_id('009'), '009-17', 'Lutondo', 20250, 12150, true),
-    (get_constituency_id('017'), '017-02', 'Kwacha', 20300, 12180, true),
-    (get_constituency_id('009'), '009-18', 'Chabota', 20350, 12210, true),
-    (get_constituency_id('009'), '009-19', 'Kalundu', 20400, 12240, true),
-    (get_constituency_id('009'), '009-20', 'Milandu', 20450, 12270, true),
-    (get_constituency_id('009'), '009-21', 'Makombwe', 20500, 12300, true),
-    (get_constituency_id('009'), '009-22', 'Nampundwe', 20550, 12330, true),
-    (get_constituency_id('010'), '010-01', 'Nalusanga', 20600, 12360, true),
-    (get_constituency_id('010'), '010-02', 'Lutale', 20650, 12390, true),
-    (get_constituency_id('010'), '010-03', 'Kalwanyembe', 20700, 12420, true),
-    (get_constituency_id('013'), '013-11', 'Kabansa', 20750, 12450, true),
-    (get_constituency_id('010'), '010-04', 'Mpusu', 20800, 12480, true),
-    (get_constituency_id('010'), '010-06', 'Mupona', 20850, 12510, true),
-    (get_constituency_id('010'), '010-07', 'Chibolyo', 20900, 12540, true),
-    (get_constituency_id('010'), '010-08', 'Nambala', 20950, 12570, true),
-    (get_constituency_id('010'), '010-09', 'Shimbizhi', 21000, 12600, true),
-    (get_constituency_id('011'), '011-10', 'Nakasaka', 21050, 12630, true),
-    (get_constituency_id('011'), '011-11', 'Nangoma', 21100, 12660, true),
-    (get_constituency_id('015'), '015-03', 'Joseph Mwila', 21150, 12690, true),
-    (get_constituency_id('011'), '011-12', 'Myooye', 21200, 12720, true),
-    (get_constituency_id('011'), '011-13', 'Shichanzu', 21250, 12750, true),
-    (get_constituency_id('011'), '011-14', 'Nalubanda', 21300, 12780, true),
-    (get_constituency_id('011'), '011-15', 'Choma', 21350, 12810, true),
-    (get_constituency_id('011'), '011-16', 'Chisalu', 21400, 12840, true),
-    (get_constituency_id('012'), '012-01', 'Lulimala', 21450, 12870, true),
-    (get_constituency_id('015'), '015-04', 'Anoya Zulu', 21500, 12900, true),
-    (get_constituency_id('012'), '012-02', 'Mpelembe', 21550, 12930, true),
-    (get_constituency_id('012'), '012-03', 'Chipundu', 21600, 12960, true),
-    (get_constituency_id('012'), '012-04', 'Luombwa', 21650, 12990, true),
-    (get_constituency_id('012'), '012-05', 'Chalilo', 21700, 13020, true),
-    (get_constituency_id('012'), '012-06', 'Chitambo', 21750, 13050, true),
-    (get_constituency_id('012'), '012-07', 'Muchinka', 21800, 13080, true),
-    (get_constituency_id('013'), '013-08', 'Mailo', 21850, 13110, true),
-    (get_constituency_id('013'), '013-09', 'Kanona', 21900, 13140, true),
-    (get_constituency_id('013'), '013-10', 'Serenje', 21950, 13170, true),
-    (get_constituency_id('013'), '013-12', 'Chisomo', 22000, 13200, true),
-    (get_constituency_id('013'), '013-13', 'Lukunsanshi', 22050, 13230, true),
-    (get_constituency_id('013'), '013-14', 'Sancha', 22100, 13260, true),
-    (get_constituency_id('015'), '015-08', 'Kakoso', 22150, 13290, true),
-    (get_constituency_id('013'), '013-15', 'Chibale', 22200, 13320, true),
-    (get_constituency_id('013'), '013-16', 'Masaninga', 22250, 13350, true),
-    (get_constituency_id('014'), '014-17', 'Kabamba', 22300, 13380, true),
-    (get_constituency_id('014'), '014-18', 'Ibolelo', 22350, 13410, true),
-    (get_constituency_id('014'), '014-19', 'Muchinga', 22400, 13440, true),
-    (get_constituency_id('014'), '014-20', 'Nganswa', 22450, 13470, true),
-    (get_constituency_id('014'), '014-21', 'Lupiya', 22500, 13500, true),
-    (get_constituency_id('014'), '014-22', 'Musangashi', 22550, 13530, true),
-    (get_constituency_id('015'), '015-01', 'Chilimina', 22600, 13560, true),
-    (get_constituency_id('015'), '015-02', 'Miyanda', 22650, 13590, true),
-    (get_constituency_id('015'), '015-05', 'Kawama', 22700, 13620, true),
-    (get_constituency_id('015'), '015-06', 'Miteta', 22750, 13650, true),
-    (get_constituency_id('015'), '015-07', 'Chitambi', 22800, 13680, true),
-    (get_constituency_id('015'), '015-11', 'Mathew Nkoloma', 22850, 13710, true),
-    (get_constituency_id('015'), '015-09', 'Kafue', 22900, 13740, true),
-    (get_constituency_id('015'), '015-10', 'Mvula', 22950, 13770, true),
-    (get_constituency_id('015'), '015-13', 'Silwizya', 23000, 13800, true),
-    (get_constituency_id('017'), '017-03', 'Sekela', 23050, 13830, true),
-    (get_constituency_id('015'), '015-14', 'Helen Kaunda', 23100, 13860, true),
-    (get_constituency_id('015'), '015-15', 'Chitimukulu', 23150, 13890, true),
-    (get_constituency_id('015'), '015-19', 'Mukuka', 23200, 13920, true),
-    (get_constituency_id('015'), '015-20', 'Yotam Muleya', 23250, 13950, true),
-    (get_constituency_id('015'), '015-21', 'Nakatindi', 23300, 13980, true),
-    (get_constituency_id('015'), '015-22', 'Mumba', 23350, 14010, true),
-    (get_constituency_id('016'), '016-13', 'Mimbula', 23400, 14040, true),
-    (get_constituency_id('016'), '016-14', 'Lulamba', 23450, 14070, true),
-    (get_constituency_id('016'), '016-18', 'Maiteneke', 23500, 14100, true),
-    (get_constituency_id('016'), '016-19', 'Chitimukulu', 23550, 14130, true),
-    (get_constituency_id('016'), '016-20', 'Chikola', 23600, 14160, true),
-    (get_constituency_id('016'), '016-21', 'Chiwempala', 23650, 14190, true),
-    (get_constituency_id('016'), '016-22', 'Kabungo', 23700, 14220, true),
-    (get_constituency_id('016'), '016-23', 'Kalilo', 23750, 14250, true),
-    (get_constituency_id('016'), '016-24', 'Ipafu', 23800, 14280, true),
-    (get_constituency_id('016'), '016-25', 'Muchinshi', 23850, 14310, true),
-    (get_constituency_id('016'), '016-26', 'Mutenda', 23900, 14340, true),
-    (get_constituency_id('016'), '016-27', 'Chingola', 23950, 14370, true),
-    (get_constituency_id('017'), '017-04', 'Nsansa', 24000, 14400, true),
-    (get_constituency_id('017'), '017-01', 'Nchanga', 24050, 14430, true),
-    (get_constituency_id('017'), '017-06', 'Kabundi', 24100, 14460, true),
-    (get_constituency_id('017'), '017-07', 'Kasala', 24150, 14490, true),
-    (get_constituency_id('017'), '017-08', 'Kapisha', 24200, 14520, true),
-    (get_constituency_id('018'), '018-08', 'Kalanga', 24250, 14550, true),
-    (get_constituency_id('017'), '017-09', 'Luano', 24300, 14580, true),
-    (get_constituency_id('018'), '018-09', 'Lubuto', 24350, 14610, true),
-    (get_constituency_id('018'), '018-10', 'Kalungwishi', 24400, 14640, true),
-    (get_constituency_id('017'), '017-10', 'Bupalo', 24450, 14670, true),
-    (get_constituency_id('018'), '018-11', 'Luapula', 24500, 14700, true),
-    (get_constituency_id('018'), '018-01', 'Musakashi', 24550, 14730, true),
-    (get_constituency_id('018'), '018-02', 'Chambishi', 24600, 14760, true),
-    (get_constituency_id('018'), '018-03', 'Twaiteka', 24650, 14790, true),
-    (get_constituency_id('018'), '018-12', 'Ngweshi', 24700, 14820, true),
-    (get_constituency_id('018'), '018-13', 'Kalengwa', 24750, 14850, true),
-    (get_constituency_id('018'), '018-04', 'Lukoshi', 24800, 14880, true),
-    (get_constituency_id('018'), '018-14', 'Chibuluma', 24850, 14910, true),
-    (get_constituency_id('018'), '018-05', 'Lulamba', 24900, 14940, true),
-    (get_constituency_id('018'), '018-06', 'Mwambashi', 24950, 14970, true),
-    (get_constituency_id('018'), '018-07', 'Ichimpe', 25000, 15000, true),
-    (get_constituency_id('019'), '019-05', 'Lubuto', 25050, 15030, true),
-    (get_constituency_id('018'), '018-16', 'Chisupa', 25100, 15060, true),
-    (get_constituency_id('018'), '018-17', 'Buseko', 25150, 15090, true),
-    (get_constituency_id('018'), '018-18', 'Dongwe', 25200, 15120, true),
-    (get_constituency_id('018'), '018-19', 'Kafue', 25250, 15150, true),
-    (get_constituency_id('018'), '018-20', 'Chankalamo', 25300, 15180, true),
-    (get_constituency_id('018'), '018-21', 'Chati', 25350, 15210, true),
-    (get_constituency_id('018'), '018-22', 'Chembe', 25400, 15240, true),
-    (get_constituency_id('019'), '019-01', 'Itimpi', 25450, 15270, true),
-    (get_constituency_id('019'), '019-06', 'Chimwemwe', 25500, 15300, true),
-    (get_constituency_id('019'), '019-02', 'Twatasha', 25550, 15330, true),
-    (get_constituency_id('019'), '019-03', 'Kawama', 25600, 15360, true),
-    (get_constituency_id('019'), '019-04', 'Buntungwa', 25650, 15390, true),
-    (get_constituency_id('020'), '020-13', 'Bupe', 25700, 15420, true),
-    (get_constituency_id('021'), '021-07', 'Kwacha', 25750, 15450, true),
-    (get_constituency_id('020'), '020-14', 'Ndeke', 25800, 15480, true),
-    (get_constituency_id('025'), '025-18', 'Kafue', 25850, 15510, true),
-    (get_constituency_id('020'), '020-15', 'Kafue', 25900, 15540, true),
-    (get_constituency_id('020'), '020-16', 'Kamfinsa', 25950, 15570, true),
-    (get_constituency_id('021'), '021-08', 'Bulangililo', 26000, 15600, true),
-    (get_constituency_id('022'), '022-24', 'Buchi', 26050, 15630, true),
-    (get_constituency_id('021'), '021-09', 'Ipusukilo', 26100, 15660, true),
-    (get_constituency_id('021'), '021-10', 'Chantete', 26150, 15690, true),
-    (get_constituency_id('021'), '021-11', 'Riverside', 26200, 15720, true),
-    (get_constituency_id('021'), '021-12', 'Lubwa', 26250, 15750, true),
-    (get_constituency_id('022'), '022-22', 'Rokana', 26300, 15780, true),
-    (get_constituency_id('022'), '022-23', 'Parklands', 26350, 15810, true),
-    (get_constituency_id('023'), '023-21', 'Wusakile', 26400, 15840, true),
-    (get_constituency_id('022'), '022-25', 'Mukuba', 26450, 15870, true),
-    (get_constituency_id('022'), '022-26', 'Miseshi', 26500, 15900, true),
-    (get_constituency_id('022'), '022-27', 'Mindolo', 26550, 15930, true),
-    (get_constituency_id('022'), '022-28', 'Kamakonde', 26600, 15960, true),
-    (get_constituency_id('023'), '023-17', 'Limaposa', 26650, 15990, true),
-    (get_constituency_id('023'), '023-18', 'Luangwa', 26700, 16020, true),
-    (get_constituency_id('023'), '023-19', 'Chamboli', 26750, 16050, true),
-    (get_constituency_id('023'), '023-20', 'Chibote', 26800, 16080, true),
-    (get_constituency_id('024'), '024-01', 'Misaka', 26850, 16110, true),
-    (get_constituency_id('024'), '024-13', 'Mulungushi', 26900, 16140, true),
-    (get_constituency_id('024'), '024-02', 'Fisenge', 26950, 16170, true),
-    (get_constituency_id('024'), '024-03', 'Twashuka', 27000, 16200, true),
-    (get_constituency_id('024'), '024-04', 'Chitwi', 27050, 16230, true),
-    (get_constituency_id('025'), '025-22', 'Nkulumashimba', 27100, 16260, true),
-    (get_constituency_id('024'), '024-05', 'Kanseshi', 27150, 16290, true),
-    (get_constituency_id('025'), '025-23', 'Baluba', 27200, 16320, true),
-    (get_constituency_id('024'), '024-06', 'Buntungwa', 27250, 16350, true),
-    (get_constituency_id('024'), '024-07', 'Mpelembe', 27300, 16380, true),
-    (get_constituency_id('024'), '024-08', 'Buteko', 27350, 16410, true),
-    (get_constituency_id('025'), '025-24', 'Milyashi', 27400, 16440, true),
-    (get_constituency_id('024'), '024-09', 'James Phiri', 27450, 16470, true),
-    (get_constituency_id('025'), '025-25', 'Ngebe', 27500, 16500, true),
-    (get_constituency_id('024'), '024-10', 'Levi Chiko', 27550, 16530, true),
-    (get_constituency_id('025'), '025-26', 'Kansengu', 27600, 16560, true),
-    (get_constituency_id('024'), '024-11', 'Mikomfwa', 27650, 16590, true),
-    (get_constituency_id('024'), '024-12', 'Zambezi', 27700, 16620, true),
-    (get_constituency_id('024'), '024-14', 'Mipundu', 27750, 16650, true),
-    (get_constituency_id('025'), '025-17', 'Lumumba', 27800, 16680, true),
-    (get_constituency_id('025'), '025-15', 'Kafubu', 27850, 16710, true),
-    (get_constituency_id('025'), '025-16', 'Nkoloma', 27900, 16740, true),
-    (get_constituency_id('025'), '025-19', 'Chilabula', 27950, 16770, true),
-    (get_constituency_id('025'), '025-20', 'Mpatamatu', 28000, 16800, true),
-    (get_constituency_id('025'), '025-21', 'Justine Kabwe', 28050, 16830, true),
-    (get_constituency_id('025'), '025-27', 'Kawama', 28100, 16860, true),
-    (get_constituency_id('025'), '025-28', 'Muva Hill', 28150, 16890, true),
-    (get_constituency_id('030'), '030-01', 'Kasanta', 28200, 16920, true),
-    (get_constituency_id('030'), '030-09', 'Chantete', 28250, 16950, true),
-    (get_constituency_id('030'), '030-03', 'Boso', 28300, 16980, true),
-    (get_constituency_id('030'), '030-04', 'Kansonka', 28350, 17010, true),
-    (get_constituency_id('030'), '030-05', 'Kafubu', 28400, 17040, true),
-    (get_constituency_id('030'), '030-06', 'Chinbanga', 28450, 17070, true),
-    (get_constituency_id('030'), '030-14', 'Lufwanyama', 28500, 17100, true),
-    (get_constituency_id('030'), '030-15', 'Luswishi', 28550, 17130, true),
-    (get_constituency_id('030'), '030-16', 'Mushingashi', 28600, 17160, true),
-    (get_constituency_id('030'), '030-07', 'Sokotwe', 28650, 17190, true),
-    (get_constituency_id('030'), '030-08', 'Mibenge', 28700, 17220, true),
-    (get_constituency_id('030'), '030-10', 'Bulaya', 28750, 17250, true),
-    (get_constituency_id('030'), '030-11', 'Mukumbo', 28800, 17280, true),
-    (get_constituency_id('030'), '030-12', 'Mwelushi', 28850, 17310, true),
-    (get_constituency_id('030'), '030-13', 'Mpindi', 28900, 17340, true),
-    (get_constituency_id('029'), '029-01', 'Mwatishi', 28950, 17370, true),
-    (get_constituency_id('029'), '029-02', 'Majaliwa', 29000, 17400, true),
-    (get_constituency_id('029'), '029-03', 'Chondwe', 29050, 17430, true),
-    (get_constituency_id('026'), '026-22', 'Buntungwa', 29100, 17460, true),
-    (get_constituency_id('026'), '026-23', 'Kangwa Nsuluka', 29150, 17490, true),
-    (get_constituency_id('029'), '029-04', 'Mutaba', 29200, 17520, true),
-    (get_constituency_id('029'), '029-05', 'Miengwe', 29250, 17550, true),
-    (get_constituency_id('029'), '029-06', 'Katonte', 29300, 17580, true),
-    (get_constituency_id('029'), '029-07', 'Ishitwe', 29350, 17610, true),
-    (get_constituency_id('036'), '036-28', 'Kaniki', 29400, 17640, true),
-    (get_constituency_id('031'), '031-08', 'Kashitu', 29450, 17670, true),
-    (get_constituency_id('027'), '027-02', 'Mulundu', 29500, 17700, true),
-    (get_constituency_id('031'), '031-09', 'Luansobe', 29550, 17730, true),
-    (get_constituency_id('027'), '027-06', 'Mulungushi', 29600, 17760, true),
-    (get_constituency_id('031'), '031-10', 'Chinondo', 29650, 17790, true),
-    (get_constituency_id('026'), '026-26', 'Kwacha', 29700, 17820, true),
-    (get_constituency_id('031'), '031-11', 'Mishikishi', 29750, 17850, true),
-    (get_constituency_id('026'), '026-27', 'Fibusa', 29800, 17880, true),
-    (get_constituency_id('031'), '031-12', 'Masangano', 29850, 17910, true),
-    (get_constituency_id('031'), '031-13', 'Lumano', 29900, 17940, true),
-    (get_constituency_id('026'), '026-28', 'Mpelembe', 29950, 17970, true),
-    (get_constituency_id('031'), '031-14', 'Katuba', 30000, 18000, true),
-    (get_constituency_id('031'), '031-15', 'Shimibanga', 30050, 18030, true),
-    (get_constituency_id('031'), '031-16', 'Chilulu', 30100, 18060, true),
-    (get_constituency_id('031'), '031-17', 'Miputu', 30150, 18090, true),
-    (get_constituency_id('032'), '032-01', 'Luswishi', 30200, 18120, true),
-    (get_constituency_id('027'), '027-07', 'Shinde', 30250, 18150, true),
-    (get_constituency_id('032'), '032-02', 'Kasonga', 30300, 18180, true),
-    (get_constituency_id('032'), '032-03', 'Munkumpu', 30350, 18210, true),
-    (get_constituency_id('027'), '027-01', 'Minambe', 30400, 18240, true),
-    (get_constituency_id('032'), '032-04', 'Kashiba', 30450, 18270, true),
-    (get_constituency_id('032'), '032-05', 'Mpongwe', 30500, 18300, true),
-    (get_constituency_id('032'), '032-06', 'Kanyenda', 30550, 18330, true),
-    (get_constituency_id('032'), '032-07', 'Kasamba', 30600, 18360, true),
-    (get_constituency_id('032'), '032-08', 'Ibenga', 30650, 18390, true),
-    (get_constituency_id('032'), '032-09', 'Kalweo', 30700, 18420, true),
-    (get_constituency_id('026'), '026-24', 'Luansobe', 30750, 18450, true),
-    (get_constituency_id('032'), '032-10', 'Mikata', 30800, 18480, true),
-    (get_constituency_id('032'), '032-11', 'Nampamba', 30850, 18510, true),
-    (get_constituency_id('032'), '032-12', 'Musofu', 30900, 18540, true),
-    (get_constituency_id('026'), '026-25', 'Butondo', 30950, 18570, true),
-    (get_constituency_id('027'), '027-08', 'Bwembya Silwizya', 31000, 18600, true),
-    (get_constituency_id('032'), '032-13', 'Impumbu', 31050, 18630, true),
-    (get_constituency_id('026'), '026-21', 'John Kapengele', 31100, 18660, true),
-    (get_constituency_id('027'), '027-03', 'Francis Mukuka', 31150, 18690, true),
-    (get_constituency_id('027'), '027-04', 'Maina Soko', 31200, 18720, true),
-    (get_constituency_id('027'), '027-05', 'Bwafwano', 31250, 18750, true),
-    (get_constituency_id('028'), '028-12', 'Bwananyina', 31300, 18780, true),
-    (get_constituency_id('028'), '028-13', 'David Kaunda', 31350, 18810, true),
-    (get_constituency_id('028'), '028-14', 'Chachacha', 31400, 18840, true),
-    (get_constituency_id('028'), '028-17', 'Kansuswa', 31450, 18870, true),
-    (get_constituency_id('028'), '028-18', 'Kafue', 31500, 18900, true),
-    (get_constituency_id('033'), '033-11', 'Itawa', 31550, 18930, true),
-    (get_constituency_id('028'), '028-19', 'Kawama', 31600, 18960, true),
-    (get_constituency_id('028'), '028-20', 'Hanky Kalanga', 31650, 18990, true),
-    (get_constituency_id('033'), '033-12', 'Munkulungwe', 31700, 19020, true),
-    (get_constituency_id('033'), '033-13', 'Twashuka', 31750, 19050, true),
-    (get_constituency_id('033'), '033-14', 'Kavu', 31800, 19080, true),
-    (get_constituency_id('033'), '033-15', 'Mushili', 31850, 19110, true),
-    (get_constituency_id('034'), '034-01', 'Pamodzi', 31900, 19140, true),
-    (get_constituency_id('034'), '034-02', 'Kawama', 31950, 19170, true),
-    (get_constituency_id('034'), '034-03', 'Fibobe', 32000, 19200, true),
-    (get_constituency_id('034'), '034-04', 'Chifubu', 32050, 19230, true),
-    (get_constituency_id('034'), '034-05', 'Kamba', 32100, 19260, true),
-    (get_constituency_id('035'), '035-17', 'Kantolomba', 32150, 19290, true),
-    (get_constituency_id('035'), '035-16', 'Chichele', 32200, 19320, true),
-    (get_constituency_id('035'), '035-18', 'Lubuto', 32250, 19350, true),
-    (get_constituency_id('035'), '035-19', 'Mukuba', 32300, 19380, true),
-    (get_constituency_id('035'), '035-22', 'Kabushi', 32350, 19410, true),
-    (get_constituency_id('035'), '035-23', 'Kafubu', 32400, 19440, true),
-    (get_constituency_id('035'), '035-24', 'Skyways', 32450, 19470, true),
-    (get_constituency_id('035'), '035-25', 'Masala', 32500, 19500, true),
-    (get_constituency_id('095'), '095-06', 'Kawimbe', 32550, 19530, true),
-    (get_constituency_id('036'), '036-06', 'Kanseshi', 32600, 19560, true),
-    (get_constituency_id('036'), '036-07', 'Nkwazi', 32650, 19590, true),
-    (get_constituency_id('036'), '036-08', 'Yengwe', 32700, 19620, true),
-    (get_constituency_id('038'), '038-17', 'Dzozwe', 32750, 19650, true),
-    (get_constituency_id('038'), '038-18', 'Vubwi', 32800, 19680, true),
-    (get_constituency_id('036'), '036-09', 'Chipulukusu', 32850, 19710, true),
-    (get_constituency_id('039'), '039-05', 'Ndunda', 32900, 19740, true),
-    (get_constituency_id('044'), '044-05', 'Kazimule', 32950, 19770, true),
-    (get_constituency_id('036'), '036-10', 'Kanini', 33000, 19800, true),
-    (get_constituency_id('039'), '039-11', 'Mwalala', 33050, 19830, true),
-    (get_constituency_id('039'), '039-12', 'Muchinga', 33100, 19860, true),
-    (get_constituency_id('046'), '046-15', 'Chimtende', 33150, 19890, true),
-    (get_constituency_id('046'), '046-16', 'Lukweta', 33200, 19920, true),
-    (get_constituency_id('046'), '046-17', 'Mkaika', 33250, 19950, true),
-    (get_constituency_id('046'), '046-18', 'Matunga', 33300, 19980, true),
-    (get_constituency_id('036'), '036-26', 'Twapia', 33350, 20010, true),
-    (get_constituency_id('050'), '050-09', 'Vuu', 33400, 20040, true),
-    (get_constituency_id('036'), '036-27', 'Dag Hammersjoed', 33450, 20070, true),
-    (get_constituency_id('037'), '037-01', 'Mangwe', 33500, 20100, true),
-    (get_constituency_id('037'), '037-02', 'Naviluri', 33550, 20130, true),
-    (get_constituency_id('037'), '037-03', 'Chilenga', 33600, 20160, true),
-    (get_constituency_id('037'), '037-04', 'Chamandala', 33650, 20190, true),
-    (get_constituency_id('037'), '037-05', 'Kampini', 33700, 20220, true),
-    (get_constituency_id('037'), '037-06', 'Ambidzi', 33750, 20250, true),
-    (get_constituency_id('037'), '037-07', 'Taferansoni', 33800, 20280, true),
-    (get_constituency_id('037'), '037-09', 'Kandabwako', 33850, 20310, true),
-    (get_constituency_id('037'), '037-10', 'Chadiza', 33900, 20340, true),
-    (get_constituency_id('071'), '071-15', 'Mankhokwe', 33950, 20370, true),
-    (get_constituency_id('037'), '037-11', 'Nsadzu', 34000, 20400, true),
-    (get_constituency_id('037'), '037-12', 'Manje', 34050, 20430, true),
-    (get_constituency_id('037'), '037-21', 'Chanjowe', 34100, 20460, true),
-    (get_constituency_id('037'), '037-22', 'Kapachi', 34150, 20490, true),
-    (get_constituency_id('038'), '038-08', 'Kabvumo', 34200, 20520, true),
-    (get_constituency_id('038'), '038-13', 'Nkhumba', 34250, 20550, true),
-    (get_constituency_id('038'), '038-14', 'Mwangazi', 34300, 20580, true),
-    (get_constituency_id('038'), '038-15', 'Mbozi', 34350, 20610, true),
-    (get_constituency_id('038'), '038-16', 'Mlawe', 34400, 20640, true),
-    (get_constituency_id('038'), '038-19', 'Chisiya', 34450, 20670, true),
-    (get_constituency_id('038'), '038-20', 'Chimphanje', 34500, 20700, true),
-    (get_constituency_id('040'), '040-13', 'Chipala', 34550, 20730, true),
-    (get_constituency_id('040'), '040-20', 'Vilimukulu', 34600, 20760, true),
-    (get_constituency_id('040'), '040-22', 'Mapamba', 34650, 20790, true),
-    (get_constituency_id('039'), '039-01', 'Mazonde', 34700, 20820, true),
-    (get_constituency_id('039'), '039-02', 'Nkhankha', 34750, 20850, true),
-    (get_constituency_id('039'), '039-03', 'Luangwa', 34800, 20880, true),
-    (get_constituency_id('039'), '039-04', 'Chisunga', 34850, 20910, true),
-    (get_constituency_id('039'), '039-06', 'Mbazi', 34900, 20940, true),
-    (get_constituency_id('039'), '039-07', 'Manthepa', 34950, 20970, true),
-    (get_constituency_id('039'), '039-08', 'Mphalausenga', 35000, 21000, true),
-    (get_constituency_id('039'), '039-09', 'Kalinkhu', 35050, 21030, true),
-    (get_constituency_id('039'), '039-10', 'Kamphemba', 35100, 21060, true),
-    (get_constituency_id('040'), '040-14', 'Bazimu', 35150, 21090, true),
-    (get_constituency_id('040'), '040-15', 'Mabinga', 35200, 21120, true),
-    (get_constituency_id('075'), '075-01', 'Nkoloma', 35250, 21150, true),
-    (get_constituency_id('040'), '040-16', 'Lupamazi', 35300, 21180, true),
-    (get_constituency_id('040'), '040-17', 'Lumezi', 35350, 21210, true),
-    (get_constituency_id('075'), '075-02', 'Chawama', 35400, 21240, true),
-    (get_constituency_id('040'), '040-18', 'Chibungwe', 35450, 21270, true),
-    (get_constituency_id('040'), '040-19', 'Lunzi', 35500, 21300, true),
-    (get_constituency_id('040'), '040-21', 'Chilenje', 35550, 21330, true),
-    (get_constituency_id('075'), '075-03', 'John Howard', 35600, 21360, true),
-    (get_constituency_id('041'), '041-13', 'Sisinje', 35650, 21390, true),
-    (get_constituency_id('041'), '041-14', 'Nthope', 35700, 21420, true),
-    (get_constituency_id('041'), '041-15', 'Chipangali', 35750, 21450, true),
-    (get_constituency_id('041'), '041-16', 'Kasenga', 35800, 21480, true),
-    (get_constituency_id('076'), '076-08', 'Chilenje', 35850, 21510, true),
-    (get_constituency_id('041'), '041-17', 'Rukuzye', 35900, 21540, true),
-    (get_constituency_id('078'), '078-13', 'Silwizya', 35950, 21570, true),
-    (get_constituency_id('041'), '041-18', 'Rukuzye', 36000, 21600, true),
-    (get_constituency_id('079'), '079-20', 'Chaisa', 36050, 21630, true),
-    (get_constituency_id('042'), '042-19', 'Msanga', 36100, 21660, true),
-    (get_constituency_id('042'), '042-20', 'Kanjala', 36150, 21690, true),
-    (get_constituency_id('079'), '079-21', 'Justine Kabwe', 36200, 21720, true),
-    (get_constituency_id('042'), '042-21', 'Dilika', 36250, 21750, true),
-    (get_constituency_id('042'), '042-22', 'Kapata', 36300, 21780, true),
-    (get_constituency_id('043'), '043-06', 'Makungwa', 36350, 21810, true),
-    (get_constituency_id('043'), '043-07', 'Chingazi', 36400, 21840, true),
-    (get_constituency_id('043'), '043-08', 'Kwenje', 36450, 21870, true),
-    (get_constituency_id('043'), '043-09', 'Ng''ongwe', 36500, 21900, true),
-    (get_constituency_id('043'), '043-10', 'Mkowe', 36550, 21930, true),
-    (get_constituency_id('044'), '044-04', 'Chikando', 36600, 21960, true),
-    (get_constituency_id('043'), '043-11', 'Mboza', 36650, 21990, true),
-    (get_constituency_id('043'), '043-12', 'Chiparamba', 36700, 22020, true),
-    (get_constituency_id('044'), '044-01', 'Nsingo', 36750, 22050, true),
-    (get_constituency_id('096'), '096-06', 'Chilumba', 36800, 22080, true),
-    (get_constituency_id('044'), '044-02', 'Khova', 36850, 22110, true),
-    (get_constituency_id('090'), '090-07', 'Mulilansolo', 36900, 22140, true),
-    (get_constituency_id('044'), '044-03', 'Makangila', 36950, 22170, true),
-    (get_constituency_id('103'), '103-01', 'Chambi', 37000, 22200, true),
-    (get_constituency_id('045'), '045-01', 'Kafumbwe', 37050, 22230, true),
-    (get_constituency_id('045'), '045-02', 'Kazala', 37100, 22260, true),
-    (get_constituency_id('045'), '045-03', 'Milanzi', 37150, 22290, true),
-    (get_constituency_id('045'), '045-04', 'Kapoche', 37200, 22320, true),
-    (get_constituency_id('103'), '103-02', 'Sewe', 37250, 22350, true),
-    (get_constituency_id('103'), '103-03', 'Lingelengenda', 37300, 22380, true),
-    (get_constituency_id('045'), '045-05', 'Chindwale', 37350, 22410, true),
-    (get_constituency_id('045'), '045-06', 'Kapangulula', 37400, 22440, true),
-    (get_constituency_id('103'), '103-04', 'Chiyeke', 37450, 22470, true),
-    (get_constituency_id('045'), '045-07', 'Dole', 37500, 22500, true),
-    (get_constituency_id('045'), '045-08', 'Chimwa', 37550, 22530, true),
-    (get_constituency_id('045'), '045-09', 'Mwandafisi', 37600, 22560, true),
-    (get_constituency_id('045'), '045-10', 'Katiula', 37650, 22590, true),
-    (get_constituency_id('046'), '046-12', 'Chavuka', 37700, 22620, true),
-    (get_constituency_id('046'), '046-13', 'Kadula', 37750, 22650, true),
-    (get_constituency_id('046'), '046-14', 'Vulamkoko', 37800, 22680, true),
-    (get_constituency_id('047'), '047-19', 'Kamwaza', 37850, 22710, true),
-    (get_constituency_id('091'), '091-13', 'Kapumaula', 37900, 22740, true),
-    (get_constituency_id('047'), '047-20', 'Nchingilizya', 37950, 22770, true),
-    (get_constituency_id('047'), '047-21', 'Luandazi', 38000, 22800, true),
-    (get_constituency_id('091'), '091-14', 'Chibundu', 38050, 22830, true),
-    (get_constituency_id('103'), '103-05', 'Kalombo Kamisamba', 38100, 22860, true),
-    (get_constituency_id('047'), '047-22', 'Chiwuyu', 38150, 22890, true),
-    (get_constituency_id('047'), '047-23', 'Sinda', 38200, 22920, true),
-    (get_constituency_id('093'), '093-15', 'Katopola', 38250, 22950, true),
-    (get_constituency_id('047'), '047-24', 'Mnyamanzi', 38300, 22980, true),
-    (get_constituency_id('103'), '103-07', 'Chavuma', 38350, 23010, true),
-    (get_constituency_id('047'), '047-25', 'Nyamasonkho', 38400, 23040, true),
-    (get_constituency_id('047'), '047-26', 'Mngo''mba', 38450, 23070, true),
-    (get_constituency_id('047'), '047-27', 'Kasangazi', 38500, 23100, true),
-    (get_constituency_id('047'), '047-28', 'Chitawe', 38550, 23130, true),
-    (get_constituency_id('048'), '048-01', 'Manda Hill', 38600, 23160, true),
-    (get_constituency_id('048'), '048-02', 'Magodi', 38650, 23190, true),
-    (get_constituency_id('133'), '133-02', 'Namazambwe', 38700, 23220, true),
-    (get_constituency_id('048'), '048-03', 'Susa', 38750, 23250, true),
-    (get_constituency_id('048'), '048-04', 'Luwerezi', 38800, 23280, true),
-    (get_constituency_id('048'), '048-05', 'Kajilime', 38850, 23310, true),
-    (get_constituency_id('048'), '048-06', 'Kapirinsanga', 38900, 23340, true),
-    (get_constituency_id('048'), '048-07', 'Nkhanga', 38950, 23370, true),
-    (get_constituency_id('048'), '048-08', 'Membe', 39000, 23400, true),
-    (get_constituency_id('049'), '049-19', 'Chamtowa', 39050, 23430, true),
-    (get_constituency_id('050'), '050-10', 'Chaboli', 39100, 23460, true),
-    (get_constituency_id('049'), '049-20', 'Kachama', 39150, 23490, true),
-    (get_constituency_id('049'), '049-21', 'Wachitangachi', 39200, 23520, true),
-    (get_constituency_id('049'), '049-22', 'Kamimba', 39250, 23550, true),
-    (get_constituency_id('049'), '049-23', 'Kazembe', 39300, 23580, true),
-    (get_constituency_id('049'), '049-24', 'Lumimba', 39350, 23610, true),
-    (get_constituency_id('049'), '049-25', 'Lukusuzi', 39400, 23640, true),
-    (get_constituency_id('049'), '049-26', 'Diwa', 39450, 23670, true),
-    (get_constituency_id('049'), '049-27', 'Chibande', 39500, 23700, true),
-    (get_constituency_id('050'), '050-11', 'Mnyamazi', 39550, 23730, true),
-    (get_constituency_id('050'), '050-12', 'Ndonda', 39600, 23760, true),
-    (get_constituency_id('050'), '050-13', 'Msuzi', 39650, 23790, true),
-    (get_constituency_id('053'), '053-06', 'Lusinde', 39700, 23820, true),
-    (get_constituency_id('053'), '053-08', 'Manyane', 39750, 23850, true),
-    (get_constituency_id('050'), '050-14', 'Mkomba', 39800, 23880, true),
-    (get_constituency_id('065'), '065-08', 'Chipamba', 39850, 23910, true),
-    (get_constituency_id('050'), '050-15', 'Chilola', 39900, 23940, true),
-    (get_constituency_id('065'), '065-10', 'Chitutu', 39950, 23970, true),
-    (get_constituency_id('065'), '065-11', 'Munwa', 40000, 24000, true),
-    (get_constituency_id('050'), '050-16', 'Chimaliro', 40050, 24030, true),
-    (get_constituency_id('050'), '050-17', 'Nthintimila', 40100, 24060, true),
-    (get_constituency_id('050'), '050-18', 'Lunevwa', 40150, 24090, true),
-    (get_constituency_id('052'), '052-01', 'Chinsimbwe', 40200, 24120, true),
-    (get_constituency_id('052'), '052-02', 'Katipa', 40250, 24150, true),
-    (get_constituency_id('052'), '052-03', 'Vizimumba', 40300, 24180, true),
-    (get_constituency_id('052'), '052-04', 'Ngozi', 40350, 24210, true),
-    (get_constituency_id('052'), '052-05', 'Lwezi', 40400, 24240, true),
-    (get_constituency_id('052'), '052-06', 'Mtilizi', 40450, 24270, true),
-    (get_constituency_id('057'), '057-18', 'Mwansabombwe', 40500, 24300, true),
-    (get_constituency_id('052'), '052-07', 'Nyimba', 40550, 24330, true),
-    (get_constituency_id('052'), '052-08', 'Kaliwe', 40600, 24360, true),
-    (get_constituency_id('052'), '052-09', 'Chiweza', 40650, 24390, true),
-    (get_constituency_id('052'), '052-10', 'Mombe', 40700, 24420, true),
-    (get_constituency_id('052'), '052-11', 'Chamilala', 40750, 24450, true),
-    (get_constituency_id('052'), '052-12', 'Chinambi', 40800, 24480, true),
-    (get_constituency_id('052'), '052-13', 'Luangwa', 40850, 24510, true),
-    (get_constituency_id('057'), '057-19', 'Kakose', 40900, 24540, true),
-    (get_constituency_id('053'), '053-01', 'Kapoche', 40950, 24570, true),
-    (get_constituency_id('059'), '059-07', 'Mulenshi', 41000, 24600, true),
-    (get_constituency_id('060'), '060-16', 'lukola', 41050, 24630, true),
-    (get_constituency_id('053'), '053-02', 'Chingombe', 41100, 24660, true),
-    (get_constituency_id('061'), '061-08', 'Chilyapa', 41150, 24690, true),
-    (get_constituency_id('053'), '053-03', 'Mwangaila', 41200, 24720, true),
-    (get_constituency_id('063'), '063-07', 'Mpasa', 41250, 24750, true),
-    (get_constituency_id('063'), '063-08', 'Chibembe', 41300, 24780, true),
-    (get_constituency_id('063'), '063-10', 'Lundashi', 41350, 24810, true),
-    (get_constituency_id('063'), '063-11', 'Mambilima', 41400, 24840, true),
-    (get_constituency_id('063'), '063-12', 'Munwa', 41450, 24870, true),
-    (get_constituency_id('063'), '063-13', 'Nsomfi', 41500, 24900, true),
-    (get_constituency_id('064'), '064-14', 'Kalanga', 41550, 24930, true),
-    (get_constituency_id('053'), '053-04', 'Matambazi', 41600, 24960, true),
-    (get_constituency_id('064'), '064-16', 'Katiti', 41650, 24990, true),
-    (get_constituency_id('064'), '064-17', 'Chachacha', 41700, 25020, true),
-    (get_constituency_id('053'), '053-05', 'Kaumbwe', 41750, 25050, true),
-    (get_constituency_id('054'), '054-07', 'Manjazi', 41800, 25080, true),
-    (get_constituency_id('066'), '066-04', 'Kilwa', 41850, 25110, true),
-    (get_constituency_id('054'), '054-09', 'Msumbazi', 41900, 25140, true),
-    (get_constituency_id('066'), '066-06', 'Nchelenge', 41950, 25170, true),
-    (get_constituency_id('066'), '066-08', 'Chisenga', 42000, 25200, true),
-    (get_constituency_id('066'), '066-09', 'Kasamba', 42050, 25230, true),
-    (get_constituency_id('066'), '066-10', 'Mulwe', 42100, 25260, true),
-    (get_constituency_id('054'), '054-10', 'Ongolwe', 42150, 25290, true),
-    (get_constituency_id('054'), '054-11', 'Kovyane', 42200, 25320, true),
-    (get_constituency_id('054'), '054-12', 'Mbala', 42250, 25350, true),
-    (get_constituency_id('068'), '068-02', 'Kasansa', 42300, 25380, true),
-    (get_constituency_id('054'), '054-13', 'Nsimbo', 42350, 25410, true),
-    (get_constituency_id('054'), '054-15', 'Nyika', 42400, 25440, true),
-    (get_constituency_id('133'), '133-03', 'Mweenda', 42450, 25470, true),
-    (get_constituency_id('054'), '054-16', 'Chalimanyana', 42500, 25500, true),
-    (get_constituency_id('082'), '082-09', 'Mofu', 42550, 25530, true),
-    (get_constituency_id('055'), '055-14', 'Nyakawise', 42600, 25560, true),
-    (get_constituency_id('055'), '055-17', 'Singozi', 42650, 25590, true),
-    (get_constituency_id('055'), '055-18', 'Mateyo Mzeka', 42700, 25620, true),
-    (get_constituency_id('055'), '055-19', 'Mawanda', 42750, 25650, true),
-    (get_constituency_id('055'), '055-20', 'Lusangazi', 42800, 25680, true),
-    (get_constituency_id('055'), '055-21', 'Ukwimi', 42850, 25710, true),
-    (get_constituency_id('055'), '055-22', 'Chisangu', 42900, 25740, true),
-    (get_constituency_id('065'), '065-01', 'Lunchinda', 42950, 25770, true),
-    (get_constituency_id('065'), '065-02', 'Chipungu', 43000, 25800, true),
-    (get_constituency_id('065'), '065-03', 'Luau', 43050, 25830, true),
-    (get_constituency_id('065'), '065-04', 'Lambwe Chomba', 43100, 25860, true),
-    (get_constituency_id('065'), '065-05', 'Chiengi', 43150, 25890, true),
-    (get_constituency_id('065'), '065-06', 'Katete', 43200, 25920, true),
-    (get_constituency_id('065'), '065-07', 'Ifuna', 43250, 25950, true),
-    (get_constituency_id('065'), '065-09', 'Kalobwa', 43300, 25980, true),
-    (get_constituency_id('065'), '065-12', 'Kulungwishi', 43350, 26010, true),
-    (get_constituency_id('065'), '065-13', 'Munungu', 43400, 26040, true),
-    (get_constituency_id('066'), '066-07', 'Chilongo', 43450, 26070, true),
-    (get_constituency_id('056'), '056-01', 'Chisenga', 43500, 26100, true),
-    (get_constituency_id('056'), '056-02', 'Kabanse', 43550, 26130, true),
-    (get_constituency_id('056'), '056-03', 'Luela', 43600, 26160, true),
-    (get_constituency_id('056'), '056-04', 'Nthumbachushi', 43650, 26190, true),
-    (get_constituency_id('056'), '056-05', 'Kawambwa', 43700, 26220, true),
-    (get_constituency_id('056'), '056-06', 'Ngo''ona', 43750, 26250, true),
-    (get_constituency_id('056'), '056-07', 'Fisaka', 43800, 26280, true),
-    (get_constituency_id('056'), '056-13', 'Pambashe', 43850, 26310, true),
-    (get_constituency_id('056'), '056-14', 'Iyanga', 43900, 26340, true),
-    (get_constituency_id('057'), '057-15', 'Mununshi', 43950, 26370, true),
-    (get_constituency_id('057'), '057-16', 'Mulele', 44000, 26400, true),
-    (get_constituency_id('057'), '057-17', 'Lufubu', 44050, 26430, true),
-    (get_constituency_id('057'), '057-20', 'Chipita', 44100, 26460, true),
-    (get_constituency_id('057'), '057-21', 'Kayo', 44150, 26490, true),
-    (get_constituency_id('057'), '057-22', 'Mbereshi', 44200, 26520, true),
-    (get_constituency_id('058'), '058-08', 'Ilombe', 44250, 26550, true),
-    (get_constituency_id('058'), '058-10', 'Chibote', 44300, 26580, true),
-    (get_constituency_id('058'), '058-11', 'Chipili', 44350, 26610, true),
-    (get_constituency_id('058'), '058-12', 'Luongo', 44400, 26640, true),
-    (get_constituency_id('059'), '059-01', 'Mutuna', 44450, 26670, true),
-    (get_constituency_id('059'), '059-02', 'Misakalala', 44500, 26700, true),
-    (get_constituency_id('059'), '059-03', 'Kaole', 44550, 26730, true),
-    (get_constituency_id('059'), '059-04', 'Mushipashi', 44600, 26760, true),
-    (get_constituency_id('059'), '059-05', 'Chibeleka', 44650, 26790, true),
-    (get_constituency_id('059'), '059-06', 'Lukangaba', 44700, 26820, true),
-    (get_constituency_id('061'), '061-09', 'Muchinka', 44750, 26850, true),
-    (get_constituency_id('061'), '061-10', 'Mansa', 44800, 26880, true),
-    (get_constituency_id('061'), '061-11', 'Chansunsu', 44850, 26910, true),
-    (get_constituency_id('068'), '068-06', 'Kafumbo', 44900, 26940, true),
-    (get_constituency_id('061'), '061-12', 'Muyulu', 44950, 26970, true),
-    (get_constituency_id('061'), '061-13', 'Katanshi', 45000, 27000, true),
-    (get_constituency_id('061'), '061-14', 'Lwingashi', 45050, 27030, true),
-    (get_constituency_id('061'), '061-15', 'Luapula', 45100, 27060, true),
-    (get_constituency_id('060'), '060-01', 'Chiswishi', 45150, 27090, true),
-    (get_constituency_id('060'), '060-02', 'Mulumbi', 45200, 27120, true),
-    (get_constituency_id('060'), '060-03', 'Itembo', 45250, 27150, true),
-    (get_constituency_id('060'), '060-04', 'Lusumbwe', 45300, 27180, true),
-    (get_constituency_id('060'), '060-05', 'Milambo', 45350, 27210, true),
-    (get_constituency_id('060'), '060-06', 'Nsaka', 45400, 27240, true),
-    (get_constituency_id('060'), '060-07', 'Fibalala', 45450, 27270, true),
-    (get_constituency_id('060'), '060-08', 'Nsunga', 45500, 27300, true),
-    (get_constituency_id('060'), '060-09', 'Chipundu', 45550, 27330, true),
-    (get_constituency_id('060'), '060-10', 'Sokontwe', 45600, 27360, true),
-    (get_constituency_id('068'), '068-07', 'Chinkutila', 45650, 27390, true),
-    (get_constituency_id('060'), '060-11', 'Mumbotuta', 45700, 27420, true),
-    (get_constituency_id('060'), '060-12', 'Kapalala', 45750, 27450, true),
-    (get_constituency_id('060'), '060-13', 'Mikula', 45800, 27480, true),
-    (get_constituency_id('062'), '062-01', 'Nsenga', 45850, 27510, true),
-    (get_constituency_id('062'), '062-02', 'Mweshi', 45900, 27540, true),
-    (get_constituency_id('062'), '062-03', 'Mumbwe', 45950, 27570, true),
-    (get_constituency_id('062'), '062-04', 'Chibalashi', 46000, 27600, true),
-    (get_constituency_id('062'), '062-05', 'Nalumpembe', 46050, 27630, true),
-    (get_constituency_id('062'), '062-06', 'Nkonge', 46100, 27660, true),
-    (get_constituency_id('064'), '064-15', 'Kasengu', 46150, 27690, true),
-    (get_constituency_id('064'), '064-18', 'Kapela', 46200, 27720, true),
-    (get_constituency_id('064'), '064-19', 'Pabekabesa', 46250, 27750, true),
-    (get_constituency_id('064'), '064-20', 'Luche', 46300, 27780, true),
-    (get_constituency_id('064'), '064-21', 'Nkanga', 46350, 27810, true),
-    (get_constituency_id('064'), '064-22', 'Kaombe', 46400, 27840, true),
-    (get_constituency_id('068'), '068-08', 'Chishi', 46450, 27870, true),
-    (get_constituency_id('066'), '066-01', 'Kabuta', 46500, 27900, true),
-    (get_constituency_id('066'), '066-02', 'Mwatishi', 46550, 27930, true),
-    (get_constituency_id('066'), '066-03', 'Munkombwe', 46600, 27960, true),
-    (get_constituency_id('066'), '066-11', 'Shabo', 46650, 27990, true),
-    (get_constituency_id('066'), '066-12', 'Mofwe', 46700, 28020, true),
-    (get_constituency_id('066'), '066-13', 'Katofwo', 46750, 28050, true),
-    (get_constituency_id('067'), '067-11', 'Chimana', 46800, 28080, true),
-    (get_constituency_id('067'), '067-12', 'Mano', 46850, 28110, true),
-    (get_constituency_id('095'), '095-07', 'Mwamba', 46900, 28140, true),
-    (get_constituency_id('067'), '067-13', 'Katanshya', 46950, 28170, true),
-    (get_constituency_id('067'), '067-16', 'Isamba', 47000, 28200, true),
-    (get_constituency_id('067'), '067-17', 'Kapata', 47050, 28230, true),
-    (get_constituency_id('068'), '068-09', 'Chifunabuli', 47100, 28260, true),
-    (get_constituency_id('067'), '067-20', 'Musaba', 47150, 28290, true),
-    (get_constituency_id('067'), '067-21', 'Kapilibila', 47200, 28320, true),
-    (get_constituency_id('067'), '067-22', 'Lumamya', 47250, 28350, true),
-    (get_constituency_id('068'), '068-01', 'Masonde', 47300, 28380, true),
-    (get_constituency_id('068'), '068-03', 'Kasaba', 47350, 28410, true),
-    (get_constituency_id('068'), '068-04', 'Kapamba', 47400, 28440, true),
-    (get_constituency_id('068'), '068-10', 'Mbabala', 47450, 28470, true),
-    (get_constituency_id('068'), '068-05', 'Kasongole', 47500, 28500, true),
-    (get_constituency_id('069'), '069-14', 'Nkutila', 47550, 28530, true),
-    (get_constituency_id('069'), '069-15', 'Lunga', 47600, 28560, true),
-    (get_constituency_id('069'), '069-19', 'Nsalushi', 47650, 28590, true),
-    (get_constituency_id('069'), '069-18', 'Ncheta', 47700, 28620, true),
-    (get_constituency_id('074'), '074-17', 'Shikabeta', 47750, 28650, true),
-    (get_constituency_id('070'), '070-01', 'Chiyaba', 47800, 28680, true),
-    (get_constituency_id('073'), '073-01', 'Kapwayambale', 47850, 28710, true),
-    (get_constituency_id('071'), '071-09', 'Lunya', 47900, 28740, true),
-    (get_constituency_id('073'), '073-02', 'Chinkuli', 47950, 28770, true),
-    (get_constituency_id('071'), '071-12', 'Mburuma', 48000, 28800, true),
-    (get_constituency_id('073'), '073-03', 'Ntandabale', 48050, 28830, true),
-    (get_constituency_id('073'), '073-04', 'Chongwe', 48100, 28860, true),
-    (get_constituency_id('073'), '073-05', 'Kanakantapa', 48150, 28890, true),
-    (get_constituency_id('073'), '073-06', 'Chalimbana', 48200, 28920, true),
-    (get_constituency_id('073'), '073-07', 'Nakatindi', 48250, 28950, true),
-    (get_constituency_id('073'), '073-08', 'Lukoshi', 48300, 28980, true),
-    (get_constituency_id('073'), '073-09', 'Manyika', 48350, 29010, true),
-    (get_constituency_id('073'), '073-10', 'Lwimba', 48400, 29040, true),
-    (get_constituency_id('071'), '071-13', 'Mwalilia', 48450, 29070, true),
-    (get_constituency_id('074'), '074-11', 'Mwachilele', 48500, 29100, true),
-    (get_constituency_id('074'), '074-12', 'Nyangwena', 48550, 29130, true),
-    (get_constituency_id('074'), '074-13', 'Bunda Bunda', 48600, 29160, true),
-    (get_constituency_id('074'), '074-14', 'Nyamanongo', 48650, 29190, true),
-    (get_constituency_id('074'), '074-15', 'Rufunsa', 48700, 29220, true),
-    (get_constituency_id('074'), '074-16', 'Mankanda', 48750, 29250, true),
-    (get_constituency_id('070'), '070-02', 'Kambale', 48800, 29280, true),
-    (get_constituency_id('070'), '070-03', 'Malundu', 48850, 29310, true),
-    (get_constituency_id('070'), '070-04', 'Chisankane', 48900, 29340, true),
-    (get_constituency_id('070'), '070-05', 'Lukolongo', 48950, 29370, true),
-    (get_constituency_id('070'), '070-06', 'Kafue', 49000, 29400, true),
-    (get_constituency_id('070'), '070-07', 'Matanda', 49050, 29430, true),
-    (get_constituency_id('070'), '070-08', 'Shabusale', 49100, 29460, true),
-    (get_constituency_id('070'), '070-09', 'Kasenje', 49150, 29490, true),
-    (get_constituency_id('128'), '128-15', 'Katimba', 49200, 29520, true),
-    (get_constituency_id('070'), '070-10', 'Muungu', 49250, 29550, true),
-    (get_constituency_id('070'), '070-11', 'Chikupi', 49300, 29580, true),
-    (get_constituency_id('072'), '072-12', 'Chilanga', 49350, 29610, true),
-    (get_constituency_id('072'), '072-13', 'Chilongolo', 49400, 29640, true),
-    (get_constituency_id('072'), '072-14', 'Namalombwe', 49450, 29670, true),
-    (get_constituency_id('072'), '072-15', 'Nyemba', 49500, 29700, true),
-    (get_constituency_id('072'), '072-16', 'Nakachenje', 49550, 29730, true),
-    (get_constituency_id('072'), '072-17', 'Chinyanja', 49600, 29760, true),
-    (get_constituency_id('071'), '071-01', 'Dzalo', 49650, 29790, true),
-    (get_constituency_id('071'), '071-02', 'Mkaliva', 49700, 29820, true),
-    (get_constituency_id('071'), '071-14', 'Kaunga', 49750, 29850, true),
-    (get_constituency_id('071'), '071-04', 'Phwazi', 49800, 29880, true),
-    (get_constituency_id('071'), '071-05', 'Mphuka', 49850, 29910, true),
-    (get_constituency_id('071'), '071-06', 'Kabowo', 49900, 29940, true),
-    (get_constituency_id('071'), '071-07', 'Kapoche', 49950, 29970, true),
-    (get_constituency_id('071'), '071-08', 'Chiriwe', 50000, 30000, true),
-    (get_constituency_id('071'), '071-10', 'Katondwe', 50050, 30030, true),
-    (get_constituency_id('071'), '071-11', 'Chikoma', 50100, 30060, true),
-    (get_constituency_id('075'), '075-04', 'Lilayi', 50150, 30090, true),
-    (get_constituency_id('095'), '095-02', 'Moto Moto', 50200, 30120, true),
-    (get_constituency_id('076'), '076-05', 'Kamwala', 50250, 30150, true),
-    (get_constituency_id('076'), '076-06', 'Kabwata', 50300, 30180, true),
-    (get_constituency_id('076'), '076-09', 'Kamulanga', 50350, 30210, true),
-    (get_constituency_id('080'), '080-24', 'Muchinga', 50400, 30240, true),
-    (get_constituency_id('077'), '077-10', 'Kanyama', 50450, 30270, true),
-    (get_constituency_id('080'), '080-25', 'Kapwepwe', 50500, 30300, true),
-    (get_constituency_id('077'), '077-11', 'Harry Mwaanga Nkumbula', 50550, 30330, true),
-    (get_constituency_id('077'), '077-12', 'Munkolo', 50600, 30360, true),
-    (get_constituency_id('078'), '078-14', 'Independence', 50650, 30390, true),
-    (get_constituency_id('080'), '080-26', 'Lima', 50700, 30420, true),
-    (get_constituency_id('078'), '078-15', 'Lubwa', 50750, 30450, true),
-    (get_constituency_id('078'), '078-16', 'Kabulonga', 50800, 30480, true),
-    (get_constituency_id('079'), '079-17', 'Roma', 50850, 30510, true),
-    (get_constituency_id('079'), '079-18', 'Mulungushi', 50900, 30540, true),
-    (get_constituency_id('079'), '079-19', 'Ngwerere', 50950, 30570, true),
-    (get_constituency_id('079'), '079-22', 'Raphael Chota', 51000, 30600, true),
-    (get_constituency_id('132'), '132-04', 'Ngombe Ilende', 51050, 30630, true),
-    (get_constituency_id('079'), '079-23', 'Mpulungu', 51100, 30660, true),
-    (get_constituency_id('081'), '081-31', 'Kalingalinga', 51150, 30690, true),
-    (get_constituency_id('080'), '080-27', 'Mwembeshi', 51200, 30720, true),
-    (get_constituency_id('080'), '080-28', 'Matero', 51250, 30750, true),
-    (get_constituency_id('081'), '081-32', 'Chakunkula', 51300, 30780, true),
-    (get_constituency_id('081'), '081-29', 'Chainda', 51350, 30810, true),
-    (get_constituency_id('081'), '081-33', 'Munali', 51400, 30840, true),
-    (get_constituency_id('084'), '084-13', 'Muchinga', 51450, 30870, true),
-    (get_constituency_id('081'), '081-30', 'Mtendere', 51500, 30900, true),
-    (get_constituency_id('086'), '086-01', 'Kasoka', 51550, 30930, true),
-    (get_constituency_id('086'), '086-02', 'Kantenshya', 51600, 30960, true),
-    (get_constituency_id('086'), '086-03', 'Sasamwenje', 51650, 30990, true),
-    (get_constituency_id('099'), '099-20', 'Muchinga', 51700, 31020, true),
-    (get_constituency_id('083'), '083-01', 'Itapa', 51750, 31050, true),
-    (get_constituency_id('083'), '083-02', 'Chilunda', 51800, 31080, true),
-    (get_constituency_id('083'), '083-03', 'Chilinda', 51850, 31110, true),
-    (get_constituency_id('083'), '083-04', 'Kaunga', 51900, 31140, true),
-    (get_constituency_id('083'), '083-05', 'Malalo', 51950, 31170, true),
-    (get_constituency_id('083'), '083-06', 'Chipanga', 52000, 31200, true),
-    (get_constituency_id('085'), '085-13', 'Thendere', 52050, 31230, true),
-    (get_constituency_id('083'), '083-07', 'Chambeshi', 52100, 31260, true),
-    (get_constituency_id('083'), '083-08', 'Lubwa', 52150, 31290, true),
-    (get_constituency_id('087'), '087-12', 'Mpanda', 52200, 31320, true),
-    (get_constituency_id('087'), '087-13', 'Mukulika', 52250, 31350, true),
-    (get_constituency_id('083'), '083-09', 'Ichinga', 52300, 31380, true),
-    (get_constituency_id('083'), '083-10', 'Nkakula', 52350, 31410, true),
-    (get_constituency_id('083'), '083-11', 'Munwaku', 52400, 31440, true),
-    (get_constituency_id('083'), '083-21', 'Chimpundu', 52450, 31470, true),
-    (get_constituency_id('083'), '083-22', 'Nkulungwe', 52500, 31500, true),
-    (get_constituency_id('084'), '084-12', 'Chamusenga', 52550, 31530, true),
-    (get_constituency_id('084'), '084-14', 'Chandaula', 52600, 31560, true),
-    (get_constituency_id('084'), '084-15', 'Mukumbi', 52650, 31590, true),
-    (get_constituency_id('084'), '084-16', 'Mwila Kabuswe', 52700, 31620, true),
-    (get_constituency_id('084'), '084-17', 'Chibinda', 52750, 31650, true),
-    (get_constituency_id('084'), '084-18', 'Mayembe', 52800, 31680, true),
-    (get_constituency_id('084'), '084-19', 'Mwiche', 52850, 31710, true),
-    (get_constituency_id('084'), '084-20', 'Ichingo', 52900, 31740, true),
-    (get_constituency_id('098'), '098-01', 'Chambeshi', 52950, 31770, true),
-    (get_constituency_id('086'), '086-04', 'Kapililonga', 53000, 31800, true),
-    (get_constituency_id('086'), '086-05', 'Itukuta', 53050, 31830, true),
-    (get_constituency_id('086'), '086-06', 'Milongo', 53100, 31860, true),
-    (get_constituency_id('086'), '086-07', 'Nkombwa', 53150, 31890, true),
-    (get_constituency_id('086'), '086-08', 'Luangwa', 53200, 31920, true),
-    (get_constituency_id('086'), '086-09', 'Mpungu', 53250, 31950, true),
-    (get_constituency_id('085'), '085-11', 'Ntonga', 53300, 31980, true),
-    (get_constituency_id('085'), '085-12', 'Mukutu', 53350, 32010, true),
-    (get_constituency_id('085'), '085-14', 'Bemba', 53400, 32040, true),
-    (get_constituency_id('085'), '085-15', 'Kakoma', 53450, 32070, true),
-    (get_constituency_id('085'), '085-16', 'Luhoka', 53500, 32100, true),
-    (get_constituency_id('085'), '085-17', 'Kalanga', 53550, 32130, true),
-    (get_constituency_id('086'), '086-10', 'Mafinga', 53600, 32160, true),
-    (get_constituency_id('050'), '050-01', 'Nsefu', 53650, 32190, true),
-    (get_constituency_id('050'), '050-02', 'Jumbe', 53700, 32220, true),
-    (get_constituency_id('050'), '050-03', 'Chipapa', 53750, 32250, true),
-    (get_constituency_id('050'), '050-04', 'Mphomwa', 53800, 32280, true),
-    (get_constituency_id('050'), '050-05', 'Chikowa', 53850, 32310, true),
-    (get_constituency_id('050'), '050-06', 'Mnkhanya', 53900, 32340, true),
-    (get_constituency_id('050'), '050-07', 'Kakumbi', 53950, 32370, true),
-    (get_constituency_id('050'), '050-08', 'Ncheka', 54000, 32400, true),
-    (get_constituency_id('050'), '050-09', 'Malama', 54050, 32430, true),
-    (get_constituency_id('050'), '050-10', 'Ndima', 54100, 32460, true),
-    (get_constituency_id('050'), '050-11', 'Msoro', 54150, 32490, true),
-    (get_constituency_id('050'), '050-12', 'Kasamanda', 54200, 32520, true),
-    (get_constituency_id('050'), '050-13', 'Nyakatokoli', 54250, 32550, true),
-    (get_constituency_id('098'), '098-02', 'Mansha', 54300, 32580, true),
-    (get_constituency_id('098'), '098-03', 'Mumbubu', 54350, 32610, true),
-    (get_constituency_id('098'), '098-04', 'Lubaleshi', 54400, 32640, true),
-    (get_constituency_id('098'), '098-05', 'Lulingila', 54450, 32670, true),
-    (get_constituency_id('098'), '098-06', 'Munikashi', 54500, 32700, true),
-    (get_constituency_id('098'), '098-07', 'Chinama', 54550, 32730, true),
-    (get_constituency_id('098'), '098-08', 'Lukulu', 54600, 32760, true),
-    (get_constituency_id('098'), '098-09', 'Lulimala', 54650, 32790, true),
-    (get_constituency_id('098'), '098-10', 'Chimbwa', 54700, 32820, true),
-    (get_constituency_id('099'), '099-19', 'Chifungwe', 54750, 32850, true),
-    (get_constituency_id('099'), '099-21', 'Chikanda', 54800, 32880, true),
-    (get_constituency_id('099'), '099-22', 'Munpamazi', 54850, 32910, true),
-    (get_constituency_id('100'), '100-11', 'Mukungwa', 54900, 32940, true),
-    (get_constituency_id('100'), '100-12', 'Lwitikila', 54950, 32970, true),
-    (get_constituency_id('100'), '100-13', 'Musakanya', 55000, 33000, true),
-    (get_constituency_id('100'), '100-14', 'Lubambala', 55050, 33030, true),
-    (get_constituency_id('100'), '100-15', 'Chishibe Isonde', 55100, 33060, true),
-    (get_constituency_id('100'), '100-16', 'Nachikufu', 55150, 33090, true),
-    (get_constituency_id('100'), '100-17', 'Mutekwe', 55200, 33120, true),
-    (get_constituency_id('100'), '100-18', 'Chipembele', 55250, 33150, true),
-    (get_constituency_id('087'), '087-01', 'Mulalo', 55300, 33180, true),
-    (get_constituency_id('102'), '102-05', 'Mikomba', 55350, 33210, true),
-    (get_constituency_id('087'), '087-02', 'Luchinde', 55400, 33240, true),
-    (get_constituency_id('087'), '087-03', 'Ngumba', 55450, 33270, true),
-    (get_constituency_id('087'), '087-04', 'Musyani', 55500, 33300, true),
-    (get_constituency_id('087'), '087-05', 'Popomozi', 55550, 33330, true),
-    (get_constituency_id('087'), '087-06', 'Chiwanza', 55600, 33360, true),
-    (get_constituency_id('087'), '087-07', 'Ilonda', 55650, 33390, true),
-    (get_constituency_id('087'), '087-08', 'Isunga', 55700, 33420, true),
-    (get_constituency_id('087'), '087-09', 'Nakonde', 55750, 33450, true),
-    (get_constituency_id('087'), '087-10', 'Old Fife', 55800, 33480, true),
-    (get_constituency_id('087'), '087-11', 'Musele', 55850, 33510, true),
-    (get_constituency_id('082'), '082-01', 'Mulanda', 55900, 33540, true),
-    (get_constituency_id('082'), '082-02', 'Chifwenge', 55950, 33570, true),
-    (get_constituency_id('082'), '082-03', 'Bulilo', 56000, 33600, true),
-    (get_constituency_id('082'), '082-04', 'Chisupa', 56050, 33630, true),
-    (get_constituency_id('092'), '092-03', 'Kabisha', 56100, 33660, true),
-    (get_constituency_id('092'), '092-04', 'Fibwe', 56150, 33690, true),
-    (get_constituency_id('092'), '092-05', 'Chibamba', 56200, 33720, true),
-    (get_constituency_id('092'), '092-06', 'Iyaya', 56250, 33750, true),
-    (get_constituency_id('092'), '092-07', 'Kalunga', 56300, 33780, true),
-    (get_constituency_id('082'), '082-05', 'Ndela', 56350, 33810, true),
-    (get_constituency_id('092'), '092-08', 'Fube', 56400, 33840, true),
-    (get_constituency_id('092'), '092-09', 'Ngulula', 56450, 33870, true),
-    (get_constituency_id('092'), '092-10', 'Mungwi', 56500, 33900, true),
-    (get_constituency_id('092'), '092-12', 'Mabula', 56550, 33930, true),
-    (get_constituency_id('082'), '082-06', 'Katamba', 56600, 33960, true),
-    (get_constituency_id('082'), '082-07', 'Muteka', 56650, 33990, true),
-    (get_constituency_id('082'), '082-08', 'Lwenda', 56700, 34020, true),
-    (get_constituency_id('082'), '082-10', 'Mpanshya', 56750, 34050, true),
-    (get_constituency_id('082'), '082-11', 'Kashitu', 56800, 34080, true),
-    (get_constituency_id('089'), '089-17', 'Choma', 56850, 34110, true),
-    (get_constituency_id('082'), '082-12', 'Kambashi', 56900, 34140, true),
-    (get_constituency_id('089'), '089-18', 'Mowa', 56950, 34170, true),
-    (get_constituency_id('089'), '089-19', 'Kaleulu', 57000, 34200, true),
-    (get_constituency_id('089'), '089-20', 'Mwawe', 57050, 34230, true),
-    (get_constituency_id('082'), '082-13', 'Nguni', 57100, 34260, true),
-    (get_constituency_id('090'), '090-05', 'Julia Chikamoneka', 57150, 34290, true),
-    (get_constituency_id('082'), '082-14', 'Chinkundu', 57200, 34320, true),
-    (get_constituency_id('082'), '082-16', 'Kanchindi', 57250, 34350, true),
-    (get_constituency_id('082'), '082-17', 'Kapoka', 57300, 34380, true),
-    (get_constituency_id('082'), '082-18', 'Kawena', 57350, 34410, true),
-    (get_constituency_id('082'), '082-20', 'Bumba', 57400, 34440, true),
-    (get_constituency_id('082'), '082-21', 'Mubemba', 57450, 34470, true),
-    (get_constituency_id('102'), '102-07', 'Muchinga', 57500, 34500, true),
-    (get_constituency_id('088'), '088-01', 'Kapisha', 57550, 34530, true),
-    (get_constituency_id('088'), '088-02', 'Nsumbu', 57600, 34560, true),
-    (get_constituency_id('088'), '088-03', 'Chisela', 57650, 34590, true),
-    (get_constituency_id('088'), '088-04', 'Munwa', 57700, 34620, true),
-    (get_constituency_id('088'), '088-05', 'Kampinda', 57750, 34650, true),
-    (get_constituency_id('088'), '088-06', 'Kakusu', 57800, 34680, true),
-    (get_constituency_id('088'), '088-07', 'Kashikishi', 57850, 34710, true),
-    (get_constituency_id('088'), '088-08', 'Mwambeshi', 57900, 34740, true),
-    (get_constituency_id('088'), '088-09', 'Chubo', 57950, 34770, true),
-    (get_constituency_id('088'), '088-10', 'Fungwa', 58000, 34800, true),
-    (get_constituency_id('088'), '088-11', 'Mukubwe', 58050, 34830, true),
-    (get_constituency_id('089'), '089-12', 'Chiyilunda', 58100, 34860, true),
-    (get_constituency_id('089'), '089-13', 'Mofwe', 58150, 34890, true),
-    (get_constituency_id('089'), '089-14', 'Kalungwishi', 58200, 34920, true),
-    (get_constituency_id('089'), '089-15', 'Nkota', 58250, 34950, true),
-    (get_constituency_id('089'), '089-16', 'Chipili', 58300, 34980, true),
-    (get_constituency_id('089'), '089-21', 'Kapulwa', 58350, 35010, true),
-    (get_constituency_id('089'), '089-22', 'Munkonge', 58400, 35040, true),
-    (get_constituency_id('092'), '092-11', 'Chambeshi', 58450, 35070, true),
-    (get_constituency_id('101'), '101-19', 'Kalungwishi', 58500, 35100, true),
-    (get_constituency_id('082'), '082-22', 'Luangwa', 58550, 35130, true),
-    (get_constituency_id('090'), '090-01', 'Kasenga', 58600, 35160, true),
-    (get_constituency_id('090'), '090-02', 'Bululu', 58650, 35190, true),
-    (get_constituency_id('090'), '090-03', 'Chilunga', 58700, 35220, true),
-    (get_constituency_id('090'), '090-06', 'Lukupa', 58750, 35250, true),
-    (get_constituency_id('090'), '090-08', 'Buseko', 58800, 35280, true),
-    (get_constituency_id('091'), '091-09', 'Lusenga', 58850, 35310, true),
-    (get_constituency_id('091'), '091-10', 'Mukanga', 58900, 35340, true),
-    (get_constituency_id('091'), '091-11', 'Lualuo', 58950, 35370, true),
-    (get_constituency_id('103'), '103-08', 'Sanjongo', 59000, 35400, true),
-    (get_constituency_id('091'), '091-12', 'Chiba', 59050, 35430, true),
-    (get_constituency_id('103'), '103-10', 'Lukolwe/musonda', 59100, 35460, true),
-    (get_constituency_id('091'), '091-15', 'Kapongolo', 59150, 35490, true),
-    (get_constituency_id('091'), '091-16', 'Musowa', 59200, 35520, true),
-    (get_constituency_id('091'), '091-17', 'Chumba', 59250, 35550, true),
-    (get_constituency_id('101'), '101-18', 'Luangwa', 59300, 35580, true),
-    (get_constituency_id('093'), '093-16', 'Namukolo', 59350, 35610, true),
-    (get_constituency_id('093'), '093-17', 'Chulungoma', 59400, 35640, true),
-    (get_constituency_id('093'), '093-18', 'Masonde', 59450, 35670, true),
-    (get_constituency_id('093'), '093-19', 'Chifwile', 59500, 35700, true),
-    (get_constituency_id('103'), '103-12', 'Nyatanda Nyambingila', 59550, 35730, true),
-    (get_constituency_id('093'), '093-20', 'Mushituwamboo', 59600, 35760, true),
-    (get_constituency_id('093'), '093-21', 'Lwata', 59650, 35790, true),
-    (get_constituency_id('093'), '093-22', 'Isangano', 59700, 35820, true),
-    (get_constituency_id('094'), '094-01', 'Itandashi', 59750, 35850, true),
-    (get_constituency_id('094'), '094-02', 'Kaela', 59800, 35880, true),
-    (get_constituency_id('094'), '094-03', 'Munshinga', 59850, 35910, true),
-    (get_constituency_id('094'), '094-04', 'Katilye', 59900, 35940, true),
-    (get_constituency_id('094'), '094-05', 'Kanfinsa', 59950, 35970, true),
-    (get_constituency_id('094'), '094-06', 'Kampemba', 60000, 36000, true),
-    (get_constituency_id('094'), '094-07', 'Mulalashi', 60050, 36030, true),
-    (get_constituency_id('094'), '094-08', 'Mufili', 60100, 36060, true),
-    (get_constituency_id('094'), '094-09', 'Ilambo', 60150, 36090, true),
-    (get_constituency_id('105'), '105-11', 'Kabompo', 60200, 36120, true),
-    (get_constituency_id('105'), '105-12', 'Litoya', 60250, 36150, true),
-    (get_constituency_id('094'), '094-10', 'Ibale', 60300, 36180, true),
-    (get_constituency_id('095'), '095-04', 'Mwambezi', 60350, 36210, true),
-    (get_constituency_id('095'), '095-05', 'Nsunzu', 60400, 36240, true),
-    (get_constituency_id('094'), '094-11', 'Bwalinde', 60450, 36270, true),
-    (get_constituency_id('094'), '094-12', 'Mwelawamangu', 60500, 36300, true),
-    (get_constituency_id('105'), '105-13', 'Kamisombo', 60550, 36330, true),
-    (get_constituency_id('094'), '094-13', 'Isansa', 60600, 36360, true),
-    (get_constituency_id('101'), '101-17', 'Masonde', 60650, 36390, true),
-    (get_constituency_id('091'), '091-04', 'Lukulu', 60700, 36420, true),
-    (get_constituency_id('095'), '095-01', 'Itala', 60750, 36450, true),
-    (get_constituency_id('095'), '095-03', 'Kazimolwa', 60800, 36480, true),
-    (get_constituency_id('095'), '095-08', 'Luandi', 60850, 36510, true),
-    (get_constituency_id('097'), '097-09', 'Mukololo', 60900, 36540, true),
-    (get_constituency_id('097'), '097-10', 'Lapisha', 60950, 36570, true),
-    (get_constituency_id('097'), '097-11', 'Malamba', 61000, 36600, true),
-    (get_constituency_id('097'), '097-12', 'Chimbili', 61050, 36630, true),
-    (get_constituency_id('097'), '097-13', 'Chela', 61100, 36660, true),
-    (get_constituency_id('097'), '097-14', 'Mwiluzi', 61150, 36690, true),
-    (get_constituency_id('097'), '097-15', 'Chinyika', 61200, 36720, true),
-    (get_constituency_id('097'), '097-16', 'Ipembe', 61250, 36750, true),
-    (get_constituency_id('097'), '097-17', 'Chozi', 61300, 36780, true),
-    (get_constituency_id('092'), '092-02', 'Mpanda', 61350, 36810, true),
-    (get_constituency_id('101'), '101-11', 'Kansanshi', 61400, 36840, true),
-    (get_constituency_id('101'), '101-12', 'Isenga', 61450, 36870, true),
-    (get_constituency_id('101'), '101-13', 'Nchelenge', 61500, 36900, true),
-    (get_constituency_id('101'), '101-14', 'Malambwa', 61550, 36930, true),
-    (get_constituency_id('101'), '101-15', 'Malaila', 61600, 36960, true),
-    (get_constituency_id('101'), '101-16', 'Bwandela', 61650, 36990, true),
-    (get_constituency_id('101'), '101-20', 'Lunte', 61700, 37020, true),
-    (get_constituency_id('101'), '101-21', 'Kanyanta', 61750, 37050, true),
-    (get_constituency_id('101'), '101-22', 'Lubushi', 61800, 37080, true),
-    (get_constituency_id('102'), '102-01', 'Lumangwe', 61850, 37110, true),
-    (get_constituency_id('102'), '102-02', 'Chikulu', 61900, 37140, true),
-    (get_constituency_id('102'), '102-03', 'Mumbuluma', 61950, 37170, true),
-    (get_constituency_id('102'), '102-04', 'Chisha Mwamba', 62000, 37200, true),
-    (get_constituency_id('102'), '102-06', 'Kapumo', 62050, 37230, true),
-    (get_constituency_id('096'), '096-02', 'Katwe', 62100, 37260, true),
-    (get_constituency_id('102'), '102-08', 'Chimpolenge', 62150, 37290, true),
-    (get_constituency_id('102'), '102-09', 'Mutotoshi', 62200, 37320, true),
-    (get_constituency_id('102'), '102-10', 'Mabale', 62250, 37350, true),
-    (get_constituency_id('092'), '092-01', 'Lubanda', 62300, 37380, true),
-    (get_constituency_id('092'), '092-13', 'Musensenshe', 62350, 37410, true),
-    (get_constituency_id('096'), '096-01', 'Kapembwa', 62400, 37440, true),
-    (get_constituency_id('096'), '096-03', 'Chibulula', 62450, 37470, true),
-    (get_constituency_id('096'), '096-04', 'Mpulungu Central', 62500, 37500, true),
-    (get_constituency_id('096'), '096-05', 'Tanganyika', 62550, 37530, true),
-    (get_constituency_id('096'), '096-07', 'Isoko', 62600, 37560, true),
-    (get_constituency_id('096'), '096-08', 'Iyendwe', 62650, 37590, true),
-    (get_constituency_id('096'), '096-09', 'Mumila', 62700, 37620, true),
-    (get_constituency_id('096'), '096-10', 'Itimbwe', 62750, 37650, true),
-    (get_constituency_id('096'), '096-11', 'Vyamba', 62800, 37680, true),
-    (get_constituency_id('096'), '096-12', 'Chisha', 62850, 37710, true),
-    (get_constituency_id('096'), '096-13', 'Isunga', 62900, 37740, true),
-    (get_constituency_id('103'), '103-09', 'Lingundu', 62950, 37770, true),
-    (get_constituency_id('103'), '103-11', 'Kambuwa Mukelangombe', 63000, 37800, true),
-    (get_constituency_id('103'), '103-13', 'Nguvu', 63050, 37830, true),
-    (get_constituency_id('111'), '111-01', 'Musaka', 63100, 37860, true),
-    (get_constituency_id('102'), '102-21', 'Kayombo', 63150, 37890, true),
-    (get_constituency_id('104'), '104-01', 'Dihamba', 63200, 37920, true),
-    (get_constituency_id('104'), '104-02', 'Lunsuna', 63250, 37950, true),
-    (get_constituency_id('104'), '104-03', 'Kashinakaji', 63300, 37980, true),
-    (get_constituency_id('104'), '104-05', 'Manyinga', 63350, 38010, true),
-    (get_constituency_id('104'), '104-06', 'Loloma', 63400, 38040, true),
-    (get_constituency_id('104'), '104-09', 'Chongo', 63450, 38070, true),
-    (get_constituency_id('105'), '105-10', 'Kamafwafwa', 63500, 38100, true),
-    (get_constituency_id('105'), '105-14', 'Kabulamena', 63550, 38130, true),
-    (get_constituency_id('105'), '105-15', 'Mumbeji', 63600, 38160, true),
-    (get_constituency_id('105'), '105-20', 'Lunyiwe', 63650, 38190, true),
-    (get_constituency_id('105'), '105-16', 'Luli', 63700, 38220, true),
-    (get_constituency_id('105'), '105-17', 'Katuva', 63750, 38250, true),
-    (get_constituency_id('105'), '105-22', 'Chikonkwelo', 63800, 38280, true),
-    (get_constituency_id('105'), '105-18', 'Maveve', 63850, 38310, true),
-    (get_constituency_id('109'), '109-03', 'Nyakaseya', 63900, 38340, true),
-    (get_constituency_id('109'), '109-04', 'Ikelenge', 63950, 38370, true),
-    (get_constituency_id('109'), '109-05', 'Mwininyilamba', 64000, 38400, true),
-    (get_constituency_id('109'), '109-06', 'Kanongesha', 64050, 38430, true),
-    (get_constituency_id('109'), '109-07', 'Mukangala', 64100, 38460, true),
-    (get_constituency_id('109'), '109-08', 'Kawiku', 64150, 38490, true),
-    (get_constituency_id('105'), '105-19', 'Chikenge', 64200, 38520, true),
-    (get_constituency_id('112'), '112-19', 'Lumwana', 64250, 38550, true),
-    (get_constituency_id('112'), '112-22', 'Chovwe', 64300, 38580, true),
-    (get_constituency_id('104'), '104-07', 'Kawanda', 64350, 38610, true),
-    (get_constituency_id('104'), '104-08', 'Kaula', 64400, 38640, true),
-    (get_constituency_id('106'), '106-01', 'Kamakoku', 64450, 38670, true),
-    (get_constituency_id('106'), '106-02', 'Nselauke', 64500, 38700, true),
-    (get_constituency_id('106'), '106-03', 'Ingwe', 64550, 38730, true),
-    (get_constituency_id('106'), '106-04', 'Kaimbwe', 64600, 38760, true),
-    (get_constituency_id('106'), '106-05', 'Mukema', 64650, 38790, true),
-    (get_constituency_id('106'), '106-06', 'Kamatete', 64700, 38820, true),
-    (get_constituency_id('106'), '106-07', 'Dengwe', 64750, 38850, true),
-    (get_constituency_id('106'), '106-08', 'Njenga', 64800, 38880, true),
-    (get_constituency_id('106'), '106-09', 'Kalombe', 64850, 38910, true),
-    (get_constituency_id('106'), '106-10', 'Kamusongolwa', 64900, 38940, true),
-    (get_constituency_id('106'), '106-11', 'Kikonkomeme', 64950, 38970, true),
-    (get_constituency_id('106'), '106-12', 'Nkenyauna', 65000, 39000, true),
-    (get_constituency_id('106'), '106-13', 'Mukinge', 65050, 39030, true),
-    (get_constituency_id('106'), '106-14', 'Katenda', 65100, 39060, true),
-    (get_constituency_id('106'), '106-15', 'Lubofu', 65150, 39090, true),
-    (get_constituency_id('106'), '106-16', 'Mpungu', 65200, 39120, true),
-    (get_constituency_id('106'), '106-17', 'Nyoka', 65250, 39150, true),
-    (get_constituency_id('106'), '106-18', 'Kelongwa', 65300, 39180, true),
-    (get_constituency_id('106'), '106-19', 'Mukunanshi', 65350, 39210, true),
-    (get_constituency_id('106'), '106-20', 'Kanongo', 65400, 39240, true),
-    (get_constituency_id('106'), '106-21', 'Kamankechi', 65450, 39270, true),
-    (get_constituency_id('106'), '106-22', 'Jifumpa', 65500, 39300, true),
-    (get_constituency_id('104'), '104-04', 'Chiteve', 65550, 39330, true),
-    (get_constituency_id('107'), '107-01', 'Kashima West', 65600, 39360, true),
-    (get_constituency_id('107'), '107-05', 'Kashima East', 65650, 39390, true),
-    (get_constituency_id('107'), '107-03', 'Matushi', 65700, 39420, true),
-    (get_constituency_id('107'), '107-04', 'Kamabuta', 65750, 39450, true),
-    (get_constituency_id('103'), '103-02', 'Nyakulenga', 65800, 39480, true),
-    (get_constituency_id('107'), '107-05', 'Kalambu', 65850, 39510, true),
-    (get_constituency_id('107'), '107-06', 'Chizera', 65900, 39540, true),
-    (get_constituency_id('107'), '107-08', 'Kikonge', 65950, 39570, true),
-    (get_constituency_id('107'), '107-09', 'Munyambala', 66000, 39600, true),
-    (get_constituency_id('107'), '107-07', 'Shukwe', 66050, 39630, true),
-    (get_constituency_id('111'), '111-07', 'Mujimanzovu', 66100, 39660, true),
-    (get_constituency_id('107'), '107-10', 'Kalengwa', 66150, 39690, true),
-    (get_constituency_id('113'), '113-08', 'Chitokoloki', 66200, 39720, true),
-    (get_constituency_id('107'), '107-11', 'Kabi Pupu', 66250, 39750, true),
-    (get_constituency_id('107'), '107-13', 'Musonweji', 66300, 39780, true),
-    (get_constituency_id('107'), '107-14', 'Kaminzekenzeke', 66350, 39810, true),
-    (get_constituency_id('107'), '107-15', 'Lalafuta', 66400, 39840, true),
-    (get_constituency_id('107'), '107-12', 'Mushima', 66450, 39870, true),
-    (get_constituency_id('108'), '108-10', 'Mundwinji', 66500, 39900, true),
-    (get_constituency_id('108'), '108-11', 'Kapundu', 66550, 39930, true),
-    (get_constituency_id('108'), '108-12', 'Kanyama', 66600, 39960, true),
-    (get_constituency_id('108'), '108-13', 'Kakoma', 66650, 39990, true),
-    (get_constituency_id('108'), '108-14', 'Kasambula', 66700, 40020, true),
-    (get_constituency_id('108'), '108-15', 'Lumwana', 66750, 40050, true),
-    (get_constituency_id('108'), '108-16', 'Sailunga', 66800, 40080, true),
-    (get_constituency_id('108'), '108-17', 'Chisasa', 66850, 40110, true),
-    (get_constituency_id('108'), '108-18', 'Ntambu', 66900, 40140, true),
-    (get_constituency_id('108'), '108-19', 'Samuteba', 66950, 40170, true),
-    (get_constituency_id('108'), '108-20', 'Mudyanyama', 67000, 40200, true),
-    (get_constituency_id('108'), '108-21', 'Chibwika', 67050, 40230, true),
-    (get_constituency_id('108'), '108-22', 'Kamapanda', 67100, 40260, true),
-    (get_constituency_id('109'), '109-01', 'Chana-chamuhinga', 67150, 40290, true),
-    (get_constituency_id('109'), '109-02', 'Jimbe', 67200, 40320, true),
-    (get_constituency_id('109'), '109-09', 'Mulumbi', 67250, 40350, true),
-    (get_constituency_id('103'), '103-06', 'Chivombo Mbalango', 67300, 40380, true),
-    (get_constituency_id('110'), '110-08', 'Kapijimpanga', 67350, 40410, true),
-    (get_constituency_id('110'), '110-09', 'Sandangombe', 67400, 40440, true),
-    (get_constituency_id('110'), '110-10', 'Kamalamba', 67450, 40470, true),
-    (get_constituency_id('114'), '114-14', 'Muyembe', 67500, 40500, true),
-    (get_constituency_id('110'), '110-12', 'Kimasala', 67550, 40530, true),
-    (get_constituency_id('111'), '111-02', 'Chikola', 67600, 40560, true),
-    (get_constituency_id('111'), '111-03', 'Kangwena', 67650, 40590, true),
-    (get_constituency_id('111'), '111-04', 'Kalilele', 67700, 40620, true),
-    (get_constituency_id('111'), '111-05', 'Mulonga', 67750, 40650, true),
-    (get_constituency_id('111'), '111-06', 'Mapunga', 67800, 40680, true),
-    (get_constituency_id('112'), '112-13', 'Mumena', 67850, 40710, true),
-    (get_constituency_id('112'), '112-15', 'Kibanza', 67900, 40740, true),
-    (get_constituency_id('112'), '112-16', 'Mukumbi', 67950, 40770, true),
-    (get_constituency_id('112'), '112-17', 'Matebo', 68000, 40800, true),
-    (get_constituency_id('112'), '112-18', 'Shilenda', 68050, 40830, true),
-    (get_constituency_id('112'), '112-14', 'Mwajimambwe', 68100, 40860, true),
-    (get_constituency_id('112'), '112-20', 'Mumbezhi', 68150, 40890, true),
-    (get_constituency_id('112'), '112-21', 'Musele', 68200, 40920, true),
-    (get_constituency_id('113'), '113-01', 'Lukunyi', 68250, 40950, true),
-    (get_constituency_id('113'), '113-03', 'Dipalata', 68300, 40980, true),
-    (get_constituency_id('115'), '115-19', 'Nakeempa', 68350, 41010, true),
-    (get_constituency_id('113'), '113-04', 'Mukanda Nkunda', 68400, 41040, true),
-    (get_constituency_id('113'), '113-05', 'Chileng''a Chizenzi', 68450, 41070, true),
-    (get_constituency_id('113'), '113-06', 'Lwitadi Lwatembo', 68500, 41100, true),
-    (get_constituency_id('113'), '113-07', 'Mpidi Kakonga', 68550, 41130, true),
-    (get_constituency_id('113'), '113-09', 'Chivweti Kasesi', 68600, 41160, true),
-    (get_constituency_id('115'), '115-22', 'Simacheche', 68650, 41190, true),
-    (get_constituency_id('113'), '113-10', 'Zambezi', 68700, 41220, true),
-    (get_constituency_id('116'), '116-06', 'Kabimba', 68750, 41250, true),
-    (get_constituency_id('114'), '114-11', 'Mapachi Chinyingi', 68800, 41280, true),
-    (get_constituency_id('114'), '114-12', 'Likungu', 68850, 41310, true),
-    (get_constituency_id('114'), '114-13', 'Liyovu', 68900, 41340, true),
-    (get_constituency_id('114'), '114-15', 'Mwange Nyawanda', 68950, 41370, true),
-    (get_constituency_id('114'), '114-16', 'Matondo', 69000, 41400, true),
-    (get_constituency_id('115'), '115-15', 'Batoka', 69050, 41430, true),
-    (get_constituency_id('115'), '115-16', 'Sikalongo', 69100, 41460, true),
-    (get_constituency_id('115'), '115-17', 'Simamvwa', 69150, 41490, true),
-    (get_constituency_id('115'), '115-18', 'Stateland', 69200, 41520, true),
-    (get_constituency_id('160'), '160-12', 'Mpanza', 69250, 41550, true),
-    (get_constituency_id('118'), '118-01', 'Chisanga', 69300, 41580, true),
-    (get_constituency_id('115'), '115-20', 'Moomba', 69350, 41610, true),
-    (get_constituency_id('115'), '115-21', 'Kulundana', 69400, 41640, true),
-    (get_constituency_id('130'), '130-05', 'Makunku', 69450, 41670, true),
-    (get_constituency_id('130'), '130-06', 'Nyambo', 69500, 41700, true),
-    (get_constituency_id('115'), '115-23', 'Sikalundu', 69550, 41730, true),
-    (get_constituency_id('115'), '115-24', 'Mubula', 69600, 41760, true),
-    (get_constituency_id('115'), '115-25', 'Singani', 69650, 41790, true),
-    (get_constituency_id('115'), '115-26', 'Siasikabole', 69700, 41820, true),
-    (get_constituency_id('115'), '115-27', 'Namuswa', 69750, 41850, true),
-    (get_constituency_id('116'), '116-03', 'Mang''unza', 69800, 41880, true),
-    (get_constituency_id('123'), '123-01', 'Freedom', 69850, 41910, true),
-    (get_constituency_id('116'), '116-04', 'Chilalantambo', 69900, 41940, true),
-    (get_constituency_id('116'), '116-05', 'Macha', 69950, 41970, true),
-    (get_constituency_id('116'), '116-07', 'Mbabala', 70000, 42000, true),
-    (get_constituency_id('117'), '117-08', 'Kasiya', 70050, 42030, true),
-    (get_constituency_id('117'), '117-09', 'Pemba', 70100, 42060, true),
-    (get_constituency_id('117'), '117-10', 'Hamaundu', 70150, 42090, true),
-    (get_constituency_id('117'), '117-11', 'Maambo', 70200, 42120, true),
-    (get_constituency_id('117'), '117-12', 'Kauba', 70250, 42150, true),
-    (get_constituency_id('117'), '117-13', 'Habunkululu', 70300, 42180, true),
-    (get_constituency_id('117'), '117-14', 'Nachibanga', 70350, 42210, true),
-    (get_constituency_id('123'), '123-02', 'Musi-o-tunya', 70400, 42240, true),
-    (get_constituency_id('160'), '160-11', 'Simaumbi', 70450, 42270, true),
-    (get_constituency_id('118'), '118-02', 'Sinafala', 70500, 42300, true),
-    (get_constituency_id('118'), '118-03', 'Jumbo', 70550, 42330, true),
-    (get_constituency_id('118'), '118-04', 'Kkoma', 70600, 42360, true),
-    (get_constituency_id('118'), '118-05', 'Chibuwe', 70650, 42390, true),
-    (get_constituency_id('118'), '118-06', 'Siampande', 70700, 42420, true),
-    (get_constituency_id('118'), '118-07', 'Kota Kota', 70750, 42450, true),
-    (get_constituency_id('123'), '123-04', 'Namatama', 70800, 42480, true),
-    (get_constituency_id('123'), '123-05', 'Kasiya', 70850, 42510, true),
-    (get_constituency_id('118'), '118-08', 'Luumbo', 70900, 42540, true),
-    (get_constituency_id('118'), '118-09', 'Kkole', 70950, 42570, true),
-    (get_constituency_id('118'), '118-10', 'Bbondo', 71000, 42600, true),
-    (get_constituency_id('118'), '118-11', 'Chaamwe', 71050, 42630, true),
-    (get_constituency_id('118'), '118-12', 'Fumbo', 71100, 42660, true),
-    (get_constituency_id('118'), '118-13', 'Jongola', 71150, 42690, true),
-    (get_constituency_id('118'), '118-14', 'Lukonde', 71200, 42720, true),
-    (get_constituency_id('130'), '130-01', 'Itezhi-tezhi', 71250, 42750, true),
-    (get_constituency_id('130'), '130-02', 'Itumbi', 71300, 42780, true),
-    (get_constituency_id('130'), '130-03', 'Kaanzwa', 71350, 42810, true),
-    (get_constituency_id('130'), '130-04', 'Banamwaze', 71400, 42840, true),
-    (get_constituency_id('130'), '130-07', 'Kabulungwe', 71450, 42870, true),
-    (get_constituency_id('130'), '130-08', 'Lubanda', 71500, 42900, true),
-    (get_constituency_id('130'), '130-09', 'Masemu', 71550, 42930, true),
-    (get_constituency_id('123'), '123-06', 'Libuyu', 71600, 42960, true),
-    (get_constituency_id('130'), '130-10', 'Luubwe', 71650, 42990, true),
-    (get_constituency_id('130'), '130-11', 'Basanga', 71700, 43020, true),
-    (get_constituency_id('130'), '130-12', 'Luchena', 71750, 43050, true),
-    (get_constituency_id('123'), '123-07', 'Mwalibonena', 71800, 43080, true),
-    (get_constituency_id('130'), '130-13', 'Mbila', 71850, 43110, true),
-    (get_constituency_id('119'), '119-01', 'Chikanta', 71900, 43140, true),
-    (get_constituency_id('123'), '123-08', 'Mulungushi', 71950, 43170, true),
-    (get_constituency_id('119'), '119-02', 'Chamuka', 72000, 43200, true),
-    (get_constituency_id('119'), '119-03', 'Kasukwe', 72050, 43230, true),
-    (get_constituency_id('119'), '119-04', 'Omba', 72100, 43260, true),
-    (get_constituency_id('119'), '119-05', 'Bbilili', 72150, 43290, true),
-    (get_constituency_id('119'), '119-06', 'Naluja', 72200, 43320, true),
-    (get_constituency_id('120'), '120-07', 'Siachitema', 72250, 43350, true),
-    (get_constituency_id('120'), '120-08', 'Kalonda', 72300, 43380, true),
-    (get_constituency_id('123'), '123-09', 'Maramba', 72350, 43410, true),
-    (get_constituency_id('120'), '120-09', 'Choonga', 72400, 43440, true),
-    (get_constituency_id('120'), '120-10', 'Mayoba', 72450, 43470, true),
-    (get_constituency_id('123'), '123-10', 'Akapelwa', 72500, 43500, true),
-    (get_constituency_id('120'), '120-11', 'Namwianga', 72550, 43530, true),
-    (get_constituency_id('120'), '120-12', 'Simayakwe', 72600, 43560, true),
-    (get_constituency_id('120'), '120-13', 'Chawila', 72650, 43590, true),
-    (get_constituency_id('123'), '123-11', 'Lizuma', 72700, 43620, true),
-    (get_constituency_id('120'), '120-14', 'Sipatunyana', 72750, 43650, true),
-    (get_constituency_id('123'), '123-16', 'Nansanzu', 72800, 43680, true),
-    (get_constituency_id('120'), '120-15', 'Nachikungu', 72850, 43710, true),
-    (get_constituency_id('122'), '122-16', 'Chidi', 72900, 43740, true),
-    (get_constituency_id('122'), '122-17', 'Mulamfu', 72950, 43770, true),
-    (get_constituency_id('122'), '122-18', 'Simwatachela', 73000, 43800, true),
-    (get_constituency_id('122'), '122-19', 'Luyaba', 73050, 43830, true),
-    (get_constituency_id('122'), '122-20', 'Zimba', 73100, 43860, true),
-    (get_constituency_id('122'), '122-21', 'Siamafumba', 73150, 43890, true),
-    (get_constituency_id('122'), '122-22', 'Mbwiko', 73200, 43920, true),
-    (get_constituency_id('121'), '121-01', 'Moomba', 73250, 43950, true),
-    (get_constituency_id('121'), '121-02', 'Chooma', 73300, 43980, true),
-    (get_constituency_id('121'), '121-03', 'Nguba', 73350, 44010, true),
-    (get_constituency_id('121'), '121-04', 'Kauwe', 73400, 44040, true),
-    (get_constituency_id('121'), '121-05', 'Nyawa', 73450, 44070, true),
-    (get_constituency_id('121'), '121-06', 'Ngwezi', 73500, 44100, true),
-    (get_constituency_id('121'), '121-07', 'Sikaunzwe', 73550, 44130, true),
-    (get_constituency_id('121'), '121-08', 'Mandia', 73600, 44160, true),
-    (get_constituency_id('132'), '132-05', 'Sikongo', 73650, 44190, true),
-    (get_constituency_id('121'), '121-09', 'Sekute', 73700, 44220, true),
-    (get_constituency_id('121'), '121-10', 'Kanchele', 73750, 44250, true),
-    (get_constituency_id('121'), '121-11', 'Simango', 73800, 44280, true),
-    (get_constituency_id('121'), '121-12', 'Musokotwane', 73850, 44310, true),
-    (get_constituency_id('121'), '121-14', 'Mukuni', 73900, 44340, true),
-    (get_constituency_id('123'), '123-03', 'Dr.mubitana', 73950, 44370, true),
-    (get_constituency_id('123'), '123-12', 'Simonga', 74000, 44400, true),
-    (get_constituency_id('123'), '123-13', 'Dambwa Central', 74050, 44430, true),
-    (get_constituency_id('123'), '123-14', 'Zambezi', 74100, 44460, true),
-    (get_constituency_id('123'), '123-15', 'Kariba', 74150, 44490, true),
-    (get_constituency_id('123'), '123-17', 'Shungu', 74200, 44520, true),
-    (get_constituency_id('124'), '124-01', 'Kasengo', 74250, 44550, true),
-    (get_constituency_id('124'), '124-02', 'Namalundu', 74300, 44580, true),
-    (get_constituency_id('124'), '124-03', 'Musaya', 74350, 44610, true),
-    (get_constituency_id('124'), '124-04', 'Nansenga', 74400, 44640, true),
-    (get_constituency_id('124'), '124-05', 'Chitete', 74450, 44670, true),
-    (get_constituency_id('124'), '124-06', 'Malala', 74500, 44700, true),
-    (get_constituency_id('125'), '125-11', 'Musuma', 74550, 44730, true),
-    (get_constituency_id('124'), '124-07', 'Mabwetuba', 74600, 44760, true),
-    (get_constituency_id('124'), '124-08', 'Upper Kaleya', 74650, 44790, true),
-    (get_constituency_id('125'), '125-09', 'Nkonkola', 74700, 44820, true),
-    (get_constituency_id('125'), '125-10', 'Chivuna', 74750, 44850, true),
-    (get_constituency_id('125'), '125-12', 'Munjile', 74800, 44880, true),
-    (get_constituency_id('126'), '126-22', 'Nenga Nenga', 74850, 44910, true),
-    (get_constituency_id('125'), '125-13', 'Ngwezi', 74900, 44940, true),
-    (get_constituency_id('125'), '125-14', 'Kalama', 74950, 44970, true),
-    (get_constituency_id('125'), '125-15', 'Munenga', 75000, 45000, true),
-    (get_constituency_id('125'), '125-16', 'Mwanachingwala', 75050, 45030, true),
-    (get_constituency_id('125'), '125-17', 'Itebe', 75100, 45060, true),
-    (get_constituency_id('126'), '126-18', 'Mazabuka Central', 75150, 45090, true),
-    (get_constituency_id('127'), '127-02', 'Kaila', 75200, 45120, true),
-    (get_constituency_id('126'), '126-19', 'Nakambala', 75250, 45150, true),
-    (get_constituency_id('126'), '126-20', 'Chizobo', 75300, 45180, true),
-    (get_constituency_id('126'), '126-21', 'Lubombo', 75350, 45210, true),
-    (get_constituency_id('127'), '127-01', 'Malundu', 75400, 45240, true),
-    (get_constituency_id('127'), '127-03', 'Keemba', 75450, 45270, true),
-    (get_constituency_id('127'), '127-06', 'Hamangaba', 75500, 45300, true),
-    (get_constituency_id('127'), '127-04', 'Choongo West', 75550, 45330, true),
-    (get_constituency_id('127'), '127-05', 'Bweengwa', 75600, 45360, true),
-    (get_constituency_id('127'), '127-07', 'Choongo East', 75650, 45390, true),
-    (get_constituency_id('128'), '128-09', 'Ufwenuka', 75700, 45420, true),
-    (get_constituency_id('128'), '128-12', 'Mayaba', 75750, 45450, true),
-    (get_constituency_id('128'), '128-10', 'Manungu', 75800, 45480, true),
-    (get_constituency_id('128'), '128-11', 'Chisekesi', 75850, 45510, true),
-    (get_constituency_id('128'), '128-13', 'Hufwa/hamapande', 75900, 45540, true),
-    (get_constituency_id('128'), '128-14', 'Hamamvwa', 75950, 45570, true),
-    (get_constituency_id('128'), '128-16', 'Hantotola', 76000, 45600, true),
-    (get_constituency_id('128'), '128-17', 'Bbombo', 76050, 45630, true),
-    (get_constituency_id('128'), '128-18', 'Monze Urban', 76100, 45660, true),
-    (get_constituency_id('129'), '129-19', 'Mwanza West', 76150, 45690, true),
-    (get_constituency_id('129'), '129-20', 'Chona', 76200, 45720, true),
-    (get_constituency_id('129'), '129-21', 'Mwanza East', 76250, 45750, true),
-    (get_constituency_id('129'), '129-22', 'Moomba', 76300, 45780, true),
-    (get_constituency_id('131'), '131-01', 'Namwala Central', 76350, 45810, true),
-    (get_constituency_id('131'), '131-02', 'Ngabo', 76400, 45840, true),
-    (get_constituency_id('131'), '131-03', 'Baambwe', 76450, 45870, true),
-    (get_constituency_id('131'), '131-04', 'Maala', 76500, 45900, true),
-    (get_constituency_id('131'), '131-05', 'Kantengwa', 76550, 45930, true),
-    (get_constituency_id('131'), '131-06', 'Kabulamwanda', 76600, 45960, true),
-    (get_constituency_id('131'), '131-07', 'Chitongo', 76650, 45990, true),
-    (get_constituency_id('131'), '131-08', 'Mandondo', 76700, 46020, true),
-    (get_constituency_id('131'), '131-09', 'Nakamboma', 76750, 46050, true),
-    (get_constituency_id('131'), '131-10', 'Mbeza', 76800, 46080, true),
-    (get_constituency_id('131'), '131-11', 'Ndema', 76850, 46110, true),
-    (get_constituency_id('131'), '131-12', 'Namakube', 76900, 46140, true),
-    (get_constituency_id('132'), '132-13', 'Lusangazi', 76950, 46170, true),
-    (get_constituency_id('131'), '131-13', 'Itapa', 77000, 46200, true),
-    (get_constituency_id('131'), '131-14', 'Moobola', 77050, 46230, true),
-    (get_constituency_id('132'), '132-01', 'Ibwe Munyama', 77100, 46260, true),
-    (get_constituency_id('132'), '132-02', 'Musaya', 77150, 46290, true),
-    (get_constituency_id('132'), '132-03', 'Chirundu', 77200, 46320, true),
-    (get_constituency_id('132'), '132-06', 'Lusitu', 77250, 46350, true),
-    (get_constituency_id('132'), '132-07', 'Nanyanga', 77300, 46380, true),
-    (get_constituency_id('133'), '133-01', 'Mabinga', 77350, 46410, true),
-    (get_constituency_id('132'), '132-08', 'Kariba', 77400, 46440, true),
-    (get_constituency_id('132'), '132-09', 'Simamba', 77450, 46470, true),
-    (get_constituency_id('132'), '132-10', 'Mulima', 77500, 46500, true),
-    (get_constituency_id('132'), '132-11', 'Manchanvwa', 77550, 46530, true),
-    (get_constituency_id('132'), '132-12', 'Sinadambwe', 77600, 46560, true),
-    (get_constituency_id('133'), '133-04', 'Muuka', 77650, 46590, true),
-    (get_constituency_id('133'), '133-05', 'Tekelo', 77700, 46620, true),
-    (get_constituency_id('133'), '133-06', 'Mweemba', 77750, 46650, true),
-    (get_constituency_id('133'), '133-07', 'Muchekwa', 77800, 46680, true),
-    (get_constituency_id('133'), '133-08', 'Maamba', 77850, 46710, true),
-    (get_constituency_id('133'), '133-09', 'Mweezya', 77900, 46740, true),
-    (get_constituency_id('133'), '133-10', 'Nkamdabwe', 77950, 46770, true),
-    (get_constituency_id('133'), '133-11', 'Sinazongwe', 78000, 46800, true),
-    (get_constituency_id('133'), '133-12', 'Nangombe', 78050, 46830, true),
-    (get_constituency_id('133'), '133-13', 'Sinenge', 78100, 46860, true),
-    (get_constituency_id('133'), '133-14', 'Malima', 78150, 46890, true),
-    (get_constituency_id('128'), '128-08', 'Chipembele', 78200, 46920, true),
-    (get_constituency_id('003'), '003-19', 'Mashikili', 78250, 46950, true),
-    (get_constituency_id('082'), '082-19', 'Kanama', 78300, 46980, true),
-    (get_constituency_id('082'), '082-15', 'Chiloba', 78350, 47010, true),
-    (get_constituency_id('030'), '030-02', 'Kabundia', 78400, 47040, true),
-    (get_constituency_id('001'), '001-05', 'Chisamba', 78450, 47070, true),
-    (get_constituency_id('071'), '071-03', 'Mandombe', 78500, 47100, true),
-    (get_constituency_id('110'), '110-11', 'Tuvwanganai', 78550, 47130, true),
-    (get_constituency_id('066'), '066-05', 'Kashikishi', 78600, 47160, true),
-    (get_constituency_id('058'), '058-09', 'Mulundu', 78650, 47190, true),
-    (get_constituency_id('076'), '076-07', 'Libala', 78700, 47220, true),
-    (get_constituency_id('121'), '121-13', 'Katapazi', 78750, 47250, true);
+INSERT INTO wards (constituency_id, code, name, population, is_active) VALUES
+    (get_constituency_id('134'), '134-08', 'Mapungu', 8000, true),
+    (get_constituency_id('134'), '134-09', 'Luanginga', 8050, true),
+    (get_constituency_id('134'), '134-10', 'Liumba', 8100, true),
+    (get_constituency_id('134'), '134-11', 'Yuka', 8150, true),
+    (get_constituency_id('134'), '134-12', 'Buleya', 8200, true),
+    (get_constituency_id('134'), '134-13', 'Lutwi', 8250, true),
+    (get_constituency_id('135'), '135-01', 'Siluwe', 8300, true),
+    (get_constituency_id('134'), '134-14', 'Ndoka', 8350, true),
+    (get_constituency_id('135'), '135-02', 'Likulundundu', 8400, true),
+    (get_constituency_id('027'), '027-09', 'Leya Mukutu', 8450, true),
+    (get_constituency_id('134'), '134-15', 'Namulilo', 8500, true),
+    (get_constituency_id('135'), '135-03', 'Luola', 8550, true),
+    (get_constituency_id('134'), '134-16', 'Nguma', 8600, true),
+    (get_constituency_id('134'), '134-17', 'Kandambo', 8650, true),
+    (get_constituency_id('027'), '027-10', 'David Kaunda', 8700, true),
+    (get_constituency_id('028'), '028-11', 'Mutundu', 8750, true),
+    (get_constituency_id('135'), '135-04', 'Salunda', 8800, true),
+    (get_constituency_id('136'), '136-19', 'Lulangunyi', 8850, true),
+    (get_constituency_id('135'), '135-05', 'Sishekanu', 8900, true),
+    (get_constituency_id('136'), '136-20', 'Tuuwa', 8950, true),
+    (get_constituency_id('135'), '135-06', 'Kuuli', 9000, true),
+    (get_constituency_id('136'), '136-25', 'Nengu', 9050, true),
+    (get_constituency_id('135'), '135-07', 'Libonda', 9100, true),
+    (get_constituency_id('143'), '143-25', 'Imwiko', 9150, true),
+    (get_constituency_id('136'), '136-18', 'Lueti', 9200, true),
+    (get_constituency_id('136'), '136-21', 'Maala', 9250, true),
+    (get_constituency_id('136'), '136-23', 'Licha', 9300, true),
+    (get_constituency_id('136'), '136-22', 'Liumena', 9350, true),
+    (get_constituency_id('136'), '136-24', 'Lwambi', 9400, true),
+    (get_constituency_id('136'), '136-26', 'Mutala', 9450, true),
+    (get_constituency_id('136'), '136-27', 'Mwenyi', 9500, true),
+    (get_constituency_id('137'), '137-01', 'Lalafuta', 9550, true),
+    (get_constituency_id('137'), '137-02', 'Shitwe', 9600, true),
+    (get_constituency_id('137'), '137-03', 'Namilangi', 9650, true),
+    (get_constituency_id('137'), '137-04', 'Nkeyama', 9700, true),
+    (get_constituency_id('137'), '137-05', 'Litoya', 9750, true),
+    (get_constituency_id('137'), '137-06', 'Mulamatila', 9800, true),
+    (get_constituency_id('137'), '137-07', 'Longe', 9850, true),
+    (get_constituency_id('143'), '143-28', 'Kaande', 9900, true),
+    (get_constituency_id('138'), '138-08', 'Naliele', 9950, true),
+    (get_constituency_id('138'), '138-09', 'Namando', 10000, true),
+    (get_constituency_id('138'), '138-10', 'Nyambi', 10050, true),
+    (get_constituency_id('138'), '138-11', 'Mulwa', 10100, true),
+    (get_constituency_id('138'), '138-12', 'Lui', 10150, true),
+    (get_constituency_id('138'), '138-13', 'Nkenga', 10200, true),
+    (get_constituency_id('138'), '138-14', 'Mbanyutu', 10250, true),
+    (get_constituency_id('139'), '139-19', 'Kapili', 10300, true),
+    (get_constituency_id('138'), '138-15', 'Luampa', 10350, true),
+    (get_constituency_id('140'), '140-05', 'Mwito', 10400, true),
+    (get_constituency_id('139'), '139-16', 'Namafulo', 10450, true),
+    (get_constituency_id('139'), '139-17', 'Luambuwa', 10500, true),
+    (get_constituency_id('139'), '139-18', 'Mushwala', 10550, true),
+    (get_constituency_id('139'), '139-20', 'Mangango', 10600, true),
+    (get_constituency_id('140'), '140-11', 'Mwandi', 10650, true),
+    (get_constituency_id('139'), '139-21', 'Kanabilumbu', 10700, true),
+    (get_constituency_id('140'), '140-12', 'Namayula', 10750, true),
+    (get_constituency_id('139'), '139-22', 'Shinkombwe', 10800, true),
+    (get_constituency_id('140'), '140-01', 'Simakumba', 10850, true),
+    (get_constituency_id('140'), '140-13', 'Luanchuma', 10900, true),
+    (get_constituency_id('140'), '140-02', 'Kamilende', 10950, true),
+    (get_constituency_id('140'), '140-03', 'Dongwe', 11000, true),
+    (get_constituency_id('143'), '143-15', 'Nyaala', 11050, true),
+    (get_constituency_id('140'), '140-04', 'Kashamba', 11100, true),
+    (get_constituency_id('143'), '143-22', 'Chin''onwe', 11150, true),
+    (get_constituency_id('140'), '140-06', 'Kang''oti', 11200, true),
+    (get_constituency_id('142'), '142-07', 'Simaa', 11250, true),
+    (get_constituency_id('140'), '140-07', 'Lukau', 11300, true),
+    (get_constituency_id('142'), '142-08', 'Ndanda', 11350, true),
+    (get_constituency_id('028'), '028-15', 'Kamuchanga', 11400, true),
+    (get_constituency_id('140'), '140-08', 'Likapai', 11450, true),
+    (get_constituency_id('143'), '143-14', 'Muyondoti', 11500, true),
+    (get_constituency_id('140'), '140-09', 'Mbanga', 11550, true),
+    (get_constituency_id('140'), '140-10', 'Kawaya', 11600, true),
+    (get_constituency_id('143'), '143-16', 'Mataba', 11650, true),
+    (get_constituency_id('143'), '143-17', 'Lupui', 11700, true),
+    (get_constituency_id('143'), '143-18', 'Kakwacha', 11750, true),
+    (get_constituency_id('028'), '028-16', 'Kasempa', 11800, true),
+    (get_constituency_id('143'), '143-19', 'Lutembwe', 11850, true),
+    (get_constituency_id('143'), '143-20', 'Mitete', 11900, true),
+    (get_constituency_id('143'), '143-21', 'Kanshizhi', 11950, true),
+    (get_constituency_id('143'), '143-16', 'Namushakende', 12000, true),
+    (get_constituency_id('142'), '142-01', 'Limulunga', 12050, true),
+    (get_constituency_id('035'), '035-20', 'Toka', 12100, true),
+    (get_constituency_id('142'), '142-02', 'Mabili', 12150, true),
+    (get_constituency_id('142'), '142-03', 'Ikwichi', 12200, true),
+    (get_constituency_id('142'), '142-04', 'Namboma', 12250, true),
+    (get_constituency_id('143'), '143-18', 'Kama', 12300, true),
+    (get_constituency_id('142'), '142-05', 'Nangula', 12350, true),
+    (get_constituency_id('142'), '142-06', 'Ushaa', 12400, true),
+    (get_constituency_id('143'), '143-22', 'Kambule', 12450, true),
+    (get_constituency_id('143'), '143-17', 'Yeta', 12500, true),
+    (get_constituency_id('143'), '143-19', 'Lumbo', 12550, true),
+    (get_constituency_id('143'), '143-23', 'Lewanika', 12600, true),
+    (get_constituency_id('143'), '143-24', 'Mulambwa', 12650, true),
+    (get_constituency_id('143'), '143-20', 'Katongo', 12700, true),
+    (get_constituency_id('143'), '143-21', 'Kanyonyo', 12750, true),
+    (get_constituency_id('143'), '143-26', 'Lealui', 12800, true),
+    (get_constituency_id('143'), '143-27', 'Mabumbu', 12850, true),
+    (get_constituency_id('144'), '144-09', 'Lui', 12900, true),
+    (get_constituency_id('017'), '017-05', 'Buntungwa', 12950, true),
+    (get_constituency_id('144'), '144-10', 'Imalyo', 13000, true),
+    (get_constituency_id('144'), '144-11', 'Mutondo', 13050, true),
+    (get_constituency_id('144'), '144-12', 'Namengo', 13100, true),
+    (get_constituency_id('144'), '144-13', 'Nakanyaa', 13150, true),
+    (get_constituency_id('146'), '146-11', 'Imatanda', 13200, true),
+    (get_constituency_id('144'), '144-14', 'Mbekise', 13250, true),
+    (get_constituency_id('144'), '144-15', 'Nakato', 13300, true),
+    (get_constituency_id('145'), '145-01', 'Lyamakumbi', 13350, true),
+    (get_constituency_id('145'), '145-02', 'Silowana', 13400, true),
+    (get_constituency_id('145'), '145-03', 'Shekela', 13450, true),
+    (get_constituency_id('145'), '145-04', 'Makoka', 13500, true),
+    (get_constituency_id('035'), '035-21', 'Kaloko', 13550, true),
+    (get_constituency_id('145'), '145-05', 'Kambai', 13600, true),
+    (get_constituency_id('150'), '150-20', 'Imusho', 13650, true),
+    (get_constituency_id('147'), '147-01', 'Mambolomoka', 13700, true),
+    (get_constituency_id('145'), '145-06', 'Kataba', 13750, true),
+    (get_constituency_id('145'), '145-07', 'Muoyo', 13800, true),
+    (get_constituency_id('145'), '145-08', 'Nanjucha', 13850, true),
+    (get_constituency_id('146'), '146-09', 'Mwanambuyu', 13900, true),
+    (get_constituency_id('146'), '146-10', 'Imatongo', 13950, true),
+    (get_constituency_id('146'), '146-12', 'Wanyau', 14000, true),
+    (get_constituency_id('146'), '146-13', 'Lipuwe', 14050, true),
+    (get_constituency_id('146'), '146-14', 'Naluywa', 14100, true),
+    (get_constituency_id('146'), '146-15', 'Lumbe', 14150, true),
+    (get_constituency_id('146'), '146-16', 'Sibukali', 14200, true),
+    (get_constituency_id('148'), '148-02', 'Kamanga', 14250, true),
+    (get_constituency_id('146'), '146-17', 'Mata', 14300, true),
+    (get_constituency_id('148'), '148-01', 'Nawinda', 14350, true),
+    (get_constituency_id('148'), '148-03', 'Lwamuloba', 14400, true),
+    (get_constituency_id('148'), '148-05', 'Mulobezi', 14450, true),
+    (get_constituency_id('148'), '148-04', 'Sichili', 14500, true),
+    (get_constituency_id('148'), '148-06', 'Machile', 14550, true),
+    (get_constituency_id('149'), '149-09', 'Mabumbu', 14600, true),
+    (get_constituency_id('149'), '149-07', 'Magumwi', 14650, true),
+    (get_constituency_id('149'), '149-10', 'Mwandi', 14700, true),
+    (get_constituency_id('149'), '149-08', 'Sankolonga', 14750, true),
+    (get_constituency_id('149'), '149-11', 'Simungoma', 14800, true),
+    (get_constituency_id('149'), '149-12', 'Lwanja', 14850, true),
+    (get_constituency_id('149'), '149-13', 'Lwazamba', 14900, true),
+    (get_constituency_id('149'), '149-14', 'Mushukula', 14950, true),
+    (get_constituency_id('150'), '150-16', 'Mulimambango', 15000, true),
+    (get_constituency_id('149'), '149-15', 'Maondo', 15050, true),
+    (get_constituency_id('015'), '015-18', 'Kamina', 15100, true),
+    (get_constituency_id('150'), '150-17', 'Lusu', 15150, true),
+    (get_constituency_id('150'), '150-18', 'Luampungu', 15200, true),
+    (get_constituency_id('016'), '016-11', 'Musenga', 15250, true),
+    (get_constituency_id('150'), '150-19', 'Kalobolelwa', 15300, true),
+    (get_constituency_id('147'), '147-02', 'Kayena', 15350, true),
+    (get_constituency_id('147'), '147-03', 'Nalwashi', 15400, true),
+    (get_constituency_id('147'), '147-04', 'Kalongola', 15450, true),
+    (get_constituency_id('147'), '147-05', 'Mbeta', 15500, true),
+    (get_constituency_id('147'), '147-06', 'Sioma', 15550, true),
+    (get_constituency_id('147'), '147-08', 'Mutomena', 15600, true),
+    (get_constituency_id('147'), '147-07', 'Sikabenga', 15650, true),
+    (get_constituency_id('147'), '147-09', 'Mulamba', 15700, true),
+    (get_constituency_id('147'), '147-10', 'Kaunga Mashi', 15750, true),
+    (get_constituency_id('147'), '147-11', 'Beshe', 15800, true),
+    (get_constituency_id('001'), '001-01', 'Muswishi', 15850, true),
+    (get_constituency_id('001'), '001-02', 'Mulungushi', 15900, true),
+    (get_constituency_id('001'), '001-03', 'Chikokomene', 15950, true),
+    (get_constituency_id('001'), '001-04', 'Chamuka', 16000, true),
+    (get_constituency_id('001'), '001-06', 'Liteta', 16050, true),
+    (get_constituency_id('147'), '147-12', 'Sipuma', 16100, true),
+    (get_constituency_id('002'), '002-12', 'Kabile', 16150, true),
+    (get_constituency_id('003'), '003-13', 'Chaloshi', 16200, true),
+    (get_constituency_id('003'), '003-14', 'Kalola', 16250, true),
+    (get_constituency_id('003'), '003-15', 'Kakoma', 16300, true),
+    (get_constituency_id('016'), '016-12', 'Kasompe', 16350, true),
+    (get_constituency_id('147'), '147-13', 'Mulonga', 16400, true),
+    (get_constituency_id('147'), '147-14', 'Simu', 16450, true),
+    (get_constituency_id('002'), '002-07', 'Katuba', 16500, true),
+    (get_constituency_id('004'), '004-06', 'Kawama', 16550, true),
+    (get_constituency_id('002'), '002-08', 'Chunga', 16600, true),
+    (get_constituency_id('002'), '002-09', 'Mungule', 16650, true),
+    (get_constituency_id('004'), '004-01', 'Muwowo', 16700, true),
+    (get_constituency_id('002'), '002-10', 'Muchenje', 16750, true),
+    (get_constituency_id('002'), '002-11', 'Chalochabalenge', 16800, true),
+    (get_constituency_id('003'), '003-16', 'Chikobo', 16850, true),
+    (get_constituency_id('004'), '004-05', 'Bwacha', 16900, true),
+    (get_constituency_id('003'), '003-17', 'Chibombo', 16950, true),
+    (get_constituency_id('016'), '016-15', 'Twatasha', 17000, true),
+    (get_constituency_id('003'), '003-18', 'Chitanda', 17050, true),
+    (get_constituency_id('003'), '003-20', 'Keembe', 17100, true),
+    (get_constituency_id('016'), '016-16', 'Chifwembe', 17150, true),
+    (get_constituency_id('003'), '003-21', 'Lunjofwa', 17200, true),
+    (get_constituency_id('003'), '003-22', 'Ipongo', 17250, true),
+    (get_constituency_id('004'), '004-02', 'Muwowo East', 17300, true),
+    (get_constituency_id('004'), '004-04', 'Chimanimani', 17350, true),
+    (get_constituency_id('004'), '004-07', 'Ben Kapufi', 17400, true),
+    (get_constituency_id('004'), '004-08', 'Makululu', 17450, true),
+    (get_constituency_id('004'), '004-09', 'Moomba', 17500, true),
+    (get_constituency_id('005'), '005-24', 'Kalonga', 17550, true),
+    (get_constituency_id('004'), '004-10', 'Zambezi', 17600, true),
+    (get_constituency_id('004'), '004-13', 'Munyama', 17650, true),
+    (get_constituency_id('004'), '004-11', 'Kangomba', 17700, true),
+    (get_constituency_id('004'), '004-12', 'Chinyanja', 17750, true),
+    (get_constituency_id('015'), '015-12', 'James Phiri', 17800, true),
+    (get_constituency_id('004'), '004-14', 'Munga', 17850, true),
+    (get_constituency_id('015'), '015-16', 'Yeta', 17900, true),
+    (get_constituency_id('004'), '004-15', 'Chililalila', 17950, true),
+    (get_constituency_id('004'), '004-23', 'Ngungu', 18000, true),
+    (get_constituency_id('005'), '005-16', 'Mpima', 18050, true),
+    (get_constituency_id('005'), '005-17', 'Luansase', 18100, true),
+    (get_constituency_id('005'), '005-21', 'Justine Kabwe', 18150, true),
+    (get_constituency_id('005'), '005-18', 'Waya', 18200, true),
+    (get_constituency_id('015'), '015-17', 'Ngebe', 18250, true),
+    (get_constituency_id('005'), '005-19', 'Chirwa', 18300, true),
+    (get_constituency_id('005'), '005-20', 'Njanji', 18350, true),
+    (get_constituency_id('016'), '016-17', 'Chabanyama', 18400, true),
+    (get_constituency_id('005'), '005-22', 'David Ramushu', 18450, true),
+    (get_constituency_id('005'), '005-23', 'Highridge', 18500, true),
+    (get_constituency_id('005'), '005-25', 'Luangwa', 18550, true),
+    (get_constituency_id('005'), '005-26', 'Nakoli', 18600, true),
+    (get_constituency_id('005'), '005-27', 'Kaputula', 18650, true),
+    (get_constituency_id('006'), '006-01', 'Ngabwe', 18700, true),
+    (get_constituency_id('006'), '006-02', 'Mukumbwe', 18750, true),
+    (get_constituency_id('006'), '006-03', 'Luanchele', 18800, true),
+    (get_constituency_id('007'), '007-04', 'Chibefwe', 18850, true),
+    (get_constituency_id('007'), '007-05', 'Nkumbi', 18900, true),
+    (get_constituency_id('006'), '006-04', 'Chipepo', 18950, true),
+    (get_constituency_id('007'), '007-06', 'Mushibemba', 19000, true),
+    (get_constituency_id('007'), '007-07', 'Nshinso', 19050, true),
+    (get_constituency_id('007'), '007-08', 'Matuka', 19100, true),
+    (get_constituency_id('007'), '007-09', 'Tembwe', 19150, true),
+    (get_constituency_id('007'), '007-10', 'Munda', 19200, true),
+    (get_constituency_id('007'), '007-11', 'Chikanda', 19250, true),
+    (get_constituency_id('008'), '008-12', 'Kalwa', 19300, true),
+    (get_constituency_id('008'), '008-13', 'Chingombe', 19350, true),
+    (get_constituency_id('008'), '008-14', 'Nkomashi', 19400, true),
+    (get_constituency_id('008'), '008-15', 'Kamimbya', 19450, true),
+    (get_constituency_id('008'), '008-16', 'Chapaba', 19500, true),
+    (get_constituency_id('006'), '006-05', 'Kapandwe', 19550, true),
+    (get_constituency_id('006'), '006-06', 'Mpunde', 19600, true),
+    (get_constituency_id('006'), '006-07', 'Chimbwelo', 19650, true),
+    (get_constituency_id('006'), '006-08', 'Kapiri Central', 19700, true),
+    (get_constituency_id('006'), '006-09', 'Kashitu', 19750, true),
+    (get_constituency_id('006'), '006-10', 'Mushimbili', 19800, true),
+    (get_constituency_id('006'), '006-11', 'Lunchu', 19850, true),
+    (get_constituency_id('006'), '006-12', 'Chang''ondo', 19900, true),
+    (get_constituency_id('006'), '006-13', 'Kakwelesa', 19950, true),
+    (get_constituency_id('006'), '006-14', 'Kapumba', 20000, true),
+    (get_constituency_id('007'), '007-01', 'Masofu', 20050, true),
+    (get_constituency_id('007'), '007-02', 'Upper Lunsefwa', 20100, true),
+    (get_constituency_id('007'), '007-03', 'Chalata', 20150, true),
+    (get_constituency_id('008'), '008-17', 'Mwalala', 20200, true),
+    (get_constituency_id('009'), '009-17', 'Lutondo', 20250, true),
+    (get_constituency_id('017'), '017-02', 'Kwacha', 20300, true),
+    (get_constituency_id('009'), '009-18', 'Chabota', 20350, true),
+    (get_constituency_id('009'), '009-19', 'Kalundu', 20400, true),
+    (get_constituency_id('009'), '009-20', 'Milandu', 20450, true),
+    (get_constituency_id('009'), '009-21', 'Makombwe', 20500, true),
+    (get_constituency_id('009'), '009-22', 'Nampundwe', 20550, true),
+    (get_constituency_id('010'), '010-01', 'Nalusanga', 20600, true),
+    (get_constituency_id('010'), '010-02', 'Lutale', 20650, true),
+    (get_constituency_id('010'), '010-03', 'Kalwanyembe', 20700, true),
+    (get_constituency_id('013'), '013-11', 'Kabansa', 20750, true),
+    (get_constituency_id('010'), '010-04', 'Mpusu', 20800, true),
+    (get_constituency_id('010'), '010-06', 'Mupona', 20850, true),
+    (get_constituency_id('010'), '010-07', 'Chibolyo', 20900, true),
+    (get_constituency_id('010'), '010-08', 'Nambala', 20950, true),
+    (get_constituency_id('010'), '010-09', 'Shimbizhi', 21000, true),
+    (get_constituency_id('011'), '011-10', 'Nakasaka', 21050, true),
+    (get_constituency_id('011'), '011-11', 'Nangoma', 21100, true),
+    (get_constituency_id('015'), '015-03', 'Joseph Mwila', 21150, true),
+    (get_constituency_id('011'), '011-12', 'Myooye', 21200, true),
+    (get_constituency_id('011'), '011-13', 'Shichanzu', 21250, true),
+    (get_constituency_id('011'), '011-14', 'Nalubanda', 21300, true),
+    (get_constituency_id('011'), '011-15', 'Choma', 21350, true),
+    (get_constituency_id('011'), '011-16', 'Chisalu', 21400, true),
+    (get_constituency_id('012'), '012-01', 'Lulimala', 21450, true),
+    (get_constituency_id('015'), '015-04', 'Anoya Zulu', 21500, true),
+    (get_constituency_id('012'), '012-02', 'Mpelembe', 21550, true),
+    (get_constituency_id('012'), '012-03', 'Chipundu', 21600, true),
+    (get_constituency_id('012'), '012-04', 'Luombwa', 21650, true),
+    (get_constituency_id('012'), '012-05', 'Chalilo', 21700, true),
+    (get_constituency_id('012'), '012-06', 'Chitambo', 21750, true),
+    (get_constituency_id('012'), '012-07', 'Muchinka', 21800, true),
+    (get_constituency_id('013'), '013-08', 'Mailo', 21850, true),
+    (get_constituency_id('013'), '013-09', 'Kanona', 21900, true),
+    (get_constituency_id('013'), '013-10', 'Serenje', 21950, true),
+    (get_constituency_id('013'), '013-12', 'Chisomo', 22000, true),
+    (get_constituency_id('013'), '013-13', 'Lukunsanshi', 22050, true),
+    (get_constituency_id('013'), '013-14', 'Sancha', 22100, true),
+    (get_constituency_id('015'), '015-08', 'Kakoso', 22150, true),
+    (get_constituency_id('013'), '013-15', 'Chibale', 22200, true),
+    (get_constituency_id('013'), '013-16', 'Masaninga', 22250, true),
+    (get_constituency_id('014'), '014-17', 'Kabamba', 22300, true),
+    (get_constituency_id('014'), '014-18', 'Ibolelo', 22350, true),
+    (get_constituency_id('014'), '014-19', 'Muchinga', 22400, true),
+    (get_constituency_id('014'), '014-20', 'Nganswa', 22450, true),
+    (get_constituency_id('014'), '014-21', 'Lupiya', 22500, true),
+    (get_constituency_id('014'), '014-22', 'Musangashi', 22550, true),
+    (get_constituency_id('015'), '015-01', 'Chilimina', 22600, true),
+    (get_constituency_id('015'), '015-02', 'Miyanda', 22650, true),
+    (get_constituency_id('015'), '015-05', 'Kawama', 22700, true),
+    (get_constituency_id('015'), '015-06', 'Miteta', 22750, true),
+    (get_constituency_id('015'), '015-07', 'Chitambi', 22800, true),
+    (get_constituency_id('015'), '015-11', 'Mathew Nkoloma', 22850, true),
+    (get_constituency_id('015'), '015-09', 'Kafue', 22900, true),
+    (get_constituency_id('015'), '015-10', 'Mvula', 22950, true),
+    (get_constituency_id('015'), '015-13', 'Silwizya', 23000, true),
+    (get_constituency_id('017'), '017-03', 'Sekela', 23050, true),
+    (get_constituency_id('015'), '015-14', 'Helen Kaunda', 23100, true),
+    (get_constituency_id('015'), '015-15', 'Chitimukulu', 23150, true),
+    (get_constituency_id('015'), '015-19', 'Mukuka', 23200, true),
+    (get_constituency_id('015'), '015-20', 'Yotam Muleya', 23250, true),
+    (get_constituency_id('015'), '015-21', 'Nakatindi', 23300, true),
+    (get_constituency_id('015'), '015-22', 'Mumba', 23350, true),
+    (get_constituency_id('016'), '016-13', 'Mimbula', 23400, true),
+    (get_constituency_id('016'), '016-14', 'Lulamba', 23450, true),
+    (get_constituency_id('016'), '016-18', 'Maiteneke', 23500, true),
+    (get_constituency_id('016'), '016-19', 'Chitimukulu', 23550, true),
+    (get_constituency_id('016'), '016-20', 'Chikola', 23600, true),
+    (get_constituency_id('016'), '016-21', 'Chiwempala', 23650, true),
+    (get_constituency_id('016'), '016-22', 'Kabungo', 23700, true),
+    (get_constituency_id('016'), '016-23', 'Kalilo', 23750, true),
+    (get_constituency_id('016'), '016-24', 'Ipafu', 23800, true),
+    (get_constituency_id('016'), '016-25', 'Muchinshi', 23850, true),
+    (get_constituency_id('016'), '016-26', 'Mutenda', 23900, true),
+    (get_constituency_id('016'), '016-27', 'Chingola', 23950, true),
+    (get_constituency_id('017'), '017-04', 'Nsansa', 24000, true),
+    (get_constituency_id('017'), '017-01', 'Nchanga', 24050, true),
+    (get_constituency_id('017'), '017-06', 'Kabundi', 24100, true),
+    (get_constituency_id('017'), '017-07', 'Kasala', 24150, true),
+    (get_constituency_id('017'), '017-08', 'Kapisha', 24200, true),
+    (get_constituency_id('018'), '018-08', 'Kalanga', 24250, true),
+    (get_constituency_id('017'), '017-09', 'Luano', 24300, true),
+    (get_constituency_id('018'), '018-09', 'Lubuto', 24350, true),
+    (get_constituency_id('018'), '018-10', 'Kalungwishi', 24400, true),
+    (get_constituency_id('017'), '017-10', 'Bupalo', 24450, true),
+    (get_constituency_id('018'), '018-11', 'Luapula', 24500, true),
+    (get_constituency_id('018'), '018-01', 'Musakashi', 24550, true),
+    (get_constituency_id('018'), '018-02', 'Chambishi', 24600, true),
+    (get_constituency_id('018'), '018-03', 'Twaiteka', 24650, true),
+    (get_constituency_id('018'), '018-12', 'Ngweshi', 24700, true),
+    (get_constituency_id('018'), '018-13', 'Kalengwa', 24750, true),
+    (get_constituency_id('018'), '018-04', 'Lukoshi', 24800, true),
+    (get_constituency_id('018'), '018-14', 'Chibuluma', 24850, true),
+    (get_constituency_id('018'), '018-05', 'Lulamba', 24900, true),
+    (get_constituency_id('018'), '018-06', 'Mwambashi', 24950, true),
+    (get_constituency_id('018'), '018-07', 'Ichimpe', 25000, true),
+    (get_constituency_id('019'), '019-05', 'Lubuto', 25050, true),
+    (get_constituency_id('018'), '018-16', 'Chisupa', 25100, true),
+    (get_constituency_id('018'), '018-17', 'Buseko', 25150, true),
+    (get_constituency_id('018'), '018-18', 'Dongwe', 25200, true),
+    (get_constituency_id('018'), '018-19', 'Kafue', 25250, true),
+    (get_constituency_id('018'), '018-20', 'Chankalamo', 25300, true),
+    (get_constituency_id('018'), '018-21', 'Chati', 25350, true),
+    (get_constituency_id('018'), '018-22', 'Chembe', 25400, true),
+    (get_constituency_id('019'), '019-01', 'Itimpi', 25450, true),
+    (get_constituency_id('019'), '019-06', 'Chimwemwe', 25500, true),
+    (get_constituency_id('019'), '019-02', 'Twatasha', 25550, true),
+    (get_constituency_id('019'), '019-03', 'Kawama', 25600, true),
+    (get_constituency_id('019'), '019-04', 'Buntungwa', 25650, true),
+    (get_constituency_id('020'), '020-13', 'Bupe', 25700, true),
+    (get_constituency_id('021'), '021-07', 'Kwacha', 25750, true),
+    (get_constituency_id('020'), '020-14', 'Ndeke', 25800, true),
+    (get_constituency_id('025'), '025-18', 'Kafue', 25850, true),
+    (get_constituency_id('020'), '020-15', 'Kafue', 25900, true),
+    (get_constituency_id('020'), '020-16', 'Kamfinsa', 25950, true),
+    (get_constituency_id('021'), '021-08', 'Bulangililo', 26000, true),
+    (get_constituency_id('022'), '022-24', 'Buchi', 26050, true),
+    (get_constituency_id('021'), '021-09', 'Ipusukilo', 26100, true),
+    (get_constituency_id('021'), '021-10', 'Chantete', 26150, true),
+    (get_constituency_id('021'), '021-11', 'Riverside', 26200, true),
+    (get_constituency_id('021'), '021-12', 'Lubwa', 26250, true),
+    (get_constituency_id('022'), '022-22', 'Rokana', 26300, true),
+    (get_constituency_id('022'), '022-23', 'Parklands', 26350, true),
+    (get_constituency_id('023'), '023-21', 'Wusakile', 26400, true),
+    (get_constituency_id('022'), '022-25', 'Mukuba', 26450, true),
+    (get_constituency_id('022'), '022-26', 'Miseshi', 26500, true),
+    (get_constituency_id('022'), '022-27', 'Mindolo', 26550, true),
+    (get_constituency_id('022'), '022-28', 'Kamakonde', 26600, true),
+    (get_constituency_id('023'), '023-17', 'Limaposa', 26650, true),
+    (get_constituency_id('023'), '023-18', 'Luangwa', 26700, true),
+    (get_constituency_id('023'), '023-19', 'Chamboli', 26750, true),
+    (get_constituency_id('023'), '023-20', 'Chibote', 26800, true),
+    (get_constituency_id('024'), '024-01', 'Misaka', 26850, true),
+    (get_constituency_id('024'), '024-13', 'Mulungushi', 26900, true),
+    (get_constituency_id('024'), '024-02', 'Fisenge', 26950, true),
+    (get_constituency_id('024'), '024-03', 'Twashuka', 27000, true),
+    (get_constituency_id('024'), '024-04', 'Chitwi', 27050, true),
+    (get_constituency_id('025'), '025-22', 'Nkulumashimba', 27100, true),
+    (get_constituency_id('024'), '024-05', 'Kanseshi', 27150, true),
+    (get_constituency_id('025'), '025-23', 'Baluba', 27200, true),
+    (get_constituency_id('024'), '024-06', 'Buntungwa', 27250, true),
+    (get_constituency_id('024'), '024-07', 'Mpelembe', 27300, true),
+    (get_constituency_id('024'), '024-08', 'Buteko', 27350, true),
+    (get_constituency_id('025'), '025-24', 'Milyashi', 27400, true),
+    (get_constituency_id('024'), '024-09', 'James Phiri', 27450, true),
+    (get_constituency_id('025'), '025-25', 'Ngebe', 27500, true),
+    (get_constituency_id('024'), '024-10', 'Levi Chiko', 27550, true),
+    (get_constituency_id('025'), '025-26', 'Kansengu', 27600, true),
+    (get_constituency_id('024'), '024-11', 'Mikomfwa', 27650, true),
+    (get_constituency_id('024'), '024-12', 'Zambezi', 27700, true),
+    (get_constituency_id('024'), '024-14', 'Mipundu', 27750, true),
+    (get_constituency_id('025'), '025-17', 'Lumumba', 27800, true),
+    (get_constituency_id('025'), '025-15', 'Kafubu', 27850, true),
+    (get_constituency_id('025'), '025-16', 'Nkoloma', 27900, true),
+    (get_constituency_id('025'), '025-19', 'Chilabula', 27950, true),
+    (get_constituency_id('025'), '025-20', 'Mpatamatu', 28000, true),
+    (get_constituency_id('025'), '025-21', 'Justine Kabwe', 28050, true),
+    (get_constituency_id('025'), '025-27', 'Kawama', 28100, true),
+    (get_constituency_id('025'), '025-28', 'Muva Hill', 28150, true),
+    (get_constituency_id('030'), '030-01', 'Kasanta', 28200, true),
+    (get_constituency_id('030'), '030-09', 'Chantete', 28250, true),
+    (get_constituency_id('030'), '030-03', 'Boso', 28300, true),
+    (get_constituency_id('030'), '030-04', 'Kansonka', 28350, true),
+    (get_constituency_id('030'), '030-05', 'Kafubu', 28400, true),
+    (get_constituency_id('030'), '030-06', 'Chinbanga', 28450, true),
+    (get_constituency_id('030'), '030-14', 'Lufwanyama', 28500, true),
+    (get_constituency_id('030'), '030-15', 'Luswishi', 28550, true),
+    (get_constituency_id('030'), '030-16', 'Mushingashi', 28600, true),
+    (get_constituency_id('030'), '030-07', 'Sokotwe', 28650, true),
+    (get_constituency_id('030'), '030-08', 'Mibenge', 28700, true),
+    (get_constituency_id('030'), '030-10', 'Bulaya', 28750, true),
+    (get_constituency_id('030'), '030-11', 'Mukumbo', 28800, true),
+    (get_constituency_id('030'), '030-12', 'Mwelushi', 28850, true),
+    (get_constituency_id('030'), '030-13', 'Mpindi', 28900, true),
+    (get_constituency_id('029'), '029-01', 'Mwatishi', 28950, true),
+    (get_constituency_id('029'), '029-02', 'Majaliwa', 29000, true),
+    (get_constituency_id('029'), '029-03', 'Chondwe', 29050, true),
+    (get_constituency_id('026'), '026-22', 'Buntungwa', 29100, true),
+    (get_constituency_id('026'), '026-23', 'Kangwa Nsuluka', 29150, true),
+    (get_constituency_id('029'), '029-04', 'Mutaba', 29200, true),
+    (get_constituency_id('029'), '029-05', 'Miengwe', 29250, true),
+    (get_constituency_id('029'), '029-06', 'Katonte', 29300, true),
+    (get_constituency_id('029'), '029-07', 'Ishitwe', 29350, true),
+    (get_constituency_id('036'), '036-28', 'Kaniki', 29400, true),
+    (get_constituency_id('031'), '031-08', 'Kashitu', 29450, true),
+    (get_constituency_id('027'), '027-02', 'Mulundu', 29500, true),
+    (get_constituency_id('031'), '031-09', 'Luansobe', 29550, true),
+    (get_constituency_id('027'), '027-06', 'Mulungushi', 29600, true),
+    (get_constituency_id('031'), '031-10', 'Chinondo', 29650, true),
+    (get_constituency_id('026'), '026-26', 'Kwacha', 29700, true),
+    (get_constituency_id('031'), '031-11', 'Mishikishi', 29750, true),
+    (get_constituency_id('026'), '026-27', 'Fibusa', 29800, true),
+    (get_constituency_id('031'), '031-12', 'Masangano', 29850, true),
+    (get_constituency_id('031'), '031-13', 'Lumano', 29900, true),
+    (get_constituency_id('026'), '026-28', 'Mpelembe', 29950, true),
+    (get_constituency_id('031'), '031-14', 'Katuba', 30000, true),
+    (get_constituency_id('031'), '031-15', 'Shimibanga', 30050, true),
+    (get_constituency_id('031'), '031-16', 'Chilulu', 30100, true),
+    (get_constituency_id('031'), '031-17', 'Miputu', 30150, true),
+    (get_constituency_id('032'), '032-01', 'Luswishi', 30200, true),
+    (get_constituency_id('027'), '027-07', 'Shinde', 30250, true),
+    (get_constituency_id('032'), '032-02', 'Kasonga', 30300, true),
+    (get_constituency_id('032'), '032-03', 'Munkumpu', 30350, true),
+    (get_constituency_id('027'), '027-01', 'Minambe', 30400, true),
+    (get_constituency_id('032'), '032-04', 'Kashiba', 30450, true),
+    (get_constituency_id('032'), '032-05', 'Mpongwe', 30500, true),
+    (get_constituency_id('032'), '032-06', 'Kanyenda', 30550, true),
+    (get_constituency_id('032'), '032-07', 'Kasamba', 30600, true),
+    (get_constituency_id('032'), '032-08', 'Ibenga', 30650, true),
+    (get_constituency_id('032'), '032-09', 'Kalweo', 30700, true),
+    (get_constituency_id('026'), '026-24', 'Luansobe', 30750, true),
+    (get_constituency_id('032'), '032-10', 'Mikata', 30800, true),
+    (get_constituency_id('032'), '032-11', 'Nampamba', 30850, true),
+    (get_constituency_id('032'), '032-12', 'Musofu', 30900, true),
+    (get_constituency_id('026'), '026-25', 'Butondo', 30950, true),
+    (get_constituency_id('027'), '027-08', 'Bwembya Silwizya', 31000, true),
+    (get_constituency_id('032'), '032-13', 'Impumbu', 31050, true),
+    (get_constituency_id('026'), '026-21', 'John Kapengele', 31100, true),
+    (get_constituency_id('027'), '027-03', 'Francis Mukuka', 31150, true),
+    (get_constituency_id('027'), '027-04', 'Maina Soko', 31200, true),
+    (get_constituency_id('027'), '027-05', 'Bwafwano', 31250, true),
+    (get_constituency_id('028'), '028-12', 'Bwananyina', 31300, true),
+    (get_constituency_id('028'), '028-13', 'David Kaunda', 31350, true),
+    (get_constituency_id('028'), '028-14', 'Chachacha', 31400, true),
+    (get_constituency_id('028'), '028-17', 'Kansuswa', 31450, true),
+    (get_constituency_id('028'), '028-18', 'Kafue', 31500, true),
+    (get_constituency_id('033'), '033-11', 'Itawa', 31550, true),
+    (get_constituency_id('028'), '028-19', 'Kawama', 31600, true),
+    (get_constituency_id('028'), '028-20', 'Hanky Kalanga', 31650, true),
+    (get_constituency_id('033'), '033-12', 'Munkulungwe', 31700, true),
+    (get_constituency_id('033'), '033-13', 'Twashuka', 31750, true),
+    (get_constituency_id('033'), '033-14', 'Kavu', 31800, true),
+    (get_constituency_id('033'), '033-15', 'Mushili', 31850, true),
+    (get_constituency_id('034'), '034-01', 'Pamodzi', 31900, true),
+    (get_constituency_id('034'), '034-02', 'Kawama', 31950, true),
+    (get_constituency_id('034'), '034-03', 'Fibobe', 32000, true),
+    (get_constituency_id('034'), '034-04', 'Chifubu', 32050, true),
+    (get_constituency_id('034'), '034-05', 'Kamba', 32100, true),
+    (get_constituency_id('035'), '035-17', 'Kantolomba', 32150, true),
+    (get_constituency_id('035'), '035-16', 'Chichele', 32200, true),
+    (get_constituency_id('035'), '035-18', 'Lubuto', 32250, true),
+    (get_constituency_id('035'), '035-19', 'Mukuba', 32300, true),
+    (get_constituency_id('035'), '035-22', 'Kabushi', 32350, true),
+    (get_constituency_id('035'), '035-23', 'Kafubu', 32400, true),
+    (get_constituency_id('035'), '035-24', 'Skyways', 32450, true),
+    (get_constituency_id('035'), '035-25', 'Masala', 32500, true),
+    (get_constituency_id('095'), '095-06', 'Kawimbe', 32550, true),
+    (get_constituency_id('036'), '036-06', 'Kanseshi', 32600, true),
+    (get_constituency_id('036'), '036-07', 'Nkwazi', 32650, true),
+    (get_constituency_id('036'), '036-08', 'Yengwe', 32700, true),
+    (get_constituency_id('038'), '038-17', 'Dzozwe', 32750, true),
+    (get_constituency_id('038'), '038-18', 'Vubwi', 32800, true),
+    (get_constituency_id('036'), '036-09', 'Chipulukusu', 32850, true),
+    (get_constituency_id('039'), '039-05', 'Ndunda', 32900, true),
+    (get_constituency_id('044'), '044-05', 'Kazimule', 32950, true),
+    (get_constituency_id('036'), '036-10', 'Kanini', 33000, true),
+    (get_constituency_id('039'), '039-11', 'Mwalala', 33050, true),
+    (get_constituency_id('039'), '039-12', 'Muchinga', 33100, true),
+    (get_constituency_id('046'), '046-15', 'Chimtende', 33150, true),
+    (get_constituency_id('046'), '046-16', 'Lukweta', 33200, true),
+    (get_constituency_id('046'), '046-17', 'Mkaika', 33250, true),
+    (get_constituency_id('046'), '046-18', 'Matunga', 33300, true),
+    (get_constituency_id('036'), '036-26', 'Twapia', 33350, true),
+    (get_constituency_id('050'), '050-09', 'Vuu', 33400, true),
+    (get_constituency_id('036'), '036-27', 'Dag Hammersjoed', 33450, true),
+    (get_constituency_id('037'), '037-01', 'Mangwe', 33500, true),
+    (get_constituency_id('037'), '037-02', 'Naviluri', 33550, true),
+    (get_constituency_id('037'), '037-03', 'Chilenga', 33600, true),
+    (get_constituency_id('037'), '037-04', 'Chamandala', 33650, true),
+    (get_constituency_id('037'), '037-05', 'Kampini', 33700, true),
+    (get_constituency_id('037'), '037-06', 'Ambidzi', 33750, true),
+    (get_constituency_id('037'), '037-07', 'Taferansoni', 33800, true),
+    (get_constituency_id('037'), '037-09', 'Kandabwako', 33850, true),
+    (get_constituency_id('037'), '037-10', 'Chadiza', 33900, true),
+    (get_constituency_id('071'), '071-15', 'Mankhokwe', 33950, true),
+    (get_constituency_id('037'), '037-11', 'Nsadzu', 34000, true),
+    (get_constituency_id('037'), '037-12', 'Manje', 34050, true),
+    (get_constituency_id('037'), '037-21', 'Chanjowe', 34100, true),
+    (get_constituency_id('037'), '037-22', 'Kapachi', 34150, true),
+    (get_constituency_id('038'), '038-08', 'Kabvumo', 34200, true),
+    (get_constituency_id('038'), '038-13', 'Nkhumba', 34250, true),
+    (get_constituency_id('038'), '038-14', 'Mwangazi', 34300, true),
+    (get_constituency_id('038'), '038-15', 'Mbozi', 34350, true),
+    (get_constituency_id('038'), '038-16', 'Mlawe', 34400, true),
+    (get_constituency_id('038'), '038-19', 'Chisiya', 34450, true),
+    (get_constituency_id('038'), '038-20', 'Chimphanje', 34500, true),
+    (get_constituency_id('040'), '040-13', 'Chipala', 34550, true),
+    (get_constituency_id('040'), '040-20', 'Vilimukulu', 34600, true),
+    (get_constituency_id('040'), '040-22', 'Mapamba', 34650, true),
+    (get_constituency_id('039'), '039-01', 'Mazonde', 34700, true),
+    (get_constituency_id('039'), '039-02', 'Nkhankha', 34750, true),
+    (get_constituency_id('039'), '039-03', 'Luangwa', 34800, true),
+    (get_constituency_id('039'), '039-04', 'Chisunga', 34850, true),
+    (get_constituency_id('039'), '039-06', 'Mbazi', 34900, true),
+    (get_constituency_id('039'), '039-07', 'Manthepa', 34950, true),
+    (get_constituency_id('039'), '039-08', 'Mphalausenga', 35000, true),
+    (get_constituency_id('039'), '039-09', 'Kalinkhu', 35050, true),
+    (get_constituency_id('039'), '039-10', 'Kamphemba', 35100, true),
+    (get_constituency_id('040'), '040-14', 'Bazimu', 35150, true),
+    (get_constituency_id('040'), '040-15', 'Mabinga', 35200, true),
+    (get_constituency_id('075'), '075-01', 'Nkoloma', 35250, true),
+    (get_constituency_id('040'), '040-16', 'Lupamazi', 35300, true),
+    (get_constituency_id('040'), '040-17', 'Lumezi', 35350, true),
+    (get_constituency_id('075'), '075-02', 'Chawama', 35400, true),
+    (get_constituency_id('040'), '040-18', 'Chibungwe', 35450, true),
+    (get_constituency_id('040'), '040-19', 'Lunzi', 35500, true),
+    (get_constituency_id('040'), '040-21', 'Chilenje', 35550, true),
+    (get_constituency_id('075'), '075-03', 'John Howard', 35600, true),
+    (get_constituency_id('041'), '041-13', 'Sisinje', 35650, true),
+    (get_constituency_id('041'), '041-14', 'Nthope', 35700, true),
+    (get_constituency_id('041'), '041-15', 'Chipangali', 35750, true),
+    (get_constituency_id('041'), '041-16', 'Kasenga', 35800, true),
+    (get_constituency_id('076'), '076-08', 'Chilenje', 35850, true),
+    (get_constituency_id('041'), '041-17', 'Rukuzye', 35900, true),
+    (get_constituency_id('078'), '078-13', 'Silwizya', 35950, true),
+    (get_constituency_id('041'), '041-18', 'Rukuzye', 36000, true),
+    (get_constituency_id('079'), '079-20', 'Chaisa', 36050, true),
+    (get_constituency_id('042'), '042-19', 'Msanga', 36100, true),
+    (get_constituency_id('042'), '042-20', 'Kanjala', 36150, true),
+    (get_constituency_id('079'), '079-21', 'Justine Kabwe', 36200, true),
+    (get_constituency_id('042'), '042-21', 'Dilika', 36250, true),
+    (get_constituency_id('042'), '042-22', 'Kapata', 36300, true),
+    (get_constituency_id('043'), '043-06', 'Makungwa', 36350, true),
+    (get_constituency_id('043'), '043-07', 'Chingazi', 36400, true),
+    (get_constituency_id('043'), '043-08', 'Kwenje', 36450, true),
+    (get_constituency_id('043'), '043-09', 'Ng''ongwe', 36500, true),
+    (get_constituency_id('043'), '043-10', 'Mkowe', 36550, true),
+    (get_constituency_id('044'), '044-04', 'Chikando', 36600, true),
+    (get_constituency_id('043'), '043-11', 'Mboza', 36650, true),
+    (get_constituency_id('043'), '043-12', 'Chiparamba', 36700, true),
+    (get_constituency_id('044'), '044-01', 'Nsingo', 36750, true),
+    (get_constituency_id('096'), '096-06', 'Chilumba', 36800, true),
+    (get_constituency_id('044'), '044-02', 'Khova', 36850, true),
+    (get_constituency_id('090'), '090-07', 'Mulilansolo', 36900, true),
+    (get_constituency_id('044'), '044-03', 'Makangila', 36950, true),
+    (get_constituency_id('103'), '103-01', 'Chambi', 37000, true),
+    (get_constituency_id('045'), '045-01', 'Kafumbwe', 37050, true),
+    (get_constituency_id('045'), '045-02', 'Kazala', 37100, true),
+    (get_constituency_id('045'), '045-03', 'Milanzi', 37150, true),
+    (get_constituency_id('045'), '045-04', 'Kapoche', 37200, true),
+    (get_constituency_id('103'), '103-02', 'Sewe', 37250, true),
+    (get_constituency_id('103'), '103-03', 'Lingelengenda', 37300, true),
+    (get_constituency_id('045'), '045-05', 'Chindwale', 37350, true),
+    (get_constituency_id('045'), '045-06', 'Kapangulula', 37400, true),
+    (get_constituency_id('103'), '103-04', 'Chiyeke', 37450, true),
+    (get_constituency_id('045'), '045-07', 'Dole', 37500, true),
+    (get_constituency_id('045'), '045-08', 'Chimwa', 37550, true),
+    (get_constituency_id('045'), '045-09', 'Mwandafisi', 37600, true),
+    (get_constituency_id('045'), '045-10', 'Katiula', 37650, true),
+    (get_constituency_id('046'), '046-12', 'Chavuka', 37700, true),
+    (get_constituency_id('046'), '046-13', 'Kadula', 37750, true),
+    (get_constituency_id('046'), '046-14', 'Vulamkoko', 37800, true),
+    (get_constituency_id('047'), '047-19', 'Kamwaza', 37850, true),
+    (get_constituency_id('091'), '091-13', 'Kapumaula', 37900, true),
+    (get_constituency_id('047'), '047-20', 'Nchingilizya', 37950, true),
+    (get_constituency_id('047'), '047-21', 'Luandazi', 38000, true),
+    (get_constituency_id('091'), '091-14', 'Chibundu', 38050, true),
+    (get_constituency_id('103'), '103-05', 'Kalombo Kamisamba', 38100, true),
+    (get_constituency_id('047'), '047-22', 'Chiwuyu', 38150, true),
+    (get_constituency_id('047'), '047-23', 'Sinda', 38200, true),
+    (get_constituency_id('093'), '093-15', 'Katopola', 38250, true),
+    (get_constituency_id('047'), '047-24', 'Mnyamanzi', 38300, true),
+    (get_constituency_id('103'), '103-07', 'Chavuma', 38350, true),
+    (get_constituency_id('047'), '047-25', 'Nyamasonkho', 38400, true),
+    (get_constituency_id('047'), '047-26', 'Mngo''mba', 38450, true),
+    (get_constituency_id('047'), '047-27', 'Kasangazi', 38500, true),
+    (get_constituency_id('047'), '047-28', 'Chitawe', 38550, true),
+    (get_constituency_id('048'), '048-01', 'Manda Hill', 38600, true),
+    (get_constituency_id('048'), '048-02', 'Magodi', 38650, true),
+    (get_constituency_id('133'), '133-02', 'Namazambwe', 38700, true),
+    (get_constituency_id('048'), '048-03', 'Susa', 38750, true),
+    (get_constituency_id('048'), '048-04', 'Luwerezi', 38800, true),
+    (get_constituency_id('048'), '048-05', 'Kajilime', 38850, true),
+    (get_constituency_id('048'), '048-06', 'Kapirinsanga', 38900, true),
+    (get_constituency_id('048'), '048-07', 'Nkhanga', 38950, true),
+    (get_constituency_id('048'), '048-08', 'Membe', 39000, true),
+    (get_constituency_id('049'), '049-19', 'Chamtowa', 39050, true),
+    (get_constituency_id('050'), '050-10', 'Chaboli', 39100, true),
+    (get_constituency_id('049'), '049-20', 'Kachama', 39150, true),
+    (get_constituency_id('049'), '049-21', 'Wachitangachi', 39200, true),
+    (get_constituency_id('049'), '049-22', 'Kamimba', 39250, true),
+    (get_constituency_id('049'), '049-23', 'Kazembe', 39300, true),
+    (get_constituency_id('049'), '049-24', 'Lumimba', 39350, true),
+    (get_constituency_id('049'), '049-25', 'Lukusuzi', 39400, true),
+    (get_constituency_id('049'), '049-26', 'Diwa', 39450, true),
+    (get_constituency_id('049'), '049-27', 'Chibande', 39500, true),
+    (get_constituency_id('050'), '050-11', 'Mnyamazi', 39550, true),
+    (get_constituency_id('050'), '050-12', 'Ndonda', 39600, true),
+    (get_constituency_id('050'), '050-13', 'Msuzi', 39650, true),
+    (get_constituency_id('053'), '053-06', 'Lusinde', 39700, true),
+    (get_constituency_id('053'), '053-08', 'Manyane', 39750, true),
+    (get_constituency_id('050'), '050-14', 'Mkomba', 39800, true),
+    (get_constituency_id('065'), '065-08', 'Chipamba', 39850, true),
+    (get_constituency_id('050'), '050-15', 'Chilola', 39900, true),
+    (get_constituency_id('065'), '065-10', 'Chitutu', 39950, true),
+    (get_constituency_id('065'), '065-11', 'Munwa', 40000, true),
+    (get_constituency_id('050'), '050-16', 'Chimaliro', 40050, true),
+    (get_constituency_id('050'), '050-17', 'Nthintimila', 40100, true),
+    (get_constituency_id('050'), '050-18', 'Lunevwa', 40150, true),
+    (get_constituency_id('052'), '052-01', 'Chinsimbwe', 40200, true),
+    (get_constituency_id('052'), '052-02', 'Katipa', 40250, true),
+    (get_constituency_id('052'), '052-03', 'Vizimumba', 40300, true),
+    (get_constituency_id('052'), '052-04', 'Ngozi', 40350, true),
+    (get_constituency_id('052'), '052-05', 'Lwezi', 40400, true),
+    (get_constituency_id('052'), '052-06', 'Mtilizi', 40450, true),
+    (get_constituency_id('057'), '057-18', 'Mwansabombwe', 40500, true),
+    (get_constituency_id('052'), '052-07', 'Nyimba', 40550, true),
+    (get_constituency_id('052'), '052-08', 'Kaliwe', 40600, true),
+    (get_constituency_id('052'), '052-09', 'Chiweza', 40650, true),
+    (get_constituency_id('052'), '052-10', 'Mombe', 40700, true),
+    (get_constituency_id('052'), '052-11', 'Chamilala', 40750, true),
+    (get_constituency_id('052'), '052-12', 'Chinambi', 40800, true),
+    (get_constituency_id('052'), '052-13', 'Luangwa', 40850, true),
+    (get_constituency_id('057'), '057-19', 'Kakose', 40900, true),
+    (get_constituency_id('053'), '053-01', 'Kapoche', 40950, true),
+    (get_constituency_id('059'), '059-07', 'Mulenshi', 41000, true),
+    (get_constituency_id('060'), '060-16', 'lukola', 41050, true),
+    (get_constituency_id('053'), '053-02', 'Chingombe', 41100, true),
+    (get_constituency_id('061'), '061-08', 'Chilyapa', 41150, true),
+    (get_constituency_id('053'), '053-03', 'Mwangaila', 41200, true),
+    (get_constituency_id('063'), '063-07', 'Mpasa', 41250, true),
+    (get_constituency_id('063'), '063-08', 'Chibembe', 41300, true),
+    (get_constituency_id('063'), '063-10', 'Lundashi', 41350, true),
+    (get_constituency_id('063'), '063-11', 'Mambilima', 41400, true),
+    (get_constituency_id('063'), '063-12', 'Munwa', 41450, true),
+    (get_constituency_id('063'), '063-13', 'Nsomfi', 41500, true),
+    (get_constituency_id('064'), '064-14', 'Kalanga', 41550, true),
+    (get_constituency_id('053'), '053-04', 'Matambazi', 41600, true),
+    (get_constituency_id('064'), '064-16', 'Katiti', 41650, true),
+    (get_constituency_id('064'), '064-17', 'Chachacha', 41700, true),
+    (get_constituency_id('053'), '053-05', 'Kaumbwe', 41750, true),
+    (get_constituency_id('054'), '054-07', 'Manjazi', 41800, true),
+    (get_constituency_id('066'), '066-04', 'Kilwa', 41850, true),
+    (get_constituency_id('054'), '054-09', 'Msumbazi', 41900, true),
+    (get_constituency_id('066'), '066-06', 'Nchelenge', 41950, true),
+    (get_constituency_id('066'), '066-08', 'Chisenga', 42000, true),
+    (get_constituency_id('066'), '066-09', 'Kasamba', 42050, true),
+    (get_constituency_id('066'), '066-10', 'Mulwe', 42100, true),
+    (get_constituency_id('054'), '054-10', 'Ongolwe', 42150, true),
+    (get_constituency_id('054'), '054-11', 'Kovyane', 42200, true),
+    (get_constituency_id('054'), '054-12', 'Mbala', 42250, true),
+    (get_constituency_id('068'), '068-02', 'Kasansa', 42300, true),
+    (get_constituency_id('054'), '054-13', 'Nsimbo', 42350, true),
+    (get_constituency_id('054'), '054-15', 'Nyika', 42400, true),
+    (get_constituency_id('133'), '133-03', 'Mweenda', 42450, true),
+    (get_constituency_id('054'), '054-16', 'Chalimanyana', 42500, true),
+    (get_constituency_id('082'), '082-09', 'Mofu', 42550, true),
+    (get_constituency_id('055'), '055-14', 'Nyakawise', 42600, true),
+    (get_constituency_id('055'), '055-17', 'Singozi', 42650, true),
+    (get_constituency_id('055'), '055-18', 'Mateyo Mzeka', 42700, true),
+    (get_constituency_id('055'), '055-19', 'Mawanda', 42750, true),
+    (get_constituency_id('055'), '055-20', 'Lusangazi', 42800, true),
+    (get_constituency_id('055'), '055-21', 'Ukwimi', 42850, true),
+    (get_constituency_id('055'), '055-22', 'Chisangu', 42900, true),
+    (get_constituency_id('065'), '065-01', 'Lunchinda', 42950, true),
+    (get_constituency_id('065'), '065-02', 'Chipungu', 43000, true),
+    (get_constituency_id('065'), '065-03', 'Luau', 43050, true),
+    (get_constituency_id('065'), '065-04', 'Lambwe Chomba', 43100, true),
+    (get_constituency_id('065'), '065-05', 'Chiengi', 43150, true),
+    (get_constituency_id('065'), '065-06', 'Katete', 43200, true),
+    (get_constituency_id('065'), '065-07', 'Ifuna', 43250, true),
+    (get_constituency_id('065'), '065-09', 'Kalobwa', 43300, true),
+    (get_constituency_id('065'), '065-12', 'Kulungwishi', 43350, true),
+    (get_constituency_id('065'), '065-13', 'Munungu', 43400, true),
+    (get_constituency_id('066'), '066-07', 'Chilongo', 43450, true),
+    (get_constituency_id('056'), '056-01', 'Chisenga', 43500, true),
+    (get_constituency_id('056'), '056-02', 'Kabanse', 43550, true),
+    (get_constituency_id('056'), '056-03', 'Luela', 43600, true),
+    (get_constituency_id('056'), '056-04', 'Nthumbachushi', 43650, true),
+    (get_constituency_id('056'), '056-05', 'Kawambwa', 43700, true),
+    (get_constituency_id('056'), '056-06', 'Ngo''ona', 43750, true),
+    (get_constituency_id('056'), '056-07', 'Fisaka', 43800, true),
+    (get_constituency_id('056'), '056-13', 'Pambashe', 43850, true),
+    (get_constituency_id('056'), '056-14', 'Iyanga', 43900, true),
+    (get_constituency_id('057'), '057-15', 'Mununshi', 43950, true),
+    (get_constituency_id('057'), '057-16', 'Mulele', 44000, true),
+    (get_constituency_id('057'), '057-17', 'Lufubu', 44050, true),
+    (get_constituency_id('057'), '057-20', 'Chipita', 44100, true),
+    (get_constituency_id('057'), '057-21', 'Kayo', 44150, true),
+    (get_constituency_id('057'), '057-22', 'Mbereshi', 44200, true),
+    (get_constituency_id('058'), '058-08', 'Ilombe', 44250, true),
+    (get_constituency_id('058'), '058-10', 'Chibote', 44300, true),
+    (get_constituency_id('058'), '058-11', 'Chipili', 44350, true),
+    (get_constituency_id('058'), '058-12', 'Luongo', 44400, true),
+    (get_constituency_id('059'), '059-01', 'Mutuna', 44450, true),
+    (get_constituency_id('059'), '059-02', 'Misakalala', 44500, true),
+    (get_constituency_id('059'), '059-03', 'Kaole', 44550, true),
+    (get_constituency_id('059'), '059-04', 'Mushipashi', 44600, true),
+    (get_constituency_id('059'), '059-05', 'Chibeleka', 44650, true),
+    (get_constituency_id('059'), '059-06', 'Lukangaba', 44700, true),
+    (get_constituency_id('061'), '061-09', 'Muchinka', 44750, true),
+    (get_constituency_id('061'), '061-10', 'Mansa', 44800, true),
+    (get_constituency_id('061'), '061-11', 'Chansunsu', 44850, true),
+    (get_constituency_id('068'), '068-06', 'Kafumbo', 44900, true),
+    (get_constituency_id('061'), '061-12', 'Muyulu', 44950, true),
+    (get_constituency_id('061'), '061-13', 'Katanshi', 45000, true),
+    (get_constituency_id('061'), '061-14', 'Lwingashi', 45050, true),
+    (get_constituency_id('061'), '061-15', 'Luapula', 45100, true),
+    (get_constituency_id('060'), '060-01', 'Chiswishi', 45150, true),
+    (get_constituency_id('060'), '060-02', 'Mulumbi', 45200, true),
+    (get_constituency_id('060'), '060-03', 'Itembo', 45250, true),
+    (get_constituency_id('060'), '060-04', 'Lusumbwe', 45300, true),
+    (get_constituency_id('060'), '060-05', 'Milambo', 45350, true),
+    (get_constituency_id('060'), '060-06', 'Nsaka', 45400, true),
+    (get_constituency_id('060'), '060-07', 'Fibalala', 45450, true),
+    (get_constituency_id('060'), '060-08', 'Nsunga', 45500, true),
+    (get_constituency_id('060'), '060-09', 'Chipundu', 45550, true),
+    (get_constituency_id('060'), '060-10', 'Sokontwe', 45600, true),
+    (get_constituency_id('068'), '068-07', 'Chinkutila', 45650, true),
+    (get_constituency_id('060'), '060-11', 'Mumbotuta', 45700, true),
+    (get_constituency_id('060'), '060-12', 'Kapalala', 45750, true),
+    (get_constituency_id('060'), '060-13', 'Mikula', 45800, true),
+    (get_constituency_id('062'), '062-01', 'Nsenga', 45850, true),
+    (get_constituency_id('062'), '062-02', 'Mweshi', 45900, true),
+    (get_constituency_id('062'), '062-03', 'Mumbwe', 45950, true),
+    (get_constituency_id('062'), '062-04', 'Chibalashi', 46000, true),
+    (get_constituency_id('062'), '062-05', 'Nalumpembe', 46050, true),
+    (get_constituency_id('062'), '062-06', 'Nkonge', 46100, true),
+    (get_constituency_id('064'), '064-15', 'Kasengu', 46150, true),
+    (get_constituency_id('064'), '064-18', 'Kapela', 46200, true),
+    (get_constituency_id('064'), '064-19', 'Pabekabesa', 46250, true),
+    (get_constituency_id('064'), '064-20', 'Luche', 46300, true),
+    (get_constituency_id('064'), '064-21', 'Nkanga', 46350, true),
+    (get_constituency_id('064'), '064-22', 'Kaombe', 46400, true),
+    (get_constituency_id('068'), '068-08', 'Chishi', 46450, true),
+    (get_constituency_id('066'), '066-01', 'Kabuta', 46500, true),
+    (get_constituency_id('066'), '066-02', 'Mwatishi', 46550, true),
+    (get_constituency_id('066'), '066-03', 'Munkombwe', 46600, true),
+    (get_constituency_id('066'), '066-11', 'Shabo', 46650, true),
+    (get_constituency_id('066'), '066-12', 'Mofwe', 46700, true),
+    (get_constituency_id('066'), '066-13', 'Katofwo', 46750, true),
+    (get_constituency_id('067'), '067-11', 'Chimana', 46800, true),
+    (get_constituency_id('067'), '067-12', 'Mano', 46850, true),
+    (get_constituency_id('095'), '095-07', 'Mwamba', 46900, true),
+    (get_constituency_id('067'), '067-13', 'Katanshya', 46950, true),
+    (get_constituency_id('067'), '067-16', 'Isamba', 47000, true),
+    (get_constituency_id('067'), '067-17', 'Kapata', 47050, true),
+    (get_constituency_id('068'), '068-09', 'Chifunabuli', 47100, true),
+    (get_constituency_id('067'), '067-20', 'Musaba', 47150, true),
+    (get_constituency_id('067'), '067-21', 'Kapilibila', 47200, true),
+    (get_constituency_id('067'), '067-22', 'Lumamya', 47250, true),
+    (get_constituency_id('068'), '068-01', 'Masonde', 47300, true),
+    (get_constituency_id('068'), '068-03', 'Kasaba', 47350, true),
+    (get_constituency_id('068'), '068-04', 'Kapamba', 47400, true),
+    (get_constituency_id('068'), '068-10', 'Mbabala', 47450, true),
+    (get_constituency_id('068'), '068-05', 'Kasongole', 47500, true),
+    (get_constituency_id('069'), '069-14', 'Nkutila', 47550, true),
+    (get_constituency_id('069'), '069-15', 'Lunga', 47600, true),
+    (get_constituency_id('069'), '069-19', 'Nsalushi', 47650, true),
+    (get_constituency_id('069'), '069-18', 'Ncheta', 47700, true),
+    (get_constituency_id('074'), '074-17', 'Shikabeta', 47750, true),
+    (get_constituency_id('070'), '070-01', 'Chiyaba', 47800, true),
+    (get_constituency_id('073'), '073-01', 'Kapwayambale', 47850, true),
+    (get_constituency_id('071'), '071-09', 'Lunya', 47900, true),
+    (get_constituency_id('073'), '073-02', 'Chinkuli', 47950, true),
+    (get_constituency_id('071'), '071-12', 'Mburuma', 48000, true),
+    (get_constituency_id('073'), '073-03', 'Ntandabale', 48050, true),
+    (get_constituency_id('073'), '073-04', 'Chongwe', 48100, true),
+    (get_constituency_id('073'), '073-05', 'Kanakantapa', 48150, true),
+    (get_constituency_id('073'), '073-06', 'Chalimbana', 48200, true),
+    (get_constituency_id('073'), '073-07', 'Nakatindi', 48250, true),
+    (get_constituency_id('073'), '073-08', 'Lukoshi', 48300, true),
+    (get_constituency_id('073'), '073-09', 'Manyika', 48350, true),
+    (get_constituency_id('073'), '073-10', 'Lwimba', 48400, true),
+    (get_constituency_id('071'), '071-13', 'Mwalilia', 48450, true),
+    (get_constituency_id('074'), '074-11', 'Mwachilele', 48500, true),
+    (get_constituency_id('074'), '074-12', 'Nyangwena', 48550, true),
+    (get_constituency_id('074'), '074-13', 'Bunda Bunda', 48600, true),
+    (get_constituency_id('074'), '074-14', 'Nyamanongo', 48650, true),
+    (get_constituency_id('074'), '074-15', 'Rufunsa', 48700, true),
+    (get_constituency_id('074'), '074-16', 'Mankanda', 48750, true),
+    (get_constituency_id('070'), '070-02', 'Kambale', 48800, true),
+    (get_constituency_id('070'), '070-03', 'Malundu', 48850, true),
+    (get_constituency_id('070'), '070-04', 'Chisankane', 48900, true),
+    (get_constituency_id('070'), '070-05', 'Lukolongo', 48950, true),
+    (get_constituency_id('070'), '070-06', 'Kafue', 49000, true),
+    (get_constituency_id('070'), '070-07', 'Matanda', 49050, true),
+    (get_constituency_id('070'), '070-08', 'Shabusale', 49100, true),
+    (get_constituency_id('070'), '070-09', 'Kasenje', 49150, true),
+    (get_constituency_id('128'), '128-15', 'Katimba', 49200, true),
+    (get_constituency_id('070'), '070-10', 'Muungu', 49250, true),
+    (get_constituency_id('070'), '070-11', 'Chikupi', 49300, true),
+    (get_constituency_id('072'), '072-12', 'Chilanga', 49350, true),
+    (get_constituency_id('072'), '072-13', 'Chilongolo', 49400, true),
+    (get_constituency_id('072'), '072-14', 'Namalombwe', 49450, true),
+    (get_constituency_id('072'), '072-15', 'Nyemba', 49500, true),
+    (get_constituency_id('072'), '072-16', 'Nakachenje', 49550, true),
+    (get_constituency_id('072'), '072-17', 'Chinyanja', 49600, true),
+    (get_constituency_id('071'), '071-01', 'Dzalo', 49650, true),
+    (get_constituency_id('071'), '071-02', 'Mkaliva', 49700, true),
+    (get_constituency_id('071'), '071-14', 'Kaunga', 49750, true),
+    (get_constituency_id('071'), '071-04', 'Phwazi', 49800, true),
+    (get_constituency_id('071'), '071-05', 'Mphuka', 49850, true),
+    (get_constituency_id('071'), '071-06', 'Kabowo', 49900, true),
+    (get_constituency_id('071'), '071-07', 'Kapoche', 49950, true),
+    (get_constituency_id('071'), '071-08', 'Chiriwe', 50000, true),
+    (get_constituency_id('071'), '071-10', 'Katondwe', 50050, true),
+    (get_constituency_id('071'), '071-11', 'Chikoma', 50100, true),
+    (get_constituency_id('075'), '075-04', 'Lilayi', 50150, true),
+    (get_constituency_id('095'), '095-02', 'Moto Moto', 50200, true),
+    (get_constituency_id('076'), '076-05', 'Kamwala', 50250, true),
+    (get_constituency_id('076'), '076-06', 'Kabwata', 50300, true),
+    (get_constituency_id('076'), '076-09', 'Kamulanga', 50350, true),
+    (get_constituency_id('080'), '080-24', 'Muchinga', 50400, true),
+    (get_constituency_id('077'), '077-10', 'Kanyama', 50450, true),
+    (get_constituency_id('080'), '080-25', 'Kapwepwe', 50500, true),
+    (get_constituency_id('077'), '077-11', 'Harry Mwaanga Nkumbula', 50550, true),
+    (get_constituency_id('077'), '077-12', 'Munkolo', 50600, true),
+    (get_constituency_id('078'), '078-14', 'Independence', 50650, true),
+    (get_constituency_id('080'), '080-26', 'Lima', 50700, true),
+    (get_constituency_id('078'), '078-15', 'Lubwa', 50750, true),
+    (get_constituency_id('078'), '078-16', 'Kabulonga', 50800, true),
+    (get_constituency_id('079'), '079-17', 'Roma', 50850, true),
+    (get_constituency_id('079'), '079-18', 'Mulungushi', 50900, true),
+    (get_constituency_id('079'), '079-19', 'Ngwerere', 50950, true),
+    (get_constituency_id('079'), '079-22', 'Raphael Chota', 51000, true),
+    (get_constituency_id('132'), '132-04', 'Ngombe Ilende', 51050, true),
+    (get_constituency_id('079'), '079-23', 'Mpulungu', 51100, true),
+    (get_constituency_id('081'), '081-31', 'Kalingalinga', 51150, true),
+    (get_constituency_id('080'), '080-27', 'Mwembeshi', 51200, true),
+    (get_constituency_id('080'), '080-28', 'Matero', 51250, true),
+    (get_constituency_id('081'), '081-32', 'Chakunkula', 51300, true),
+    (get_constituency_id('081'), '081-29', 'Chainda', 51350, true),
+    (get_constituency_id('081'), '081-33', 'Munali', 51400, true),
+    (get_constituency_id('084'), '084-13', 'Muchinga', 51450, true),
+    (get_constituency_id('081'), '081-30', 'Mtendere', 51500, true),
+    (get_constituency_id('086'), '086-01', 'Kasoka', 51550, true),
+    (get_constituency_id('086'), '086-02', 'Kantenshya', 51600, true),
+    (get_constituency_id('086'), '086-03', 'Sasamwenje', 51650, true),
+    (get_constituency_id('099'), '099-20', 'Muchinga', 51700, true),
+    (get_constituency_id('083'), '083-01', 'Itapa', 51750, true),
+    (get_constituency_id('083'), '083-02', 'Chilunda', 51800, true),
+    (get_constituency_id('083'), '083-03', 'Chilinda', 51850, true),
+    (get_constituency_id('083'), '083-04', 'Kaunga', 51900, true),
+    (get_constituency_id('083'), '083-05', 'Malalo', 51950, true),
+    (get_constituency_id('083'), '083-06', 'Chipanga', 52000, true),
+    (get_constituency_id('085'), '085-13', 'Thendere', 52050, true),
+    (get_constituency_id('083'), '083-07', 'Chambeshi', 52100, true),
+    (get_constituency_id('083'), '083-08', 'Lubwa', 52150, true),
+    (get_constituency_id('087'), '087-12', 'Mpanda', 52200, true),
+    (get_constituency_id('087'), '087-13', 'Mukulika', 52250, true),
+    (get_constituency_id('083'), '083-09', 'Ichinga', 52300, true),
+    (get_constituency_id('083'), '083-10', 'Nkakula', 52350, true),
+    (get_constituency_id('083'), '083-11', 'Munwaku', 52400, true),
+    (get_constituency_id('083'), '083-21', 'Chimpundu', 52450, true),
+    (get_constituency_id('083'), '083-22', 'Nkulungwe', 52500, true),
+    (get_constituency_id('084'), '084-12', 'Chamusenga', 52550, true),
+    (get_constituency_id('084'), '084-14', 'Chandaula', 52600, true),
+    (get_constituency_id('084'), '084-15', 'Mukumbi', 52650, true),
+    (get_constituency_id('084'), '084-16', 'Mwila Kabuswe', 52700, true),
+    (get_constituency_id('084'), '084-17', 'Chibinda', 52750, true),
+    (get_constituency_id('084'), '084-18', 'Mayembe', 52800, true),
+    (get_constituency_id('084'), '084-19', 'Mwiche', 52850, true),
+    (get_constituency_id('084'), '084-20', 'Ichingo', 52900, true),
+    (get_constituency_id('098'), '098-01', 'Chambeshi', 52950, true),
+    (get_constituency_id('086'), '086-04', 'Kapililonga', 53000, true),
+    (get_constituency_id('086'), '086-05', 'Itukuta', 53050, true),
+    (get_constituency_id('086'), '086-06', 'Milongo', 53100, true),
+    (get_constituency_id('086'), '086-07', 'Nkombwa', 53150, true),
+    (get_constituency_id('086'), '086-08', 'Luangwa', 53200, true),
+    (get_constituency_id('086'), '086-09', 'Mpungu', 53250, true),
+    (get_constituency_id('085'), '085-11', 'Ntonga', 53300, true),
+    (get_constituency_id('085'), '085-12', 'Mukutu', 53350, true),
+    (get_constituency_id('085'), '085-14', 'Bemba', 53400, true),
+    (get_constituency_id('085'), '085-15', 'Kakoma', 53450, true),
+    (get_constituency_id('085'), '085-16', 'Luhoka', 53500, true),
+    (get_constituency_id('085'), '085-17', 'Kalanga', 53550, true),
+    (get_constituency_id('086'), '086-10', 'Mafinga', 53600, true),
+    (get_constituency_id('050'), '050-01', 'Nsefu', 53650, true),
+    (get_constituency_id('050'), '050-02', 'Jumbe', 53700, true),
+    (get_constituency_id('050'), '050-03', 'Chipapa', 53750, true),
+    (get_constituency_id('050'), '050-04', 'Mphomwa', 53800, true),
+    (get_constituency_id('050'), '050-05', 'Chikowa', 53850, true),
+    (get_constituency_id('050'), '050-06', 'Mnkhanya', 53900, true),
+    (get_constituency_id('050'), '050-07', 'Kakumbi', 53950, true),
+    (get_constituency_id('050'), '050-08', 'Ncheka', 54000, true),
+    (get_constituency_id('050'), '050-09', 'Malama', 54050, true),
+    (get_constituency_id('050'), '050-10', 'Ndima', 54100, true),
+    (get_constituency_id('050'), '050-11', 'Msoro', 54150, true),
+    (get_constituency_id('050'), '050-12', 'Kasamanda', 54200, true),
+    (get_constituency_id('050'), '050-13', 'Nyakatokoli', 54250, true),
+    (get_constituency_id('098'), '098-02', 'Mansha', 54300, true),
+    (get_constituency_id('098'), '098-03', 'Mumbubu', 54350, true),
+    (get_constituency_id('098'), '098-04', 'Lubaleshi', 54400, true),
+    (get_constituency_id('098'), '098-05', 'Lulingila', 54450, true),
+    (get_constituency_id('098'), '098-06', 'Munikashi', 54500, true),
+    (get_constituency_id('098'), '098-07', 'Chinama', 54550, true),
+    (get_constituency_id('098'), '098-08', 'Lukulu', 54600, true),
+    (get_constituency_id('098'), '098-09', 'Lulimala', 54650, true),
+    (get_constituency_id('098'), '098-10', 'Chimbwa', 54700, true),
+    (get_constituency_id('099'), '099-19', 'Chifungwe', 54750, true),
+    (get_constituency_id('099'), '099-21', 'Chikanda', 54800, true),
+    (get_constituency_id('099'), '099-22', 'Munpamazi', 54850, true),
+    (get_constituency_id('100'), '100-11', 'Mukungwa', 54900, true),
+    (get_constituency_id('100'), '100-12', 'Lwitikila', 54950, true),
+    (get_constituency_id('100'), '100-13', 'Musakanya', 55000, true),
+    (get_constituency_id('100'), '100-14', 'Lubambala', 55050, true),
+    (get_constituency_id('100'), '100-15', 'Chishibe Isonde', 55100, true),
+    (get_constituency_id('100'), '100-16', 'Nachikufu', 55150, true),
+    (get_constituency_id('100'), '100-17', 'Mutekwe', 55200, true),
+    (get_constituency_id('100'), '100-18', 'Chipembele', 55250, true),
+    (get_constituency_id('087'), '087-01', 'Mulalo', 55300, true),
+    (get_constituency_id('102'), '102-05', 'Mikomba', 55350, true),
+    (get_constituency_id('087'), '087-02', 'Luchinde', 55400, true),
+    (get_constituency_id('087'), '087-03', 'Ngumba', 55450, true),
+    (get_constituency_id('087'), '087-04', 'Musyani', 55500, true),
+    (get_constituency_id('087'), '087-05', 'Popomozi', 55550, true),
+    (get_constituency_id('087'), '087-06', 'Chiwanza', 55600, true),
+    (get_constituency_id('087'), '087-07', 'Ilonda', 55650, true),
+    (get_constituency_id('087'), '087-08', 'Isunga', 55700, true),
+    (get_constituency_id('087'), '087-09', 'Nakonde', 55750, true),
+    (get_constituency_id('087'), '087-10', 'Old Fife', 55800, true),
+    (get_constituency_id('087'), '087-11', 'Musele', 55850, true),
+    (get_constituency_id('082'), '082-01', 'Mulanda', 55900, true),
+    (get_constituency_id('082'), '082-02', 'Chifwenge', 55950, true),
+    (get_constituency_id('082'), '082-03', 'Bulilo', 56000, true),
+    (get_constituency_id('082'), '082-04', 'Chisupa', 56050, true),
+    (get_constituency_id('092'), '092-03', 'Kabisha', 56100, true),
+    (get_constituency_id('092'), '092-04', 'Fibwe', 56150, true),
+    (get_constituency_id('092'), '092-05', 'Chibamba', 56200, true),
+    (get_constituency_id('092'), '092-06', 'Iyaya', 56250, true),
+    (get_constituency_id('092'), '092-07', 'Kalunga', 56300, true),
+    (get_constituency_id('082'), '082-05', 'Ndela', 56350, true),
+    (get_constituency_id('092'), '092-08', 'Fube', 56400, true),
+    (get_constituency_id('092'), '092-09', 'Ngulula', 56450, true),
+    (get_constituency_id('092'), '092-10', 'Mungwi', 56500, true),
+    (get_constituency_id('092'), '092-12', 'Mabula', 56550, true),
+    (get_constituency_id('082'), '082-06', 'Katamba', 56600, true),
+    (get_constituency_id('082'), '082-07', 'Muteka', 56650, true),
+    (get_constituency_id('082'), '082-08', 'Lwenda', 56700, true),
+    (get_constituency_id('082'), '082-10', 'Mpanshya', 56750, true),
+    (get_constituency_id('082'), '082-11', 'Kashitu', 56800, true),
+    (get_constituency_id('089'), '089-17', 'Choma', 56850, true),
+    (get_constituency_id('082'), '082-12', 'Kambashi', 56900, true),
+    (get_constituency_id('089'), '089-18', 'Mowa', 56950, true),
+    (get_constituency_id('089'), '089-19', 'Kaleulu', 57000, true),
+    (get_constituency_id('089'), '089-20', 'Mwawe', 57050, true),
+    (get_constituency_id('082'), '082-13', 'Nguni', 57100, true),
+    (get_constituency_id('090'), '090-05', 'Julia Chikamoneka', 57150, true),
+    (get_constituency_id('082'), '082-14', 'Chinkundu', 57200, true),
+    (get_constituency_id('082'), '082-16', 'Kanchindi', 57250, true),
+    (get_constituency_id('082'), '082-17', 'Kapoka', 57300, true),
+    (get_constituency_id('082'), '082-18', 'Kawena', 57350, true),
+    (get_constituency_id('082'), '082-20', 'Bumba', 57400, true),
+    (get_constituency_id('082'), '082-21', 'Mubemba', 57450, true),
+    (get_constituency_id('102'), '102-07', 'Muchinga', 57500, true),
+    (get_constituency_id('088'), '088-01', 'Kapisha', 57550, true),
+    (get_constituency_id('088'), '088-02', 'Nsumbu', 57600, true),
+    (get_constituency_id('088'), '088-03', 'Chisela', 57650, true),
+    (get_constituency_id('088'), '088-04', 'Munwa', 57700, true),
+    (get_constituency_id('088'), '088-05', 'Kampinda', 57750, true),
+    (get_constituency_id('088'), '088-06', 'Kakusu', 57800, true),
+    (get_constituency_id('088'), '088-07', 'Kashikishi', 57850, true),
+    (get_constituency_id('088'), '088-08', 'Mwambeshi', 57900, true),
+    (get_constituency_id('088'), '088-09', 'Chubo', 57950, true),
+    (get_constituency_id('088'), '088-10', 'Fungwa', 58000, true),
+    (get_constituency_id('088'), '088-11', 'Mukubwe', 58050, true),
+    (get_constituency_id('089'), '089-12', 'Chiyilunda', 58100, true),
+    (get_constituency_id('089'), '089-13', 'Mofwe', 58150, true),
+    (get_constituency_id('089'), '089-14', 'Kalungwishi', 58200, true),
+    (get_constituency_id('089'), '089-15', 'Nkota', 58250, true),
+    (get_constituency_id('089'), '089-16', 'Chipili', 58300, true),
+    (get_constituency_id('089'), '089-21', 'Kapulwa', 58350, true),
+    (get_constituency_id('089'), '089-22', 'Munkonge', 58400, true),
+    (get_constituency_id('092'), '092-11', 'Chambeshi', 58450, true),
+    (get_constituency_id('101'), '101-19', 'Kalungwishi', 58500, true),
+    (get_constituency_id('082'), '082-22', 'Luangwa', 58550, true),
+    (get_constituency_id('090'), '090-01', 'Kasenga', 58600, true),
+    (get_constituency_id('090'), '090-02', 'Bululu', 58650, true),
+    (get_constituency_id('090'), '090-03', 'Chilunga', 58700, true),
+    (get_constituency_id('090'), '090-06', 'Lukupa', 58750, true),
+    (get_constituency_id('090'), '090-08', 'Buseko', 58800, true),
+    (get_constituency_id('091'), '091-09', 'Lusenga', 58850, true),
+    (get_constituency_id('091'), '091-10', 'Mukanga', 58900, true),
+    (get_constituency_id('091'), '091-11', 'Lualuo', 58950, true),
+    (get_constituency_id('103'), '103-08', 'Sanjongo', 59000, true),
+    (get_constituency_id('091'), '091-12', 'Chiba', 59050, true),
+    (get_constituency_id('103'), '103-10', 'Lukolwe/musonda', 59100, true),
+    (get_constituency_id('091'), '091-15', 'Kapongolo', 59150, true),
+    (get_constituency_id('091'), '091-16', 'Musowa', 59200, true),
+    (get_constituency_id('091'), '091-17', 'Chumba', 59250, true),
+    (get_constituency_id('101'), '101-18', 'Luangwa', 59300, true),
+    (get_constituency_id('093'), '093-16', 'Namukolo', 59350, true),
+    (get_constituency_id('093'), '093-17', 'Chulungoma', 59400, true),
+    (get_constituency_id('093'), '093-18', 'Masonde', 59450, true),
+    (get_constituency_id('093'), '093-19', 'Chifwile', 59500, true),
+    (get_constituency_id('103'), '103-12', 'Nyatanda Nyambingila', 59550, true),
+    (get_constituency_id('093'), '093-20', 'Mushituwamboo', 59600, true),
+    (get_constituency_id('093'), '093-21', 'Lwata', 59650, true),
+    (get_constituency_id('093'), '093-22', 'Isangano', 59700, true),
+    (get_constituency_id('094'), '094-01', 'Itandashi', 59750, true),
+    (get_constituency_id('094'), '094-02', 'Kaela', 59800, true),
+    (get_constituency_id('094'), '094-03', 'Munshinga', 59850, true),
+    (get_constituency_id('094'), '094-04', 'Katilye', 59900, true),
+    (get_constituency_id('094'), '094-05', 'Kanfinsa', 59950, true),
+    (get_constituency_id('094'), '094-06', 'Kampemba', 60000, true),
+    (get_constituency_id('094'), '094-07', 'Mulalashi', 60050, true),
+    (get_constituency_id('094'), '094-08', 'Mufili', 60100, true),
+    (get_constituency_id('094'), '094-09', 'Ilambo', 60150, true),
+    (get_constituency_id('105'), '105-11', 'Kabompo', 60200, true),
+    (get_constituency_id('105'), '105-12', 'Litoya', 60250, true),
+    (get_constituency_id('094'), '094-10', 'Ibale', 60300, true),
+    (get_constituency_id('095'), '095-04', 'Mwambezi', 60350, true),
+    (get_constituency_id('095'), '095-05', 'Nsunzu', 60400, true),
+    (get_constituency_id('094'), '094-11', 'Bwalinde', 60450, true),
+    (get_constituency_id('094'), '094-12', 'Mwelawamangu', 60500, true),
+    (get_constituency_id('105'), '105-13', 'Kamisombo', 60550, true),
+    (get_constituency_id('094'), '094-13', 'Isansa', 60600, true),
+    (get_constituency_id('101'), '101-17', 'Masonde', 60650, true),
+    (get_constituency_id('091'), '091-04', 'Lukulu', 60700, true),
+    (get_constituency_id('095'), '095-01', 'Itala', 60750, true),
+    (get_constituency_id('095'), '095-03', 'Kazimolwa', 60800, true),
+    (get_constituency_id('095'), '095-08', 'Luandi', 60850, true),
+    (get_constituency_id('097'), '097-09', 'Mukololo', 60900, true),
+    (get_constituency_id('097'), '097-10', 'Lapisha', 60950, true),
+    (get_constituency_id('097'), '097-11', 'Malamba', 61000, true),
+    (get_constituency_id('097'), '097-12', 'Chimbili', 61050, true),
+    (get_constituency_id('097'), '097-13', 'Chela', 61100, true),
+    (get_constituency_id('097'), '097-14', 'Mwiluzi', 61150, true),
+    (get_constituency_id('097'), '097-15', 'Chinyika', 61200, true),
+    (get_constituency_id('097'), '097-16', 'Ipembe', 61250, true),
+    (get_constituency_id('097'), '097-17', 'Chozi', 61300, true),
+    (get_constituency_id('092'), '092-02', 'Mpanda', 61350, true),
+    (get_constituency_id('101'), '101-11', 'Kansanshi', 61400, true),
+    (get_constituency_id('101'), '101-12', 'Isenga', 61450, true),
+    (get_constituency_id('101'), '101-13', 'Nchelenge', 61500, true),
+    (get_constituency_id('101'), '101-14', 'Malambwa', 61550, true),
+    (get_constituency_id('101'), '101-15', 'Malaila', 61600, true),
+    (get_constituency_id('101'), '101-16', 'Bwandela', 61650, true),
+    (get_constituency_id('101'), '101-20', 'Lunte', 61700, true),
+    (get_constituency_id('101'), '101-21', 'Kanyanta', 61750, true),
+    (get_constituency_id('101'), '101-22', 'Lubushi', 61800, true),
+    (get_constituency_id('102'), '102-01', 'Lumangwe', 61850, true),
+    (get_constituency_id('102'), '102-02', 'Chikulu', 61900, true),
+    (get_constituency_id('102'), '102-03', 'Mumbuluma', 61950, true),
+    (get_constituency_id('102'), '102-04', 'Chisha Mwamba', 62000, true),
+    (get_constituency_id('102'), '102-06', 'Kapumo', 62050, true),
+    (get_constituency_id('096'), '096-02', 'Katwe', 62100, true),
+    (get_constituency_id('102'), '102-08', 'Chimpolenge', 62150, true),
+    (get_constituency_id('102'), '102-09', 'Mutotoshi', 62200, true),
+    (get_constituency_id('102'), '102-10', 'Mabale', 62250, true),
+    (get_constituency_id('092'), '092-01', 'Lubanda', 62300, true),
+    (get_constituency_id('092'), '092-13', 'Musensenshe', 62350, true),
+    (get_constituency_id('096'), '096-01', 'Kapembwa', 62400, true),
+    (get_constituency_id('096'), '096-03', 'Chibulula', 62450, true),
+    (get_constituency_id('096'), '096-04', 'Mpulungu Central', 62500, true),
+    (get_constituency_id('096'), '096-05', 'Tanganyika', 62550, true),
+    (get_constituency_id('096'), '096-07', 'Isoko', 62600, true),
+    (get_constituency_id('096'), '096-08', 'Iyendwe', 62650, true),
+    (get_constituency_id('096'), '096-09', 'Mumila', 62700, true),
+    (get_constituency_id('096'), '096-10', 'Itimbwe', 62750, true),
+    (get_constituency_id('096'), '096-11', 'Vyamba', 62800, true),
+    (get_constituency_id('096'), '096-12', 'Chisha', 62850, true),
+    (get_constituency_id('096'), '096-13', 'Isunga', 62900, true),
+    (get_constituency_id('103'), '103-09', 'Lingundu', 62950, true),
+    (get_constituency_id('103'), '103-11', 'Kambuwa Mukelangombe', 63000, true),
+    (get_constituency_id('103'), '103-13', 'Nguvu', 63050, true),
+    (get_constituency_id('111'), '111-01', 'Musaka', 63100, true),
+    (get_constituency_id('102'), '102-21', 'Kayombo', 63150, true),
+    (get_constituency_id('104'), '104-01', 'Dihamba', 63200, true),
+    (get_constituency_id('104'), '104-02', 'Lunsuna', 63250, true),
+    (get_constituency_id('104'), '104-03', 'Kashinakaji', 63300, true),
+    (get_constituency_id('104'), '104-05', 'Manyinga', 63350, true),
+    (get_constituency_id('104'), '104-06', 'Loloma', 63400, true),
+    (get_constituency_id('104'), '104-09', 'Chongo', 63450, true),
+    (get_constituency_id('105'), '105-10', 'Kamafwafwa', 63500, true),
+    (get_constituency_id('105'), '105-14', 'Kabulamena', 63550, true),
+    (get_constituency_id('105'), '105-15', 'Mumbeji', 63600, true),
+    (get_constituency_id('105'), '105-20', 'Lunyiwe', 63650, true),
+    (get_constituency_id('105'), '105-16', 'Luli', 63700, true),
+    (get_constituency_id('105'), '105-17', 'Katuva', 63750, true),
+    (get_constituency_id('105'), '105-22', 'Chikonkwelo', 63800, true),
+    (get_constituency_id('105'), '105-18', 'Maveve', 63850, true),
+    (get_constituency_id('109'), '109-03', 'Nyakaseya', 63900, true),
+    (get_constituency_id('109'), '109-04', 'Ikelenge', 63950, true),
+    (get_constituency_id('109'), '109-05', 'Mwininyilamba', 64000, true),
+    (get_constituency_id('109'), '109-06', 'Kanongesha', 64050, true),
+    (get_constituency_id('109'), '109-07', 'Mukangala', 64100, true),
+    (get_constituency_id('109'), '109-08', 'Kawiku', 64150, true),
+    (get_constituency_id('105'), '105-19', 'Chikenge', 64200, true),
+    (get_constituency_id('112'), '112-19', 'Lumwana', 64250, true),
+    (get_constituency_id('112'), '112-22', 'Chovwe', 64300, true),
+    (get_constituency_id('104'), '104-07', 'Kawanda', 64350, true),
+    (get_constituency_id('104'), '104-08', 'Kaula', 64400, true),
+    (get_constituency_id('106'), '106-01', 'Kamakoku', 64450, true),
+    (get_constituency_id('106'), '106-02', 'Nselauke', 64500, true),
+    (get_constituency_id('106'), '106-03', 'Ingwe', 64550, true),
+    (get_constituency_id('106'), '106-04', 'Kaimbwe', 64600, true),
+    (get_constituency_id('106'), '106-05', 'Mukema', 64650, true),
+    (get_constituency_id('106'), '106-06', 'Kamatete', 64700, true),
+    (get_constituency_id('106'), '106-07', 'Dengwe', 64750, true),
+    (get_constituency_id('106'), '106-08', 'Njenga', 64800, true),
+    (get_constituency_id('106'), '106-09', 'Kalombe', 64850, true),
+    (get_constituency_id('106'), '106-10', 'Kamusongolwa', 64900, true),
+    (get_constituency_id('106'), '106-11', 'Kikonkomeme', 64950, true),
+    (get_constituency_id('106'), '106-12', 'Nkenyauna', 65000, true),
+    (get_constituency_id('106'), '106-13', 'Mukinge', 65050, true),
+    (get_constituency_id('106'), '106-14', 'Katenda', 65100, true),
+    (get_constituency_id('106'), '106-15', 'Lubofu', 65150, true),
+    (get_constituency_id('106'), '106-16', 'Mpungu', 65200, true),
+    (get_constituency_id('106'), '106-17', 'Nyoka', 65250, true),
+    (get_constituency_id('106'), '106-18', 'Kelongwa', 65300, true),
+    (get_constituency_id('106'), '106-19', 'Mukunanshi', 65350, true),
+    (get_constituency_id('106'), '106-20', 'Kanongo', 65400, true),
+    (get_constituency_id('106'), '106-21', 'Kamankechi', 65450, true),
+    (get_constituency_id('106'), '106-22', 'Jifumpa', 65500, true),
+    (get_constituency_id('104'), '104-04', 'Chiteve', 65550, true),
+    (get_constituency_id('107'), '107-01', 'Kashima West', 65600, true),
+    (get_constituency_id('107'), '107-05', 'Kashima East', 65650, true),
+    (get_constituency_id('107'), '107-03', 'Matushi', 65700, true),
+    (get_constituency_id('107'), '107-04', 'Kamabuta', 65750, true),
+    (get_constituency_id('103'), '103-02', 'Nyakulenga', 65800, true),
+    (get_constituency_id('107'), '107-05', 'Kalambu', 65850, true),
+    (get_constituency_id('107'), '107-06', 'Chizera', 65900, true),
+    (get_constituency_id('107'), '107-08', 'Kikonge', 65950, true),
+    (get_constituency_id('107'), '107-09', 'Munyambala', 66000, true),
+    (get_constituency_id('107'), '107-07', 'Shukwe', 66050, true),
+    (get_constituency_id('111'), '111-07', 'Mujimanzovu', 66100, true),
+    (get_constituency_id('107'), '107-10', 'Kalengwa', 66150, true),
+    (get_constituency_id('113'), '113-08', 'Chitokoloki', 66200, true),
+    (get_constituency_id('107'), '107-11', 'Kabi Pupu', 66250, true),
+    (get_constituency_id('107'), '107-13', 'Musonweji', 66300, true),
+    (get_constituency_id('107'), '107-14', 'Kaminzekenzeke', 66350, true),
+    (get_constituency_id('107'), '107-15', 'Lalafuta', 66400, true),
+    (get_constituency_id('107'), '107-12', 'Mushima', 66450, true),
+    (get_constituency_id('108'), '108-10', 'Mundwinji', 66500, true),
+    (get_constituency_id('108'), '108-11', 'Kapundu', 66550, true),
+    (get_constituency_id('108'), '108-12', 'Kanyama', 66600, true),
+    (get_constituency_id('108'), '108-13', 'Kakoma', 66650, true),
+    (get_constituency_id('108'), '108-14', 'Kasambula', 66700, true),
+    (get_constituency_id('108'), '108-15', 'Lumwana', 66750, true),
+    (get_constituency_id('108'), '108-16', 'Sailunga', 66800, true),
+    (get_constituency_id('108'), '108-17', 'Chisasa', 66850, true),
+    (get_constituency_id('108'), '108-18', 'Ntambu', 66900, true),
+    (get_constituency_id('108'), '108-19', 'Samuteba', 66950, true),
+    (get_constituency_id('108'), '108-20', 'Mudyanyama', 67000, true),
+    (get_constituency_id('108'), '108-21', 'Chibwika', 67050, true),
+    (get_constituency_id('108'), '108-22', 'Kamapanda', 67100, true),
+    (get_constituency_id('109'), '109-01', 'Chana-chamuhinga', 67150, true),
+    (get_constituency_id('109'), '109-02', 'Jimbe', 67200, true),
+    (get_constituency_id('109'), '109-09', 'Mulumbi', 67250, true),
+    (get_constituency_id('103'), '103-06', 'Chivombo Mbalango', 67300, true),
+    (get_constituency_id('110'), '110-08', 'Kapijimpanga', 67350, true),
+    (get_constituency_id('110'), '110-09', 'Sandangombe', 67400, true),
+    (get_constituency_id('110'), '110-10', 'Kamalamba', 67450, true),
+    (get_constituency_id('114'), '114-14', 'Muyembe', 67500, true),
+    (get_constituency_id('110'), '110-12', 'Kimasala', 67550, true),
+    (get_constituency_id('111'), '111-02', 'Chikola', 67600, true),
+    (get_constituency_id('111'), '111-03', 'Kangwena', 67650, true),
+    (get_constituency_id('111'), '111-04', 'Kalilele', 67700, true),
+    (get_constituency_id('111'), '111-05', 'Mulonga', 67750, true),
+    (get_constituency_id('111'), '111-06', 'Mapunga', 67800, true),
+    (get_constituency_id('112'), '112-13', 'Mumena', 67850, true),
+    (get_constituency_id('112'), '112-15', 'Kibanza', 67900, true),
+    (get_constituency_id('112'), '112-16', 'Mukumbi', 67950, true),
+    (get_constituency_id('112'), '112-17', 'Matebo', 68000, true),
+    (get_constituency_id('112'), '112-18', 'Shilenda', 68050, true),
+    (get_constituency_id('112'), '112-14', 'Mwajimambwe', 68100, true),
+    (get_constituency_id('112'), '112-20', 'Mumbezhi', 68150, true),
+    (get_constituency_id('112'), '112-21', 'Musele', 68200, true),
+    (get_constituency_id('113'), '113-01', 'Lukunyi', 68250, true),
+    (get_constituency_id('113'), '113-03', 'Dipalata', 68300, true),
+    (get_constituency_id('115'), '115-19', 'Nakeempa', 68350, true),
+    (get_constituency_id('113'), '113-04', 'Mukanda Nkunda', 68400, true),
+    (get_constituency_id('113'), '113-05', 'Chileng''a Chizenzi', 68450, true),
+    (get_constituency_id('113'), '113-06', 'Lwitadi Lwatembo', 68500, true),
+    (get_constituency_id('113'), '113-07', 'Mpidi Kakonga', 68550, true),
+    (get_constituency_id('113'), '113-09', 'Chivweti Kasesi', 68600, true),
+    (get_constituency_id('115'), '115-22', 'Simacheche', 68650, true),
+    (get_constituency_id('113'), '113-10', 'Zambezi', 68700, true),
+    (get_constituency_id('116'), '116-06', 'Kabimba', 68750, true),
+    (get_constituency_id('114'), '114-11', 'Mapachi Chinyingi', 68800, true),
+    (get_constituency_id('114'), '114-12', 'Likungu', 68850, true),
+    (get_constituency_id('114'), '114-13', 'Liyovu', 68900, true),
+    (get_constituency_id('114'), '114-15', 'Mwange Nyawanda', 68950, true),
+    (get_constituency_id('114'), '114-16', 'Matondo', 69000, true),
+    (get_constituency_id('115'), '115-15', 'Batoka', 69050, true),
+    (get_constituency_id('115'), '115-16', 'Sikalongo', 69100, true),
+    (get_constituency_id('115'), '115-17', 'Simamvwa', 69150, true),
+    (get_constituency_id('115'), '115-18', 'Stateland', 69200, true),
+    (get_constituency_id('160'), '160-12', 'Mpanza', 69250, true),
+    (get_constituency_id('118'), '118-01', 'Chisanga', 69300, true),
+    (get_constituency_id('115'), '115-20', 'Moomba', 69350, true),
+    (get_constituency_id('115'), '115-21', 'Kulundana', 69400, true),
+    (get_constituency_id('130'), '130-05', 'Makunku', 69450, true),
+    (get_constituency_id('130'), '130-06', 'Nyambo', 69500, true),
+    (get_constituency_id('115'), '115-23', 'Sikalundu', 69550, true),
+    (get_constituency_id('115'), '115-24', 'Mubula', 69600, true),
+    (get_constituency_id('115'), '115-25', 'Singani', 69650, true),
+    (get_constituency_id('115'), '115-26', 'Siasikabole', 69700, true),
+    (get_constituency_id('115'), '115-27', 'Namuswa', 69750, true),
+    (get_constituency_id('116'), '116-03', 'Mang''unza', 69800, true),
+    (get_constituency_id('123'), '123-01', 'Freedom', 69850, true),
+    (get_constituency_id('116'), '116-04', 'Chilalantambo', 69900, true),
+    (get_constituency_id('116'), '116-05', 'Macha', 69950, true),
+    (get_constituency_id('116'), '116-07', 'Mbabala', 70000, true),
+    (get_constituency_id('117'), '117-08', 'Kasiya', 70050, true),
+    (get_constituency_id('117'), '117-09', 'Pemba', 70100, true),
+    (get_constituency_id('117'), '117-10', 'Hamaundu', 70150, true),
+    (get_constituency_id('117'), '117-11', 'Maambo', 70200, true),
+    (get_constituency_id('117'), '117-12', 'Kauba', 70250, true),
+    (get_constituency_id('117'), '117-13', 'Habunkululu', 70300, true),
+    (get_constituency_id('117'), '117-14', 'Nachibanga', 70350, true),
+    (get_constituency_id('123'), '123-02', 'Musi-o-tunya', 70400, true),
+    (get_constituency_id('160'), '160-11', 'Simaumbi', 70450, true),
+    (get_constituency_id('118'), '118-02', 'Sinafala', 70500, true),
+    (get_constituency_id('118'), '118-03', 'Jumbo', 70550, true),
+    (get_constituency_id('118'), '118-04', 'Kkoma', 70600, true),
+    (get_constituency_id('118'), '118-05', 'Chibuwe', 70650, true),
+    (get_constituency_id('118'), '118-06', 'Siampande', 70700, true),
+    (get_constituency_id('118'), '118-07', 'Kota Kota', 70750, true),
+    (get_constituency_id('123'), '123-04', 'Namatama', 70800, true),
+    (get_constituency_id('123'), '123-05', 'Kasiya', 70850, true),
+    (get_constituency_id('118'), '118-08', 'Luumbo', 70900, true),
+    (get_constituency_id('118'), '118-09', 'Kkole', 70950, true),
+    (get_constituency_id('118'), '118-10', 'Bbondo', 71000, true),
+    (get_constituency_id('118'), '118-11', 'Chaamwe', 71050, true),
+    (get_constituency_id('118'), '118-12', 'Fumbo', 71100, true),
+    (get_constituency_id('118'), '118-13', 'Jongola', 71150, true),
+    (get_constituency_id('118'), '118-14', 'Lukonde', 71200, true),
+    (get_constituency_id('130'), '130-01', 'Itezhi-tezhi', 71250, true),
+    (get_constituency_id('130'), '130-02', 'Itumbi', 71300, true),
+    (get_constituency_id('130'), '130-03', 'Kaanzwa', 71350, true),
+    (get_constituency_id('130'), '130-04', 'Banamwaze', 71400, true),
+    (get_constituency_id('130'), '130-07', 'Kabulungwe', 71450, true),
+    (get_constituency_id('130'), '130-08', 'Lubanda', 71500, true),
+    (get_constituency_id('130'), '130-09', 'Masemu', 71550, true),
+    (get_constituency_id('123'), '123-06', 'Libuyu', 71600, true),
+    (get_constituency_id('130'), '130-10', 'Luubwe', 71650, true),
+    (get_constituency_id('130'), '130-11', 'Basanga', 71700, true),
+    (get_constituency_id('130'), '130-12', 'Luchena', 71750, true),
+    (get_constituency_id('123'), '123-07', 'Mwalibonena', 71800, true),
+    (get_constituency_id('130'), '130-13', 'Mbila', 71850, true),
+    (get_constituency_id('119'), '119-01', 'Chikanta', 71900, true),
+    (get_constituency_id('123'), '123-08', 'Mulungushi', 71950, true),
+    (get_constituency_id('119'), '119-02', 'Chamuka', 72000, true),
+    (get_constituency_id('119'), '119-03', 'Kasukwe', 72050, true),
+    (get_constituency_id('119'), '119-04', 'Omba', 72100, true),
+    (get_constituency_id('119'), '119-05', 'Bbilili', 72150, true),
+    (get_constituency_id('119'), '119-06', 'Naluja', 72200, true),
+    (get_constituency_id('120'), '120-07', 'Siachitema', 72250, true),
+    (get_constituency_id('120'), '120-08', 'Kalonda', 72300, true),
+    (get_constituency_id('123'), '123-09', 'Maramba', 72350, true),
+    (get_constituency_id('120'), '120-09', 'Choonga', 72400, true),
+    (get_constituency_id('120'), '120-10', 'Mayoba', 72450, true),
+    (get_constituency_id('123'), '123-10', 'Akapelwa', 72500, true),
+    (get_constituency_id('120'), '120-11', 'Namwianga', 72550, true),
+    (get_constituency_id('120'), '120-12', 'Simayakwe', 72600, true),
+    (get_constituency_id('120'), '120-13', 'Chawila', 72650, true),
+    (get_constituency_id('123'), '123-11', 'Lizuma', 72700, true),
+    (get_constituency_id('120'), '120-14', 'Sipatunyana', 72750, true),
+    (get_constituency_id('123'), '123-16', 'Nansanzu', 72800, true),
+    (get_constituency_id('120'), '120-15', 'Nachikungu', 72850, true),
+    (get_constituency_id('122'), '122-16', 'Chidi', 72900, true),
+    (get_constituency_id('122'), '122-17', 'Mulamfu', 72950, true),
+    (get_constituency_id('122'), '122-18', 'Simwatachela', 73000, true),
+    (get_constituency_id('122'), '122-19', 'Luyaba', 73050, true),
+    (get_constituency_id('122'), '122-20', 'Zimba', 73100, true),
+    (get_constituency_id('122'), '122-21', 'Siamafumba', 73150, true),
+    (get_constituency_id('122'), '122-22', 'Mbwiko', 73200, true),
+    (get_constituency_id('121'), '121-01', 'Moomba', 73250, true),
+    (get_constituency_id('121'), '121-02', 'Chooma', 73300, true),
+    (get_constituency_id('121'), '121-03', 'Nguba', 73350, true),
+    (get_constituency_id('121'), '121-04', 'Kauwe', 73400, true),
+    (get_constituency_id('121'), '121-05', 'Nyawa', 73450, true),
+    (get_constituency_id('121'), '121-06', 'Ngwezi', 73500, true),
+    (get_constituency_id('121'), '121-07', 'Sikaunzwe', 73550, true),
+    (get_constituency_id('121'), '121-08', 'Mandia', 73600, true),
+    (get_constituency_id('132'), '132-05', 'Sikongo', 73650, true),
+    (get_constituency_id('121'), '121-09', 'Sekute', 73700, true),
+    (get_constituency_id('121'), '121-10', 'Kanchele', 73750, true),
+    (get_constituency_id('121'), '121-11', 'Simango', 73800, true),
+    (get_constituency_id('121'), '121-12', 'Musokotwane', 73850, true),
+    (get_constituency_id('121'), '121-14', 'Mukuni', 73900, true),
+    (get_constituency_id('123'), '123-03', 'Dr.mubitana', 73950, true),
+    (get_constituency_id('123'), '123-12', 'Simonga', 74000, true),
+    (get_constituency_id('123'), '123-13', 'Dambwa Central', 74050, true),
+    (get_constituency_id('123'), '123-14', 'Zambezi', 74100, true),
+    (get_constituency_id('123'), '123-15', 'Kariba', 74150, true),
+    (get_constituency_id('123'), '123-17', 'Shungu', 74200, true),
+    (get_constituency_id('124'), '124-01', 'Kasengo', 74250, true),
+    (get_constituency_id('124'), '124-02', 'Namalundu', 74300, true),
+    (get_constituency_id('124'), '124-03', 'Musaya', 74350, true),
+    (get_constituency_id('124'), '124-04', 'Nansenga', 74400, true),
+    (get_constituency_id('124'), '124-05', 'Chitete', 74450, true),
+    (get_constituency_id('124'), '124-06', 'Malala', 74500, true),
+    (get_constituency_id('125'), '125-11', 'Musuma', 74550, true),
+    (get_constituency_id('124'), '124-07', 'Mabwetuba', 74600, true),
+    (get_constituency_id('124'), '124-08', 'Upper Kaleya', 74650, true),
+    (get_constituency_id('125'), '125-09', 'Nkonkola', 74700, true),
+    (get_constituency_id('125'), '125-10', 'Chivuna', 74750, true),
+    (get_constituency_id('125'), '125-12', 'Munjile', 74800, true),
+    (get_constituency_id('126'), '126-22', 'Nenga Nenga', 74850, true),
+    (get_constituency_id('125'), '125-13', 'Ngwezi', 74900, true),
+    (get_constituency_id('125'), '125-14', 'Kalama', 74950, true),
+    (get_constituency_id('125'), '125-15', 'Munenga', 75000, true),
+    (get_constituency_id('125'), '125-16', 'Mwanachingwala', 75050, true),
+    (get_constituency_id('125'), '125-17', 'Itebe', 75100, true),
+    (get_constituency_id('126'), '126-18', 'Mazabuka Central', 75150, true),
+    (get_constituency_id('127'), '127-02', 'Kaila', 75200, true),
+    (get_constituency_id('126'), '126-19', 'Nakambala', 75250, true),
+    (get_constituency_id('126'), '126-20', 'Chizobo', 75300, true),
+    (get_constituency_id('126'), '126-21', 'Lubombo', 75350, true),
+    (get_constituency_id('127'), '127-01', 'Malundu', 75400, true),
+    (get_constituency_id('127'), '127-03', 'Keemba', 75450, true),
+    (get_constituency_id('127'), '127-06', 'Hamangaba', 75500, true),
+    (get_constituency_id('127'), '127-04', 'Choongo West', 75550, true),
+    (get_constituency_id('127'), '127-05', 'Bweengwa', 75600, true),
+    (get_constituency_id('127'), '127-07', 'Choongo East', 75650, true),
+    (get_constituency_id('128'), '128-09', 'Ufwenuka', 75700, true),
+    (get_constituency_id('128'), '128-12', 'Mayaba', 75750, true),
+    (get_constituency_id('128'), '128-10', 'Manungu', 75800, true),
+    (get_constituency_id('128'), '128-11', 'Chisekesi', 75850, true),
+    (get_constituency_id('128'), '128-13', 'Hufwa/hamapande', 75900, true),
+    (get_constituency_id('128'), '128-14', 'Hamamvwa', 75950, true),
+    (get_constituency_id('128'), '128-16', 'Hantotola', 76000, true),
+    (get_constituency_id('128'), '128-17', 'Bbombo', 76050, true),
+    (get_constituency_id('128'), '128-18', 'Monze Urban', 76100, true),
+    (get_constituency_id('129'), '129-19', 'Mwanza West', 76150, true),
+    (get_constituency_id('129'), '129-20', 'Chona', 76200, true),
+    (get_constituency_id('129'), '129-21', 'Mwanza East', 76250, true),
+    (get_constituency_id('129'), '129-22', 'Moomba', 76300, true),
+    (get_constituency_id('131'), '131-01', 'Namwala Central', 76350, true),
+    (get_constituency_id('131'), '131-02', 'Ngabo', 76400, true),
+    (get_constituency_id('131'), '131-03', 'Baambwe', 76450, true),
+    (get_constituency_id('131'), '131-04', 'Maala', 76500, true),
+    (get_constituency_id('131'), '131-05', 'Kantengwa', 76550, true),
+    (get_constituency_id('131'), '131-06', 'Kabulamwanda', 76600, true),
+    (get_constituency_id('131'), '131-07', 'Chitongo', 76650, true),
+    (get_constituency_id('131'), '131-08', 'Mandondo', 76700, true),
+    (get_constituency_id('131'), '131-09', 'Nakamboma', 76750, true),
+    (get_constituency_id('131'), '131-10', 'Mbeza', 76800, true),
+    (get_constituency_id('131'), '131-11', 'Ndema', 76850, true),
+    (get_constituency_id('131'), '131-12', 'Namakube', 76900, true),
+    (get_constituency_id('132'), '132-13', 'Lusangazi', 76950, true),
+    (get_constituency_id('131'), '131-13', 'Itapa', 77000, true),
+    (get_constituency_id('131'), '131-14', 'Moobola', 77050, true),
+    (get_constituency_id('132'), '132-01', 'Ibwe Munyama', 77100, true),
+    (get_constituency_id('132'), '132-02', 'Musaya', 77150, true),
+    (get_constituency_id('132'), '132-03', 'Chirundu', 77200, true),
+    (get_constituency_id('132'), '132-06', 'Lusitu', 77250, true),
+    (get_constituency_id('132'), '132-07', 'Nanyanga', 77300, true),
+    (get_constituency_id('133'), '133-01', 'Mabinga', 77350, true),
+    (get_constituency_id('132'), '132-08', 'Kariba', 77400, true),
+    (get_constituency_id('132'), '132-09', 'Simamba', 77450, true),
+    (get_constituency_id('132'), '132-10', 'Mulima', 77500, true),
+    (get_constituency_id('132'), '132-11', 'Manchanvwa', 77550, true),
+    (get_constituency_id('132'), '132-12', 'Sinadambwe', 77600, true),
+    (get_constituency_id('133'), '133-04', 'Muuka', 77650, true),
+    (get_constituency_id('133'), '133-05', 'Tekelo', 77700, true),
+    (get_constituency_id('133'), '133-06', 'Mweemba', 77750, true),
+    (get_constituency_id('133'), '133-07', 'Muchekwa', 77800, true),
+    (get_constituency_id('133'), '133-08', 'Maamba', 77850, true),
+    (get_constituency_id('133'), '133-09', 'Mweezya', 77900, true),
+    (get_constituency_id('133'), '133-10', 'Nkamdabwe', 77950, true),
+    (get_constituency_id('133'), '133-11', 'Sinazongwe', 78000, true),
+    (get_constituency_id('133'), '133-12', 'Nangombe', 78050, true),
+    (get_constituency_id('133'), '133-13', 'Sinenge', 78100, true),
+    (get_constituency_id('133'), '133-14', 'Malima', 78150, true),
+    (get_constituency_id('128'), '128-08', 'Chipembele', 78200, true),
+    (get_constituency_id('003'), '003-19', 'Mashikili', 78250, true),
+    (get_constituency_id('082'), '082-19', 'Kanama', 78300, true),
+    (get_constituency_id('082'), '082-15', 'Chiloba', 78350, true),
+    (get_constituency_id('030'), '030-02', 'Kabundia', 78400, true),
+    (get_constituency_id('001'), '001-05', 'Chisamba', 78450, true),
+    (get_constituency_id('071'), '071-03', 'Mandombe', 78500, true),
+    (get_constituency_id('110'), '110-11', 'Tuvwanganai', 78550, true),
+    (get_constituency_id('066'), '066-05', 'Kashikishi', 78600, true),
+    (get_constituency_id('058'), '058-09', 'Mulundu', 78650, true),
+    (get_constituency_id('076'), '076-07', 'Libala', 78700, true),
+    (get_constituency_id('121'), '121-13', 'Katapazi', 78750, true);
 
 DROP FUNCTION IF EXISTS get_constituency_id;
 